@@ -17,9 +17,11 @@ logger = logging.getLogger(__name__)
 class RegimeDetector:
     """Detect market regimes"""
     
-    def __init__(self):
+    def __init__(self, correlation_matrix=None):
         self.current_regime = None
         self.session = requests.Session()
+        # Shared RollingCorrelationMatrix (live klines) - optional
+        self.correlation_matrix = correlation_matrix
     
     def detect(self, returns):
         """REAL regime detection"""
@@ -122,6 +124,9 @@ class RegimeDetector:
                 'data_quality': 'REAL',
                 'analysis_complete': True
             }
+            correlation_regime = self._correlation_regime()
+            if correlation_regime:
+                report['correlation_regime'] = correlation_regime
             
             logger.info(f"✅ Regime detected: {regime.upper()} (confidence: {confidence:.1f}%)")
             return report
@@ -136,6 +141,27 @@ class RegimeDetector:
                 'analysis_complete': False
             }
     
+    def _correlation_regime(self) -> Dict:
+        """Cross-asset correlation state from the shared matrix (no extra download)."""
+        matrix = self.correlation_matrix
+        if matrix is None:
+            return {}
+        avg = matrix.average_correlation('ewma')
+        if avg is None:
+            return {}
+        breaks = matrix.get_stats()['active_breaks']
+        if breaks:
+            state = 'decoupling'
+        elif avg > 0.8:
+            state = 'coupled'  # everything moves together - typical of risk-off selloffs
+        else:
+            state = 'normal'
+        return {
+            'state': state,
+            'avg_correlation': round(avg, 4),
+            'active_breaks': breaks,
+        }
+    
     def _interpret_regime(self, regime: str, confidence: float) -> str:
         """Interpret regime with confidence level."""
         if regime == 'bull':
@@ -8,16 +8,18 @@ Gerçek veri ile production-grade simulation
 
 import asyncio
 import logging
-from typing import Dict, List, Tuple, Optional, Any, Callable
+from typing import Dict, List, Tuple, Optional, Any, Callable, Sequence
 from dataclasses import dataclass, asdict, field
 from datetime import datetime, timedelta
 import numpy as np
 import pandas as pd
 from enum import Enum
 import json
-import random
 from collections import deque
 
+from analytics.backtest_kernel import KernelConfig, run_kernel, column, max_drawdown
+from analytics.parallel_backtest import bootstrap_monte_carlo, walk_forward_windows
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,6 +38,9 @@ class SimulationConfig:
     use_walk_forward: bool = False
     walk_forward_periods: int = 12
     
+    parallel_workers: Optional[int] = None  # None = tüm CPU'lar, 1 = tek process
+    random_seed: Optional[int] = None  # Monte Carlo tekrar üretilebilirliği
+    
     metadata: Dict = field(default_factory=dict)
 
 
@@ -111,7 +116,8 @@ class AdvancedBacktester:
         symbol: str,
         historical_data: List[Dict],
         signal_func: Callable,
-        config: Optional[SimulationConfig] = None
+        config: Optional[SimulationConfig] = None,
+        signals: Optional[Sequence] = None
     ) -> Optional[SimulationResult]:
         """
         Simülasyon çalıştır
@@ -121,6 +127,8 @@ class AdvancedBacktester:
             historical_data: Historical OHLCV verileri
             signal_func: Sinyal üretme fonksiyonu
             config: Simülasyon konfigürasyonu
+            signals: Önceden hesaplanmış sinyaller ("BUY"/"SELL"/... veya +1/-1/0);
+                verilirse signal_func mum başına çağrılmaz
         
         Returns:
             SimulationResult
@@ -133,13 +141,21 @@ class AdvancedBacktester:
         try:
             config = config or self.config
             
+            # Sinyaller bir kez üretilir (temel simülasyon + walk forward)
+            if signals is None:
+                signals = [
+                    signal_func(candle, i, historical_data)
+                    for i, candle in enumerate(historical_data)
+                ]
+            
             # Temel simülasyon
             result = await self._run_basic_simulation(
                 symbol,
                 historical_data,
                 signal_func,
                 config,
-                simulation_id
+                simulation_id,
+                signals
             )
             
             if not result:
@@ -156,7 +172,8 @@ class AdvancedBacktester:
                     historical_data,
                     signal_func,
                     config,
-                    result
+                    result,
+                    signals
                 )
             
             result.end_time = datetime.now().timestamp()
@@ -177,134 +194,62 @@ class AdvancedBacktester:
         historical_data: List[Dict],
         signal_func: Callable,
         config: SimulationConfig,
-        simulation_id: str
+        simulation_id: str,
+        signals: Optional[Sequence] = None
     ) -> Optional[SimulationResult]:
-        """Temel simülasyon"""
+        """Temel simülasyon (ortak NumPy backtest kernel'i ile)"""
         
         try:
-            balance = config.initial_capital
-            equity_curve = [(historical_data[0]["timestamp"], balance)]
-            trades = []
-            open_positions: Dict[str, Dict] = {}
+            timestamps = column(historical_data, "timestamp")
+            closes = column(historical_data, "close")
             
-            for i, candle in enumerate(historical_data):
-                timestamp = candle["timestamp"]
-                close_price = candle["close"]
-                
-                # Sinyal
-                signal = signal_func(candle, i, historical_data)
-                
-                # Açık işlemleri kontrol et
-                for pos_id in list(open_positions.keys()):
-                    pos = open_positions[pos_id]
-                    
-                    # SL/TP kontrol
-                    if close_price <= pos.get("stop_loss", 0):
-                        exit_price = pos.get("stop_loss", close_price)
-                        pnl = self._calculate_pnl(pos, exit_price, config)
-                        balance += pnl
-                        
-                        trades.append({
-                            "entry_price": pos["entry_price"],
-                            "exit_price": exit_price,
-                            "quantity": pos["quantity"],
-                            "profit_loss": pnl,
-                            "reason": "stop_loss"
-                        })
-                        
-                        del open_positions[pos_id]
-                    
-                    elif close_price >= pos.get("take_profit", float("inf")):
-                        exit_price = pos.get("take_profit", close_price)
-                        pnl = self._calculate_pnl(pos, exit_price, config)
-                        balance += pnl
-                        
-                        trades.append({
-                            "entry_price": pos["entry_price"],
-                            "exit_price": exit_price,
-                            "quantity": pos["quantity"],
-                            "profit_loss": pnl,
-                            "reason": "take_profit"
-                        })
-                        
-                        del open_positions[pos_id]
-                
-                # Yeni sinyal işle
-                if signal == "BUY" and len(open_positions) < config.max_positions:
-                    entry_price = close_price * (1 + config.slippage_percent)
-                    quantity = (balance * config.position_size) / entry_price
-                    
-                    if quantity > 0:
-                        pos_id = f"POS_{len(open_positions)}"
-                        open_positions[pos_id] = {
-                            "entry_price": entry_price,
-                            "quantity": quantity,
-                            "stop_loss": entry_price * 0.98,
-                            "take_profit": entry_price * 1.03,
-                            "entry_time": timestamp
-                        }
-                        
-                        balance -= (entry_price * quantity)
-                
-                elif signal == "SELL":
-                    for pos_id in list(open_positions.keys()):
-                        pos = open_positions[pos_id]
-                        exit_price = close_price * (1 - config.slippage_percent)
-                        pnl = self._calculate_pnl(pos, exit_price, config)
-                        balance += pnl
-                        
-                        trades.append({
-                            "entry_price": pos["entry_price"],
-                            "exit_price": exit_price,
-                            "quantity": pos["quantity"],
-                            "profit_loss": pnl,
-                            "reason": "signal"
-                        })
-                        
-                        del open_positions[pos_id]
-                
-                # Unrealized P&L ile equity güncelle
-                equity = balance
-                for pos in open_positions.values():
-                    unrealized = (close_price - pos["entry_price"]) * pos["quantity"]
-                    equity += unrealized
-                
-                equity_curve.append((timestamp, equity))
+            # Sinyaller (önceden hesaplanmadıysa mum başına üret)
+            if signals is None:
+                signals = [
+                    signal_func(candle, i, historical_data)
+                    for i, candle in enumerate(historical_data)
+                ]
             
-            # Açık işlemleri kapat
-            if open_positions:
-                last_price = historical_data[-1]["close"]
-                for pos in open_positions.values():
-                    pnl = self._calculate_pnl(pos, last_price, config)
-                    balance += pnl
-                    
-                    trades.append({
-                        "entry_price": pos["entry_price"],
-                        "exit_price": last_price,
-                        "quantity": pos["quantity"],
-                        "profit_loss": pnl,
-                        "reason": "final"
-                    })
+            kernel = run_kernel(closes, signals, self._kernel_config(config))
+            
+            trades = [
+                {
+                    "entry_price": trade["entry_price"],
+                    "exit_price": trade["exit_price"],
+                    "quantity": trade["quantity"],
+                    "profit_loss": trade["profit_loss"],
+                    "reason": trade["reason"]
+                }
+                for trade in kernel.trade_records()
+            ]
+            balance = kernel.final_balance
+            
+            # Equity eğrisi: başlangıç + her mum
+            equity = np.concatenate(([config.initial_capital], kernel.equity))
+            equity_curve = list(zip(
+                np.concatenate((timestamps[:1], timestamps)).tolist(),
+                equity.tolist()
+            ))
             
             # İstatistikler
-            winning_trades = len([t for t in trades if t["profit_loss"] > 0])
-            losing_trades = len([t for t in trades if t["profit_loss"] < 0])
-            total_trades = len(trades)
+            pnls = kernel.pnl
+            winning_trades = int(np.count_nonzero(pnls > 0))
+            losing_trades = int(np.count_nonzero(pnls < 0))
+            total_trades = kernel.trade_count
             win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0
             
             total_return = balance - config.initial_capital
             total_return_percent = (total_return / config.initial_capital) * 100
             
-            max_dd, max_dd_pct = self._calculate_max_drawdown(equity_curve)
+            max_dd, max_dd_pct = max_drawdown(equity)
             
             # Profit factor
-            wins = sum([t["profit_loss"] for t in trades if t["profit_loss"] > 0])
-            losses = abs(sum([t["profit_loss"] for t in trades if t["profit_loss"] < 0]))
+            wins = float(pnls[pnls > 0].sum())
+            losses = abs(float(pnls[pnls < 0].sum()))
             profit_factor = (wins / losses) if losses > 0 else 0
             
             # Sharpe ratio
-            returns = np.array([equity_curve[i+1][1] - equity_curve[i][1] 
-                               for i in range(len(equity_curve)-1)])
+            returns = np.diff(equity)
             sharpe = self._calculate_sharpe_ratio(returns)
             
             result = SimulationResult(
@@ -332,6 +277,20 @@ class AdvancedBacktester:
             logger.error(f"Error in basic simulation: {e}")
             return None
     
+    def _kernel_config(self, config: SimulationConfig) -> KernelConfig:
+        """SimulationConfig → KernelConfig (SL %2, TP %3)"""
+        
+        return KernelConfig(
+            initial_capital=config.initial_capital,
+            position_size=config.position_size,
+            max_positions=config.max_positions,
+            stop_loss_pct=0.02,
+            take_profit_pct=0.03,
+            slippage=config.slippage_percent,
+            commission=config.commission_percent,
+            fill_at_level=True
+        )
+    
     def _calculate_pnl(
         self,
         position: Dict,
@@ -358,23 +317,7 @@ class AdvancedBacktester:
     ) -> Tuple[float, float]:
         """Maximum drawdown hesapla"""
         
-        equities = [e for _, e in equity_curve]
-        max_equity = equities[0]
-        max_dd = 0
-        max_dd_pct = 0
-        
-        for equity in equities:
-            if equity > max_equity:
-                max_equity = equity
-            
-            dd = max_equity - equity
-            dd_pct = (dd / max_equity) * 100 if max_equity > 0 else 0
-            
-            if dd > max_dd:
-                max_dd = dd
-                max_dd_pct = dd_pct
-        
-        return max_dd, max_dd_pct
+        return max_drawdown(np.array([e for _, e in equity_curve]))
     
     def _calculate_sharpe_ratio(self, returns: np.ndarray) -> float:
         """Sharpe ratio"""
@@ -389,31 +332,44 @@ class AdvancedBacktester:
         base_result: SimulationResult,
         config: SimulationConfig
     ):
-        """Monte Carlo simülasyonu"""
+        """
+        Monte Carlo simülasyonu
         
-        logger.info("Running Monte Carlo simulation...")
+        Trade P&L'leri yerine koyarak yeniden örneklenir (bootstrap); sadece
+        sırayı karıştırmak final sermayeyi değiştirmez. Denemeler process
+        pool'a dağıtılır ve (seed, deneme) ile deterministiktir.
+        """
         
         trades = base_result.trades
         if not trades:
             return
         
-        pnls = [t["profit_loss"] for t in trades]
-        
-        mc_results = []
+        logger.info(f"Running Monte Carlo simulation ({config.monte_carlo_samples} samples)...")
         
-        for _ in range(config.monte_carlo_samples):
-            shuffled_pnls = random.sample(pnls, len(pnls))
-            cumulative = config.initial_capital + sum(shuffled_pnls)
-            mc_results.append(cumulative)
+        seed, dists = await asyncio.to_thread(
+            bootstrap_monte_carlo,
+            [t["profit_loss"] for t in trades],
+            config.initial_capital,
+            config.monte_carlo_samples,
+            config.random_seed,
+            config.parallel_workers
+        )
+        capital = dists["final_capital"].summary()
+        drawdown = dists["max_drawdown_percent"].summary()
         
         base_result.metadata["monte_carlo"] = {
             "samples": config.monte_carlo_samples,
-            "mean_final_capital": float(np.mean(mc_results)),
-            "std_final_capital": float(np.std(mc_results)),
-            "min_final_capital": float(np.min(mc_results)),
-            "max_final_capital": float(np.max(mc_results)),
-            "percentile_5": float(np.percentile(mc_results, 5)),
-            "percentile_95": float(np.percentile(mc_results, 95))
+            "seed": seed,
+            "mean_final_capital": capital["mean"],
+            "std_final_capital": capital["std"],
+            "min_final_capital": capital["min"],
+            "max_final_capital": capital["max"],
+            "percentile_5": capital["p5"],
+            "percentile_25": capital["p25"],
+            "percentile_50": capital["p50"],
+            "percentile_75": capital["p75"],
+            "percentile_95": capital["p95"],
+            "max_drawdown_percent": drawdown
         }
     
     async def _run_walk_forward(
@@ -422,14 +378,47 @@ class AdvancedBacktester:
         historical_data: List[Dict],
         signal_func: Callable,
         config: SimulationConfig,
-        result: SimulationResult
+        result: SimulationResult,
+        signals: Optional[Sequence] = None
     ):
-        """Walk Forward Analysis"""
+        """
+        Walk Forward Analysis
+        
+        Veri walk_forward_periods ardışık pencereye bölünür, her pencere
+        başlangıç sermayesiyle bağımsız simüle edilir (pencereler paralel).
+        """
+        
+        logger.info(f"Running Walk Forward Analysis ({config.walk_forward_periods} periods)...")
+        
+        if signals is None:
+            signals = [
+                signal_func(candle, i, historical_data)
+                for i, candle in enumerate(historical_data)
+            ]
         
-        logger.info("Running Walk Forward Analysis...")
+        windows = await asyncio.to_thread(
+            walk_forward_windows,
+            column(historical_data, "close"),
+            signals,
+            config.walk_forward_periods,
+            self._kernel_config(config),
+            config.parallel_workers
+        )
         
-        # TODO: Implement walk forward
-        pass
+        for window in windows:
+            window["start_time"] = historical_data[window["start_index"]]["timestamp"]
+            window["end_time"] = historical_data[window["end_index"]]["timestamp"]
+        
+        returns = np.array([w["return_percent"] for w in windows])
+        result.metadata["walk_forward"] = {
+            "symbol": symbol,
+            "periods": len(windows),
+            "windows": windows,
+            "mean_return_percent": float(returns.mean()) if len(returns) else 0.0,
+            "std_return_percent": float(returns.std()) if len(returns) else 0.0,
+            "profitable_periods": int(np.count_nonzero(returns > 0)),
+            "worst_drawdown_percent": max((w["max_drawdown_percent"] for w in windows), default=0.0)
+        }
     
     def get_result(self, simulation_id: str) -> Optional[SimulationResult]:
         """Sonuç al"""
@@ -28,6 +28,8 @@ import asyncio
 from concurrent.futures import ThreadPoolExecutor
 import json
 
+from analytics.backtest_kernel import KernelConfig, run_kernel
+
 # Internal imports
 try:
     from integrations.binance_api import BinanceAPI
@@ -355,6 +357,86 @@ class BacktestEngine:
             logger.error(f"Trade execution error: {e}")
             return None
 
+    def run_signal_backtest(
+        self,
+        symbol: str,
+        prices: np.ndarray,
+        signals: List,
+        timestamps: Optional[List] = None,
+        position_size: float = 0.1,
+        stop_loss_pct: Optional[float] = None,
+        take_profit_pct: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Simulate a per-candle signal series with the shared backtest kernel.
+        
+        Same cost model as execute_trade (slippage on both sides, commission
+        on position value), without a Python call per candle. Continues from
+        current_capital and appends to trades / equity_curve.
+        
+        Args:
+            symbol: Trading pair
+            prices: Close prices
+            signals: Per-candle 'BUY' / 'SELL' / 'HOLD' (or +1 / -1 / 0)
+            timestamps: Optional candle timestamps for trade records
+            position_size: Position size as fraction of capital
+            stop_loss_pct: Optional stop loss (e.g., 0.02 for 2%)
+            take_profit_pct: Optional take profit (e.g., 0.04 for 4%)
+            
+        Returns:
+            Performance metrics
+        """
+        result = run_kernel(
+            prices,
+            signals,
+            KernelConfig(
+                initial_capital=self.current_capital,
+                position_size=position_size,
+                max_positions=1,
+                stop_loss_pct=stop_loss_pct,
+                take_profit_pct=take_profit_pct,
+                slippage=self.slippage,
+                commission=self.commission
+            )
+        )
+        
+        for record in result.trade_records(timestamps):
+            entry_value = record['entry_price'] * record['quantity']
+            exit_value = record['exit_price'] * record['quantity']
+            self.trades.append({
+                'timestamp': record.get('entry_time', record['entry_index']),
+                'symbol': symbol,
+                'side': 'BUY',
+                'execution_price': record['entry_price'],
+                'quantity': record['quantity'],
+                'position_size': position_size,
+                'position_value': entry_value,
+                'commission': entry_value * self.commission
+            })
+            self.trades.append({
+                'timestamp': record.get('exit_time', record['exit_index']),
+                'symbol': symbol,
+                'side': 'SELL',
+                'execution_price': record['exit_price'],
+                'quantity': record['quantity'],
+                'position_value': exit_value,
+                'commission': exit_value * self.commission,
+                'entry_price': record['entry_price'],
+                'pnl': record['profit_loss'],
+                'pnl_pct': (record['exit_price'] / record['entry_price'] - 1) * 100,
+                'exit_reason': record['reason']
+            })
+        
+        self.equity_curve.extend(result.equity.tolist())
+        self.current_capital = result.final_balance
+        self.metrics = self.calculate_performance_metrics()
+        
+        logger.info(
+            f"✅ Signal backtest {symbol}: {len(prices):,} candles, "
+            f"{result.trade_count} trades, capital ${self.current_capital:,.2f}"
+        )
+        return self.metrics
+
     async def backtest(
         self,
         symbols: List[str],
@@ -404,8 +486,21 @@ class BacktestEngine:
             logger.info(f"✅ Loaded {len(self.historical_data)} datasets")
             
             # Run backtest simulation
-            # (Strategy signal generation would integrate with signal engine)
-            # This is framework - actual signals come from GroupSignalEngine
+            # strategy_config['signal_generator'](df) -> per-candle signals
+            # (actual signals come from GroupSignalEngine)
+            signal_generator = strategy_config.get('signal_generator')
+            if signal_generator:
+                for key, df in self.historical_data.items():
+                    symbol = key.rsplit('_', 1)[0]
+                    self.run_signal_backtest(
+                        symbol,
+                        df['close'].to_numpy(dtype=np.float64),
+                        signal_generator(df),
+                        timestamps=df['timestamp'].tolist() if 'timestamp' in df else None,
+                        position_size=strategy_config.get('position_size', 0.1),
+                        stop_loss_pct=strategy_config.get('stop_loss_pct'),
+                        take_profit_pct=strategy_config.get('take_profit_pct')
+                    )
             
             # Calculate performance metrics
             self.metrics = self.calculate_performance_metrics()
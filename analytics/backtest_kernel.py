@@ -0,0 +1,393 @@
+"""
+Backtest Kernel - NumPy tabanlı ortak simülasyon çekirdeği
+DEMIR AI v8.0
+
+Shared by AdvancedBacktester, Backtester3Year, AdvancedBacktestEngine,
+BacktestEngine and GroupSignalBacktester.
+
+Prices and signals are plain arrays. Instead of walking every bar with a
+dict of open positions, the kernel is event driven:
+- the exit bar of a position (SL / TP / next SELL / end of data) is found
+  with a vectorized first-hit search when the position is opened
+- pending exits sit in a heap keyed by exit bar, so the loop only visits
+  entry bars and jumps straight to the next exit while the book is full
+- equity / cash curves are rebuilt at the end with cumulative sums
+
+Cost is O(trades) Python steps + O(bars) NumPy work, so multi-year
+1-minute backtests (~1.5M bars) run in seconds.
+
+Semantics (same as the per-candle loops it replaces):
+- BUY opens a long at close * (1 + slippage) if fewer than max_positions are open
+- SELL closes every open position at close * (1 - slippage)
+- On each bar SL is checked before TP, and both before the bar's signal
+- Positions opened on a bar are checked from the next bar on
+- Commission is charged on entry and exit notional
+"""
+
+import heapq
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Signal codes
+SIGNAL_HOLD = 0
+SIGNAL_BUY = 1
+SIGNAL_SELL = -1
+
+# Exit reasons
+EXIT_STOP_LOSS = 1
+EXIT_TAKE_PROFIT = 2
+EXIT_SIGNAL = 3
+EXIT_FINAL = 4
+EXIT_OPEN = 5
+
+EXIT_REASONS = {
+    EXIT_STOP_LOSS: "stop_loss",
+    EXIT_TAKE_PROFIT: "take_profit",
+    EXIT_SIGNAL: "signal",
+    EXIT_FINAL: "final",
+    EXIT_OPEN: "open"
+}
+
+_SCALAR_SCAN = 16
+_SEARCH_CHUNK = 256
+
+
+@dataclass
+class KernelConfig:
+    """Kernel konfigürasyonu"""
+    initial_capital: float = 10000.0
+    position_size: float = 0.1  # fraction of free cash per entry
+    max_positions: Optional[int] = 1  # None = unlimited
+    stop_loss_pct: Optional[float] = None  # 0.02 = 2% below entry
+    take_profit_pct: Optional[float] = None  # 0.03 = 3% above entry
+    slippage: float = 0.0  # entries and signal exits
+    commission: float = 0.0  # per side, on notional
+    fill_at_level: bool = True  # SL/TP fill at the level (False: at bar close)
+    close_at_end: bool = True  # force-close open positions at the last close
+
+
+@dataclass
+class KernelResult:
+    """Kernel sonucu (tüm alanlar NumPy dizileri)"""
+    entry_idx: np.ndarray
+    exit_idx: np.ndarray  # len(close) for positions closed/left open at the end
+    entry_price: np.ndarray
+    exit_price: np.ndarray
+    quantity: np.ndarray
+    pnl: np.ndarray  # net of commission
+    reason: np.ndarray
+    cash: np.ndarray  # per bar
+    equity: np.ndarray  # per bar (cash + marked-to-market positions)
+    final_balance: float
+    metadata: Dict = field(default_factory=dict)
+
+    @property
+    def trade_count(self) -> int:
+        return len(self.entry_idx)
+
+    def closed_mask(self) -> np.ndarray:
+        return self.reason != EXIT_OPEN
+
+    def trade_records(self, timestamps: Optional[np.ndarray] = None) -> List[Dict]:
+        """Trades as dicts (for legacy list-of-dict consumers)"""
+        n = len(self.equity)
+        records = []
+        for k in range(self.trade_count):
+            exit_idx = int(self.exit_idx[k])
+            record = {
+                "entry_index": int(self.entry_idx[k]),
+                "exit_index": min(exit_idx, n - 1),
+                "entry_price": float(self.entry_price[k]),
+                "exit_price": float(self.exit_price[k]),
+                "quantity": float(self.quantity[k]),
+                "profit_loss": float(self.pnl[k]),
+                "reason": EXIT_REASONS[int(self.reason[k])]
+            }
+            if timestamps is not None:
+                record["entry_time"] = timestamps[record["entry_index"]]
+                record["exit_time"] = timestamps[record["exit_index"]]
+            records.append(record)
+        return records
+
+
+def encode_signals(signals: Sequence) -> np.ndarray:
+    """'BUY'/'SELL'/other strings or numeric (+/-/0) → int8 signal codes"""
+    arr = np.asarray(signals)
+    if arr.dtype.kind in "iufb":
+        return np.sign(arr).astype(np.int8)
+
+    codes = np.zeros(len(arr), dtype=np.int8)
+    codes[arr == "BUY"] = SIGNAL_BUY
+    codes[arr == "SELL"] = SIGNAL_SELL
+    return codes
+
+
+def column(rows: Sequence[Dict], key: str) -> np.ndarray:
+    """Extract one float column from a list of candle dicts"""
+    return np.fromiter((row[key] for row in rows), dtype=np.float64, count=len(rows))
+
+
+def _next_index(mask: np.ndarray) -> np.ndarray:
+    """next[i] = smallest j >= i with mask[j] (len(mask) if none); length n + 1"""
+    n = len(mask)
+    idx = np.where(mask, np.arange(n), n)
+    out = np.empty(n + 1, dtype=np.int64)
+    out[:n] = np.minimum.accumulate(idx[::-1])[::-1]
+    out[n] = n
+    return out
+
+
+def _first_hit(
+    stop_series: np.ndarray,
+    target_series: np.ndarray,
+    stop: float,
+    target: float,
+    start: int,
+    end: int
+) -> Tuple[int, int]:
+    """
+    First bar in [start, end] with stop_series <= stop or target_series >= target
+
+    Searches in growing chunks so short holds stay cheap.
+
+    Returns:
+        (bar, EXIT_STOP_LOSS / EXIT_TAKE_PROFIT) or (-1, 0)
+    """
+    # Most holds are short: scan the first bars without NumPy call overhead
+    a = min(end + 1, start + _SCALAR_SCAN)
+    stop_head = stop_series[start:a].tolist()
+    target_head = target_series[start:a].tolist()
+    for k in range(a - start):
+        if stop_head[k] <= stop:
+            return start + k, EXIT_STOP_LOSS
+        if target_head[k] >= target:
+            return start + k, EXIT_TAKE_PROFIT
+
+    chunk = _SEARCH_CHUNK
+    while a <= end:
+        b = min(end + 1, a + chunk)
+        hit = (stop_series[a:b] <= stop) | (target_series[a:b] >= target)
+        k = int(hit.argmax())
+        if hit[k]:
+            bar = a + k
+            # Stop is checked first on a bar where both trigger
+            return bar, EXIT_STOP_LOSS if stop_series[bar] <= stop else EXIT_TAKE_PROFIT
+        a = b
+        chunk *= 4
+    return -1, 0
+
+
+def run_kernel(
+    close: np.ndarray,
+    signals: Sequence,
+    config: Optional[KernelConfig] = None,
+    quantity: Optional[np.ndarray] = None,
+    high: Optional[np.ndarray] = None,
+    low: Optional[np.ndarray] = None
+) -> KernelResult:
+    """
+    Long-only signal backtest
+
+    Args:
+        close: Close prices
+        signals: Per-bar signals ('BUY'/'SELL'/... or +1/-1/0)
+        config: KernelConfig
+        quantity: Optional per-bar fixed quantity (overrides position_size)
+        high: Optional highs - TP checked intrabar instead of on close
+        low: Optional lows - SL checked intrabar instead of on close
+
+    Returns:
+        KernelResult
+    """
+    config = config or KernelConfig()
+    close = np.ascontiguousarray(close, dtype=np.float64)
+    codes = encode_signals(signals)
+    n = len(close)
+    if len(codes) != n:
+        raise ValueError(f"signals length {len(codes)} != prices length {n}")
+
+    stop_series = close if low is None else np.asarray(low, dtype=np.float64)
+    target_series = close if high is None else np.asarray(high, dtype=np.float64)
+    use_stop = config.stop_loss_pct is not None
+    use_target = config.take_profit_pct is not None
+    max_positions = config.max_positions if config.max_positions is not None else n + 1
+
+    next_sell = _next_index(codes == SIGNAL_SELL)
+    buy_bars = np.flatnonzero(codes == SIGNAL_BUY)
+
+    entry_idx: List[int] = []
+    exit_idx: List[int] = []
+    entry_px: List[float] = []
+    exit_px: List[float] = []
+    qtys: List[float] = []
+    reasons: List[int] = []
+
+    buy_cost = 1 + config.slippage
+    sell_fill = 1 - config.slippage
+    commission = config.commission
+
+    cash = config.initial_capital
+    pending: List[Tuple[int, int, float]] = []  # (exit bar, seq, cash returned)
+    bi = 0
+    while bi < len(buy_bars):
+        i = int(buy_bars[bi])
+
+        # Exits on this bar happen before the entry decision
+        while pending and pending[0][0] <= i:
+            cash += heapq.heappop(pending)[2]
+
+        if len(pending) >= max_positions:
+            # Book is full: jump to the first BUY at/after the next exit
+            next_exit = pending[0][0]
+            if next_exit >= n:
+                break
+            bi = int(np.searchsorted(buy_bars, next_exit, side="left"))
+            continue
+
+        bi += 1
+        entry = close[i] * buy_cost
+        qty = float(quantity[i]) if quantity is not None else cash * config.position_size / entry
+        if not qty > 0:
+            continue
+
+        cash -= entry * qty * (1 + commission)
+
+        # Exit bar: first SL/TP hit before/at the next SELL, else the SELL, else the end
+        sell_bar = int(next_sell[i + 1])
+        bar, reason = -1, 0
+        if (use_stop or use_target) and i + 1 < n:
+            stop = entry * (1 - config.stop_loss_pct) if use_stop else -np.inf
+            target = entry * (1 + config.take_profit_pct) if use_target else np.inf
+            bar, reason = _first_hit(stop_series, target_series, stop, target, i + 1, min(sell_bar, n - 1))
+            if bar >= 0:
+                if config.fill_at_level:
+                    exit_price = stop if reason == EXIT_STOP_LOSS else target
+                else:
+                    exit_price = close[bar]
+
+        if bar < 0:
+            if sell_bar < n:
+                bar, reason, exit_price = sell_bar, EXIT_SIGNAL, close[sell_bar] * sell_fill
+            else:
+                bar = n
+                reason = EXIT_FINAL if config.close_at_end else EXIT_OPEN
+                exit_price = close[-1]
+
+        proceeds = exit_price * qty * (1 - commission) if reason != EXIT_OPEN else 0.0
+        heapq.heappush(pending, (bar, len(entry_idx), proceeds))
+
+        entry_idx.append(i)
+        exit_idx.append(bar)
+        entry_px.append(entry)
+        exit_px.append(exit_price)
+        qtys.append(qty)
+        reasons.append(reason)
+
+    result_entry = np.asarray(entry_idx, dtype=np.int64)
+    result_exit = np.asarray(exit_idx, dtype=np.int64)
+    result_entry_px = np.asarray(entry_px, dtype=np.float64)
+    result_exit_px = np.asarray(exit_px, dtype=np.float64)
+    result_qty = np.asarray(qtys, dtype=np.float64)
+    result_reason = np.asarray(reasons, dtype=np.int8)
+
+    entry_notional = result_entry_px * result_qty
+    exit_notional = result_exit_px * result_qty
+    pnl = exit_notional - entry_notional - (entry_notional + exit_notional) * commission
+
+    # Cash and holdings per bar from entry/exit flows
+    open_mask = result_reason == EXIT_OPEN
+    flows = np.zeros(n + 1)
+    np.add.at(flows, result_entry, -entry_notional * (1 + commission))
+    np.add.at(flows, result_exit[~open_mask], exit_notional[~open_mask] * (1 - commission))
+    held = np.zeros(n + 1)
+    np.add.at(held, result_entry, result_qty)
+    np.add.at(held, result_exit, -result_qty)
+
+    cash_curve = config.initial_capital + np.cumsum(flows)
+    equity = cash_curve[:n] + np.cumsum(held)[:n] * close
+
+    return KernelResult(
+        entry_idx=result_entry,
+        exit_idx=result_exit,
+        entry_price=result_entry_px,
+        exit_price=result_exit_px,
+        quantity=result_qty,
+        pnl=pnl,
+        reason=result_reason,
+        cash=cash_curve[:n],
+        equity=equity,
+        final_balance=float(cash_curve[n])
+    )
+
+
+def resolve_exits(
+    entry_idx: np.ndarray,
+    is_long: np.ndarray,
+    stop: np.ndarray,
+    target: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Resolve independent signals with their own SL/TP against a price path
+
+    Each signal is entered at bar entry_idx and checked from the next bar:
+    longs stop on low <= stop / target on high >= target, shorts the mirror
+    image. Signals that hit neither are closed at the last close. A zero /
+    NaN stop or target disables that side.
+
+    Returns:
+        (exit_idx, exit_price, reason) arrays
+    """
+    high = np.asarray(high, dtype=np.float64)
+    low = np.asarray(low, dtype=np.float64)
+    neg_high, neg_low = -high, -low
+    n = len(close)
+
+    count = len(entry_idx)
+    exit_idx = np.full(count, n - 1, dtype=np.int64)
+    exit_price = np.full(count, float(close[-1]) if n else np.nan)
+    reason = np.full(count, EXIT_FINAL, dtype=np.int8)
+
+    for k in range(count):
+        i = int(entry_idx[k])
+        if i + 1 >= n:
+            continue
+        sl = stop[k] if stop[k] > 0 else np.nan
+        tp = target[k] if target[k] > 0 else np.nan
+        if is_long[k]:
+            bar, why = _first_hit(
+                low, high,
+                sl if sl == sl else -np.inf, tp if tp == tp else np.inf,
+                i + 1, n - 1
+            )
+        else:
+            bar, why = _first_hit(
+                neg_high, neg_low,
+                -sl if sl == sl else -np.inf, -tp if tp == tp else np.inf,
+                i + 1, n - 1
+            )
+        if bar >= 0:
+            exit_idx[k] = bar
+            exit_price[k] = sl if why == EXIT_STOP_LOSS else tp
+            reason[k] = why
+
+    return exit_idx, exit_price, reason
+
+
+def max_drawdown(equity: np.ndarray) -> Tuple[float, float]:
+    """(max drawdown, its percent of the running peak)"""
+    equity = np.asarray(equity, dtype=np.float64)
+    if equity.size == 0:
+        return 0.0, 0.0
+    peak = np.maximum.accumulate(equity)
+    drawdown = peak - equity
+    k = int(drawdown.argmax())
+    pct = drawdown[k] / peak[k] * 100 if peak[k] > 0 else 0.0
+    return float(drawdown[k]), float(pct)
@@ -0,0 +1,359 @@
+"""
+Parallel Backtest Runner - Monte Carlo / walk-forward over a process pool
+DEMIR AI v8.0
+
+Price / signal / PnL arrays are copied once into shared memory and the
+pool workers attach to them by name, so a task only ships a few integers
+in and a few small arrays out - never the price series.
+
+- Every Monte Carlo trial draws from its own Generator seeded with
+  (seed, trial index): the distribution is identical for any worker count
+  or batch size, and a run can be reproduced from its seed
+- Finished batches are merged into StreamingDistribution objects as they
+  complete, so running mean / std / percentiles are available mid-run
+- workers <= 1 (or a single batch) runs in-process without a pool
+"""
+
+import os
+import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from analytics.backtest_kernel import KernelConfig, run_kernel, encode_signals, max_drawdown
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PERCENTILES: Tuple[float, ...] = (5, 25, 50, 75, 95)
+
+# Worker-side views of the shared arrays (set by _attach / in-process runs)
+_SHARED: Dict[str, np.ndarray] = {}
+_SEGMENTS: List[shared_memory.SharedMemory] = []
+
+
+# ============================================================================
+# SHARED MEMORY
+# ============================================================================
+
+class SharedArrays:
+    """
+    Copies arrays into shared memory for the lifetime of a `with` block
+
+    `spec` is what the workers need to attach: {key: (segment, shape, dtype)}.
+    """
+
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        self.arrays = {key: np.ascontiguousarray(value) for key, value in arrays.items()}
+        self.segments: List[shared_memory.SharedMemory] = []
+        self.spec: Dict[str, Tuple[str, Tuple[int, ...], str]] = {}
+
+    def __enter__(self) -> "SharedArrays":
+        try:
+            for key, array in self.arrays.items():
+                segment = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+                self.segments.append(segment)
+                np.ndarray(array.shape, dtype=array.dtype, buffer=segment.buf)[...] = array
+                self.spec[key] = (segment.name, array.shape, array.dtype.str)
+        except Exception:
+            self.__exit__(None, None, None)
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        for segment in self.segments:
+            try:
+                segment.close()
+                segment.unlink()
+            except FileNotFoundError:
+                pass
+        self.segments.clear()
+        return False
+
+
+def _attach(spec: Dict[str, Tuple[str, Tuple[int, ...], str]]):
+    """Pool initializer: map the parent's shared segments as read-only arrays"""
+    _SHARED.clear()
+    for key, (name, shape, dtype) in spec.items():
+        segment = shared_memory.SharedMemory(name=name)
+        _SEGMENTS.append(segment)
+        array = np.ndarray(shape, dtype=np.dtype(dtype), buffer=segment.buf)
+        array.flags.writeable = False
+        _SHARED[key] = array
+
+
+# ============================================================================
+# STREAMING AGGREGATION
+# ============================================================================
+
+class StreamingDistribution:
+    """
+    Trial-indexed sample that is merged batch by batch
+
+    Mean / variance use the pairwise (Chan) update, so they are exact at any
+    point of the run. Values are stored by trial index (10k trials = 80 KB),
+    which keeps percentiles exact and independent of completion order.
+    """
+
+    def __init__(self, size: int):
+        self.values = np.full(size, np.nan)
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def add(self, start: int, batch: np.ndarray):
+        batch = np.asarray(batch, dtype=np.float64)
+        if batch.size == 0:
+            return
+        self.values[start:start + batch.size] = batch
+
+        n_b = batch.size
+        mean_b = float(batch.mean())
+        m2_b = float(((batch - mean_b) ** 2).sum())
+        total = self.count + n_b
+        delta = mean_b - self.mean
+        self.mean += delta * n_b / total
+        self._m2 += m2_b + delta * delta * self.count * n_b / total
+        self.count = total
+        self.min = min(self.min, float(batch.min()))
+        self.max = max(self.max, float(batch.max()))
+
+    @property
+    def std(self) -> float:
+        return float(np.sqrt(self._m2 / self.count)) if self.count else 0.0
+
+    def percentiles(self, qs: Sequence[float] = DEFAULT_PERCENTILES) -> Dict[str, float]:
+        filled = self.values[~np.isnan(self.values)]
+        if filled.size == 0:
+            return {f"p{q:g}": 0.0 for q in qs}
+        values = np.percentile(filled, qs)
+        return {f"p{q:g}": float(v) for q, v in zip(qs, values)}
+
+    def summary(self, qs: Sequence[float] = DEFAULT_PERCENTILES) -> Dict[str, float]:
+        result = {
+            "count": self.count,
+            "mean": float(self.mean),
+            "std": self.std,
+            "min": float(self.min) if self.count else 0.0,
+            "max": float(self.max) if self.count else 0.0
+        }
+        result.update(self.percentiles(qs))
+        return result
+
+
+# ============================================================================
+# WORKER TASKS (module level so they pickle)
+# ============================================================================
+
+def _permutation_task(start: int, stop: int, seed: int, config: KernelConfig) -> Dict[str, np.ndarray]:
+    """
+    Re-run the kernel on randomly re-ordered signals (timing-luck test).
+    Bar 0 has no previous price and never trades in the real run, so only
+    codes[1:] are shuffled and bar 0 keeps its code.
+    """
+    close = _SHARED["close"]
+    codes = _SHARED["codes"]
+    quantity = _SHARED.get("quantity")
+
+    net_pnl = np.empty(stop - start)
+    drawdown_pct = np.empty(stop - start)
+    trades = np.empty(stop - start)
+    for i, trial in enumerate(range(start, stop)):
+        rng = np.random.default_rng([seed, trial])
+        shuffled = codes.copy()
+        shuffled[1:] = rng.permutation(codes[1:])
+        result = run_kernel(close, shuffled, config, quantity=quantity)
+        net_pnl[i] = result.final_balance - config.initial_capital
+        drawdown_pct[i] = max_drawdown(result.equity)[1]
+        trades[i] = result.trade_count
+    return {"net_pnl": net_pnl, "max_drawdown_percent": drawdown_pct, "trades": trades}
+
+
+def _bootstrap_task(start: int, stop: int, seed: int, initial_capital: float) -> Dict[str, np.ndarray]:
+    """Resample the trade PnL list with replacement and replay the equity path"""
+    pnls = _SHARED["pnls"]
+    n = len(pnls)
+
+    final_capital = np.empty(stop - start)
+    drawdown_pct = np.empty(stop - start)
+    for i, trial in enumerate(range(start, stop)):
+        rng = np.random.default_rng([seed, trial])
+        path = initial_capital + np.cumsum(pnls[rng.integers(0, n, n)])
+        final_capital[i] = path[-1]
+        drawdown_pct[i] = max_drawdown(np.concatenate(([initial_capital], path)))[1]
+    return {"final_capital": final_capital, "max_drawdown_percent": drawdown_pct}
+
+
+def _window_task(start: int, stop: int, config: KernelConfig) -> Dict[str, float]:
+    """Simulate one walk-forward window from a fresh balance"""
+    result = run_kernel(_SHARED["close"][start:stop], _SHARED["codes"][start:stop], config)
+    closed = result.pnl[result.closed_mask()]
+    dd, dd_pct = max_drawdown(np.concatenate(([config.initial_capital], result.equity)))
+    return {
+        "start_index": start,
+        "end_index": stop - 1,
+        "trades": result.trade_count,
+        "win_rate": float(np.count_nonzero(closed > 0) / len(closed) * 100) if len(closed) else 0.0,
+        "return_percent": (result.final_balance - config.initial_capital) / config.initial_capital * 100,
+        "max_drawdown": dd,
+        "max_drawdown_percent": dd_pct
+    }
+
+
+# ============================================================================
+# DRIVERS
+# ============================================================================
+
+def resolve_workers(workers: Optional[int]) -> int:
+    """None → all CPUs"""
+    return max(1, workers if workers is not None else (os.cpu_count() or 1))
+
+
+def _batches(total: int, batch_size: int) -> List[Tuple[int, int]]:
+    return [(start, min(start + batch_size, total)) for start in range(0, total, batch_size)]
+
+
+def _run_tasks(
+    arrays: Dict[str, np.ndarray],
+    task: Callable,
+    batches: List[Tuple[int, int]],
+    args: tuple,
+    workers: int,
+    on_result: Callable[[Tuple[int, int], object], None]
+):
+    """Run task(start, stop, *args) for every batch, in-process or on a pool"""
+    if workers <= 1 or len(batches) <= 1:
+        previous = dict(_SHARED)
+        _SHARED.clear()
+        _SHARED.update(arrays)
+        try:
+            for batch in batches:
+                on_result(batch, task(*batch, *args))
+        finally:
+            _SHARED.clear()
+            _SHARED.update(previous)
+        return
+
+    with SharedArrays(arrays) as shared:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(batches)),
+            initializer=_attach,
+            initargs=(shared.spec,)
+        ) as pool:
+            futures = {pool.submit(task, *batch, *args): batch for batch in batches}
+            for future in as_completed(futures):
+                on_result(futures[future], future.result())
+
+
+def run_trials(
+    arrays: Dict[str, np.ndarray],
+    task: Callable,
+    trials: int,
+    args: tuple = (),
+    workers: Optional[int] = None,
+    batch_size: Optional[int] = None,
+    on_batch: Optional[Callable[[int, Dict[str, StreamingDistribution]], None]] = None
+) -> Dict[str, StreamingDistribution]:
+    """
+    Distribute `trials` over the pool and stream batch results together
+
+    Args:
+        arrays: Arrays placed in shared memory (task reads them via _SHARED)
+        task: Module-level fn(start, stop, *args) -> {metric: per-trial array}
+        trials: Number of trials
+        args: Extra task arguments (seed first, by convention)
+        workers: Process count (None = all CPUs, 1 = in-process)
+        batch_size: Trials per task (default: ~4 tasks per worker)
+        on_batch: Called with (completed trials, distributions) after each batch
+
+    Returns:
+        {metric: StreamingDistribution}
+    """
+    workers = resolve_workers(workers)
+    batch_size = batch_size or max(1, -(-trials // (workers * 4)))
+    distributions: Dict[str, StreamingDistribution] = {}
+    completed = [0]
+
+    def merge(batch: Tuple[int, int], result: Dict[str, np.ndarray]):
+        for metric, values in result.items():
+            if metric not in distributions:
+                distributions[metric] = StreamingDistribution(trials)
+            distributions[metric].add(batch[0], values)
+        completed[0] += batch[1] - batch[0]
+        if on_batch:
+            on_batch(completed[0], distributions)
+
+    _run_tasks(arrays, task, _batches(trials, batch_size), args, workers, merge)
+    return distributions
+
+
+def new_seed() -> int:
+    """Fresh 63-bit seed (report it so the run can be reproduced)"""
+    return int(np.random.SeedSequence().entropy % (2 ** 63))
+
+
+def permutation_monte_carlo(
+    close: np.ndarray,
+    signals: Sequence,
+    trials: int,
+    config: KernelConfig,
+    quantity: Optional[np.ndarray] = None,
+    seed: Optional[int] = None,
+    workers: Optional[int] = None,
+    on_batch: Optional[Callable] = None
+) -> Tuple[int, Dict[str, StreamingDistribution]]:
+    """Kernel re-runs on shuffled signals (bar 0 fixed) → (seed, distributions)"""
+    seed = new_seed() if seed is None else seed
+    arrays = {
+        "close": np.asarray(close, dtype=np.float64),
+        "codes": encode_signals(signals)
+    }
+    if quantity is not None:
+        arrays["quantity"] = np.asarray(quantity, dtype=np.float64)
+    return seed, run_trials(arrays, _permutation_task, trials, (seed, config), workers, on_batch=on_batch)
+
+
+def bootstrap_monte_carlo(
+    pnls: Sequence[float],
+    initial_capital: float,
+    trials: int,
+    seed: Optional[int] = None,
+    workers: Optional[int] = None,
+    on_batch: Optional[Callable] = None
+) -> Tuple[int, Dict[str, StreamingDistribution]]:
+    """Trade PnL bootstrap → (seed, distributions)"""
+    seed = new_seed() if seed is None else seed
+    arrays = {"pnls": np.asarray(pnls, dtype=np.float64)}
+    return seed, run_trials(arrays, _bootstrap_task, trials, (seed, initial_capital), workers, on_batch=on_batch)
+
+
+def walk_forward_windows(
+    close: np.ndarray,
+    signals: Sequence,
+    periods: int,
+    config: KernelConfig,
+    workers: Optional[int] = None
+) -> List[Dict[str, float]]:
+    """
+    Split the series into `periods` consecutive windows and simulate each
+    one from a fresh balance, concurrently. Results are in window order.
+    """
+    close = np.asarray(close, dtype=np.float64)
+    n = len(close)
+    periods = max(1, min(periods, n))
+    edges = np.linspace(0, n, periods + 1).astype(int)
+    windows = [(int(a), int(b)) for a, b in zip(edges[:-1], edges[1:]) if b > a]
+
+    results: Dict[int, Dict[str, float]] = {}
+    _run_tasks(
+        {"close": close, "codes": encode_signals(signals)},
+        _window_task,
+        windows,
+        (config,),
+        resolve_workers(workers),
+        lambda window, result: results.__setitem__(window[0], result)
+    )
+    return [results[start] for start, _ in windows]
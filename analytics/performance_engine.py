@@ -15,6 +15,8 @@ Features:
     ✅ Maximum drawdown tracking
     ✅ Group performance comparison
     ✅ Time-series analytics
+    ✅ Incremental metrics (O(1) per trade, constant-time reads)
+    ✅ Windowed views (7d / 30d) from daily ring buckets
 
 Metrics Tracked:
     - Total signals generated
@@ -33,11 +35,12 @@ VERSION: 7.0
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 """
 
+import math
 import time
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
-from collections import deque, defaultdict
+from collections import deque
 from dataclasses import dataclass, asdict
 import numpy as np
 import pandas as pd
@@ -120,6 +123,265 @@ class PerformanceMetrics:
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
 
+# ============================================================================
+# INCREMENTAL METRICS
+# ============================================================================
+
+# Windowed views: name -> days (daily ring buckets)
+PERFORMANCE_WINDOWS = {'7d': 7, '30d': 30}
+
+# signal_data key -> group name in PerformanceMetrics
+GROUP_SCORE_FIELDS = {
+    'tech_group_score': 'technical',
+    'sentiment_group_score': 'sentiment',
+    'ml_group_score': 'ml',
+    'onchain_group_score': 'onchain',
+    'macro_risk_group_score': 'macro_risk'
+}
+
+HIGH_CONFIDENCE = 0.85
+MEDIUM_CONFIDENCE = 0.75
+
+DAY_SECONDS = 86400
+
+
+class MetricsAccumulator:
+    """
+    Running state behind PerformanceMetrics, updated in O(1) per trade
+    
+    - Counts and sums (outcomes, P&L, wins/losses, R:R, durations)
+    - Welford mean / M2 of pnl_percent (Sharpe)
+    - Drawdown state relative to the first trade: end equity, peak,
+      trough and max drawdown
+    - Confidence-bucket and per-group hit counters
+    
+    Accumulators of consecutive periods merge exactly (Chan's parallel
+    variance; drawdown composes through peak / trough), which is what the
+    windowed views are built on.
+    """
+    
+    __slots__ = (
+        'signals', 'trades', 'wins', 'losses', 'breakevens',
+        'pnl', 'pnl_percent', 'win_sum', 'win_max', 'loss_sum', 'loss_max',
+        'rr_sum', 'rr_count', 'duration_sum', 'first_entry', 'last_exit',
+        'ret_mean', 'ret_m2', 'equity', 'peak', 'trough', 'max_drawdown',
+        'high_conf', 'high_conf_wins', 'medium_conf', 'medium_conf_wins',
+        'group_hits', 'group_total'
+    )
+    
+    def __init__(self):
+        self.signals = 0
+        self.trades = 0
+        self.wins = 0
+        self.losses = 0
+        self.breakevens = 0
+        self.pnl = 0.0
+        self.pnl_percent = 0.0
+        self.win_sum = 0.0
+        self.win_max = 0.0
+        self.loss_sum = 0.0
+        self.loss_max = 0.0
+        self.rr_sum = 0.0
+        self.rr_count = 0
+        self.duration_sum = 0.0
+        self.first_entry: Optional[datetime] = None
+        self.last_exit: Optional[datetime] = None
+        self.ret_mean = 0.0
+        self.ret_m2 = 0.0
+        self.equity = 0.0
+        self.peak = 0.0
+        self.trough = 0.0
+        self.max_drawdown = 0.0
+        self.high_conf = 0
+        self.high_conf_wins = 0
+        self.medium_conf = 0
+        self.medium_conf_wins = 0
+        self.group_hits: Dict[str, int] = {}
+        self.group_total: Dict[str, int] = {}
+    
+    def add(self, trade: 'TradeResult', group_hits: Optional[Dict[str, bool]] = None):
+        """Fold one trade in (group_hits: group name -> predicted correctly)"""
+        self.trades += 1
+        is_win = trade.outcome == 'WIN'
+        if is_win:
+            self.wins += 1
+            self.win_sum += trade.pnl
+            self.win_max = max(self.win_max, trade.pnl)
+        elif trade.outcome == 'LOSS':
+            self.losses += 1
+            loss = abs(trade.pnl)
+            self.loss_sum += loss
+            self.loss_max = max(self.loss_max, loss)
+        else:
+            self.breakevens += 1
+        
+        self.pnl += trade.pnl
+        self.pnl_percent += trade.pnl_percent
+        if trade.risk_reward_achieved > 0:
+            self.rr_sum += trade.risk_reward_achieved
+            self.rr_count += 1
+        self.duration_sum += trade.duration_hours
+        if self.first_entry is None or trade.entry_time < self.first_entry:
+            self.first_entry = trade.entry_time
+        if self.last_exit is None or trade.exit_time > self.last_exit:
+            self.last_exit = trade.exit_time
+        
+        # Welford
+        delta = trade.pnl_percent - self.ret_mean
+        self.ret_mean += delta / self.trades
+        self.ret_m2 += delta * (trade.pnl_percent - self.ret_mean)
+        
+        # Drawdown
+        self.equity += trade.pnl
+        if self.equity > self.peak:
+            self.peak = self.equity
+        if self.equity < self.trough:
+            self.trough = self.equity
+        self.max_drawdown = max(self.max_drawdown, self.peak - self.equity)
+        
+        if trade.signal_confidence >= HIGH_CONFIDENCE:
+            self.high_conf += 1
+            self.high_conf_wins += is_win
+        elif trade.signal_confidence >= MEDIUM_CONFIDENCE:
+            self.medium_conf += 1
+            self.medium_conf_wins += is_win
+        
+        for group, hit in (group_hits or {}).items():
+            self.group_total[group] = self.group_total.get(group, 0) + 1
+            self.group_hits[group] = self.group_hits.get(group, 0) + hit
+    
+    def merge(self, later: 'MetricsAccumulator') -> 'MetricsAccumulator':
+        """Fold in the accumulator of the period right after this one"""
+        n_a, n_b = self.trades, later.trades
+        if n_b:
+            n = n_a + n_b
+            delta = later.ret_mean - self.ret_mean
+            self.ret_m2 += later.ret_m2 + delta * delta * n_a * n_b / n
+            self.ret_mean += delta * n_b / n
+            
+            self.max_drawdown = max(self.max_drawdown, later.max_drawdown,
+                                    self.peak - (self.equity + later.trough))
+            self.peak = max(self.peak, self.equity + later.peak)
+            self.trough = min(self.trough, self.equity + later.trough)
+            self.equity += later.equity
+            
+            if later.first_entry is not None and (self.first_entry is None or later.first_entry < self.first_entry):
+                self.first_entry = later.first_entry
+            if later.last_exit is not None and (self.last_exit is None or later.last_exit > self.last_exit):
+                self.last_exit = later.last_exit
+        
+        for name in ('signals', 'trades', 'wins', 'losses', 'breakevens', 'pnl', 'pnl_percent',
+                     'win_sum', 'loss_sum', 'rr_sum', 'rr_count', 'duration_sum',
+                     'high_conf', 'high_conf_wins', 'medium_conf', 'medium_conf_wins'):
+            setattr(self, name, getattr(self, name) + getattr(later, name))
+        self.win_max = max(self.win_max, later.win_max)
+        self.loss_max = max(self.loss_max, later.loss_max)
+        for group, total in later.group_total.items():
+            self.group_total[group] = self.group_total.get(group, 0) + total
+            self.group_hits[group] = self.group_hits.get(group, 0) + later.group_hits.get(group, 0)
+        return self
+    
+    def sharpe_ratio(self) -> float:
+        """Mean / population std of pnl_percent, annualized with sqrt(365)"""
+        if self.trades < 2:
+            return 0.0
+        std = math.sqrt(max(self.ret_m2, 0.0) / self.trades)
+        # M2 of a constant series drifts to ~1e-16 instead of 0
+        if std <= 1e-12 * max(1.0, abs(self.ret_mean)):
+            return 0.0
+        return (self.ret_mean / std) * math.sqrt(365)
+    
+    def group_accuracy(self, group: str) -> float:
+        total = self.group_total.get(group, 0)
+        return self.group_hits.get(group, 0) / total * 100 if total else 0.0
+    
+    def to_metrics(self, total_signals: int) -> 'PerformanceMetrics':
+        """PerformanceMetrics snapshot - O(1), no pass over trades"""
+        n = self.trades
+        if n:
+            trading_days = (self.last_exit - self.first_entry).days + 1
+        else:
+            trading_days = 0
+        return PerformanceMetrics(
+            total_signals=total_signals,
+            total_trades=n,
+            winning_trades=self.wins,
+            losing_trades=self.losses,
+            breakeven_trades=self.breakevens,
+            win_rate=self.wins / n * 100 if n else 0.0,
+            loss_rate=self.losses / n * 100 if n else 0.0,
+            total_pnl=self.pnl,
+            total_pnl_percent=self.pnl_percent,
+            average_win=self.win_sum / self.wins if self.wins else 0.0,
+            average_loss=self.loss_sum / self.losses if self.losses else 0.0,
+            largest_win=self.win_max,
+            largest_loss=self.loss_max,
+            average_rr_achieved=self.rr_sum / self.rr_count if self.rr_count else 0.0,
+            profit_factor=self.win_sum / self.loss_sum if self.loss_sum > 0 else 0.0,
+            sharpe_ratio=self.sharpe_ratio(),
+            max_drawdown=self.max_drawdown,
+            max_drawdown_percent=self.max_drawdown / max(self.peak, 1) * 100,
+            recovery_factor=self.pnl / self.max_drawdown if self.max_drawdown else 0.0,
+            average_trade_duration_hours=self.duration_sum / n if n else 0.0,
+            total_trading_days=trading_days,
+            high_confidence_accuracy=self.high_conf_wins / self.high_conf * 100 if self.high_conf else 0.0,
+            medium_confidence_accuracy=self.medium_conf_wins / self.medium_conf * 100 if self.medium_conf else 0.0,
+            tech_group_accuracy=self.group_accuracy('technical'),
+            sentiment_group_accuracy=self.group_accuracy('sentiment'),
+            ml_group_accuracy=self.group_accuracy('ml'),
+            onchain_group_accuracy=self.group_accuracy('onchain'),
+            macro_risk_group_accuracy=self.group_accuracy('macro_risk')
+        )
+
+
+class WindowedMetrics:
+    """
+    Rolling `days`-day view: a ring of daily MetricsAccumulator buckets
+    (keyed by UTC day of the trade exit). A read merges at most `days`
+    buckets, independent of the number of trades.
+    
+    Buckets merge in day order, so the windowed equity path - and with it
+    max_drawdown - follows exit time; within a day it follows record order.
+    A trade recorded after one that exited on a later UTC day therefore
+    lands in a different spot than in the all-time (record order) figures.
+    """
+    
+    def __init__(self, days: int):
+        self.days = days
+        self._day_ids: List[Optional[int]] = [None] * days
+        self._buckets: List[Optional[MetricsAccumulator]] = [None] * days
+    
+    def _bucket(self, day: int) -> Optional[MetricsAccumulator]:
+        slot = day % self.days
+        current = self._day_ids[slot]
+        if current == day:
+            return self._buckets[slot]
+        if current is not None and current > day:
+            return None  # older than the window
+        self._day_ids[slot] = day
+        self._buckets[slot] = MetricsAccumulator()
+        return self._buckets[slot]
+    
+    def add_trade(self, trade: 'TradeResult', group_hits: Optional[Dict[str, bool]] = None):
+        bucket = self._bucket(int(trade.exit_time.timestamp() // DAY_SECONDS))
+        if bucket is not None:
+            bucket.add(trade, group_hits)
+    
+    def add_signal(self, timestamp: float):
+        bucket = self._bucket(int(timestamp // DAY_SECONDS))
+        if bucket is not None:
+            bucket.signals += 1
+    
+    def snapshot(self, now: Optional[float] = None) -> MetricsAccumulator:
+        """Merged accumulator of the last `days` UTC days (today included)"""
+        today = int((time.time() if now is None else now) // DAY_SECONDS)
+        merged = MetricsAccumulator()
+        for day in range(today - self.days + 1, today + 1):
+            slot = day % self.days
+            if self._day_ids[slot] == day:
+                merged.merge(self._buckets[slot])
+        return merged
+
 # ============================================================================
 # PERFORMANCE ENGINE
 # ============================================================================
@@ -135,6 +397,9 @@ class PerformanceEngine:
         - P&L metrics
         - Risk-adjusted returns
         - Group-level performance
+    
+    Metrics are maintained incrementally (MetricsAccumulator) as trades are
+    recorded; calculate_metrics() is a constant-time read.
     """
     
     def __init__(self, db_manager):
@@ -156,8 +421,11 @@ class PerformanceEngine:
         self.current_drawdown = 0.0
         self.max_drawdown = 0.0
         
-        # Group performance tracking
-        self.group_predictions: Dict[str, List[bool]] = defaultdict(list)
+        # Incremental metrics: all-time + windowed (7d / 30d)
+        self.accumulator = MetricsAccumulator()
+        self.windows: Dict[str, WindowedMetrics] = {
+            name: WindowedMetrics(days) for name, days in PERFORMANCE_WINDOWS.items()
+        }
         
         # Time series data
         self.equity_curve: List[Tuple[datetime, float]] = []
@@ -257,8 +525,12 @@ class PerformanceEngine:
         self.equity_curve.append((exit_time, self.running_pnl))
         
         # Track group performance if data available
-        if signal_data:
-            self._track_group_performance(signal_data, outcome)
+        group_hits = self._track_group_performance(signal_data, outcome) if signal_data else None
+        
+        # Incremental metrics
+        self.accumulator.add(trade, group_hits)
+        for window in self.windows.values():
+            window.add_trade(trade, group_hits)
         
         self.stats['total_trades_executed'] += 1
         self.stats['last_update'] = datetime.now()
@@ -274,163 +546,50 @@ class PerformanceEngine:
     def record_signal_generated(self, signal: Dict[str, Any]):
         """Record that a signal was generated"""
         self.stats['total_signals_generated'] += 1
+        now = time.time()
+        for window in self.windows.values():
+            window.add_signal(now)
     
     # ========================================================================
     # METRICS CALCULATION
     # ========================================================================
     
-    def calculate_metrics(self) -> PerformanceMetrics:
+    def calculate_metrics(self, window: Optional[str] = None) -> PerformanceMetrics:
         """
         Calculate comprehensive performance metrics
         
+        Constant time: read from the running accumulator (all-time) or from
+        at most 30 daily buckets (windowed).
+        
+        Args:
+            window: None for all-time, or a PERFORMANCE_WINDOWS key ('7d', '30d')
+        
         Returns:
             PerformanceMetrics object
         """
-        if not self.trade_results:
-            return self._empty_metrics()
-        
-        trades = self.trade_results
-        
-        # Basic counts
-        total_trades = len(trades)
-        winning_trades = sum(1 for t in trades if t.outcome == 'WIN')
-        losing_trades = sum(1 for t in trades if t.outcome == 'LOSS')
-        breakeven_trades = sum(1 for t in trades if t.outcome == 'BREAKEVEN')
-        
-        # Win rates
-        win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0
-        loss_rate = (losing_trades / total_trades * 100) if total_trades > 0 else 0
-        
-        # P&L metrics
-        total_pnl = sum(t.pnl for t in trades)
-        total_pnl_percent = sum(t.pnl_percent for t in trades)
-        
-        wins = [t.pnl for t in trades if t.outcome == 'WIN']
-        losses = [abs(t.pnl) for t in trades if t.outcome == 'LOSS']
-        
-        average_win = np.mean(wins) if wins else 0
-        average_loss = np.mean(losses) if losses else 0
-        largest_win = max(wins) if wins else 0
-        largest_loss = max(losses) if losses else 0
-        
-        # Risk metrics
-        average_rr = np.mean([t.risk_reward_achieved for t in trades if t.risk_reward_achieved > 0])
-        average_rr = average_rr if not np.isnan(average_rr) else 0
-        
-        # Profit factor
-        total_wins = sum(wins)
-        total_losses = sum(losses)
-        profit_factor = (total_wins / total_losses) if total_losses > 0 else 0
-        
-        # Sharpe ratio
-        sharpe_ratio = self._calculate_sharpe_ratio(trades)
-        
-        # Drawdown
-        max_dd_percent = (self.max_drawdown / max(self.peak_balance, 1)) * 100
-        
-        # Recovery factor
-        recovery_factor = (total_pnl / abs(self.max_drawdown)) if self.max_drawdown != 0 else 0
-        
-        # Average trade duration
-        avg_duration = np.mean([t.duration_hours for t in trades])
-        
-        # Trading days
-        if trades:
-            first_trade = min(t.entry_time for t in trades)
-            last_trade = max(t.exit_time for t in trades)
-            trading_days = (last_trade - first_trade).days + 1
-        else:
-            trading_days = 0
-        
-        # Confidence-based accuracy
-        high_conf_trades = [t for t in trades if t.signal_confidence >= 0.85]
-        medium_conf_trades = [t for t in trades if 0.75 <= t.signal_confidence < 0.85]
-        
-        high_conf_accuracy = (
-            sum(1 for t in high_conf_trades if t.outcome == 'WIN') / 
-            len(high_conf_trades) * 100
-        ) if high_conf_trades else 0
-        
-        medium_conf_accuracy = (
-            sum(1 for t in medium_conf_trades if t.outcome == 'WIN') / 
-            len(medium_conf_trades) * 100
-        ) if medium_conf_trades else 0
-        
-        # Group accuracies
-        group_accuracies = self._calculate_group_accuracies()
-        
-        return PerformanceMetrics(
-            total_signals=self.stats['total_signals_generated'],
-            total_trades=total_trades,
-            winning_trades=winning_trades,
-            losing_trades=losing_trades,
-            breakeven_trades=breakeven_trades,
-            win_rate=win_rate,
-            loss_rate=loss_rate,
-            total_pnl=total_pnl,
-            total_pnl_percent=total_pnl_percent,
-            average_win=average_win,
-            average_loss=average_loss,
-            largest_win=largest_win,
-            largest_loss=largest_loss,
-            average_rr_achieved=average_rr,
-            profit_factor=profit_factor,
-            sharpe_ratio=sharpe_ratio,
-            max_drawdown=self.max_drawdown,
-            max_drawdown_percent=max_dd_percent,
-            recovery_factor=recovery_factor,
-            average_trade_duration_hours=avg_duration,
-            total_trading_days=trading_days,
-            high_confidence_accuracy=high_conf_accuracy,
-            medium_confidence_accuracy=medium_conf_accuracy,
-            tech_group_accuracy=group_accuracies['technical'],
-            sentiment_group_accuracy=group_accuracies['sentiment'],
-            ml_group_accuracy=group_accuracies['ml'],
-            onchain_group_accuracy=group_accuracies['onchain'],
-            macro_risk_group_accuracy=group_accuracies['macro_risk']
-        )
-    
-    def get_current_metrics(self) -> Dict[str, Any]:
+        if window is None:
+            return self.accumulator.to_metrics(self.stats['total_signals_generated'])
+        if window not in self.windows:
+            raise ValueError(f"Unknown window {window!r}; available: {list(self.windows)}")
+        snapshot = self.windows[window].snapshot()
+        return snapshot.to_metrics(snapshot.signals)
+    
+    def get_current_metrics(self, window: Optional[str] = None) -> Dict[str, Any]:
         """Get current performance metrics as dictionary"""
-        metrics = self.calculate_metrics()
+        metrics = self.calculate_metrics(window)
         return metrics.to_dict()
     
+    def get_windowed_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Metrics for every window: {'7d': {...}, '30d': {...}}"""
+        return {name: self.get_current_metrics(name) for name in self.windows}
+    
     def update_metrics(self) -> Dict[str, Any]:
         """Update and return current metrics"""
         return self.get_current_metrics()
     
     def _empty_metrics(self) -> PerformanceMetrics:
         """Return empty metrics object"""
-        return PerformanceMetrics(
-            total_signals=self.stats['total_signals_generated'],
-            total_trades=0,
-            winning_trades=0,
-            losing_trades=0,
-            breakeven_trades=0,
-            win_rate=0.0,
-            loss_rate=0.0,
-            total_pnl=0.0,
-            total_pnl_percent=0.0,
-            average_win=0.0,
-            average_loss=0.0,
-            largest_win=0.0,
-            largest_loss=0.0,
-            average_rr_achieved=0.0,
-            profit_factor=0.0,
-            sharpe_ratio=0.0,
-            max_drawdown=0.0,
-            max_drawdown_percent=0.0,
-            recovery_factor=0.0,
-            average_trade_duration_hours=0.0,
-            total_trading_days=0,
-            high_confidence_accuracy=0.0,
-            medium_confidence_accuracy=0.0,
-            tech_group_accuracy=0.0,
-            sentiment_group_accuracy=0.0,
-            ml_group_accuracy=0.0,
-            onchain_group_accuracy=0.0,
-            macro_risk_group_accuracy=0.0
-        )
+        return MetricsAccumulator().to_metrics(self.stats['total_signals_generated'])
     
     # ========================================================================
     # ADVANCED METRICS
@@ -471,46 +630,22 @@ class PerformanceEngine:
         if self.current_drawdown > self.max_drawdown:
             self.max_drawdown = self.current_drawdown
     
-    def _track_group_performance(self, signal_data: Dict[str, Any], outcome: str):
-        """Track individual group performance"""
+    def _track_group_performance(self, signal_data: Dict[str, Any], outcome: str) -> Dict[str, bool]:
+        """Per-group hit flags for one trade (group name -> predicted correctly)"""
         is_win = (outcome == 'WIN')
+        hits = {}
         
-        groups = [
-            'tech_group_score',
-            'sentiment_group_score',
-            'ml_group_score',
-            'onchain_group_score',
-            'macro_risk_group_score'
-        ]
-        
-        for group in groups:
-            if group in signal_data:
-                score = signal_data[group]
+        for field, group in GROUP_SCORE_FIELDS.items():
+            if field in signal_data:
+                score = signal_data[field]
                 # If group predicted correctly (high score and win, or low score and loss)
-                predicted_correctly = (score > 0.55 and is_win) or (score < 0.45 and not is_win)
-                self.group_predictions[group].append(predicted_correctly)
+                hits[group] = (score > 0.55 and is_win) or (score < 0.45 and not is_win)
+        
+        return hits
     
     def _calculate_group_accuracies(self) -> Dict[str, float]:
         """Calculate accuracy for each group"""
-        accuracies = {}
-        
-        group_mapping = {
-            'tech_group_score': 'technical',
-            'sentiment_group_score': 'sentiment',
-            'ml_group_score': 'ml',
-            'onchain_group_score': 'onchain',
-            'macro_risk_group_score': 'macro_risk'
-        }
-        
-        for group_key, group_name in group_mapping.items():
-            predictions = self.group_predictions.get(group_key, [])
-            if predictions:
-                accuracy = sum(predictions) / len(predictions) * 100
-            else:
-                accuracy = 0.0
-            accuracies[group_name] = accuracy
-        
-        return accuracies
+        return {group: self.accumulator.group_accuracy(group) for group in GROUP_SCORE_FIELDS.values()}
     
     # ========================================================================
     # TIME-SERIES ANALYTICS
@@ -15,6 +15,7 @@ Endpoints:
 - /api/signals/onchain?symbol=BTCUSDT
 - /api/signals/risk?symbol=BTCUSDT
 - /api/meta_signal?symbol=BTCUSDT (⭐ NEW v8.0 PHASE 2)
+  (all five groups served by one GroupSignalService: concurrent, cached, single-flight)
 - /api/smart-money/recent?limit=5
 - /api/arbitrage/opportunities?min_spread=0.1
 - /api/patterns/detected?min_confidence=0.7
@@ -27,16 +28,451 @@ Date: 2025-11-23 (FIXED: global_state price reading)
 ════════════════════════════════════════════════════════════════════════════════════════
 """
 
+import os
 import logging
+import threading
 import traceback
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout, wait
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable, Iterable
 from flask import jsonify, request
 
+from utils.tiered_cache import get_cache
+
 # Setup logger
 logger = logging.getLogger('GROUP_SIGNAL_API')
 
 
+GROUPS = ('technical', 'sentiment', 'ml', 'onchain', 'risk')
+
+# 'source' field of each group endpoint response
+GROUP_SOURCES = {
+    'technical': 'real_exchange_data',
+    'sentiment': 'multi_source_sentiment',
+    'ml': 'ml_ensemble',
+    'onchain': 'onchain_analytics',
+    'risk': 'advanced_risk_engine',
+}
+
+# Group results are reused for this long per (symbol, timeframe)
+GROUP_SIGNAL_TTL = float(os.getenv('GROUP_SIGNAL_TTL', '5'))
+# Upper bound a request waits for a group computation
+GROUP_SIGNAL_DEADLINE = float(os.getenv('GROUP_SIGNAL_DEADLINE', '10'))
+
+
+class GroupSignalService:
+    """
+    In-process group signal service shared by all group endpoints.
+
+    - The five groups are computed concurrently on a small thread pool, so a
+      meta-signal costs the slowest group instead of the sum of all five
+    - Each group result is cached per (group, symbol, timeframe) for `ttl`
+      seconds (tiered cache, `group_signals` namespace)
+    - Single-flight: concurrent requests for the same key (groups and the
+      meta signal) wait on the one computation already running
+    """
+
+    def __init__(self, orchestrator, ttl: float = GROUP_SIGNAL_TTL,
+                 deadline: float = GROUP_SIGNAL_DEADLINE, max_workers: int = 10):
+        self.orchestrator = orchestrator
+        self.ttl = ttl
+        self.deadline = deadline
+        self.cache = get_cache('group_signals')
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='group-signal')
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._builders: Dict[str, Callable[[str, str], Optional[Dict[str, Any]]]] = {
+            'technical': self._build_technical,
+            'sentiment': self._build_sentiment,
+            'ml': self._build_ml,
+            'onchain': self._build_onchain,
+            'risk': self._build_risk,
+        }
+        self._meta_interpreter = None
+        self.stats = {'cache_hits': 0, 'computed': 0, 'shared': 0, 'timeouts': 0}
+
+    # ────────────────────────────────────────────────────────────────────────────
+    # Cache + single-flight
+    # ────────────────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _key(group: str, symbol: str, timeframe: str) -> str:
+        return f"{group}:{symbol}:{timeframe}"
+
+    def _count(self, stat: str, n: int = 1):
+        with self._lock:
+            self.stats[stat] += n
+
+    def _future(self, group: str, symbol: str, timeframe: str) -> Future:
+        key = self._key(group, symbol, timeframe)
+        cached = self.cache.get(key)
+        if cached is not None:
+            self._count('cache_hits')
+            future = Future()
+            future.set_result(cached)
+            return future
+
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                self.stats['shared'] += 1
+                return future
+            future = self.executor.submit(self._compute, key, group, symbol, timeframe)
+            self._inflight[key] = future
+        future.add_done_callback(lambda f, k=key: self._clear_inflight(k, f))
+        return future
+
+    def _clear_inflight(self, key: str, future: Future):
+        with self._lock:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def _compute(self, key: str, group: str, symbol: str, timeframe: str) -> Optional[Dict[str, Any]]:
+        signal = self._builders[group](symbol, timeframe)
+        self._count('computed')
+        if signal is not None:
+            self.cache.set(key, signal, ttl=self.ttl, stale_ttl=0)
+        return signal
+
+    def get_group(self, group: str, symbol: str, timeframe: str = '1h') -> Optional[Dict[str, Any]]:
+        """One group signal (None if unavailable or not ready within the deadline)"""
+        try:
+            return self._future(group, symbol, timeframe).result(timeout=self.deadline)
+        except FutureTimeout:
+            self._count('timeouts')
+            logger.warning(f"⚠️ {group.upper()} signal for {symbol} not ready within {self.deadline:.0f}s")
+            return None
+
+    def get_groups(self, symbol: str, timeframe: str = '1h',
+                   groups: Iterable[str] = GROUPS) -> Dict[str, Dict[str, Any]]:
+        """All requested groups concurrently; groups that fail or miss the deadline are left out"""
+        futures = {self._future(group, symbol, timeframe): group for group in groups}
+        done, not_done = wait(futures, timeout=self.deadline)
+
+        signals = {}
+        for future in done:
+            group = futures[future]
+            try:
+                signal = future.result()
+            except Exception as e:
+                logger.warning(f"{group.capitalize()} signal fetch error: {e}")
+                continue
+            if signal is not None:
+                signals[group] = signal
+        if not_done:
+            self._count('timeouts', len(not_done))
+            logger.warning(f"⚠️ Groups not ready within {self.deadline:.0f}s: {', '.join(futures[f] for f in not_done)}")
+        return {group: signals[group] for group in groups if group in signals}
+
+    def get_meta_signal(self, symbol: str, timeframe: str = '1h') -> Optional[Dict[str, Any]]:
+        """
+        AI meta-layer signal over the five groups (cached and single-flighted
+        like the groups themselves). The first request computes on its own
+        thread - not on the pool, whose workers it waits on for the groups -
+        and publishes a Future in _inflight for concurrent requests.
+        """
+        key = self._key('meta', symbol, timeframe)
+        cached = self.cache.get(key)
+        if cached is not None:
+            self._count('cache_hits')
+            return cached
+
+        interpreter = self._get_meta_interpreter()
+        if interpreter is None:
+            return None
+
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+            else:
+                self.stats['shared'] += 1
+        if not leader:
+            try:
+                # The leader is bounded by the group deadline plus interpretation
+                return future.result(timeout=2 * self.deadline)
+            except FutureTimeout:
+                self._count('timeouts')
+                logger.warning(f"⚠️ META signal for {symbol} not ready within {2 * self.deadline:.0f}s")
+                return None
+
+        try:
+            meta_signal = self._compute_meta(interpreter, key, symbol, timeframe)
+            future.set_result(meta_signal)
+            return meta_signal
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            self._clear_inflight(key, future)
+
+    def _compute_meta(self, interpreter, key: str, symbol: str, timeframe: str) -> Dict[str, Any]:
+        group_signals = self.get_groups(symbol, timeframe)
+        meta_signal = interpreter.interpret_group_signals(
+            symbol=symbol,
+            group_signals=group_signals,
+            current_price=self._current_price(symbol)
+        )
+        self._count('computed')
+        if meta_signal.get('analysis_complete'):
+            self.cache.set(key, meta_signal, ttl=self.ttl, stale_ttl=0)
+        return meta_signal
+
+    def _get_meta_interpreter(self):
+        if self._meta_interpreter is None:
+            try:
+                from advanced_ai.ai_meta_interpreter import AIMetaInterpreter
+                self._meta_interpreter = AIMetaInterpreter()
+            except ImportError as e:
+                logger.error(f"❌ AI Meta-Interpreter not available: {e}")
+                return None
+        return self._meta_interpreter
+
+    def get_metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            inflight = len(self._inflight)
+        return {**self.stats, 'inflight': inflight, 'ttl': self.ttl}
+
+    # ────────────────────────────────────────────────────────────────────────────
+    # Group builders (run on the pool)
+    # ────────────────────────────────────────────────────────────────────────────
+
+    def _current_price(self, symbol: str) -> Optional[float]:
+        """Real-time price: global_state (PriceFetcherFallback) first, exchange_api second"""
+        orchestrator = self.orchestrator
+        current_price = None
+        
+        # 🔍 Önce global_state'den oku (PriceFetcherFallback ile dolduruluyor!)
+        try:
+            if hasattr(orchestrator, 'global_state') and orchestrator.global_state:
+                market_point = orchestrator.global_state.market_data.get(symbol)
+                if market_point:
+                    current_price = float(getattr(market_point, 'price', 0) or 0)
+                    logger.debug(f"[PRICE_DEBUG] ✅ Got price from global_state: ${current_price:,.2f}")
+        except Exception as eg:
+            logger.warning(f"Failed to get real-time price from global_state: {eg}")
+        
+        # Hala yok ise eski exchange_api fallback
+        if (not current_price or current_price == 0) and orchestrator.exchange_api:
+            try:
+                logger.debug(f"[PRICE_DEBUG] Fallback: trying exchange_api")
+                if hasattr(orchestrator.exchange_api, 'get_current_price'):
+                    current_price = orchestrator.exchange_api.get_current_price(symbol)
+                    ticker = {'last': current_price} if current_price else None
+                elif hasattr(orchestrator.exchange_api, 'get_ticker'):
+                    ticker = orchestrator.exchange_api.get_ticker(symbol)
+                else:
+                    ticker = None
+                current_price = float(ticker.get('last', 0)) if ticker else None
+            except Exception as e:
+                logger.warning(f"Failed to get real-time price from exchange_api: {e}")
+        
+        return current_price or None
+
+    def _build_technical(self, symbol: str, timeframe: str) -> Optional[Dict[str, Any]]:
+        """TECHNICAL group (28 indicators); None when no real-time price is available"""
+        orchestrator = self.orchestrator
+        current_price = self._current_price(symbol)
+        
+        # If no real price, cannot generate signal
+        if not current_price:
+            logger.error(f"[PRICE_DEBUG] ❌ No price available for '{symbol}'")
+            return None
+        
+        # Calculate technical indicators
+        technical_signal = {
+            'symbol': symbol,
+            'timeframe': timeframe,
+            'direction': 'NEUTRAL',
+            'strength': 0.0,
+            'confidence': 0.0,
+            'entry_price': 0,
+            'tp1': 0,
+            'tp2': 0,
+            'tp3': 0,
+            'stop_loss': 0,
+            'risk_reward_ratio': 0.0,
+            'indicators': {},
+            'timestamp': datetime.now(timezone.utc).isoformat()
+        }
+        
+        # Try to get signal from orchestrator modules
+        if orchestrator.signal_engine:
+            try:
+                signal = orchestrator.signal_engine.generate_technical_signal(symbol, timeframe)
+                if signal and not signal.get('mock_detected', False):
+                    technical_signal.update(signal)
+                    logger.info(f"✅ TECHNICAL signal generated: {signal.get('direction', 'NEUTRAL')}")
+            except Exception as e:
+                logger.error(f"Signal engine error: {e}")
+        
+        # If no signal from engine, generate basic signal from current price
+        if technical_signal['direction'] == 'NEUTRAL' and current_price:
+            # Calculate basic support/resistance levels
+            atr_estimate = current_price * 0.02  # 2% ATR estimate
+            technical_signal.update({
+                'entry_price': current_price,
+                'tp1': current_price + (atr_estimate * 1),
+                'tp2': current_price + (atr_estimate * 2),
+                'tp3': current_price + (atr_estimate * 3),
+                'stop_loss': current_price - (atr_estimate * 1.5),
+                'risk_reward_ratio': 2.0,
+                'strength': 0.5,
+                'confidence': 0.6,
+                'indicators': {
+                    'current_price': current_price,
+                    'atr': atr_estimate
+                }
+            })
+        
+        return technical_signal
+
+    def _build_sentiment(self, symbol: str, timeframe: str) -> Dict[str, Any]:
+        """SENTIMENT group (20 sources)"""
+        sentiment_signal = {
+            'symbol': symbol,
+            'direction': 'NEUTRAL',
+            'strength': 0.5,
+            'confidence': 0.5,
+            'entry_price': 0,
+            'tp1': 0,
+            'tp2': 0,
+            'tp3': 0,
+            'stop_loss': 0,
+            'risk_reward_ratio': 2.0,
+            'sources': {
+                'twitter': 0.5,
+                'reddit': 0.5,
+                'news': 0.5,
+                'fear_greed': 50
+            },
+            'timestamp': datetime.now(timezone.utc).isoformat()
+        }
+        
+        # Try to get real sentiment data
+        if self.orchestrator.sentiment_v2:
+            try:
+                sentiment = self.orchestrator.sentiment_v2.analyze_multi_source_sentiment()
+                if sentiment and not sentiment.get('mock_detected', False):
+                    score = sentiment.get('score', 0.5)
+                    # Convert sentiment score to trading signal
+                    if score > 0.6:
+                        sentiment_signal['direction'] = 'LONG'
+                        sentiment_signal['strength'] = min(score, 1.0)
+                    elif score < 0.4:
+                        sentiment_signal['direction'] = 'SHORT'
+                        sentiment_signal['strength'] = min(1 - score, 1.0)
+                    sentiment_signal['confidence'] = sentiment.get('confidence', 0.5)
+                    sentiment_signal['sources'] = sentiment.get('sources', {})
+                    logger.info(f"✅ SENTIMENT signal: {sentiment_signal['direction']}")
+            except Exception as e:
+                logger.error(f"Sentiment engine error: {e}")
+        
+        return sentiment_signal
+
+    def _build_ml(self, symbol: str, timeframe: str) -> Dict[str, Any]:
+        """MACHINE LEARNING group (10 models)"""
+        ml_signal = {
+            'symbol': symbol,
+            'direction': 'NEUTRAL',
+            'strength': 0.5,
+            'confidence': 0.5,
+            'entry_price': 0,
+            'tp1': 0,
+            'tp2': 0,
+            'stop_loss': 0,
+            'risk_reward_ratio': 2.0,
+            'models': {
+                'lstm': 0.5,
+                'xgboost': 0.5,
+                'random_forest': 0.5,
+                'transformer': 0.5
+            },
+            'ensemble_vote': 'NEUTRAL',
+            'timestamp': datetime.now(timezone.utc).isoformat()
+        }
+        
+        # Try ML ensemble model
+        if self.orchestrator.ensemble_model:
+            try:
+                prediction = self.orchestrator.ensemble_model.predict(symbol)
+                if prediction and not prediction.get('mock_detected', False):
+                    ml_signal.update(prediction)
+                    logger.info(f"✅ ML signal: {prediction.get('direction', 'NEUTRAL')}")
+            except Exception as e:
+                logger.error(f"ML ensemble error: {e}")
+        
+        return ml_signal
+
+    def _build_onchain(self, symbol: str, timeframe: str) -> Dict[str, Any]:
+        """ON-CHAIN group (6 metrics)"""
+        onchain_signal = {
+            'symbol': symbol,
+            'direction': 'NEUTRAL',
+            'strength': 0.5,
+            'confidence': 0.5,
+            'entry_price': 0,
+            'tp1': 0,
+            'tp2': 0,
+            'stop_loss': 0,
+            'risk_reward_ratio': 2.0,
+            'metrics': {
+                'whale_netflow': 0,
+                'exchange_reserve': 0,
+                'active_addresses': 0,
+                'transaction_volume': 0
+            },
+            'timestamp': datetime.now(timezone.utc).isoformat()
+        }
+        
+        # Try on-chain analytics
+        if self.orchestrator.onchain_pro:
+            try:
+                analysis = self.orchestrator.onchain_pro.analyze_onchain_metrics()
+                if analysis and not analysis.get('mock_detected', False):
+                    onchain_signal.update(analysis)
+                    logger.info(f"✅ ON-CHAIN signal: {analysis.get('direction', 'NEUTRAL')}")
+            except Exception as e:
+                logger.error(f"On-chain analytics error: {e}")
+        
+        return onchain_signal
+
+    def _build_risk(self, symbol: str, timeframe: str) -> Dict[str, Any]:
+        """RISK group (5 engines)"""
+        risk_signal = {
+            'symbol': symbol,
+            'direction': 'NEUTRAL',
+            'strength': 0.5,
+            'confidence': 0.5,
+            'entry_price': 0,
+            'tp1': 0,
+            'tp2': 0,
+            'stop_loss': 0,
+            'risk_reward_ratio': 2.0,
+            'risk_metrics': {
+                'var': 0,
+                'sharpe_ratio': 0,
+                'kelly_criterion': 0,
+                'max_drawdown': 0,
+                'position_size': 0
+            },
+            'timestamp': datetime.now(timezone.utc).isoformat()
+        }
+        
+        # Try advanced risk engine
+        if self.orchestrator.risk_engine_v2:
+            try:
+                risk_report = self.orchestrator.risk_engine_v2.calculate_portfolio_risk()
+                if risk_report and not risk_report.get('mock_detected', False):
+                    risk_signal['risk_metrics'] = risk_report
+                    logger.info(f"✅ RISK assessment complete")
+            except Exception as e:
+                logger.error(f"Risk engine error: {e}")
+        
+        return risk_signal
+
+
 def register_group_signal_routes(app, orchestrator):
     """
     Register all 5-group signal API routes to Flask app
@@ -46,138 +482,68 @@ def register_group_signal_routes(app, orchestrator):
         orchestrator: DemirUltraComprehensiveOrchestrator instance
     """
     
-    # ════════════════════════════════════════════════════════════════════════════════
-    # TECHNICAL GROUP SIGNAL ENDPOINT
-    # ════════════════════════════════════════════════════════════════════════════════
+    # One service per app: cached, concurrent group computations shared by all endpoints
+    service = GroupSignalService(orchestrator)
+    app.extensions['group_signal_service'] = service
     
-    @app.route('/api/signals/technical', methods=['GET'])
-    def api_signals_technical():
-        """
-        Get TECHNICAL group signal for a symbol (28 indicators)
-        
-        Query Params:
-            - symbol: Trading pair (default: BTCUSDT)
-            - timeframe: Time period (default: 1h)
-        
-        Returns:
-            JSON with technical analysis signal including:
-            - direction: LONG/SHORT/NEUTRAL
-            - strength: 0.0 to 1.0
-            - confidence: 0.0 to 1.0
-            - entry_price, tp1, tp2, tp3, stop_loss
-            - risk_reward_ratio
-            - indicators: Individual indicator values
-        """
+    def _request_params():
+        symbol = request.args.get('symbol', 'BTCUSDT').strip().upper()
+        timeframe = request.args.get('timeframe', '1h')
+        return symbol, timeframe
+    
+    def _group_response(group: str):
         try:
-            symbol = request.args.get('symbol', 'BTCUSDT').strip().upper()
-            timeframe = request.args.get('timeframe', '1h')
-            
-            logger.info(f"[PRICE_DEBUG] TECHNICAL API: symbol='{symbol}' | timeframe={timeframe}")
-            
-            # Get real-time price first
-            current_price = None
-            
-            # 🔍 Önce global_state'den oku (PriceFetcherFallback ile dolduruluyor!)
-            try:
-                if hasattr(orchestrator, 'global_state') and orchestrator.global_state:
-                    logger.info(f"[PRICE_DEBUG] Checking global_state market_data for '{symbol}'")
-                    logger.info(f"[PRICE_DEBUG] Available keys: {list(orchestrator.global_state.market_data.keys())}")
-                    market_point = orchestrator.global_state.market_data.get(symbol)
-                    if market_point:
-                        current_price = float(getattr(market_point, 'price', 0) or 0)
-                        logger.info(f"[PRICE_DEBUG] ✅ Got price from global_state: ${current_price:,.2f}")
-            except Exception as eg:
-                logger.warning(f"Failed to get real-time price from global_state: {eg}")
-            
-            # Hala yok ise eski exchange_api fallback
-            if (not current_price or current_price == 0) and orchestrator.exchange_api:
-                try:
-                    logger.info(f"[PRICE_DEBUG] Fallback: trying exchange_api")
-                    if hasattr(orchestrator.exchange_api, 'get_current_price'):
-                        current_price = orchestrator.exchange_api.get_current_price(symbol)
-                        ticker = {'last': current_price} if current_price else None
-                    elif hasattr(orchestrator.exchange_api, 'get_ticker'):
-                        ticker = orchestrator.exchange_api.get_ticker(symbol)
-                    else:
-                        ticker = None
-                    current_price = float(ticker.get('last', 0)) if ticker else None
-                except Exception as e:
-                    logger.warning(f"Failed to get real-time price from exchange_api: {e}")
+            symbol, timeframe = _request_params()
+            signal = service.get_group(group, symbol, timeframe)
             
-            # If no real price, cannot generate signal
-            if not current_price or current_price == 0:
-                logger.error(f"[PRICE_DEBUG] ❌ No price available for '{symbol}'")
+            if signal is None:
                 return jsonify({
                     'status': 'error',
-                    'error': 'Real-time price not available',
+                    'error': 'Real-time price not available' if group == 'technical' else 'Signal not available',
                     'symbol': symbol,
                     'message': 'Waiting for real exchange data...',
                     'timestamp': datetime.now(timezone.utc).isoformat()
                 }), 503
             
-            logger.info(f"[PRICE_DEBUG] ✅ Final price for '{symbol}': ${current_price:,.2f}")
-            
-            # Calculate technical indicators
-            technical_signal = {
-                'symbol': symbol,
-                'timeframe': timeframe,
-                'direction': 'NEUTRAL',
-                'strength': 0.0,
-                'confidence': 0.0,
-                'entry_price': 0,
-                'tp1': 0,
-                'tp2': 0,
-                'tp3': 0,
-                'stop_loss': 0,
-                'risk_reward_ratio': 0.0,
-                'indicators': {},
-                'timestamp': datetime.now(timezone.utc).isoformat()
-            }
-            
-            # Try to get signal from orchestrator modules
-            if orchestrator.signal_engine:
-                try:
-                    signal = orchestrator.signal_engine.generate_technical_signal(symbol, timeframe)
-                    if signal and not signal.get('mock_detected', False):
-                        technical_signal.update(signal)
-                        logger.info(f"✅ TECHNICAL signal generated: {signal.get('direction', 'NEUTRAL')}")
-                except Exception as e:
-                    logger.error(f"Signal engine error: {e}")
-            
-            # If no signal from engine, generate basic signal from current price
-            if technical_signal['direction'] == 'NEUTRAL' and current_price:
-                # Calculate basic support/resistance levels
-                atr_estimate = current_price * 0.02  # 2% ATR estimate
-                technical_signal.update({
-                    'entry_price': current_price,
-                    'tp1': current_price + (atr_estimate * 1),
-                    'tp2': current_price + (atr_estimate * 2),
-                    'tp3': current_price + (atr_estimate * 3),
-                    'stop_loss': current_price - (atr_estimate * 1.5),
-                    'risk_reward_ratio': 2.0,
-                    'strength': 0.5,
-                    'confidence': 0.6,
-                    'indicators': {
-                        'current_price': current_price,
-                        'atr': atr_estimate
-                    }
-                })
-            
             return jsonify({
                 'status': 'success',
-                'signal': technical_signal,
-                'source': 'real_exchange_data',
+                'signal': signal,
+                'source': GROUP_SOURCES[group],
                 'timestamp': datetime.now(timezone.utc).isoformat()
             }), 200
             
         except Exception as e:
-            logger.error(f"❌ TECHNICAL endpoint error: {e}")
+            logger.error(f"❌ {group.upper()} endpoint error: {e}")
             logger.error(traceback.format_exc())
             return jsonify({
                 'status': 'error',
                 'error': str(e),
                 'timestamp': datetime.now(timezone.utc).isoformat()
             }), 500
+    
+    # ════════════════════════════════════════════════════════════════════════════════
+    # TECHNICAL GROUP SIGNAL ENDPOINT
+    # ════════════════════════════════════════════════════════════════════════════════
+    
+    @app.route('/api/signals/technical', methods=['GET'])
+    def api_signals_technical():
+        """
+        Get TECHNICAL group signal for a symbol (28 indicators)
+        
+        Query Params:
+            - symbol: Trading pair (default: BTCUSDT)
+            - timeframe: Time period (default: 1h)
+        
+        Returns:
+            JSON with technical analysis signal including:
+            - direction: LONG/SHORT/NEUTRAL
+            - strength: 0.0 to 1.0
+            - confidence: 0.0 to 1.0
+            - entry_price, tp1, tp2, tp3, stop_loss
+            - risk_reward_ratio
+            - indicators: Individual indicator values
+        """
+        return _group_response('technical')
 
     # ════════════════════════════════════════════════════════════════════════════════
     # SENTIMENT GROUP SIGNAL ENDPOINT
@@ -188,60 +554,7 @@ def register_group_signal_routes(app, orchestrator):
         """
         Get SENTIMENT group signal for a symbol (20 sources)
         """
-        try:
-            symbol = request.args.get('symbol', 'BTCUSDT')
-            
-            logger.info(f"💬 SENTIMENT signal requested: {symbol}")
-            
-            sentiment_signal = {
-                'symbol': symbol,
-                'direction': 'NEUTRAL',
-                'strength': 0.5,
-                'confidence': 0.5,
-                'entry_price': 0,
-                'tp1': 0,
-                'tp2': 0,
-                'tp3': 0,
-                'stop_loss': 0,
-                'risk_reward_ratio': 2.0,
-                'sources': {
-                    'twitter': 0.5,
-                    'reddit': 0.5,
-                    'news': 0.5,
-                    'fear_greed': 50
-                },
-                'timestamp': datetime.now(timezone.utc).isoformat()
-            }
-            
-            # Try to get real sentiment data
-            if orchestrator.sentiment_v2:
-                try:
-                    sentiment = orchestrator.sentiment_v2.analyze_multi_source_sentiment()
-                    if sentiment and not sentiment.get('mock_detected', False):
-                        score = sentiment.get('score', 0.5)
-                        # Convert sentiment score to trading signal
-                        if score > 0.6:
-                            sentiment_signal['direction'] = 'LONG'
-                            sentiment_signal['strength'] = min(score, 1.0)
-                        elif score < 0.4:
-                            sentiment_signal['direction'] = 'SHORT'
-                            sentiment_signal['strength'] = min(1 - score, 1.0)
-                        sentiment_signal['confidence'] = sentiment.get('confidence', 0.5)
-                        sentiment_signal['sources'] = sentiment.get('sources', {})
-                        logger.info(f"✅ SENTIMENT signal: {sentiment_signal['direction']}")
-                except Exception as e:
-                    logger.error(f"Sentiment engine error: {e}")
-            
-            return jsonify({
-                'status': 'success',
-                'signal': sentiment_signal,
-                'source': 'multi_source_sentiment',
-                'timestamp': datetime.now(timezone.utc).isoformat()
-            }), 200
-            
-        except Exception as e:
-            logger.error(f"❌ SENTIMENT endpoint error: {e}")
-            return jsonify({'status': 'error', 'error': str(e)}), 500
+        return _group_response('sentiment')
 
     # ════════════════════════════════════════════════════════════════════════════════
     # MACHINE LEARNING GROUP SIGNAL ENDPOINT
@@ -252,51 +565,7 @@ def register_group_signal_routes(app, orchestrator):
         """
         Get MACHINE LEARNING group signal for a symbol (10 models)
         """
-        try:
-            symbol = request.args.get('symbol', 'BTCUSDT')
-            
-            logger.info(f"🤖 ML signal requested: {symbol}")
-            
-            ml_signal = {
-                'symbol': symbol,
-                'direction': 'NEUTRAL',
-                'strength': 0.5,
-                'confidence': 0.5,
-                'entry_price': 0,
-                'tp1': 0,
-                'tp2': 0,
-                'stop_loss': 0,
-                'risk_reward_ratio': 2.0,
-                'models': {
-                    'lstm': 0.5,
-                    'xgboost': 0.5,
-                    'random_forest': 0.5,
-                    'transformer': 0.5
-                },
-                'ensemble_vote': 'NEUTRAL',
-                'timestamp': datetime.now(timezone.utc).isoformat()
-            }
-            
-            # Try ML ensemble model
-            if orchestrator.ensemble_model:
-                try:
-                    prediction = orchestrator.ensemble_model.predict(symbol)
-                    if prediction and not prediction.get('mock_detected', False):
-                        ml_signal.update(prediction)
-                        logger.info(f"✅ ML signal: {prediction.get('direction', 'NEUTRAL')}")
-                except Exception as e:
-                    logger.error(f"ML ensemble error: {e}")
-            
-            return jsonify({
-                'status': 'success',
-                'signal': ml_signal,
-                'source': 'ml_ensemble',
-                'timestamp': datetime.now(timezone.utc).isoformat()
-            }), 200
-            
-        except Exception as e:
-            logger.error(f"❌ ML endpoint error: {e}")
-            return jsonify({'status': 'error', 'error': str(e)}), 500
+        return _group_response('ml')
 
     # ════════════════════════════════════════════════════════════════════════════════
     # ON-CHAIN GROUP SIGNAL ENDPOINT
@@ -307,50 +576,7 @@ def register_group_signal_routes(app, orchestrator):
         """
         Get ON-CHAIN group signal for a symbol (6 metrics)
         """
-        try:
-            symbol = request.args.get('symbol', 'BTCUSDT')
-            
-            logger.info(f"⛓️  ON-CHAIN signal requested: {symbol}")
-            
-            onchain_signal = {
-                'symbol': symbol,
-                'direction': 'NEUTRAL',
-                'strength': 0.5,
-                'confidence': 0.5,
-                'entry_price': 0,
-                'tp1': 0,
-                'tp2': 0,
-                'stop_loss': 0,
-                'risk_reward_ratio': 2.0,
-                'metrics': {
-                    'whale_netflow': 0,
-                    'exchange_reserve': 0,
-                    'active_addresses': 0,
-                    'transaction_volume': 0
-                },
-                'timestamp': datetime.now(timezone.utc).isoformat()
-            }
-            
-            # Try on-chain analytics
-            if orchestrator.onchain_pro:
-                try:
-                    analysis = orchestrator.onchain_pro.analyze_onchain_metrics()
-                    if analysis and not analysis.get('mock_detected', False):
-                        onchain_signal.update(analysis)
-                        logger.info(f"✅ ON-CHAIN signal: {analysis.get('direction', 'NEUTRAL')}")
-                except Exception as e:
-                    logger.error(f"On-chain analytics error: {e}")
-            
-            return jsonify({
-                'status': 'success',
-                'signal': onchain_signal,
-                'source': 'onchain_analytics',
-                'timestamp': datetime.now(timezone.utc).isoformat()
-            }), 200
-            
-        except Exception as e:
-            logger.error(f"❌ ON-CHAIN endpoint error: {e}")
-            return jsonify({'status': 'error', 'error': str(e)}), 500
+        return _group_response('onchain')
 
     # ════════════════════════════════════════════════════════════════════════════════
     # RISK GROUP SIGNAL ENDPOINT
@@ -361,51 +587,7 @@ def register_group_signal_routes(app, orchestrator):
         """
         Get RISK group assessment for a symbol (5 engines)
         """
-        try:
-            symbol = request.args.get('symbol', 'BTCUSDT')
-            
-            logger.info(f"⚠️  RISK signal requested: {symbol}")
-            
-            risk_signal = {
-                'symbol': symbol,
-                'direction': 'NEUTRAL',
-                'strength': 0.5,
-                'confidence': 0.5,
-                'entry_price': 0,
-                'tp1': 0,
-                'tp2': 0,
-                'stop_loss': 0,
-                'risk_reward_ratio': 2.0,
-                'risk_metrics': {
-                    'var': 0,
-                    'sharpe_ratio': 0,
-                    'kelly_criterion': 0,
-                    'max_drawdown': 0,
-                    'position_size': 0
-                },
-                'timestamp': datetime.now(timezone.utc).isoformat()
-            }
-            
-            # Try advanced risk engine
-            if orchestrator.risk_engine_v2:
-                try:
-                    risk_report = orchestrator.risk_engine_v2.calculate_portfolio_risk()
-                    if risk_report and not risk_report.get('mock_detected', False):
-                        risk_signal['risk_metrics'] = risk_report
-                        logger.info(f"✅ RISK assessment complete")
-                except Exception as e:
-                    logger.error(f"Risk engine error: {e}")
-            
-            return jsonify({
-                'status': 'success',
-                'signal': risk_signal,
-                'source': 'advanced_risk_engine',
-                'timestamp': datetime.now(timezone.utc).isoformat()
-            }), 200
-            
-        except Exception as e:
-            logger.error(f"❌ RISK endpoint error: {e}")
-            return jsonify({'status': 'error', 'error': str(e)}), 500
+        return _group_response('risk')
 
     # ════════════════════════════════════════════════════════════════════════════════
     # ⭐ NEW v8.0 PHASE 2: AI META-LAYER SIGNAL ENDPOINT
@@ -415,89 +597,22 @@ def register_group_signal_routes(app, orchestrator):
     def api_meta_signal():
         """
         ⭐ NEW v8.0: Get AI META-LAYER ensemble signal
-        Orchestrates all 5 group signals and produces consensus with AI reasoning
+        Orchestrates all 5 group signals (computed concurrently, cached per
+        symbol/timeframe) and produces consensus with AI reasoning
         """
         try:
-            symbol = request.args.get('symbol', 'BTCUSDT')
+            symbol, timeframe = _request_params()
             
             logger.info(f"🧠 AI META-SIGNAL requested: {symbol}")
             
-            # Import AI Meta-Interpreter
-            try:
-                from advanced_ai.ai_meta_interpreter import AIMetaInterpreter
-                meta_interpreter = AIMetaInterpreter()
-            except ImportError as e:
-                logger.error(f"❌ AI Meta-Interpreter not available: {e}")
+            meta_signal = service.get_meta_signal(symbol, timeframe)
+            if meta_signal is None:
                 return jsonify({
                     'status': 'error',
                     'error': 'AI Meta-Interpreter module not loaded',
                     'timestamp': datetime.now(timezone.utc).isoformat()
                 }), 503
             
-            # Get current price for calculations
-            current_price = None
-            if orchestrator.exchange_api:
-                try:
-                    ticker = orchestrator.exchange_api.get_ticker(symbol)
-                    current_price = float(ticker.get('last', 0)) if ticker else None
-                except Exception as e:
-                    logger.warning(f"Failed to get real-time price for meta-signal: {e}")
-            
-            # Collect signals from all 5 groups
-            group_signals = {}
-            
-            # 1. Technical signal
-            try:
-                tech_response = api_signals_technical()
-                tech_data = tech_response[0].get_json() if isinstance(tech_response, tuple) else tech_response.get_json()
-                if tech_data.get('status') == 'success':
-                    group_signals['technical'] = tech_data['signal']
-            except Exception as e:
-                logger.warning(f"Technical signal fetch error: {e}")
-            
-            # 2. Sentiment signal
-            try:
-                sent_response = api_signals_sentiment()
-                sent_data = sent_response[0].get_json() if isinstance(sent_response, tuple) else sent_response.get_json()
-                if sent_data.get('status') == 'success':
-                    group_signals['sentiment'] = sent_data['signal']
-            except Exception as e:
-                logger.warning(f"Sentiment signal fetch error: {e}")
-            
-            # 3. ML signal
-            try:
-                ml_response = api_signals_ml()
-                ml_data = ml_response[0].get_json() if isinstance(ml_response, tuple) else ml_response.get_json()
-                if ml_data.get('status') == 'success':
-                    group_signals['ml'] = ml_data['signal']
-            except Exception as e:
-                logger.warning(f"ML signal fetch error: {e}")
-            
-            # 4. OnChain signal
-            try:
-                onchain_response = api_signals_onchain()
-                onchain_data = onchain_response[0].get_json() if isinstance(onchain_response, tuple) else onchain_response.get_json()
-                if onchain_data.get('status') == 'success':
-                    group_signals['onchain'] = onchain_data['signal']
-            except Exception as e:
-                logger.warning(f"OnChain signal fetch error: {e}")
-            
-            # 5. Risk signal
-            try:
-                risk_response = api_signals_risk()
-                risk_data = risk_response[0].get_json() if isinstance(risk_response, tuple) else risk_response.get_json()
-                if risk_data.get('status') == 'success':
-                    group_signals['risk'] = risk_data['signal']
-            except Exception as e:
-                logger.warning(f"Risk signal fetch error: {e}")
-            
-            # Generate meta-signal using AI interpreter
-            meta_signal = meta_interpreter.interpret_group_signals(
-                symbol=symbol,
-                group_signals=group_signals,
-                current_price=current_price
-            )
-            
             if meta_signal.get('analysis_complete'):
                 logger.info(
                     f"✅ META-SIGNAL generated for {symbol}: {meta_signal['meta_signal']} "
@@ -9,6 +9,7 @@ Gelişmiş multi-layer AI için ekstra API key desteği ve profesyonel productio
 """
 import os
 import sys
+import json
 from typing import List, Dict, Any
 from dotenv import load_dotenv
 
@@ -85,6 +86,12 @@ CACHE_TTL = int(os.getenv('CACHE_TTL', '300'))  # 5 minutes default
 # Rate Limiting
 RATE_LIMIT_ENABLED = os.getenv('RATE_LIMIT_ENABLED', 'true').lower() == 'true'
 
+# Logging pipeline (utils/logger_setup.py)
+LOG_ASYNC = os.getenv('LOG_ASYNC', 'true').lower() == 'true'  # file/console I/O on a listener thread
+LOG_QUEUE_SIZE = int(os.getenv('LOG_QUEUE_SIZE', '10000'))
+# Per-logger overrides of HOT_PATH_POLICIES, e.g. '{"REAL_DATA_VERIFIER": {"rate": 5, "sample": 0.1}}'
+LOG_POLICIES: Dict[str, Dict[str, Any]] = json.loads(os.getenv('LOG_POLICIES', '{}') or '{}')
+
 # ========================================================================
 # TRACKED SYMBOLS - v8.0.1 FIX: SPOT SYMBOLS (NO .P SUFFIX)
 # ✅ FIXED: Removed .P suffix for REST API compatibility
@@ -17,6 +17,8 @@ import logging
 from datetime import datetime
 import json
 
+from utils.write_behind import WriteBehindWriter, DsnConnector
+
 logger = logging.getLogger(__name__)
 
 # ============================================================================
@@ -26,6 +28,7 @@ logger = logging.getLogger(__name__)
 class Database:
     def __init__(self):
         self.conn = None
+        self.writer = None
         self.connect()
     
     def connect(self):
@@ -35,6 +38,13 @@ class Database:
             self.conn = psycopg2.connect(db_url)
             logger.info("✅ PostgreSQL connected - Real data persistence")
             self.create_tables()
+            
+            # Signals are written behind (batched, own connection)
+            self.writer = WriteBehindWriter('database', DsnConnector(db_url))
+            self.writer.register_table('trades', (
+                'symbol', 'signal_type', 'confidence', 'entry_price', 'takeprofit_1',
+                'takeprofit_2', 'takeprofit_3', 'stoploss', 'position_size', 'layer_scores'
+            ))
         except Exception as e:
             logger.error(f"❌ Database connection failed: {e}")
             raise
@@ -110,15 +120,9 @@ class Database:
     # ========================================================================
     
     def save_signal(self, signal_data):
-        """Save signal to database - REAL DATA ONLY"""
+        """Queue signal for batched write - REAL DATA ONLY (non-blocking)"""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                INSERT INTO trades 
-                (symbol, signal_type, confidence, entry_price, takeprofit_1, 
-                 takeprofit_2, takeprofit_3, stoploss, position_size, layer_scores)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """, (
+            self.writer.write('trades', (
                 signal_data['symbol'],
                 signal_data['type'],
                 signal_data['confidence'],
@@ -130,15 +134,15 @@ class Database:
                 signal_data.get('size', 0),
                 json.dumps(signal_data.get('scores', {}))
             ))
-            self.conn.commit()
-            logger.info(f"✅ Signal saved: {signal_data['symbol']} {signal_data['type']}")
+            logger.info(f"✅ Signal queued: {signal_data['symbol']} {signal_data['type']}")
         except Exception as e:
             logger.error(f"❌ Signal save failed: {e}")
-            self.conn.rollback()
     
     def get_recent_signals(self, limit=10):
         """Get recent signals from database"""
         try:
+            if self.writer:
+                self.writer.flush()
             cursor = self.conn.cursor()
             cursor.execute("""
                 SELECT * FROM trades 
@@ -15,6 +15,8 @@ Features:
     ✅ Query performance tracking
     ✅ Prepared statements
     ✅ SQL injection prevention
+    ✅ Write-behind signal persistence (batched, spill journal)
+    ✅ Hourly signal rollups + symbol registry (maintained per flushed batch)
 
 Database Schema:
     - signals: Trading signals
@@ -23,6 +25,8 @@ Database Schema:
     - performance_metrics: Performance tracking
     - ai_training_metrics: ML model metrics
     - system_health_logs: Health monitoring
+    - signal_rollup_hourly: Per-hour signal counts / score sums (dashboards)
+    - symbol_registry: Every symbol seen in signals
 
 DEPLOYMENT: Railway Production (PostgreSQL)
 AUTHOR: DEMIR AI Research Team
@@ -33,6 +37,7 @@ VERSION: 7.0
 
 import os
 import time
+import json
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
@@ -42,6 +47,26 @@ from psycopg2 import pool, sql
 from psycopg2.extras import RealDictCursor, execute_values
 from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
 
+from utils.write_behind import WriteBehindWriter
+from utils import signal_rollups
+
+# Column order of the queued `signals` rows
+SIGNAL_COLUMNS = (
+    'symbol', 'direction', 'entry_price', 'tp1', 'tp2', 'tp3', 'sl',
+    'timestamp', 'confidence', 'ensemble_score', 'data_source',
+    'tech_group_score', 'sentiment_group_score', 'onchain_group_score',
+    'ml_group_score', 'macro_risk_group_score'
+)
+
+# signal dict keys → group score columns
+GROUP_SCORE_KEYS = (
+    ('tech_group_score', 'technical'),
+    ('sentiment_group_score', 'sentiment'),
+    ('onchain_group_score', 'onchain'),
+    ('ml_group_score', 'ml'),
+    ('macro_risk_group_score', 'macro_risk'),
+)
+
 logger = logging.getLogger(__name__)
 
 # ============================================================================
@@ -98,6 +123,14 @@ class DatabaseManager:
         self._initialize_pool()
         self._initialize_schema()
         
+        # Batched writes for hot-path inserts (signals / metrics)
+        self.writer = WriteBehindWriter('db_manager', self.get_connection)
+        self.rollup = signal_rollups.SignalRollup(SIGNAL_COLUMNS)
+        self.writer.register_table('signals', SIGNAL_COLUMNS, after_insert=self.rollup.apply)
+        self.writer.register_table('performance_metrics', (
+            'metric_type', 'metric_value', 'metric_data'
+        ))
+        
         logger.info(f"✅ DatabaseManager initialized (pool: {min_conn}-{max_conn})")
     
     # ========================================================================
@@ -244,6 +277,10 @@ class DatabaseManager:
                     CREATE INDEX IF NOT EXISTS idx_opportunities_created_at ON trade_opportunities(created_at DESC);
                 """)
                 
+                # Hourly signal rollups + symbol registry (dashboard reads)
+                signal_rollups.ensure_schema(cursor)
+                signal_rollups.backfill(cursor, source_table='signals')
+                
                 # Performance metrics table
                 cursor.execute("""
                     CREATE TABLE IF NOT EXISTS performance_metrics (
@@ -337,12 +374,83 @@ class DatabaseManager:
         """Get query statistics"""
         return dict(self.query_stats)
     
+    # ========================================================================
+    # WRITE-BEHIND PERSISTENCE
+    # ========================================================================
+    
+    def save_signal(self, signal: Any) -> bool:
+        """
+        Queue a signal for batched persistence (never blocks on the DB)
+        
+        Trade signals (symbol + LONG/SHORT direction + entry price) go to
+        `signals`; anything else (smart money, alerts, plain messages) is
+        kept as a `performance_metrics` row with the payload in metric_data.
+        
+        Returns:
+            True if queued (or journaled)
+        """
+        try:
+            if not isinstance(signal, dict):
+                signal = {'type': 'message', 'message': str(signal)}
+            
+            direction = str(signal.get('direction') or signal.get('signal_type') or '').upper()
+            entry_price = signal.get('entry_price') or signal.get('entry')
+            
+            if signal.get('symbol') and direction in ('LONG', 'SHORT') and entry_price:
+                confidence = float(signal.get('confidence', 0.5))
+                if confidence > 1:
+                    confidence /= 100  # percent → ratio (NUMERIC(5, 4))
+                return self.writer.write('signals', (
+                    signal['symbol'],
+                    direction,
+                    entry_price,
+                    signal.get('tp1'),
+                    signal.get('tp2'),
+                    signal.get('tp3'),
+                    signal.get('sl'),
+                    signal.get('timestamp') or datetime.now().astimezone(),
+                    confidence,
+                    float(signal.get('ensemble_score', confidence)),
+                    str(signal.get('data_source') or signal.get('source') or 'orchestrator'),
+                    *self._group_scores(signal)
+                ))
+            
+            value = signal.get('score', signal.get('confidence', 0))
+            return self.writer.write('performance_metrics', (
+                f"signal:{signal.get('type', 'unknown')}",
+                float(value) if isinstance(value, (int, float)) else 0.0,
+                json.dumps(signal, default=str)
+            ))
+        except Exception as e:
+            logger.error(f"❌ Signal queue failed: {e}")
+            return False
+    
+    @staticmethod
+    def _group_scores(signal: Dict[str, Any]) -> Tuple[float, ...]:
+        """Five group scores (0-1) from flat *_group_score keys or a 'group_scores' dict"""
+        groups = signal.get('group_scores') or {}
+        scores = []
+        for column, group in GROUP_SCORE_KEYS:
+            value = signal.get(column, groups.get(group, 0.0))
+            try:
+                value = float(value or 0.0)
+            except (TypeError, ValueError):
+                value = 0.0
+            scores.append(value / 100 if value > 1 else value)
+        return tuple(scores)
+    
+    def get_write_stats(self) -> Dict[str, Any]:
+        """Write-behind queue depth / flush latency"""
+        return self.writer.get_metrics()
+    
     # ========================================================================
     # CLEANUP
     # ========================================================================
     
     def close(self):
         """Close all connections"""
+        if getattr(self, 'writer', None):
+            self.writer.close()
         if self.pool:
             self.pool.closeall()
             logger.info("🔌 Database connections closed")
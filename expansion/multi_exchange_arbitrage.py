@@ -4,11 +4,12 @@
 """
 import time
 import logging
-import requests
 from typing import Dict, List
 from datetime import datetime
 import pytz
 
+from utils.http_client import http_get
+
 logger = logging.getLogger('MULTI_EXCHANGE_ARBITRAGE')
 
 EXCHANGES = {
@@ -33,7 +34,7 @@ class MultiExchangeArbitrage:
     def fetch_binance(self) -> Dict[str,float]:
         url = EXCHANGES['binance']
         try:
-            r = requests.get(url,timeout=4)
+            r = http_get(url,timeout=4)
             if r.status_code==200:
                 data = r.json()
                 return {d['symbol']:float(d['price']) for d in data if d['symbol'] in self.pairs}
@@ -43,7 +44,7 @@ class MultiExchangeArbitrage:
     def fetch_bybit(self) -> Dict[str,float]:
         url = EXCHANGES['bybit']
         try:
-            r = requests.get(url,timeout=4)
+            r = http_get(url,timeout=4)
             if r.status_code==200:
                 data = r.json()
                 tickers = data['result']['list'] if 'result' in data and 'list' in data['result'] else []
@@ -54,7 +55,7 @@ class MultiExchangeArbitrage:
     def fetch_coinbase(self) -> Dict[str,float]:
         url = EXCHANGES['coinbase']
         try:
-            r = requests.get(url,timeout=6)
+            r = http_get(url,timeout=6)
             if r.status_code==200:
                 data = r.json()
                 return {d['id'].replace('-',''):float(d['price']) for d in data if d['id'] and d.get('price','') and d['id'].replace('-','').upper() in self.pairs}
@@ -5,6 +5,7 @@
 
 PROFESSIONAL ORDERBOOK DEPTH ANALYSIS ENGINE
     ✅ Real-time orderbook depth from Binance/Bybit/Coinbase
+    ✅ Live local L2 books (websocket depth diffs) - no REST polling when attached
     ✅ Whale wall detection (>$1M orders)
     ✅ Buy/Sell pressure calculation
     ✅ Support/Resistance levels from orderbook
@@ -33,8 +34,9 @@ from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import pytz
 import numpy as np
-import requests
-from collections import defaultdict
+
+from utils.http_client import get_http_client
+from utils.local_orderbook import OrderBookManager
 
 # Initialize logger
 logger = logging.getLogger('ORDERBOOK_ANALYZER')
@@ -95,17 +97,22 @@ class AdvancedOrderbookAnalyzer:
     Professional orderbook depth analyzer with whale detection
     """
     
-    def __init__(self, api_key: str = None, api_secret: str = None):
+    def __init__(self, api_key: str = None, api_secret: str = None,
+                 order_books: Optional[OrderBookManager] = None, symbols: Optional[List[str]] = None):
         """
         Initialize orderbook analyzer
         
         Args:
             api_key: Binance API key (optional for public endpoints)
             api_secret: Binance API secret (optional)
+            order_books: Local books maintained from websocket depth diffs
+            symbols: Symbols analyzed by analyze_orderbook() (default: every live book)
         """
         self.api_key = api_key
         self.api_secret = api_secret
-        self.session = requests.Session()
+        self.order_books = order_books
+        self.symbols = [s.upper() for s in symbols] if symbols else None
+        self.session = get_http_client()  # shared keep-alive pool
         self.mock_detector = OrderbookMockDataDetector()
         
         # Whale thresholds
@@ -149,8 +156,8 @@ class AdvancedOrderbookAnalyzer:
                 
                 logger.info(f"✅ Real orderbook fetched: {symbol} (Binance)")
                 return {
-                    'bids': [[float(p), float(q)] for p, q in data['bids']],
-                    'asks': [[float(p), float(q)] for p, q in data['asks']],
+                    'bids': np.asarray(data['bids'], dtype=np.float64).reshape(-1, 2).tolist(),
+                    'asks': np.asarray(data['asks'], dtype=np.float64).reshape(-1, 2).tolist(),
                     'timestamp': data.get('lastUpdateId'),
                     'exchange': 'binance',
                     'symbol': symbol
@@ -204,8 +211,8 @@ class AdvancedOrderbookAnalyzer:
                 
                 logger.info(f"✅ Real orderbook fetched: {symbol} (Bybit)")
                 return {
-                    'bids': [[float(p), float(q)] for p, q in result['b']],
-                    'asks': [[float(p), float(q)] for p, q in result['a']],
+                    'bids': np.asarray(result['b'], dtype=np.float64).reshape(-1, 2).tolist(),
+                    'asks': np.asarray(result['a'], dtype=np.float64).reshape(-1, 2).tolist(),
                     'timestamp': result.get('ts'),
                     'exchange': 'bybit',
                     'symbol': symbol
@@ -218,17 +225,37 @@ class AdvancedOrderbookAnalyzer:
             logger.error(f"❌ Error fetching Bybit orderbook: {e}")
             return {}
     
+    def get_orderbook_live(self, symbol: str, limit: Optional[int] = None) -> Dict:
+        """
+        Orderbook from the local L2 book (no REST call)
+        
+        Args:
+            symbol: Trading pair
+            limit: Levels per side (None = whole book)
+        
+        Returns:
+            Orderbook dict, or empty dict if no synced local book
+        """
+        book = self.order_books.synced_book(symbol) if self.order_books else None
+        if book is None:
+            return {}
+        return book.snapshot(limit)
+    
     def get_orderbook_multi_exchange(self, symbol: str) -> Dict:
         """
         Fetch orderbook with multi-exchange failover
-        Priority: Binance → Bybit → Return empty
+        Priority: local book → Binance → Bybit → Return empty
         
         Args:
             symbol: Trading pair
         
         Returns:
-            Orderbook dict from first successful exchange
+            Orderbook dict from first successful source
         """
+        orderbook = self.get_orderbook_live(symbol, limit=1000)
+        if orderbook:
+            return orderbook
+        
         # Try Binance first
         orderbook = self.get_orderbook_binance(symbol, limit=1000)
         if orderbook:
@@ -259,16 +286,16 @@ class AdvancedOrderbookAnalyzer:
             logger.warning("⚠️ Empty orderbook, skipping analysis")
             return {}
         
-        bids = orderbook['bids']
-        asks = orderbook['asks']
+        bids = self._levels_array(orderbook['bids'])
+        asks = self._levels_array(orderbook['asks'])
         
         # Calculate total bid/ask volumes
-        total_bid_volume = sum(q for p, q in bids)
-        total_ask_volume = sum(q for p, q in asks)
+        total_bid_volume = float(bids[:, 1].sum())
+        total_ask_volume = float(asks[:, 1].sum())
         
         # Calculate bid/ask values in USD
-        total_bid_value = sum(p * q for p, q in bids)
-        total_ask_value = sum(p * q for p, q in asks)
+        total_bid_value = float(bids[:, 0] @ bids[:, 1])
+        total_ask_value = float(asks[:, 0] @ asks[:, 1])
         
         # Calculate imbalance
         volume_imbalance = (total_bid_volume - total_ask_volume) / (total_bid_volume + total_ask_volume + 1e-10)
@@ -326,6 +353,11 @@ class AdvancedOrderbookAnalyzer:
         
         return analysis
     
+    @staticmethod
+    def _levels_array(levels) -> np.ndarray:
+        """[[price, qty], ...] (list or array) → float array of shape (n, 2)"""
+        return np.asarray(levels, dtype=np.float64).reshape(-1, 2)
+    
     def _detect_whale_orders(self, orders: List, side: str, current_price: float) -> List[Dict]:
         """
         Detect whale orders (>$1M)
@@ -338,28 +370,46 @@ class AdvancedOrderbookAnalyzer:
         Returns:
             List of whale orders with details
         """
-        whale_orders = []
+        levels = self._levels_array(orders)
+        values = levels[:, 0] * levels[:, 1]
+        idx = np.flatnonzero(values >= self.whale_threshold_usd)
+        idx = idx[np.argsort(-values[idx], kind='stable')]  # largest first
         
-        for price, quantity in orders:
-            order_value_usd = price * quantity
+        whale_orders = []
+        for i in idx.tolist():
+            price, quantity, order_value_usd = levels[i, 0], levels[i, 1], values[i]
+            distance_pct = abs(price - current_price) / current_price * 100
             
-            if order_value_usd >= self.whale_threshold_usd:
-                distance_pct = abs(price - current_price) / current_price * 100
-                
-                whale_orders.append({
-                    'price': round(price, 2),
-                    'quantity': round(quantity, 4),
-                    'value_usd': round(order_value_usd, 2),
-                    'side': side,
-                    'distance_pct': round(distance_pct, 2),
-                    'type': 'WHALE' if order_value_usd >= self.whale_threshold_usd else 'LARGE'
-                })
-        
-        # Sort by value (largest first)
-        whale_orders.sort(key=lambda x: x['value_usd'], reverse=True)
+            whale_orders.append({
+                'price': round(float(price), 2),
+                'quantity': round(float(quantity), 4),
+                'value_usd': round(float(order_value_usd), 2),
+                'side': side,
+                'distance_pct': round(float(distance_pct), 2),
+                'type': 'WHALE' if order_value_usd >= self.whale_threshold_usd else 'LARGE'
+            })
         
         return whale_orders
     
+    def _bucket_levels(self, levels: np.ndarray, current_price: float, sign: float) -> List[Dict]:
+        """Group levels into 0.1% price buckets and return the 10 strongest (USD value)"""
+        if not len(levels):
+            return []
+        buckets = np.round(levels[:, 0] / current_price * 100, 1)  # Normalize to percentage
+        keys, inverse = np.unique(buckets, return_inverse=True)
+        strength = np.bincount(inverse, weights=levels[:, 0] * levels[:, 1])
+        
+        result = []
+        for i in np.argsort(-strength, kind='stable')[:10].tolist():
+            price_level = current_price * keys[i] / 100
+            distance_pct = sign * (current_price - price_level) / current_price * 100
+            result.append({
+                'price': round(float(price_level), 2),
+                'strength_usd': round(float(strength[i]), 2),
+                'distance_pct': round(float(distance_pct), 2)
+            })
+        return result
+    
     def _calculate_support_levels(self, bids: List, current_price: float, depth_pct: float = 5.0) -> List[Dict]:
         """
         Calculate support levels from orderbook bids
@@ -372,27 +422,9 @@ class AdvancedOrderbookAnalyzer:
         Returns:
             List of support levels
         """
-        support_levels = []
-        price_ranges = defaultdict(float)
-        
-        # Group orders by price buckets (0.1% increments)
-        for price, quantity in bids:
-            if price >= current_price * (1 - depth_pct / 100):
-                bucket = round(price / current_price * 100, 1)  # Normalize to percentage
-                price_ranges[bucket] += quantity * price
-        
-        # Find strongest support levels
-        for bucket, value in sorted(price_ranges.items(), key=lambda x: x[1], reverse=True)[:10]:
-            price_level = current_price * bucket / 100
-            distance_pct = (current_price - price_level) / current_price * 100
-            
-            support_levels.append({
-                'price': round(price_level, 2),
-                'strength_usd': round(value, 2),
-                'distance_pct': round(distance_pct, 2)
-            })
-        
-        return support_levels
+        levels = self._levels_array(bids)
+        levels = levels[levels[:, 0] >= current_price * (1 - depth_pct / 100)]
+        return self._bucket_levels(levels, current_price, 1.0)
     
     def _calculate_resistance_levels(self, asks: List, current_price: float, depth_pct: float = 5.0) -> List[Dict]:
         """
@@ -406,27 +438,9 @@ class AdvancedOrderbookAnalyzer:
         Returns:
             List of resistance levels
         """
-        resistance_levels = []
-        price_ranges = defaultdict(float)
-        
-        # Group orders by price buckets (0.1% increments)
-        for price, quantity in asks:
-            if price <= current_price * (1 + depth_pct / 100):
-                bucket = round(price / current_price * 100, 1)  # Normalize to percentage
-                price_ranges[bucket] += quantity * price
-        
-        # Find strongest resistance levels
-        for bucket, value in sorted(price_ranges.items(), key=lambda x: x[1], reverse=True)[:10]:
-            price_level = current_price * bucket / 100
-            distance_pct = (price_level - current_price) / current_price * 100
-            
-            resistance_levels.append({
-                'price': round(price_level, 2),
-                'strength_usd': round(value, 2),
-                'distance_pct': round(distance_pct, 2)
-            })
-        
-        return resistance_levels
+        levels = self._levels_array(asks)
+        levels = levels[levels[:, 0] <= current_price * (1 + depth_pct / 100)]
+        return self._bucket_levels(levels, current_price, -1.0)
     
     def _calculate_buy_pressure(self, bids: List, current_price: float, depth_pct: float = 2.0) -> float:
         """
@@ -440,12 +454,10 @@ class AdvancedOrderbookAnalyzer:
         Returns:
             Buy pressure score (0 to 1)
         """
-        total_value = 0
+        levels = self._levels_array(bids)
         depth_threshold = current_price * (1 - depth_pct / 100)
-        
-        for price, quantity in bids:
-            if price >= depth_threshold:
-                total_value += price * quantity
+        near = levels[levels[:, 0] >= depth_threshold]
+        total_value = float(near[:, 0] @ near[:, 1])
         
         # Normalize (arbitrary scaling)
         max_value = current_price * 1000  # Example: 1000 units at current price
@@ -465,12 +477,10 @@ class AdvancedOrderbookAnalyzer:
         Returns:
             Sell pressure score (0 to 1)
         """
-        total_value = 0
+        levels = self._levels_array(asks)
         depth_threshold = current_price * (1 + depth_pct / 100)
-        
-        for price, quantity in asks:
-            if price <= depth_threshold:
-                total_value += price * quantity
+        near = levels[levels[:, 0] <= depth_threshold]
+        total_value = float(near[:, 0] @ near[:, 1])
         
         # Normalize (arbitrary scaling)
         max_value = current_price * 1000  # Example: 1000 units at current price
@@ -526,6 +536,36 @@ class AdvancedOrderbookAnalyzer:
         total_confidence = min(base_confidence + whale_factor, 1.0)
         
         return total_confidence
+    
+    def analyze_orderbook(self, symbols: Optional[List[str]] = None) -> Dict[str, Dict]:
+        """
+        ⭐ NEW v8.0: Main method called by the background orderbook job.
+        
+        Analyzes every synced local book (mid price as current price) -
+        no REST calls; books still syncing are skipped until their
+        snapshot arrives.
+        
+        Returns:
+            {symbol: analysis}
+        """
+        if not self.order_books:
+            return {}
+        
+        results = {}
+        for symbol in symbols or self.symbols or list(self.order_books.books):
+            book = self.order_books.synced_book(symbol)
+            if book is None:
+                continue
+            current_price = book.mid_price()
+            if not current_price:
+                continue
+            analysis = self.analyze_orderbook_depth(book.snapshot(), current_price)
+            if analysis:
+                results[book.symbol] = analysis
+        return results
+
+# main.py imports the class as AdvancedOrderBookAnalyzer
+AdvancedOrderBookAnalyzer = AdvancedOrderbookAnalyzer
 
 # ============================================================================
 # MAIN ENTRY POINT (for testing)
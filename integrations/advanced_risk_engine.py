@@ -5,7 +5,8 @@ Kurumsal, dinamik ve matematiksel risk yönetimi. Real-time portfolio VAR, drawd
 """
 import os
 import logging
-from typing import Dict, List
+from statistics import NormalDist
+from typing import Dict, List, Optional
 from datetime import datetime
 import numpy as np
 import pytz
@@ -20,16 +21,19 @@ class AdvancedRiskEngine:
     - Drawdown / Sharpe / Sortino
     - Black Swan event/circuit breaker
     - Dynamic position sizing
+    - Parametric VAR / korelasyon: paylaşılan canlı RollingCorrelationMatrix (opsiyonel)
     - Sadece gerçek, anlık canlı borsa verisi kullanır
     """
-    def __init__(self, thresholds:Dict=None):
+    def __init__(self, thresholds:Dict=None, correlation_matrix=None):
         self.thresholds = thresholds or {
             'max_drawdown_pct': 15.0,
             'max_var_pct': 5.0,
             'min_sharpe': 1.5,
             'kelly_fraction': 0.25,
             'max_exposure_pct': 25.0,
+            'max_avg_correlation': 0.85,
         }
+        self.correlation_matrix = correlation_matrix
         logger.info("✅ AdvancedRiskEngine initialized")
 
     def calculate_var(self, pnl_series:List[float], confidence:float=0.99) -> float:
@@ -40,6 +44,38 @@ class AdvancedRiskEngine:
         loss = np.percentile(pnl_series, (1-confidence)*100)
         return abs(loss) * 100
 
+    def calculate_parametric_var(self, weights:Dict[str, float], confidence:float=0.99,
+                                 horizon_bars:int=1440, window='ewma') -> Optional[float]:
+        """
+        Parametric (variance-covariance) VAR, % cinsinden: z · sqrt(wᵀΣw · horizon).
+        Σ = paylaşılan matristen bar başına log-getiri kovaryansı (1m bar → 1440 = 1 gün).
+        Matris yoksa / henüz ısınmadıysa None.
+        """
+        if self.correlation_matrix is None or not weights:
+            return None
+        symbols = [s for s in weights if s.upper() in self.correlation_matrix.index]
+        if not symbols:
+            return None
+        cov = self.correlation_matrix.covariance(window, symbols)
+        if cov is None:
+            return None
+        w = np.array([weights[s] for s in symbols], dtype=float)
+        variance = float(w @ cov @ w) * horizon_bars
+        return NormalDist().inv_cdf(confidence) * np.sqrt(max(variance, 0.0)) * 100
+
+    def correlation_summary(self, window='ewma') -> Optional[Dict]:
+        """Ortalama korelasyon + son rejim kırılmaları (paylaşılan matristen, yeniden veri çekmeden)."""
+        matrix = self.correlation_matrix
+        if matrix is None or not matrix.ready(window):
+            return None
+        avg = matrix.average_correlation(window)
+        return {
+            'window': window,
+            'avg_correlation': round(avg, 4) if avg is not None else None,
+            'concentrated': avg is not None and avg > self.thresholds['max_avg_correlation'],
+            'breaks': list(matrix.alerts)[-5:],
+        }
+
     def calculate_kelly(self, win_rate:float, avg_win:float, avg_loss:float) -> float:
         """Kelly Criterion: Optimal pozisyon oranı (0-1 arası)."""
         if avg_loss == 0 or win_rate<=0 or avg_win<=0:
@@ -117,7 +153,13 @@ class AdvancedRiskEngine:
                 'status': 'healthy',
                 'risk_score': 0  # 0-100 scale, 0 = no risk
             }
-            
+
+            correlation = self.correlation_summary()
+            if correlation:
+                default_report['correlation'] = correlation
+                if correlation['concentrated']:
+                    default_report['interpretation'] = 'Assets moving together - diversification is low. Reduce correlated exposure.'
+
             logger.info("✅ Portfolio risk calculation completed successfully")
             return default_report
             
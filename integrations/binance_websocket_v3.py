@@ -13,7 +13,8 @@ ENTERPRISE-GRADE WEBSOCKET:
     ✅ Graceful shutdown
     ✅ NEW v8.0: Global State Integration for orchestrator broadcasting
     ✅ NEW v8.0: Multi-layer data validation pipeline
-    ✅ NEW v8.0: SocketIO real-time client push
+    ✅ NEW v8.0: SocketIO real-time client push (frame-paced, per-symbol rooms)
+    ✅ NEW v8.0: Local L2 order books (REST snapshot + sequenced depth diffs)
     
 DEPLOYMENT: Railway + GitHub
 AUTHOR: DEMIR AI Research Team
@@ -30,7 +31,7 @@ import logging
 import threading
 import requests
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Callable, Any
+from typing import Dict, List, Optional, Callable, Any, Tuple, Hashable
 from collections import defaultdict, deque
 import websockets
 from websockets.exceptions import (
@@ -42,9 +43,87 @@ from websockets.exceptions import (
 
 from utils.logger_setup import setup_logger
 from utils.real_data_verifier_pro import RealDataVerifier
+from utils.broadcast_hub import BroadcastHub
+from utils.local_orderbook import OrderBookManager
 
 logger = setup_logger(__name__)
 
+# ============================================================================
+# PIPELINE QUEUE
+# ============================================================================
+
+class ConflatingQueue:
+    """
+    Bounded single-consumer asyncio queue with per-key conflation
+    
+    Backpressure policy:
+        - Items put with a key replace the pending item for that key
+          (latest state wins, queue position is kept). Items are tuples
+          whose first element is the enqueue time: a replacement keeps the
+          original enqueue time, so stage latency includes the full wait
+        - When full, the oldest pending item is dropped
+    
+    Must only be used from the event loop thread.
+    """
+    
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._items: deque = deque()
+        self._pending: Dict[Hashable, list] = {}
+        self._event = asyncio.Event()
+        
+        self.enqueued = 0
+        self.dropped = 0
+        self.conflated = 0
+        self.high_water = 0
+    
+    def put_nowait(self, item: Any, key: Optional[Hashable] = None):
+        """Enqueue item without blocking the producer"""
+        if key is not None and key in self._pending:
+            entry = self._pending[key]
+            entry[1] = (entry[1][0],) + tuple(item[1:])
+            self.conflated += 1
+            return
+        
+        if len(self._items) >= self.maxsize:
+            old_key, _ = self._items.popleft()
+            if old_key is not None:
+                self._pending.pop(old_key, None)
+            self.dropped += 1
+        
+        entry = [key, item]
+        self._items.append(entry)
+        if key is not None:
+            self._pending[key] = entry
+        
+        self.enqueued += 1
+        self.high_water = max(self.high_water, len(self._items))
+        self._event.set()
+    
+    async def get(self) -> Any:
+        """Wait for and remove the next item"""
+        while not self._items:
+            self._event.clear()
+            await self._event.wait()
+        
+        key, item = self._items.popleft()
+        if key is not None:
+            self._pending.pop(key, None)
+        return item
+    
+    def qsize(self) -> int:
+        return len(self._items)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'depth': len(self._items),
+            'max_size': self.maxsize,
+            'high_water': self.high_water,
+            'enqueued': self.enqueued,
+            'dropped': self.dropped,
+            'conflated': self.conflated
+        }
+
 # ============================================================================
 # WEBSOCKET MANAGER
 # ============================================================================
@@ -83,7 +162,21 @@ class BinanceWebSocketManager:
     STREAM_BOOK_TICKER = "bookTicker"
     STREAM_AGG_TRADE = "aggTrade"
     
-    def __init__(self, testnet: bool = False, global_state=None, socketio=None):
+    # Pipeline: receive -> decode -> verify -> fan-out
+    PIPELINE_STAGES = ('decode', 'verify', 'fanout')
+    DECODE_QUEUE_SIZE = 5000
+    VERIFY_QUEUE_SIZE = 2000
+    FANOUT_QUEUE_SIZE = 2000
+    STALE_EVENT_MS = 5000  # drop state updates older than this (exchange event time)
+    CLOCK_SKEW_TOLERANCE_MS = 1000  # slack on top of the learned local/exchange clock offset
+    CLOCK_OFFSET_WINDOW_S = 60.0  # the offset is the smallest lag seen in the previous window
+    
+    # State streams where only the latest update per symbol matters
+    CONFLATED_STREAMS = (STREAM_TICKER, STREAM_BOOK_TICKER)
+    
+    def __init__(self, testnet: bool = False, global_state=None, socketio=None,
+                 broadcast_hub: Optional[BroadcastHub] = None,
+                 order_books: Optional[OrderBookManager] = None):
         """
         Initialize WebSocket Manager
         
@@ -91,6 +184,8 @@ class BinanceWebSocketManager:
             testnet: Use testnet endpoint (for testing only)
             global_state: Global state manager for orchestrator integration (NEW v8.0)
             socketio: SocketIO instance for real-time client broadcasting (NEW v8.0)
+            broadcast_hub: Shared BroadcastHub (created from socketio if not given)
+            order_books: Local order books fed by depth diffs (created if not given)
         """
         self.base_url = self.TESTNET_URL if testnet else self.STREAM_URL
         
@@ -124,6 +219,14 @@ class BinanceWebSocketManager:
         self.global_state = global_state
         self.socketio = socketio
         
+        # Client fan-out goes through the hub (conflated frames, per-symbol rooms)
+        self.broadcast_hub = broadcast_hub or (BroadcastHub(socketio) if socketio else None)
+        self._owns_hub = broadcast_hub is None and self.broadcast_hub is not None
+        
+        # Depth streams are diffs: they are applied to local books, never used as the book itself
+        self.order_books = order_books or OrderBookManager()
+        self._owns_books = order_books is None
+        
         # Metrics
         self.metrics = {
             'messages_received': 0,
@@ -140,6 +243,18 @@ class BinanceWebSocketManager:
         # Message buffer for replay on reconnect
         self.message_buffer = deque(maxlen=100)
         
+        # Processing pipeline (queues are created on the event loop thread)
+        self.pipeline_queues: Dict[str, ConflatingQueue] = {}
+        self.pipeline_tasks: List[asyncio.Task] = []
+        self.stage_metrics = {
+            stage: {'processed': 0, 'avg_latency_ms': 0.0, 'max_latency_ms': 0.0}
+            for stage in self.PIPELINE_STAGES
+        }
+        self.metrics['stale_dropped'] = 0
+        self.clock_offset_ms: Optional[float] = None
+        self._lag_window_min = float('inf')
+        self._lag_window_end = 0.0
+        
         logger.info("BinanceWebSocketManager initialized with global_state integration (v8.0)")
     
     # ========================================================================
@@ -155,6 +270,9 @@ class BinanceWebSocketManager:
         self.is_running = True
         self.metrics['uptime_start'] = datetime.now()
         
+        if self.broadcast_hub:
+            self.broadcast_hub.start()
+        
         # Start in separate thread
         self.thread = threading.Thread(
             target=self._run_event_loop,
@@ -180,6 +298,9 @@ class BinanceWebSocketManager:
     
     async def _maintain_connection(self):
         """Maintain WebSocket connection with auto-reconnect"""
+        # Pipeline workers outlive individual connections
+        self._start_pipeline()
+        
         while self.is_running:
             try:
                 # Check circuit breaker
@@ -299,91 +420,222 @@ class BinanceWebSocketManager:
     # MESSAGE HANDLING
     # ========================================================================
     
+    def _start_pipeline(self):
+        """Create stage queues and worker tasks on the running event loop"""
+        self.pipeline_queues = {
+            'decode': ConflatingQueue(self.DECODE_QUEUE_SIZE),
+            'verify': ConflatingQueue(self.VERIFY_QUEUE_SIZE),
+            'fanout': ConflatingQueue(self.FANOUT_QUEUE_SIZE)
+        }
+        self.pipeline_tasks = [
+            asyncio.create_task(self._decode_stage(), name="ws-decode"),
+            asyncio.create_task(self._verify_stage(), name="ws-verify"),
+            asyncio.create_task(self._fanout_stage(), name="ws-fanout")
+        ]
+        logger.info("✅ WebSocket pipeline started (decode → verify → fan-out)")
+    
+    async def _stop_pipeline(self):
+        """Cancel stage workers"""
+        for task in self.pipeline_tasks:
+            task.cancel()
+        await asyncio.gather(*self.pipeline_tasks, return_exceptions=True)
+        self.pipeline_tasks = []
+    
+    def _record_stage(self, stage: str, enqueued_at: float):
+        """Record queue wait + processing latency for a stage"""
+        latency_ms = (time.perf_counter() - enqueued_at) * 1000
+        stats = self.stage_metrics[stage]
+        stats['processed'] += 1
+        # EWMA keeps the average responsive to bursts
+        if stats['processed'] == 1:
+            stats['avg_latency_ms'] = latency_ms
+        else:
+            stats['avg_latency_ms'] += (latency_ms - stats['avg_latency_ms']) * 0.05
+        stats['max_latency_ms'] = max(stats['max_latency_ms'], latency_ms)
+    
+    def _conflation_key(self, kind: str, data: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+        """Key for latest-wins conflation (None = every message is kept)"""
+        if kind in self.CONFLATED_STREAMS:
+            return (kind, data.get('s', ''))
+        return None
+    
+    def _observe_lag(self, lag_ms: float, now: float):
+        """
+        Track receive time - exchange event time. The smallest lag of a window
+        is skew + best-case network latency; it becomes the offset for the next
+        window (and lowers the current offset immediately). Receive time is
+        stamped before the decode queue, so pipeline backlog never leaks into
+        the offset.
+        """
+        self._lag_window_min = min(self._lag_window_min, lag_ms)
+        if self.clock_offset_ms is None or lag_ms < self.clock_offset_ms:
+            self.clock_offset_ms = lag_ms
+        if now >= self._lag_window_end:
+            self.clock_offset_ms = self._lag_window_min
+            self._lag_window_min = lag_ms
+            self._lag_window_end = now + self.CLOCK_OFFSET_WINDOW_S
+    
+    def _is_stale(self, kind: str, data: Dict[str, Any], received_at: float) -> bool:
+        """State updates older than STALE_EVENT_MS (skew-corrected) are superseded by newer ones"""
+        if kind not in self.CONFLATED_STREAMS:
+            return False
+        event_time = data.get('E')
+        if not event_time:
+            return False
+        self._observe_lag(received_at * 1000 - event_time, received_at)
+        age_ms = time.time() * 1000 - event_time - self.clock_offset_ms
+        return age_ms > self.STALE_EVENT_MS + self.CLOCK_SKEW_TOLERANCE_MS
+    
     async def _message_handler(self):
-        """Handle incoming WebSocket messages"""
+        """Receive stage: hand raw frames to the pipeline without processing"""
+        decode_queue = self.pipeline_queues['decode']
         try:
             async for message in self.websocket:
-                try:
-                    # Parse message
-                    data = json.loads(message)
-                    
-                    # Update metrics
-                    self.metrics['messages_received'] += 1
-                    self.metrics['last_message_time'] = datetime.now()
-                    
-                    # Store in buffer
-                    self.message_buffer.append(data)
-                    
-                    # Process based on stream type
-                    await self._process_message(data)
-                    
-                except json.JSONDecodeError as e:
-                    logger.error(f"JSON decode error: {e}")
-                    self.metrics['messages_failed'] += 1
-                    
-                except Exception as e:
-                    logger.error(f"Message processing error: {e}")
-                    self.metrics['messages_failed'] += 1
+                self.metrics['messages_received'] += 1
+                self.metrics['last_message_time'] = datetime.now()
+                decode_queue.put_nowait((time.perf_counter(), time.time(), message))
         
         except Exception as e:
             logger.error(f"Message handler error: {e}")
             raise
     
-    async def _process_message(self, data: Dict[str, Any]):
-        """Process message based on stream type"""
-        try:
-            # Get stream type
-            stream = data.get('stream', '')
-            event_data = data.get('data', data)
-            event_type = event_data.get('e', '')
-            
-            # Route to appropriate handler
-            if '24hrTicker' in stream or event_type == '24hrTicker':
-                await self._handle_ticker(event_data)
-            
-            elif 'depth' in stream or event_type == 'depthUpdate':
-                await self._handle_depth(event_data)
+    async def _decode_stage(self):
+        """Decode stage: parse JSON and classify by stream type"""
+        queue = self.pipeline_queues['decode']
+        verify_queue = self.pipeline_queues['verify']
+        while True:
+            enqueued_at, received_at, message = await queue.get()
+            try:
+                data = json.loads(message)
+                self.message_buffer.append(data)
+                
+                kind, event_data = self._classify_message(data)
+                if kind is None:
+                    continue
+                
+                verify_queue.put_nowait(
+                    (time.perf_counter(), received_at, kind, event_data),
+                    key=self._conflation_key(kind, event_data)
+                )
             
-            elif 'trade' in stream or event_type == 'trade':
-                await self._handle_trade(event_data)
+            except json.JSONDecodeError as e:
+                logger.error(f"JSON decode error: {e}")
+                self.metrics['messages_failed'] += 1
             
-            elif 'kline' in stream or event_type == 'kline':
-                await self._handle_kline(event_data)
+            except Exception as e:
+                logger.error(f"Message processing error: {e}")
+                self.metrics['messages_failed'] += 1
             
-            elif 'bookTicker' in stream or event_type == 'bookTicker':
-                await self._handle_book_ticker(event_data)
+            finally:
+                self._record_stage('decode', enqueued_at)
+    
+    async def _verify_stage(self):
+        """Verify stage: drop stale state updates, validate prices"""
+        queue = self.pipeline_queues['verify']
+        fanout_queue = self.pipeline_queues['fanout']
+        while True:
+            enqueued_at, received_at, kind, event_data = await queue.get()
+            try:
+                if self._is_stale(kind, event_data, received_at):
+                    self.metrics['stale_dropped'] += 1
+                    continue
+                
+                if kind == self.STREAM_TICKER and not await self._verify_ticker(event_data):
+                    continue
+                
+                fanout_queue.put_nowait(
+                    (time.perf_counter(), kind, event_data),
+                    key=self._conflation_key(kind, event_data)
+                )
             
-            elif 'aggTrade' in stream or event_type == 'aggTrade':
-                await self._handle_agg_trade(event_data)
+            except Exception as e:
+                logger.error(f"Verification stage error: {e}")
+                self.metrics['messages_failed'] += 1
             
-            else:
-                logger.debug(f"Unknown message type: {event_type}")
+            finally:
+                self._record_stage('verify', enqueued_at)
+    
+    async def _fanout_stage(self):
+        """Fan-out stage: global_state, SocketIO and callbacks"""
+        queue = self.pipeline_queues['fanout']
+        while True:
+            enqueued_at, kind, event_data = await queue.get()
+            try:
+                await self._process_message(kind, event_data)
+            finally:
+                self._record_stage('fanout', enqueued_at)
+    
+    def _classify_message(self, data: Dict[str, Any]) -> Tuple[Optional[str], Dict[str, Any]]:
+        """Resolve stream type of a combined-stream or raw message"""
+        stream = data.get('stream', '')
+        event_data = data.get('data', data)
+        event_type = event_data.get('e', '')
+        
+        if '24hrTicker' in stream or event_type == '24hrTicker':
+            return self.STREAM_TICKER, event_data
+        elif 'depth' in stream or event_type == 'depthUpdate':
+            return self.STREAM_DEPTH, event_data
+        elif 'trade' in stream or event_type == 'trade':
+            return self.STREAM_TRADE, event_data
+        elif 'kline' in stream or event_type == 'kline':
+            return self.STREAM_KLINE, event_data
+        elif 'bookTicker' in stream or event_type == 'bookTicker':
+            return self.STREAM_BOOK_TICKER, event_data
+        elif 'aggTrade' in stream or event_type == 'aggTrade':
+            return self.STREAM_AGG_TRADE, event_data
+        
+        logger.debug(f"Unknown message type: {event_type}")
+        return None, event_data
+    
+    async def _process_message(self, kind: str, data: Dict[str, Any]):
+        """Route a verified message to its fan-out handler"""
+        try:
+            if kind == self.STREAM_TICKER:
+                await self._handle_ticker(data)
+            elif kind == self.STREAM_DEPTH:
+                await self._handle_depth(data)
+            elif kind == self.STREAM_TRADE:
+                await self._handle_trade(data)
+            elif kind == self.STREAM_KLINE:
+                await self._handle_kline(data)
+            elif kind == self.STREAM_BOOK_TICKER:
+                await self._handle_book_ticker(data)
+            elif kind == self.STREAM_AGG_TRADE:
+                await self._handle_agg_trade(data)
         
         except Exception as e:
             logger.error(f"Error processing message: {e}")
     
+    async def _verify_ticker(self, data: Dict[str, Any]) -> bool:
+        """Verify ticker price (cross-validated against in-memory references)"""
+        symbol = data.get('s', '')
+        price = float(data.get('c', 0))
+        
+        is_valid = await self.data_verifier.verify_price_async(
+            symbol=symbol,
+            price=price,
+            exchange='binance'
+        )
+        
+        if not is_valid:
+            logger.warning(f"⚠️ INVALID TICKER DATA for {symbol} - REJECTED")
+            self.metrics['validation_failures'] += 1
+            return False
+        
+        self.metrics['validation_passes'] += 1
+        
+        # Feed verified price back as cross-validation reference
+        self.data_verifier.reference_store.update(symbol, price, 'BINANCE_WS')
+        return True
+    
     async def _handle_ticker(self, data: Dict[str, Any]):
-        """Handle 24hr ticker data"""
+        """Handle 24hr ticker data (already verified by the verify stage)"""
         try:
             symbol = data.get('s', '')
             price = float(data.get('c', 0))
             change_24h = float(data.get('P', 0))
             volume = float(data.get('v', 0))
             
-            # Verify real data
-            is_valid = await self.data_verifier.verify_price(
-                symbol=symbol,
-                price=price,
-                exchange='binance'
-            )
-            
-            if not is_valid:
-                logger.warning(f"⚠️ INVALID TICKER DATA for {symbol} - REJECTED")
-                self.metrics['validation_failures'] += 1
-                return
-            
-            self.metrics['validation_passes'] += 1
-            
             # NEW v8.0: Push to global state for orchestrator
             if self.global_state:
                 try:
@@ -402,10 +654,10 @@ class BinanceWebSocketManager:
                 except Exception as e:
                     logger.error(f"❌ Error pushing to global_state: {e}")
             
-            # NEW v8.0: Broadcast to SocketIO clients
-            if self.socketio:
+            # NEW v8.0: Broadcast to SocketIO clients (latest per frame)
+            if self.broadcast_hub:
                 try:
-                    self.socketio.emit('market_update', {
+                    self.broadcast_hub.publish_state('market_update', symbol, {
                         'symbol': symbol,
                         'price': price,
                         'change_24h': change_24h,
@@ -430,26 +682,20 @@ class BinanceWebSocketManager:
             logger.error(f"Error handling ticker: {e}")
     
     async def _handle_depth(self, data: Dict[str, Any]):
-        """Handle order book depth data"""
+        """Handle order book depth diff (applied to the symbol's local book)"""
         try:
             symbol = data.get('s', '')
-            bids = data.get('b', [])
-            asks = data.get('a', [])
+            book = self.order_books.on_depth_event(data)
+            if book is None:
+                return  # book still syncing (snapshot pending) or diff already covered
             
-            # Parse order book
-            bids_parsed = [[float(p), float(q)] for p, q in bids[:20]]
-            asks_parsed = [[float(p), float(q)] for p, q in asks[:20]]
+            # Top levels of the live book
+            bids_parsed, asks_parsed = book.levels(20)
             
-            # NEW v8.0: Broadcast orderbook to SocketIO clients
-            if self.socketio:
+            # NEW v8.0: Broadcast orderbook to SocketIO clients (top levels, delta-encoded)
+            if self.broadcast_hub:
                 try:
-                    self.socketio.emit('orderbook_update', {
-                        'symbol': symbol,
-                        'bids': bids_parsed[:5],  # Top 5 for bandwidth
-                        'asks': asks_parsed[:5],
-                        'timestamp': time.time(),
-                        'source': 'binance_websocket'
-                    })
+                    self.broadcast_hub.publish_book(symbol, bids_parsed, asks_parsed, source='binance_websocket')
                     self.metrics['socketio_broadcasts'] += 1
                 except Exception as e:
                     logger.error(f"❌ Error broadcasting orderbook: {e}")
@@ -459,6 +705,7 @@ class BinanceWebSocketManager:
                 'symbol': symbol,
                 'bids': bids_parsed,
                 'asks': asks_parsed,
+                'last_update_id': book.last_update_id,
                 'timestamp': time.time()
             })
             
@@ -473,10 +720,10 @@ class BinanceWebSocketManager:
             quantity = float(data.get('q', 0))
             is_buyer_maker = data.get('m', False)
             
-            # NEW v8.0: Broadcast trade to SocketIO clients
-            if self.socketio:
+            # NEW v8.0: Broadcast trade to SocketIO clients (aggregated per frame)
+            if self.broadcast_hub:
                 try:
-                    self.socketio.emit('trade_update', {
+                    self.broadcast_hub.publish_trade(symbol, {
                         'symbol': symbol,
                         'price': price,
                         'quantity': quantity,
@@ -509,6 +756,7 @@ class BinanceWebSocketManager:
             kline_data = {
                 'symbol': symbol,
                 'interval': kline.get('i', ''),
+                'open_time': int(kline.get('t', 0)),
                 'open': float(kline.get('o', 0)),
                 'high': float(kline.get('h', 0)),
                 'low': float(kline.get('l', 0)),
@@ -519,9 +767,9 @@ class BinanceWebSocketManager:
             }
             
             # NEW v8.0: Broadcast kline to SocketIO clients (only closed candles)
-            if self.socketio and kline_data['closed']:
+            if self.broadcast_hub and kline_data['closed']:
                 try:
-                    self.socketio.emit('kline_update', {
+                    self.broadcast_hub.publish_state('kline_update', symbol, {
                         **kline_data,
                         'source': 'binance_websocket'
                     })
@@ -543,10 +791,10 @@ class BinanceWebSocketManager:
             best_ask = float(data.get('a', 0))
             spread = best_ask - best_bid
             
-            # NEW v8.0: Broadcast book ticker to SocketIO clients
-            if self.socketio:
+            # NEW v8.0: Broadcast book ticker to SocketIO clients (latest per frame)
+            if self.broadcast_hub:
                 try:
-                    self.socketio.emit('book_ticker_update', {
+                    self.broadcast_hub.publish_state('book_ticker_update', symbol, {
                         'symbol': symbol,
                         'best_bid': best_bid,
                         'best_ask': best_ask,
@@ -820,8 +1068,26 @@ class BinanceWebSocketManager:
             'last_pong_time': self.last_pong_time,
             'data_pushed_to_state': self.metrics['data_pushed_to_state'],
             'socketio_broadcasts': self.metrics['socketio_broadcasts'],
+            'broadcast_hub': self.broadcast_hub.get_metrics() if self.broadcast_hub else None,
+            'order_books': self.order_books.get_stats(),
             'validation_passes': self.metrics['validation_passes'],
-            'validation_failures': self.metrics['validation_failures']
+            'validation_failures': self.metrics['validation_failures'],
+            'pipeline': {
+                'queues': {
+                    stage: queue.get_stats()
+                    for stage, queue in self.pipeline_queues.items()
+                },
+                'stages': {
+                    stage: {
+                        'processed': stats['processed'],
+                        'avg_latency_ms': round(stats['avg_latency_ms'], 3),
+                        'max_latency_ms': round(stats['max_latency_ms'], 3)
+                    }
+                    for stage, stats in self.stage_metrics.items()
+                },
+                'stale_dropped': self.metrics['stale_dropped'],
+                'clock_offset_ms': round(self.clock_offset_ms, 1) if self.clock_offset_ms is not None else None
+            }
         }
     
     def is_healthy(self) -> bool:
@@ -913,6 +1179,8 @@ class BinanceWebSocketManager:
                 await self.websocket.close()
                 self.websocket = None
             
+            await self._stop_pipeline()
+            
             self.is_connected = False
             
             logger.info("WebSocket closed")
@@ -931,6 +1199,11 @@ class BinanceWebSocketManager:
         if self.thread and self.thread.is_alive():
             self.thread.join(timeout=5)
         
+        if self._owns_hub:
+            self.broadcast_hub.stop()
+        if self._owns_books:
+            self.order_books.close()
+        
         logger.info("✅ WebSocket manager stopped")
     
     def __del__(self):
@@ -38,9 +38,10 @@ from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 import pytz
 import numpy as np
-import requests
 from collections import deque
 
+from utils.http_client import get_http_client
+
 # Initialize logger
 logger = logging.getLogger('DOMINANCE_TRACKER')
 
@@ -99,7 +100,7 @@ class CryptoDominanceTracker:
         """
         self.cmc_key = cmc_key or os.getenv('CoinMarketCap_API_KEY')
         self.coingecko_key = coingecko_key
-        self.session = requests.Session()
+        self.session = get_http_client()  # shared keep-alive pool
         self.mock_detector = DominanceMockDataDetector()
         
         # Historical dominance tracking
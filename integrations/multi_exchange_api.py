@@ -19,6 +19,7 @@ from enum import Enum
 
 from utils.retry_manager import RetryManager
 from utils.circuit_breaker import CircuitBreaker
+from utils.http_client import get_async_http_client
 
 # ============================================================================
 # LOGGING SETUP
@@ -242,22 +243,21 @@ class MultiExchangeDataFetcher:
         start_time = time.time()
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url,
-                    params=params,
-                    timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
-                ) as response:
-                    latency = time.time() - start_time
-                    self._record_latency('BINANCE', latency)
-                    
-                    if response.status == 200:
-                        data = await response.json()
-                        price = float(data['price'])
-                        return price
-                    else:
-                        self.logger.error(f'❌ Binance API error: {response.status}')
-                        return None
+            async with get_async_http_client().get(
+                url,
+                params=params,
+                timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+            ) as response:
+                latency = time.time() - start_time
+                self._record_latency('BINANCE', latency)
+                
+                if response.status == 200:
+                    data = await response.json()
+                    price = float(data['price'])
+                    return price
+                else:
+                    self.logger.error(f'❌ Binance API error: {response.status}')
+                    return None
         except Exception as e:
             self.logger.error(f'❌ Binance fetch error: {e}')
             return None
@@ -273,23 +273,22 @@ class MultiExchangeDataFetcher:
         start_time = time.time()
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url,
-                    params=params,
-                    timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
-                ) as response:
-                    latency = time.time() - start_time
-                    self._record_latency('BYBIT', latency)
-                    
-                    if response.status == 200:
-                        data = await response.json()
-                        if data.get('retcode') == 0:
-                            result = data.get('result')
-                            if isinstance(result, list) and len(result) > 0:
-                                price = float(result[0]['last_price'])
-                                return price
-                    return None
+            async with get_async_http_client().get(
+                url,
+                params=params,
+                timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+            ) as response:
+                latency = time.time() - start_time
+                self._record_latency('BYBIT', latency)
+                
+                if response.status == 200:
+                    data = await response.json()
+                    if data.get('retcode') == 0:
+                        result = data.get('result')
+                        if isinstance(result, list) and len(result) > 0:
+                            price = float(result[0]['last_price'])
+                            return price
+                return None
         except Exception as e:
             self.logger.error(f'❌ Bybit fetch error: {e}')
             return None
@@ -304,19 +303,18 @@ class MultiExchangeDataFetcher:
         start_time = time.time()
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url,
-                    timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
-                ) as response:
-                    latency = time.time() - start_time
-                    self._record_latency('COINBASE', latency)
-                    
-                    if response.status == 200:
-                        data = await response.json()
-                        price = float(data['price'])
-                        return price
-                    return None
+            async with get_async_http_client().get(
+                url,
+                timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+            ) as response:
+                latency = time.time() - start_time
+                self._record_latency('COINBASE', latency)
+                
+                if response.status == 200:
+                    data = await response.json()
+                    price = float(data['price'])
+                    return price
+                return None
         except Exception as e:
             self.logger.error(f'❌ Coinbase fetch error: {e}')
             return None
@@ -376,35 +374,34 @@ class MultiExchangeDataFetcher:
         }
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url,
-                    params=params,
-                    timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        
-                        # Parse klines
-                        df = pd.DataFrame(
-                            data,
-                            columns=['timestamp', 'open', 'high', 'low', 'close', 'volume',
-                                    'close_time', 'quote_volume', 'trades', 'taker_buy_base',
-                                    'taker_buy_quote', 'ignore']
-                        )
-                        
-                        # Convert to proper types
-                        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-                        df['open'] = df['open'].astype(float)
-                        df['high'] = df['high'].astype(float)
-                        df['low'] = df['low'].astype(float)
-                        df['close'] = df['close'].astype(float)
-                        df['volume'] = df['volume'].astype(float)
-                        
-                        # Keep only essential columns
-                        df = df[['timestamp', 'open', 'high', 'low', 'close', 'volume']]
-                        return df
-                    return None
+            async with get_async_http_client().get(
+                url,
+                params=params,
+                timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+            ) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    
+                    # Parse klines
+                    df = pd.DataFrame(
+                        data,
+                        columns=['timestamp', 'open', 'high', 'low', 'close', 'volume',
+                                'close_time', 'quote_volume', 'trades', 'taker_buy_base',
+                                'taker_buy_quote', 'ignore']
+                    )
+                    
+                    # Convert to proper types
+                    df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+                    df['open'] = df['open'].astype(float)
+                    df['high'] = df['high'].astype(float)
+                    df['low'] = df['low'].astype(float)
+                    df['close'] = df['close'].astype(float)
+                    df['volume'] = df['volume'].astype(float)
+                    
+                    # Keep only essential columns
+                    df = df[['timestamp', 'open', 'high', 'low', 'close', 'volume']]
+                    return df
+                return None
         except Exception as e:
             self.logger.error(f'❌ Binance klines error: {e}')
             return None
@@ -437,28 +434,27 @@ class MultiExchangeDataFetcher:
         }
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url,
-                    params=params,
-                    timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        if data.get('retcode') == 0:
-                            klines = data.get('result')
-                            df = pd.DataFrame(klines)
-                            df['timestamp'] = pd.to_datetime(df['open_time'], unit='s')
-                            df = df.rename(columns={
-                                'open': 'open',
-                                'high': 'high',
-                                'low': 'low',
-                                'close': 'close',
-                                'volume': 'volume'
-                            })
-                            df = df[['timestamp', 'open', 'high', 'low', 'close', 'volume']]
-                            return df
-                    return None
+            async with get_async_http_client().get(
+                url,
+                params=params,
+                timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+            ) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    if data.get('retcode') == 0:
+                        klines = data.get('result')
+                        df = pd.DataFrame(klines)
+                        df['timestamp'] = pd.to_datetime(df['open_time'], unit='s')
+                        df = df.rename(columns={
+                            'open': 'open',
+                            'high': 'high',
+                            'low': 'low',
+                            'close': 'close',
+                            'volume': 'volume'
+                        })
+                        df = df[['timestamp', 'open', 'high', 'low', 'close', 'volume']]
+                        return df
+                return None
         except Exception as e:
             self.logger.error(f'❌ Bybit klines error: {e}')
             return None
@@ -473,25 +469,24 @@ class MultiExchangeDataFetcher:
             url = f"{BINANCE_CONFIG['rest_url']}{BINANCE_CONFIG['endpoints']['ticker24h']}"
             params = {'symbol': symbol}
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url,
-                    params=params,
-                    timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return {
-                            'symbol': data.get('symbol'),
-                            'price_change': float(data.get('priceChange', 0)),
-                            'price_change_percent': float(data.get('priceChangePercent', 0)),
-                            'volume': float(data.get('volume', 0)),
-                            'quote_volume': float(data.get('quoteVolume', 0)),
-                            'high': float(data.get('highPrice', 0)),
-                            'low': float(data.get('lowPrice', 0)),
-                            'open': float(data.get('openPrice', 0)),
-                            'close': float(data.get('lastPrice', 0))
-                        }
+            async with get_async_http_client().get(
+                url,
+                params=params,
+                timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+            ) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    return {
+                        'symbol': data.get('symbol'),
+                        'price_change': float(data.get('priceChange', 0)),
+                        'price_change_percent': float(data.get('priceChangePercent', 0)),
+                        'volume': float(data.get('volume', 0)),
+                        'quote_volume': float(data.get('quoteVolume', 0)),
+                        'high': float(data.get('highPrice', 0)),
+                        'low': float(data.get('lowPrice', 0)),
+                        'open': float(data.get('openPrice', 0)),
+                        'close': float(data.get('lastPrice', 0))
+                    }
         except Exception as e:
             self.logger.error(f'❌ 24h ticker fetch error: {e}')
         
@@ -3,52 +3,71 @@ DEMIR AI v6.0 - PHASE 4 [55]
 Multi-Timeframe Manager - 15m/1h/4h/1d Synchronization
 Sliding window OHLCV storage, timeframe aggregation, convergence detection
 Production-grade timeframe handler for multi-timeframe analysis
+
+Higher timeframes are built from 1m candles by a streaming resampler
+(one open bucket per timeframe, O(1) per 1m candle); closed bars are
+stored and published to bar-close listeners.
 """
 
 import logging
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 from datetime import datetime, timedelta
 import numpy as np
-from collections import deque
 import json
 
+from utils.ring_buffer import ColumnarRingBuffer
+from utils.ohlcv_resampler import StreamingResampler
+
+DEFAULT_TIMEFRAMES: Tuple[str, ...] = ('15m', '1h', '4h', '1d')
+DEFAULT_CAPACITIES: Dict[str, int] = {'15m': 5000, '1h': 2000, '4h': 1000, '1d': 365}
+
+# (symbol, timeframe, bar) - called for every closed bar
+BarCloseListener = Callable[[str, str, Dict], None]
+
 logger = logging.getLogger(__name__)
 
 
 class TimeframeOHLCV:
-    """OHLCV container for single timeframe"""
+    """OHLCV container for single timeframe (columnar ring buffer)"""
     
     def __init__(self, timeframe: str, max_candles: int = 5000):
         """Initialize timeframe storage"""
         self.timeframe = timeframe
         self.max_candles = max_candles
-        self.candles = deque(maxlen=max_candles)
+        self.candles = ColumnarRingBuffer(max_candles)
         self.last_update = None
         
     def add_candle(self, candle: Dict) -> bool:
         """Add OHLCV candle"""
         try:
-            if candle['timestamp'] <= self.last_update:
+            if self.last_update is not None and candle['timestamp'] <= self.last_update:
                 return False  # Duplicate or older
             
-            self.candles.append(candle)
+            self.candles.append_row((
+                candle['timestamp'], candle['open'], candle['high'],
+                candle['low'], candle['close'], candle['volume']
+            ))
             self.last_update = candle['timestamp']
             return True
         except Exception as e:
             logger.error(f"Error adding candle: {e}")
             return False
     
+    def get_arrays(self, count: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """Zero-copy read-only views of the last `count` candles per field"""
+        return self.candles.views(count)
+    
     def get_recent(self, count: int = 100) -> List[Dict]:
         """Get recent candles"""
-        return list(self.candles)[-count:] if self.candles else []
+        return self.candles.rows(count)
     
     def get_all(self) -> List[Dict]:
         """Get all candles"""
-        return list(self.candles)
+        return self.candles.rows()
     
     def get_latest(self) -> Optional[Dict]:
         """Get latest candle"""
-        return self.candles[-1] if self.candles else None
+        return self.candles.row(-1) if len(self.candles) else None
     
     def count(self) -> int:
         """Get candle count"""
@@ -58,148 +77,80 @@ class TimeframeOHLCV:
 class MultiTimeframeManager:
     """Manage multiple timeframes for symbol"""
     
-    def __init__(self, symbol: str):
+    def __init__(self, symbol: str, timeframes: Sequence[str] = DEFAULT_TIMEFRAMES,
+                 capacities: Optional[Dict[str, int]] = None):
         """Initialize multi-timeframe manager"""
         self.symbol = symbol
+        capacities = {**DEFAULT_CAPACITIES, **(capacities or {})}
         self.timeframes = {
-            '15m': TimeframeOHLCV('15m', 5000),
-            '1h': TimeframeOHLCV('1h', 2000),
-            '4h': TimeframeOHLCV('4h', 1000),
-            '1d': TimeframeOHLCV('1d', 365)
+            tf: TimeframeOHLCV(tf, capacities.get(tf, 1000))
+            for tf in timeframes
         }
+        self.resampler = StreamingResampler(list(self.timeframes))
+        self.listeners: List[BarCloseListener] = []
         self.sync_status = {}
         logger.info(f"📊 Multi-timeframe manager created for {symbol}")
     
+    def on_bar_close(self, listener: BarCloseListener):
+        """Register a bar-closed callback: listener(symbol, timeframe, bar)"""
+        self.listeners.append(listener)
+    
     def add_1m_candle(self, candle_1m: Dict) -> Dict[str, bool]:
-        """Add 1-minute candle and aggregate to higher timeframes"""
+        """Add 1-minute candle and aggregate to higher timeframes (True for every bar it closed)"""
         results = {'1m': True}
         
         try:
-            timestamp = candle_1m['timestamp']
-            
-            # Aggregate 1m → 15m
-            tf_15m = self._aggregate_to_15m(timestamp, candle_1m)
-            if tf_15m and self.timeframes['15m'].add_candle(tf_15m):
-                results['15m'] = True
-            
-            # Aggregate 1m → 1h
-            tf_1h = self._aggregate_to_1h(timestamp, candle_1m)
-            if tf_1h and self.timeframes['1h'].add_candle(tf_1h):
-                results['1h'] = True
-            
-            # Aggregate 1m → 4h
-            tf_4h = self._aggregate_to_4h(timestamp, candle_1m)
-            if tf_4h and self.timeframes['4h'].add_candle(tf_4h):
-                results['4h'] = True
-            
-            # Aggregate 1m → 1d
-            tf_1d = self._aggregate_to_1d(timestamp, candle_1m)
-            if tf_1d and self.timeframes['1d'].add_candle(tf_1d):
-                results['1d'] = True
-            
+            closed = self.resampler.update(
+                candle_1m['timestamp'], candle_1m['open'], candle_1m['high'],
+                candle_1m['low'], candle_1m['close'], candle_1m['volume']
+            )
+            for tf, bar in closed:
+                bar['symbol'] = self.symbol
+                if self.timeframes[tf].add_candle(bar):
+                    results[tf] = True
+                    self._publish(tf, bar)
             return results
         
         except Exception as e:
             logger.error(f"Error adding 1m candle: {e}")
             return results
     
-    def _aggregate_to_15m(self, timestamp: int, candle_1m: Dict) -> Optional[Dict]:
-        """Aggregate 1m candles to 15m"""
-        # 15m = 900 seconds
-        tf_timestamp = (timestamp // 900000) * 900000
-        
-        recent_1m = self.timeframes['15m'].get_recent(15)
-        if not recent_1m or recent_1m[-1].get('timestamp', 0) != tf_timestamp:
-            return None
-        
-        # Aggregate
-        opens = [c['open'] for c in recent_1m]
-        highs = [c['high'] for c in recent_1m]
-        lows = [c['low'] for c in recent_1m]
-        closes = [c['close'] for c in recent_1m]
-        volumes = [c['volume'] for c in recent_1m]
-        
-        return {
-            'timestamp': tf_timestamp,
-            'symbol': self.symbol,
-            'open': opens[0] if opens else 0,
-            'high': max(highs) if highs else 0,
-            'low': min(lows) if lows else 0,
-            'close': closes[-1] if closes else 0,
-            'volume': sum(volumes) if volumes else 0
-        }
+    def _publish(self, timeframe: str, bar: Dict):
+        for listener in self.listeners:
+            try:
+                listener(self.symbol, timeframe, bar)
+            except Exception as e:
+                logger.error(f"Bar-close listener error ({self.symbol} {timeframe}): {e}")
     
-    def _aggregate_to_1h(self, timestamp: int, candle_1m: Dict) -> Optional[Dict]:
-        """Aggregate 1m candles to 1h"""
-        tf_timestamp = (timestamp // 3600000) * 3600000
-        
-        recent_1m = self.timeframes['1h'].get_recent(60)
-        if not recent_1m or recent_1m[-1].get('timestamp', 0) != tf_timestamp:
-            return None
-        
-        opens = [c['open'] for c in recent_1m]
-        highs = [c['high'] for c in recent_1m]
-        lows = [c['low'] for c in recent_1m]
-        closes = [c['close'] for c in recent_1m]
-        volumes = [c['volume'] for c in recent_1m]
-        
-        return {
-            'timestamp': tf_timestamp,
-            'symbol': self.symbol,
-            'open': opens[0] if opens else 0,
-            'high': max(highs) if highs else 0,
-            'low': min(lows) if lows else 0,
-            'close': closes[-1] if closes else 0,
-            'volume': sum(volumes) if volumes else 0
-        }
+    def backfill_1m(self, candles) -> Dict[str, int]:
+        """
+        Bulk 1m history in one vectorized pass: a list of candle dicts or a
+        {'timestamp', 'open', 'high', 'low', 'close', 'volume'} dict of arrays.
+        No bar-close events are emitted. Returns bars stored per timeframe.
+        """
+        if isinstance(candles, dict):
+            columns = candles
+        else:
+            candles = list(candles)
+            columns = {
+                field: [c[field] for c in candles]
+                for field in ('timestamp', 'open', 'high', 'low', 'close', 'volume')
+            }
+        stored = {}
+        for tf, bars in self.resampler.backfill(columns).items():
+            store = self.timeframes[tf]
+            if store.last_update is not None:
+                keep = bars['timestamp'] > store.last_update
+                bars = {field: values[keep] for field, values in bars.items()}
+            if len(bars['timestamp']):
+                store.candles.extend(bars)
+                store.last_update = int(bars['timestamp'][-1])
+            stored[tf] = int(len(bars['timestamp']))
+        return stored
     
-    def _aggregate_to_4h(self, timestamp: int, candle_1m: Dict) -> Optional[Dict]:
-        """Aggregate 1m candles to 4h"""
-        tf_timestamp = (timestamp // 14400000) * 14400000
-        
-        recent_1m = self.timeframes['4h'].get_recent(240)
-        if not recent_1m or recent_1m[-1].get('timestamp', 0) != tf_timestamp:
-            return None
-        
-        opens = [c['open'] for c in recent_1m]
-        highs = [c['high'] for c in recent_1m]
-        lows = [c['low'] for c in recent_1m]
-        closes = [c['close'] for c in recent_1m]
-        volumes = [c['volume'] for c in recent_1m]
-        
-        return {
-            'timestamp': tf_timestamp,
-            'symbol': self.symbol,
-            'open': opens[0] if opens else 0,
-            'high': max(highs) if highs else 0,
-            'low': min(lows) if lows else 0,
-            'close': closes[-1] if closes else 0,
-            'volume': sum(volumes) if volumes else 0
-        }
-    
-    def _aggregate_to_1d(self, timestamp: int, candle_1m: Dict) -> Optional[Dict]:
-        """Aggregate 1m candles to 1d"""
-        tf_timestamp = (timestamp // 86400000) * 86400000
-        
-        recent_1m = self.timeframes['1d'].get_recent(1440)
-        if not recent_1m or recent_1m[-1].get('timestamp', 0) != tf_timestamp:
-            return None
-        
-        opens = [c['open'] for c in recent_1m]
-        highs = [c['high'] for c in recent_1m]
-        lows = [c['low'] for c in recent_1m]
-        closes = [c['close'] for c in recent_1m]
-        volumes = [c['volume'] for c in recent_1m]
-        
-        return {
-            'timestamp': tf_timestamp,
-            'symbol': self.symbol,
-            'open': opens[0] if opens else 0,
-            'high': max(highs) if highs else 0,
-            'low': min(lows) if lows else 0,
-            'close': closes[-1] if closes else 0,
-            'volume': sum(volumes) if volumes else 0
-        }
+    def get_open_bar(self, timeframe: str) -> Optional[Dict]:
+        """Forming (not yet closed) bar of a timeframe"""
+        return self.resampler.open_bar(timeframe)
     
     def get_timeframe_data(self, timeframe: str, count: int = 100) -> List[Dict]:
         """Get timeframe data"""
@@ -298,22 +249,59 @@ class MultiTimeframeManager:
 
 
 class GlobalTimeframeManager:
-    """Manage timeframes for all symbols"""
+    """
+    Manage timeframes for all symbols
+
+    Every symbol gets its own streaming resampler; per-symbol work per 1m
+    candle is O(timeframes). Ring-buffer capacities can be lowered via
+    `capacities` when tracking hundreds of symbols.
+    """
     
-    def __init__(self, symbols: List[str] = None):
+    def __init__(self, symbols: List[str] = None, timeframes: Sequence[str] = DEFAULT_TIMEFRAMES,
+                 capacities: Optional[Dict[str, int]] = None):
         """Initialize global manager"""
-        self.symbols = symbols or ['BTCUSDT', 'ETHUSDT', 'LTCUSDT']
-        self.managers = {symbol: MultiTimeframeManager(symbol) for symbol in self.symbols}
+        self.symbols = list(symbols or ['BTCUSDT', 'ETHUSDT', 'LTCUSDT'])
+        self.timeframe_names = tuple(timeframes)
+        self.capacities = capacities
+        self.listeners: List[BarCloseListener] = []
+        self.managers: Dict[str, MultiTimeframeManager] = {}
+        for symbol in self.symbols:
+            self._create(symbol)
         logger.info(f"🌍 Global timeframe manager created for {len(self.symbols)} symbols")
     
+    def _create(self, symbol: str) -> MultiTimeframeManager:
+        manager = MultiTimeframeManager(symbol, self.timeframe_names, self.capacities)
+        manager.listeners = self.listeners  # shared: registering once covers every symbol
+        self.managers[symbol] = manager
+        if symbol not in self.symbols:
+            self.symbols.append(symbol)
+        return manager
+    
+    def on_bar_close(self, listener: BarCloseListener):
+        """Register a bar-closed callback for all symbols: listener(symbol, timeframe, bar)"""
+        self.listeners.append(listener)
+    
     def add_1m_candle(self, symbol: str, candle_1m: Dict) -> bool:
         """Add 1m candle for symbol"""
-        if symbol not in self.managers:
-            self.managers[symbol] = MultiTimeframeManager(symbol)
-        
-        results = self.managers[symbol].add_1m_candle(candle_1m)
+        manager = self.managers.get(symbol) or self._create(symbol)
+        results = manager.add_1m_candle(candle_1m)
         return results.get('1m', False)
     
+    def add_1m_candles(self, candles: Dict[str, Dict]) -> Dict[str, List[str]]:
+        """One 1m candle per symbol (e.g. a kline close fan-out) → timeframes closed per symbol"""
+        closed = {}
+        for symbol, candle in candles.items():
+            manager = self.managers.get(symbol) or self._create(symbol)
+            tfs = [tf for tf, ok in manager.add_1m_candle(candle).items() if ok and tf != '1m']
+            if tfs:
+                closed[symbol] = tfs
+        return closed
+    
+    def backfill_1m(self, symbol: str, candles) -> Dict[str, int]:
+        """Bulk 1m history for a symbol (vectorized)"""
+        manager = self.managers.get(symbol) or self._create(symbol)
+        return manager.backfill_1m(candles)
+    
     def get_manager(self, symbol: str) -> Optional[MultiTimeframeManager]:
         """Get manager for symbol"""
         return self.managers.get(symbol)
@@ -321,15 +309,15 @@ class GlobalTimeframeManager:
     def get_all_confluence(self) -> Dict[str, Dict]:
         """Get confluence for all symbols"""
         return {
-            symbol: self.managers[symbol].get_confluence()
-            for symbol in self.symbols
+            symbol: manager.get_confluence()
+            for symbol, manager in list(self.managers.items())
         }
     
     def get_all_divergence(self) -> Dict[str, Dict]:
         """Get divergence for all symbols"""
         return {
-            symbol: self.managers[symbol].get_divergence()
-            for symbol in self.symbols
+            symbol: manager.get_divergence()
+            for symbol, manager in list(self.managers.items())
         }
 
 
@@ -15,6 +15,8 @@ from typing import Dict, List
 from datetime import datetime
 import pytz
 
+from utils.source_collector import SourceCollector, SourceSpec, until_next_utc
+
 # Import config to access ENABLE_NEWSAPI_LAYER flag
 try:
     from config import ENABLE_NEWSAPI_LAYER
@@ -40,6 +42,12 @@ class SentimentAnalysisV2:
         # Check if NewsAPI layer is enabled
         self.newsapi_enabled = ENABLE_NEWSAPI_LAYER and bool(self.newsapi_key)
         
+        # Kaynaklar paralel + kaynak bazlı TTL ile toplanır (tek RTT). Orchestrator
+        # kaynakları kendi collector'ına ekler; kendi collector'ımız sadece snapshot
+        # verilmediğinde (ilk kullanımda) oluşturulur
+        self.source_names = [spec.name for spec in self.source_specs()]
+        self.collector = None
+        
         if not ENABLE_NEWSAPI_LAYER:
             logger.info("✅ SentimentAnalysisV2 başlatıldı (2-source mode: Fear&Greed + Funding Rate - NewsAPI DISABLED)")
         elif not self.newsapi_key:
@@ -215,7 +223,29 @@ class SentimentAnalysisV2:
         logger.info(f"SentimentV2 - {symbol}: {result['score']} from {len(sources_used)} sources")
         return result
     
-    def analyze_multi_source_sentiment(self) -> Dict:
+    def source_specs(self) -> List[SourceSpec]:
+        """
+        Sources behind analyze_multi_source_sentiment, with their natural TTLs:
+        Fear & Greed is daily, funding settles every 8h, news every 15 min.
+        Can be merged into a larger SourceCollector (one collect per tick).
+        """
+        specs = [
+            SourceSpec('fear_greed', self.get_fear_greed_index, ttl=until_next_utc(24)),
+            SourceSpec('funding_btc', lambda: self.get_binance_funding_rate('BTCUSDT'), ttl=until_next_utc(8)),
+            SourceSpec('funding_eth', lambda: self.get_binance_funding_rate('ETHUSDT'), ttl=until_next_utc(8)),
+        ]
+        if ENABLE_NEWSAPI_LAYER:
+            specs.append(SourceSpec('news_btc', lambda: self.analyze_sentiment('BTC'), ttl=900))
+            specs.append(SourceSpec('news_eth', lambda: self.analyze_sentiment('ETH'), ttl=900))
+        return specs
+    
+    def _own_collector(self) -> SourceCollector:
+        """Private collector for standalone use (no snapshot from the orchestrator)"""
+        if self.collector is None:
+            self.collector = SourceCollector('sentiment_v2', self.source_specs())
+        return self.collector
+    
+    def analyze_multi_source_sentiment(self, snapshot: Dict = None) -> Dict:
         """
         ⭐ v8.0 3-SOURCE MODE: Main method called by background sentiment thread.
         
@@ -234,16 +264,26 @@ class SentimentAnalysisV2:
         ⚠️ ZERO FALLBACK POLICY: Minimum 2 sources required, else error
         """
         try:
+            # All sources fetched concurrently (cached per natural TTL); a source
+            # that fails / misses the deadline is served stale or reported missing
+            if snapshot is None:
+                snapshot = self._own_collector().collect()
+            sources = snapshot['sources']
+            
+            def value(name):
+                view = sources.get(name)
+                return view['value'] if view else None
+            
             # PRIMARY: Fear & Greed Index (most reliable, free, no key) - 50%
-            fear_greed = self.get_fear_greed_index()
+            fear_greed = value('fear_greed')
             
             # SECONDARY: Binance funding rates (real market sentiment) - 30%
-            btc_funding = self.get_binance_funding_rate('BTCUSDT')
-            eth_funding = self.get_binance_funding_rate('ETHUSDT')
+            btc_funding = value('funding_btc')
+            eth_funding = value('funding_eth')
             
             # TERTIARY: News-based sentiment (if enabled via config and API keys available) - 20%
-            btc_sentiment = self.analyze_sentiment('BTC')
-            eth_sentiment = self.analyze_sentiment('ETH')
+            btc_sentiment = value('news_btc')
+            eth_sentiment = value('news_eth')
             
             # Build sentiment score from available sources
             sentiment_scores = []
@@ -291,6 +331,8 @@ class SentimentAnalysisV2:
             total_weight = sum(weight for _, _, weight in sentiment_scores)
             aggregate_score = sum(score * (weight / total_weight) for _, score, weight in sentiment_scores)
             
+            stale_sources = [n for n in self.source_names if sources.get(n, {}).get('stale', True)]
+            
             # Build comprehensive report
             report = {
                 'timestamp': datetime.now(pytz.UTC).isoformat(),
@@ -301,6 +343,14 @@ class SentimentAnalysisV2:
                 'confidence': round(total_weight, 2),
                 'newsapi_enabled': ENABLE_NEWSAPI_LAYER,
                 
+                # Source freshness (stale = last good value, fetch failed / timed out)
+                'partial': bool(stale_sources),
+                'stale_sources': stale_sources,
+                'source_status': {
+                    n: {k: sources[n][k] for k in ('status', 'age', 'stale', 'error')}
+                    for n in self.source_names if n in sources
+                },
+                
                 # Fear & Greed details
                 'fear_greed': fear_greed if fear_greed else None,
                 
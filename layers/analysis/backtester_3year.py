@@ -18,6 +18,8 @@ from enum import Enum
 import json
 import sqlite3
 
+from analytics.backtest_kernel import KernelConfig, run_kernel, column
+
 logger = logging.getLogger(__name__)
 
 
@@ -174,14 +176,17 @@ class Backtester3Year:
     def run_backtest(
         self,
         signal_generator_func,
-        position_size: float = 0.1
+        position_size: float = 0.1,
+        signals: Optional[List] = None
     ) -> bool:
         """
-        Backtest çalıştır
+        Backtest çalıştır (ortak NumPy backtest kernel'i ile)
         
         Args:
             signal_generator_func: Sinyal üretme fonksiyonu
             position_size: Her position için pozisyon boyutu (% olarak)
+            signals: Önceden hesaplanmış sinyaller ("BUY"/"SELL"/... veya +1/-1/0);
+                verilirse signal_generator_func mum başına çağrılmaz
         """
         
         try:
@@ -189,41 +194,61 @@ class Backtester3Year:
                 logger.error("No historical data loaded")
                 return False
             
-            self.equity_curve = []
+            data = self.historical_data
+            timestamps = column(data, "timestamp")
+            closes = column(data, "close")
             
-            for i, candle in enumerate(self.historical_data):
-                timestamp = candle["timestamp"]
-                close_price = candle["close"]
-                
-                # Sinyal üret
-                signal = signal_generator_func(candle, i, self.historical_data)
-                
-                # Açık işlemleri kontrol et
-                self._check_open_positions(close_price, timestamp)
-                
-                # Sinyal işle
-                if signal == "BUY":
-                    self._enter_long_position(
-                        close_price,
-                        timestamp,
-                        position_size,
-                        candle
-                    )
-                elif signal == "SELL":
-                    self._close_all_positions(close_price, timestamp)
-                
-                # Equity güncelle
-                equity = self._calculate_equity(close_price)
-                self.equity_curve.append((timestamp, equity))
+            # Sinyal üret
+            if signals is None:
+                signals = [
+                    signal_generator_func(candle, i, data)
+                    for i, candle in enumerate(data)
+                ]
+            
+            # SL/TP kapanışta kontrol edilir ve kapanış fiyatından çıkılır
+            fee = Trade.__dataclass_fields__["fee"].default
+            result = run_kernel(
+                closes,
+                signals,
+                KernelConfig(
+                    initial_capital=self.current_balance,
+                    position_size=position_size,
+                    max_positions=None,
+                    stop_loss_pct=0.02,
+                    take_profit_pct=0.03,
+                    commission=fee,
+                    fill_at_level=False
+                )
+            )
+            
+            self.equity_curve = list(zip(timestamps.tolist(), result.equity.tolist()))
+            
+            # Trade nesneleri (giriş sırasıyla)
+            last_index = len(data) - 1
+            for k in range(result.trade_count):
+                entry_index = int(result.entry_idx[k])
+                exit_index = min(int(result.exit_idx[k]), last_index)
+                entry_price = float(result.entry_price[k])
+                trade = Trade(
+                    entry_time=float(timestamps[entry_index]),
+                    entry_price=entry_price,
+                    quantity=float(result.quantity[k]),
+                    position_type="long",
+                    fee=fee,
+                    stop_loss=entry_price * 0.98,
+                    take_profit=entry_price * 1.03,
+                    metadata={
+                        "candle": data[entry_index]
+                    }
+                )
+                trade.close(float(result.exit_price[k]), float(timestamps[exit_index]))
+                self.trades.append(trade)
+                self.closed_trades.append(trade)
             
-            # Açık işlemleri kapat
-            if self.open_trades:
-                last_price = self.historical_data[-1]["close"]
-                last_time = self.historical_data[-1]["timestamp"]
-                for trade in self.open_trades:
-                    trade.close(last_price, last_time)
-                    self.closed_trades.append(trade)
-                self.open_trades.clear()
+            # Kapanış sırasına göre (istatistikler için)
+            self.closed_trades.sort(key=lambda t: t.exit_time)
+            self.open_trades.clear()
+            self.current_balance = result.final_balance
             
             # İstatistikleri hesapla
             self._calculate_stats()
@@ -407,16 +432,10 @@ class Backtester3Year:
         if not self.equity_curve:
             return
         
-        equities = [e for _, e in self.equity_curve]
-        max_equity = equities[0]
-        max_drawdown = 0
-        
-        for equity in equities:
-            if equity > max_equity:
-                max_equity = equity
-            
-            drawdown = (max_equity - equity) / max_equity
-            max_drawdown = max(max_drawdown, drawdown)
+        equities = np.array([e for _, e in self.equity_curve])
+        peak = np.maximum.accumulate(equities)
+        max_drawdown = float(np.max((peak - equities) / peak))
+        max_equity = float(peak[-1])
         
         self.stats.max_drawdown = max_equity - (max_equity * (1 - max_drawdown))
         self.stats.max_drawdown_percent = max_drawdown * 100
@@ -446,7 +465,7 @@ class Backtester3Year:
             },
             "capital": {
                 "initial": self.initial_capital,
-                "final": self.current_balance + sum([t.profit_loss for t in self.closed_trades])
+                "final": self.current_balance
             },
             "statistics": self.stats.to_dict(),
             "trades": [t.to_dict() for t in self.closed_trades[-20:]]  # Son 20 işlem
@@ -26,60 +26,44 @@ import json
 from datetime import datetime, timedelta
 import numpy as np
 from functools import lru_cache
-import threading
-from queue import Queue
+
+from utils.tiered_cache import get_cache
+from utils.write_behind import WriteBehindWriter, DsnConnector
 
 logger = logging.getLogger(__name__)
 
 class CacheLayer:
     """
     Intelligent In-Memory Cache Management
-    - LRU Cache for frequently accessed data
+    - LRU Cache for frequently accessed data (O(1) get / set / eviction)
     - Cache invalidation strategy
     - Performance optimization
     - Memory management
+    Backed by the shared tiered cache (in-process tier only).
     """
-    def __init__(self, max_size=10000):
-        self.cache = {}
-        self.access_count = {}
+    def __init__(self, max_size=10000, namespace='database'):
         self.max_size = max_size
-        self.lock = threading.Lock()
+        self.cache = get_cache(namespace, max_entries=max_size, default_ttl=None, use_redis=False)
         
     def get(self, key):
         """Get from cache with LRU tracking"""
-        with self.lock:
-            if key in self.cache:
-                self.access_count[key] = self.access_count.get(key, 0) + 1
-                return self.cache[key]
-            return None
+        return self.cache.get(key)
     
     def set(self, key, value):
-        """Set cache with intelligent eviction"""
-        with self.lock:
-            if len(self.cache) >= self.max_size:
-                # Evict least recently used
-                lru_key = min(self.access_count, key=self.access_count.get)
-                del self.cache[lru_key]
-                del self.access_count[lru_key]
-            
-            self.cache[key] = value
-            self.access_count[key] = 1
+        """Set cache (least recently used entry is evicted when full)"""
+        self.cache.set(key, value)
     
     def invalidate(self, pattern):
         """Intelligently invalidate cache by pattern"""
-        with self.lock:
-            keys_to_delete = [k for k in self.cache if pattern in k]
-            for k in keys_to_delete:
-                del self.cache[k]
-                del self.access_count[k]
+        self.cache.invalidate(pattern)
     
     def analyze(self):
-        """Return cache health score"""
-        if not self.cache:
+        """Return cache health score (hit rate)"""
+        stats = self.cache.get_stats()
+        if not stats['entries'] or not (stats['hits'] + stats['misses']):
             return 0.5
         
-        hit_ratio = np.mean(list(self.access_count.values())) / max(self.access_count.values())
-        return np.clip(hit_ratio, 0, 1)
+        return np.clip(stats['hit_rate'] / 100, 0, 1)
 
 class PerformanceLayer:
     """
@@ -174,13 +158,13 @@ class PostgresLayer:
     - Performance optimization
     - Real-time analytics
     - Data recovery
+    - Write-behind inserts (batched, spill journal while DB is down)
     """
     def __init__(self, connection_string):
         self.conn_string = connection_string
         self.connection = None
-        self.transaction_queue = Queue()
+        self.writer = None
         self.connected = False
-        self.transaction_log = []
         
         self.connect()
         self.create_tables()
@@ -302,11 +286,33 @@ class PostgresLayer:
             logger.error(f"❌ Table creation error: {e}")
             self.connection.rollback()
     
-    def save_signal(self, signal_data):
-        """Save signal with all context and reasoning"""
+    def save_signal(self, signal_data, wait_for_id=False):
+        """
+        Save signal with all context and reasoning.
+        Queued for a batched write by default (returns None); pass
+        wait_for_id=True when the trade id is needed (direct INSERT ... RETURNING id).
+        """
         if not self.connected:
             return None
         
+        row = (
+            signal_data['symbol'],
+            signal_data['type'],
+            signal_data['confidence'],
+            signal_data.get('entry', 0),
+            signal_data.get('tp1', 0),
+            signal_data.get('tp2', 0),
+            signal_data.get('tp3', 0),
+            signal_data.get('sl', 0),
+            signal_data.get('size', 0),
+            json.dumps(signal_data.get('scores', {})),
+            signal_data.get('regime', 'UNKNOWN')
+        )
+        
+        if not wait_for_id:
+            self.writer.write('trades', row)
+            return None
+        
         try:
             cursor = self.connection.cursor()
             
@@ -317,19 +323,7 @@ class PostgresLayer:
                  layer_scores, market_regime)
                 VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
                 RETURNING id
-            """, (
-                signal_data['symbol'],
-                signal_data['type'],
-                signal_data['confidence'],
-                signal_data.get('entry', 0),
-                signal_data.get('tp1', 0),
-                signal_data.get('tp2', 0),
-                signal_data.get('tp3', 0),
-                signal_data.get('sl', 0),
-                signal_data.get('size', 0),
-                json.dumps(signal_data.get('scores', {})),
-                signal_data.get('regime', 'UNKNOWN')
-            ))
+            """, row)
             
             trade_id = cursor.fetchone()[0]
             self.connection.commit()
@@ -342,42 +336,18 @@ class PostgresLayer:
             return None
     
     def save_layer_performance(self, layer_name, accuracy, exec_time, confidence):
-        """Track layer performance for optimization"""
+        """Track layer performance for optimization (batched write)"""
         if not self.connected:
             return
         
-        try:
-            cursor = self.connection.cursor()
-            
-            cursor.execute("""
-                INSERT INTO layer_performance 
-                (layer_name, accuracy, execution_time, avg_confidence)
-                VALUES (%s, %s, %s, %s)
-            """, (layer_name, accuracy, exec_time, confidence))
-            
-            self.connection.commit()
-        except Exception as e:
-            logger.error(f"Performance save error: {e}")
-            self.connection.rollback()
+        self.writer.write('layer_performance', (layer_name, accuracy, exec_time, confidence))
     
     def save_ai_decision(self, decision_type, reasoning, layers_used, confidence, action):
-        """Log AI reasoning and decisions"""
+        """Log AI reasoning and decisions (batched write)"""
         if not self.connected:
             return
         
-        try:
-            cursor = self.connection.cursor()
-            
-            cursor.execute("""
-                INSERT INTO ai_decisions 
-                (decision_type, reasoning, layers_used, confidence_score, action_taken)
-                VALUES (%s, %s, %s, %s, %s)
-            """, (decision_type, reasoning, layers_used, confidence, action))
-            
-            self.connection.commit()
-        except Exception as e:
-            logger.error(f"AI decision log error: {e}")
-            self.connection.rollback()
+        self.writer.write('ai_decisions', (decision_type, reasoning, layers_used, confidence, action))
     
     def get_recent_signals(self, limit=20):
         """Retrieve recent signals for analysis"""
@@ -385,6 +355,7 @@ class PostgresLayer:
             return []
         
         try:
+            self.writer.flush()
             cursor = self.connection.cursor(cursor_factory=RealDictCursor)
             
             cursor.execute("""
@@ -427,21 +398,22 @@ class PostgresLayer:
             return {}
     
     def start_transaction_worker(self):
-        """Start background thread for async transactions"""
-        import threading
+        """Start background write-behind flusher (trades, layer_performance, ai_decisions)"""
+        if not self.connected or self.writer:
+            return
         
-        worker_thread = threading.Thread(target=self._transaction_worker, daemon=True)
-        worker_thread.start()
-    
-    def _transaction_worker(self):
-        """Process queued transactions in background"""
-        while True:
-            try:
-                transaction = self.transaction_queue.get(timeout=1)
-                # Process transaction
-                self.transaction_log.append(transaction)
-            except:
-                continue
+        self.writer = WriteBehindWriter('postgres_layer', DsnConnector(self.conn_string))
+        self.writer.register_table('trades', (
+            'symbol', 'signal_type', 'confidence', 'entry_price', 'take_profit_1',
+            'take_profit_2', 'take_profit_3', 'stop_loss', 'position_size',
+            'layer_scores', 'market_regime'
+        ))
+        self.writer.register_table('layer_performance', (
+            'layer_name', 'accuracy', 'execution_time', 'avg_confidence'
+        ))
+        self.writer.register_table('ai_decisions', (
+            'decision_type', 'reasoning', 'layers_used', 'confidence_score', 'action_taken'
+        ))
     
     def analyze(self):
         """Database health and performance score"""
@@ -26,6 +26,7 @@ Railway: https://demir1988.up.railway.app/
 """
 
 import os
+import time
 import logging
 import numpy as np
 import pandas as pd
@@ -33,6 +34,8 @@ from datetime import datetime, timedelta
 from typing import Dict, Optional, Tuple, List
 import warnings
 
+from layers.ml.model_lifecycle import ModelLifecycle, sliding_training_set, fit_classifier
+
 warnings.filterwarnings('ignore')
 logger = logging.getLogger(__name__)
 
@@ -103,6 +106,16 @@ ML_LAYER_CONFIG = {
     }
 }
 
+
+def _align_volumes(prices, volumes):
+    """Volumes aligned bar-for-bar with prices (None if they cannot be)"""
+    if volumes is None:
+        return None
+    volumes = np.asarray(volumes, dtype=np.float64)
+    if len(volumes) < len(prices):
+        return None
+    return volumes[-len(prices):]
+
 logger.info("🔧 ML Layer Config Loaded:")
 logger.info(f"   Active: {sum(1 for cfg in ML_LAYER_CONFIG.values() if cfg['enabled'])}/10")
 logger.info(f"   Disabled: {sum(1 for cfg in ML_LAYER_CONFIG.values() if not cfg['enabled'])}/10")
@@ -114,6 +127,8 @@ logger.info(f"   Disabled: {sum(1 for cfg in ML_LAYER_CONFIG.values() if not cfg
 class LSTMLayer:
     """LSTM Neural Network for price prediction - 250+ lines ✅ ACTIVE"""
     
+    SEQ_LENGTH = 30
+    
     def __init__(self):
         self.enabled = ML_LAYER_CONFIG["LSTM"]["enabled"]
         self.priority = ML_LAYER_CONFIG["LSTM"]["priority"]
@@ -134,12 +149,22 @@ class LSTMLayer:
             self.LSTM = LSTM
             self.Dense = Dense
             self.Dropout = Dropout
-            self.model_initialized = False
             self.scaler = None
+            
+            # Trained once, persisted, reused between retrains
+            self.lifecycle = ModelLifecycle(
+                'ml_lstm',
+                serialize=lambda model: model.get_weights(),
+                deserialize=self._model_from_weights
+            )
             logger.info("✅ LSTM Layer initialized (ACTIVE)")
         except ImportError:
             raise ImportError("TensorFlow required for LSTM")
     
+    @property
+    def model_initialized(self) -> bool:
+        return self.lifecycle.model is not None
+    
     def analyze(self, prices: np.ndarray, volumes: np.ndarray = None) -> Dict:
         """LSTM prediction analysis - 100% REAL DATA"""
         if not self.enabled:
@@ -154,14 +179,12 @@ class LSTMLayer:
             prices_array = np.array(prices, dtype=np.float64)
             normalized_prices = self._normalize_prices(prices_array)
             
-            # Create sequences
-            X, y = self._create_sequences(normalized_prices)
-            
-            if X.shape[0] < 10:
-                raise ValueError("Insufficient sequences for training")
-            
-            # Train model
-            score = self._train_and_predict(X, y, normalized_prices[-1])
+            # Train only when there is no model / it is stale / features drifted
+            if self.lifecycle.ensure_model(self._train, normalized_prices):
+                score = self._predict(normalized_prices)
+            else:
+                logger.warning("⚠️ LSTM model unavailable, using fallback analysis")
+                score = self._fallback_score(prices_array)
             
             logger.info(f"✅ LSTM prediction: {score:.2f}")
             return {'lstm_score': score, 'confidence': 0.75}
@@ -181,7 +204,7 @@ class LSTMLayer:
         normalized = (prices - min_price) / (max_price - min_price)
         return normalized
     
-    def _create_sequences(self, data, seq_length=30):
+    def _create_sequences(self, data, seq_length=SEQ_LENGTH):
         """Create sequences for LSTM"""
         X, y = [], []
         
@@ -194,48 +217,72 @@ class LSTMLayer:
         
         return np.array(X).reshape(-1, seq_length, 1), np.array(y)
     
-    def _train_and_predict(self, X, y, current_price):
-        """Train LSTM and predict"""
-        try:
-            # Split data
-            split = int(0.8 * len(X))
-            X_train, X_test = X[:split], X[split:]
-            y_train, y_test = y[:split], y[split:]
-            
-            # Build model
-            model = self.Sequential([
-                self.LSTM(50, activation='relu', input_shape=(X.shape[1], 1)),
-                self.Dropout(0.2),
-                self.LSTM(50, activation='relu'),
-                self.Dropout(0.2),
-                self.Dense(25, activation='relu'),
-                self.Dense(1)
-            ])
-            
-            model.compile(optimizer='adam', loss='mse')
-            
-            # Train
-            model.fit(X_train, y_train, epochs=10, batch_size=16, 
-                     validation_data=(X_test, y_test), verbose=0)
-            
-            # Predict
-            last_sequence = X[-1].reshape(1, X.shape[1], 1)
-            next_price = model.predict(last_sequence, verbose=0)[0][0]
-            
-            # Score: is next price higher than current?
-            if next_price > current_price:
-                score = 0.5 + (next_price - current_price) * 0.5
-            else:
-                score = 0.5 - (current_price - next_price) * 0.5
-            
-            return np.clip(score, 0, 1)
+    def _build_model(self):
+        """LSTM architecture (shared by training and registry warm-start)"""
+        model = self.Sequential([
+            self.LSTM(50, activation='relu', return_sequences=True,
+                      input_shape=(self.SEQ_LENGTH, 1)),
+            self.Dropout(0.2),
+            self.LSTM(50, activation='relu'),
+            self.Dropout(0.2),
+            self.Dense(25, activation='relu'),
+            self.Dense(1)
+        ])
+        model.compile(optimizer='adam', loss='mse')
+        return model
+    
+    def _model_from_weights(self, weights):
+        model = self._build_model()
+        model.set_weights(weights)
+        return model
+    
+    @staticmethod
+    def _drift_features(sequences):
+        """Per-sequence (mean, std) of normalized steps - drift tracking only"""
+        steps = np.diff(sequences.reshape(len(sequences), -1), axis=1)
+        return np.column_stack([steps.mean(axis=1), steps.std(axis=1)])
+    
+    def _train(self, normalized_prices):
+        """Train LSTM on all sequences of the current series"""
+        X, y = self._create_sequences(normalized_prices)
         
-        except Exception as e:
-            logger.warning(f"⚠️ LSTM training failed: {e}, using fallback analysis")
-            # Fallback: simple trend analysis
-            returns = np.diff(np.log(X.flatten()[-30:]))
-            trend = np.mean(returns)
-            return np.clip(0.5 + trend * 10, 0, 1)
+        if X.shape[0] < 10:
+            raise ValueError("Insufficient sequences for training")
+        
+        # Split data
+        split = int(0.8 * len(X))
+        X_train, X_test = X[:split], X[split:]
+        y_train, y_test = y[:split], y[split:]
+        
+        model = self._build_model()
+        history = model.fit(X_train, y_train, epochs=10, batch_size=16,
+                            validation_data=(X_test, y_test), verbose=0)
+        
+        val_loss = float(history.history.get('val_loss', [0.0])[-1])
+        return model, self._drift_features(X), {'val_loss': val_loss}
+    
+    def _predict(self, normalized_prices):
+        """Predict next normalized price with the served model"""
+        last_sequence = normalized_prices[-self.SEQ_LENGTH:].reshape(1, self.SEQ_LENGTH, 1)
+        current_price = normalized_prices[-1]
+        
+        with self.lifecycle.inference(self._drift_features(last_sequence)):
+            # Direct call avoids predict()'s per-call dataset setup
+            next_price = float(self.lifecycle.model(last_sequence, training=False).numpy()[0][0])
+        
+        # Score: is next price higher than current?
+        if next_price > current_price:
+            score = 0.5 + (next_price - current_price) * 0.5
+        else:
+            score = 0.5 - (current_price - next_price) * 0.5
+        
+        return float(np.clip(score, 0, 1))
+    
+    def _fallback_score(self, prices):
+        """Simple trend analysis when no model could be trained"""
+        returns = np.diff(np.log(prices[-self.SEQ_LENGTH:]))
+        trend = np.mean(returns)
+        return float(np.clip(0.5 + trend * 10, 0, 1))
 
 # ============================================================================
 # ML LAYER 2: XGBOOST GRADIENT BOOSTING (200+ lines) ✅ ACTIVE - REAL DATA
@@ -244,6 +291,8 @@ class LSTMLayer:
 class XGBoostLayer:
     """XGBoost Gradient Boosting - 200+ lines ✅ ACTIVE"""
     
+    FEATURE_WINDOW = 50
+    
     def __init__(self):
         self.enabled = ML_LAYER_CONFIG["XGBoost"]["enabled"]
         self.priority = ML_LAYER_CONFIG["XGBoost"]["priority"]
@@ -258,13 +307,20 @@ class XGBoostLayer:
             
             self.xgb = xgb
             self.StandardScaler = StandardScaler
-            self.model = None
             self.scaler = None
-            self.trained = False
+            self.lifecycle = ModelLifecycle('ml_xgboost')
             logger.info("✅ XGBoost Layer initialized (ACTIVE)")
         except ImportError:
             raise ImportError("XGBoost and scikit-learn required")
     
+    @property
+    def model(self):
+        return self.lifecycle.model
+    
+    @property
+    def trained(self) -> bool:
+        return self.lifecycle.model is not None
+    
     def analyze(self, prices: np.ndarray, volumes: np.ndarray = None) -> Dict:
         """XGBoost analysis - 100% REAL DATA"""
         if not self.enabled:
@@ -277,14 +333,14 @@ class XGBoostLayer:
             
             prices = np.array(prices, dtype=np.float64)
             
-            # Feature engineering
-            features = self._engineer_features(prices, volumes)
-            
-            if features.shape[0] < 5:
-                raise ValueError("Insufficient features")
+            # Feature engineering (same window as training)
+            features = self._engineer_features(
+                prices[-self.FEATURE_WINDOW:],
+                volumes[-self.FEATURE_WINDOW:] if volumes is not None else None
+            )
             
-            # Train and predict
-            score = self._train_and_predict_xgb(features, prices)
+            # Predict with the served model (retrains per schedule/drift)
+            score = self._predict_xgb(features, prices, volumes)
             
             logger.info(f"✅ XGBoost score: {score:.2f}")
             return {'xgboost_score': score, 'confidence': 0.80}
@@ -332,7 +388,7 @@ class XGBoostLayer:
     def _calculate_rsi(self, prices, period=14):
         """Calculate RSI indicator"""
         deltas = np.diff(prices)
-        seed = deltas[:period+1]
+        seed = deltas[-period:]
         up = seed[seed >= 0].sum() / period
         down = -seed[seed < 0].sum() / period
         rs = up / (down + 1e-6)
@@ -354,24 +410,26 @@ class XGBoostLayer:
         atr = np.mean(np.abs(ranges[-period:]))
         return atr
     
-    def _train_and_predict_xgb(self, features, prices):
-        """Train XGBoost model"""
+    def _train_xgb(self, prices, volumes):
+        """Train XGBoost on every feature window of the series"""
+        X, y = sliding_training_set(
+            prices, _align_volumes(prices, volumes),
+            self._engineer_features, self.FEATURE_WINDOW
+        )
+        model, metrics = fit_classifier(
+            lambda: self.xgb.XGBClassifier(max_depth=3, n_estimators=50, random_state=42),
+            X, y
+        )
+        return model, X, metrics
+    
+    def _predict_xgb(self, features, prices, volumes):
+        """Predict with the served XGBoost model"""
         try:
-            # Simple trend-based target
-            recent_trend = np.mean(np.diff(prices[-10:]))
-            target = 1 if recent_trend > 0 else 0
-            
-            # Create simple model
-            model = self.xgb.XGBClassifier(max_depth=3, n_estimators=10, random_state=42)
-            
-            # Train on aggregated data
-            X_train = np.vstack([features] * 5)
-            y_train = np.array([target] * 5)
+            if not self.lifecycle.ensure_model(self._train_xgb, prices, volumes):
+                raise ValueError("no trained model")
             
-            model.fit(X_train, y_train, verbose=False)
-            
-            # Predict
-            pred_prob = model.predict_proba(features)[0]
+            with self.lifecycle.inference(features):
+                pred_prob = self.lifecycle.model.predict_proba(features)[0]
             score = pred_prob[1]
             
             return score
@@ -387,6 +445,8 @@ class XGBoostLayer:
 class RandomForestLayer:
     """Random Forest - 200+ lines ✅ ACTIVE"""
     
+    FEATURE_WINDOW = 30
+    
     def __init__(self):
         self.enabled = ML_LAYER_CONFIG["RandomForest"]["enabled"]
         self.priority = ML_LAYER_CONFIG["RandomForest"]["priority"]
@@ -401,11 +461,15 @@ class RandomForestLayer:
             
             self.RandomForestClassifier = RandomForestClassifier
             self.StandardScaler = StandardScaler
-            self.model = None
+            self.lifecycle = ModelLifecycle('ml_random_forest')
             logger.info("✅ RandomForest Layer initialized (ACTIVE)")
         except ImportError:
             raise ImportError("scikit-learn required")
     
+    @property
+    def model(self):
+        return self.lifecycle.model
+    
     def analyze(self, prices: np.ndarray, volumes: np.ndarray = None) -> Dict:
         """Random Forest analysis - 100% REAL DATA"""
         if not self.enabled:
@@ -413,7 +477,7 @@ class RandomForestLayer:
             raise ValueError(f"RandomForest Layer disabled - {ML_LAYER_CONFIG['RandomForest']['reason']}")
         
         try:
-            if prices is None or len(prices) < 20:
+            if prices is None or len(prices) < 21:
                 raise ValueError("Insufficient data")
             
             prices = np.array(prices, dtype=np.float64)
@@ -421,11 +485,8 @@ class RandomForestLayer:
             # Create features
             X = self._create_features_rf(prices, volumes)
             
-            # Create target (price will go up next period)
-            y = (prices[-1] > prices[-2])
-            
-            # Train RF
-            score = self._train_rf(X, y)
+            # Predict (price will go up next period)
+            score = self._predict_rf(X, prices, volumes)
             
             logger.info(f"✅ Random Forest: {score:.2f}")
             return {'rf_score': score, 'confidence': 0.75}
@@ -437,11 +498,11 @@ class RandomForestLayer:
     def _create_features_rf(self, prices, volumes):
         """Create features for Random Forest"""
         # Price features
-        ret_5 = np.mean(np.diff(prices[-5:]) / prices[-6:-1])
-        ret_10 = np.mean(np.diff(prices[-10:]) / prices[-11:-1])
-        ret_20 = np.mean(np.diff(prices[-20:]) / prices[-21:-1])
+        ret_5 = np.mean(np.diff(prices[-6:]) / prices[-6:-1])
+        ret_10 = np.mean(np.diff(prices[-11:]) / prices[-11:-1])
+        ret_20 = np.mean(np.diff(prices[-21:]) / prices[-21:-1])
         
-        volatility = np.std(np.diff(prices[-20:]) / prices[-21:-1])
+        volatility = np.std(np.diff(prices[-21:]) / prices[-21:-1])
         
         ma_ratio_5_20 = np.mean(prices[-5:]) / np.mean(prices[-20:])
         
@@ -459,24 +520,32 @@ class RandomForestLayer:
         
         return X
     
-    def _train_rf(self, X, y):
-        """Train Random Forest"""
+    def _train_rf(self, prices, volumes):
+        """Train Random Forest on every feature window of the series"""
+        X, y = sliding_training_set(
+            prices, _align_volumes(prices, volumes),
+            self._create_features_rf, self.FEATURE_WINDOW
+        )
+        model, metrics = fit_classifier(
+            lambda: self.RandomForestClassifier(n_estimators=50, max_depth=5, random_state=42),
+            X, y
+        )
+        return model, X, metrics
+    
+    def _predict_rf(self, X, prices, volumes):
+        """Predict with the served Random Forest"""
         try:
-            model = self.RandomForestClassifier(n_estimators=20, max_depth=5, random_state=42)
-            
-            # Duplicate data for training
-            X_train = np.vstack([X] * 10)
-            y_train = np.array([y] * 10)
-            
-            model.fit(X_train, y_train)
+            if not self.lifecycle.ensure_model(self._train_rf, prices, volumes):
+                return 0.5
             
-            pred_prob = model.predict_proba(X)[0]
+            with self.lifecycle.inference(X):
+                pred_prob = self.lifecycle.model.predict_proba(X)[0]
             score = pred_prob[1]
             
             return score
         
         except Exception as e:
-            logger.warning(f"⚠️ RF training failed: {e}")
+            logger.warning(f"⚠️ RF prediction failed: {e}")
             return 0.5
 
 # ============================================================================
@@ -586,6 +655,8 @@ class SVMLayer:
 class GradientBoostingLayer:
     """Gradient Boosting + Transformer - 200+ lines ✅ ACTIVE"""
     
+    FEATURE_WINDOW = 50
+    
     def __init__(self):
         self.enabled = ML_LAYER_CONFIG["GradientBoosting"]["enabled"]
         self.priority = ML_LAYER_CONFIG["GradientBoosting"]["priority"]
@@ -597,6 +668,7 @@ class GradientBoostingLayer:
         try:
             from sklearn.ensemble import GradientBoostingClassifier
             self.GBClassifier = GradientBoostingClassifier
+            self.lifecycle = ModelLifecycle('ml_gradient_boosting')
             logger.info("✅ GradientBoosting Layer initialized (ACTIVE) - Transformer attention merged")
         except ImportError:
             raise ImportError("scikit-learn required")
@@ -613,14 +685,11 @@ class GradientBoostingLayer:
             
             prices = np.array(prices, dtype=np.float64)
             
-            # Features with attention weighting
-            X = self._gb_features_with_attention(prices, volumes)
-            
-            # Target
-            y = (prices[-1] > prices[-2])
+            # Features with attention weighting (same window as training)
+            X = self._gb_features_with_attention(prices[-self.FEATURE_WINDOW:], volumes)
             
-            # Train
-            score = self._train_gb(X, y)
+            # Predict
+            score = self._predict_gb(X, prices, volumes)
             
             logger.info(f"✅ Gradient Boosting (+ Transformer): {score:.2f}")
             return {'gb_score': score, 'confidence': 0.75}
@@ -649,23 +718,31 @@ class GradientBoostingLayer:
         
         return X
     
-    def _train_gb(self, X, y):
-        """Train GB"""
+    def _train_gb(self, prices, volumes):
+        """Train GB on every feature window of the series"""
+        X, y = sliding_training_set(
+            prices, None, self._gb_features_with_attention, self.FEATURE_WINDOW
+        )
+        model, metrics = fit_classifier(
+            lambda: self.GBClassifier(n_estimators=50, max_depth=3, learning_rate=0.1, random_state=42),
+            X, y
+        )
+        return model, X, metrics
+    
+    def _predict_gb(self, X, prices, volumes):
+        """Predict with the served GB model"""
         try:
-            model = self.GBClassifier(n_estimators=20, max_depth=3, learning_rate=0.1, random_state=42)
-            
-            X_train = np.vstack([X] * 10)
-            y_train = np.array([y] * 10)
-            
-            model.fit(X_train, y_train)
+            if not self.lifecycle.ensure_model(self._train_gb, prices, volumes):
+                return 0.5
             
-            pred_prob = model.predict_proba(X)[0]
+            with self.lifecycle.inference(X):
+                pred_prob = self.lifecycle.model.predict_proba(X)[0]
             score = pred_prob[1]
             
             return score
         
         except Exception as e:
-            logger.warning(f"⚠️ GB training failed: {e}")
+            logger.warning(f"⚠️ GB prediction failed: {e}")
             return 0.5
 
 # ============================================================================
@@ -919,6 +996,9 @@ class IsolationForestLayer:
 class KMeansLayer:
     """K-Means Clustering - 200+ lines ✅ ACTIVE - Single authoritative regime analyzer"""
     
+    # Regime scores by cluster rank (lowest mean return first)
+    REGIME_SCORES = (0.3, 0.5, 0.7)
+    
     def __init__(self):
         self.enabled = ML_LAYER_CONFIG["KMeans"]["enabled"]
         self.priority = ML_LAYER_CONFIG["KMeans"]["priority"]
@@ -930,6 +1010,7 @@ class KMeansLayer:
         try:
             from sklearn.cluster import KMeans
             self.KMeans = KMeans
+            self.lifecycle = ModelLifecycle('ml_kmeans')
             logger.info("✅ KMeans Layer initialized (ACTIVE) - Market regime analyzer")
         except ImportError:
             raise ImportError("scikit-learn required")
@@ -946,9 +1027,7 @@ class KMeansLayer:
             
             prices = np.array(prices, dtype=np.float64)
             
-            X = self._km_features(prices)
-            
-            regime_score = self._cluster_regimes(X)
+            regime_score = self._current_regime(prices)
             
             logger.info(f"✅ K-Means regime: {regime_score:.2f}")
             return {'km_score': regime_score, 'confidence': 0.75}
@@ -970,22 +1049,33 @@ class KMeansLayer:
         
         return np.array(features)
     
-    def _cluster_regimes(self, X):
-        """Cluster market regimes"""
+    def _cluster_regimes(self, prices):
+        """Cluster market regimes and rank clusters bearish → bullish"""
+        X = self._km_features(prices)
+        model = self.KMeans(n_clusters=3, random_state=42, n_init=10)
+        model.fit(X)
+        
+        # Cluster labels are arbitrary - order them by mean return
+        ranks = np.argsort(np.argsort(model.cluster_centers_[:, 0]))
+        regime = {
+            'kmeans': model,
+            'scores': {int(label): self.REGIME_SCORES[rank] for label, rank in enumerate(ranks)}
+        }
+        return regime, X, {'inertia': float(model.inertia_)}
+    
+    def _current_regime(self, prices):
+        """Score the latest 10-bar window with the served clustering"""
         try:
-            model = self.KMeans(n_clusters=3, random_state=42, n_init=10)
+            if not self.lifecycle.ensure_model(self._cluster_regimes, prices):
+                return 0.5
             
-            clusters = model.fit_predict(X)
+            X = self._km_features(prices[-11:])
+            regime = self.lifecycle.model
             
-            current_cluster = clusters[-1]
+            with self.lifecycle.inference(X):
+                current_cluster = int(regime['kmeans'].predict(X)[0])
             
-            # Regime mapping: 0=bearish, 1=neutral, 2=bullish
-            if current_cluster == 0:
-                return 0.3
-            elif current_cluster == 1:
-                return 0.5
-            else:
-                return 0.7
+            return regime['scores'][current_cluster]
         
         except Exception as e:
             logger.warning(f"⚠️ K-Means failed: {e}")
@@ -998,6 +1088,19 @@ class KMeansLayer:
 class EnsembleVotingLayer:
     """Ensemble Voting Orchestrator - 250+ lines ✅ ACTIVE - Master aggregator"""
     
+    # Layer mapping: (weight name, result key, ML_LAYER_CONFIG key) in self.layers order
+    LAYER_KEYS = [
+        ('lstm', 'lstm_score', 'LSTM'),
+        ('xgboost', 'xgboost_score', 'XGBoost'),
+        ('rf', 'rf_score', 'RandomForest'),
+        ('svm', 'svm_score', 'SVM'),  # Will be skipped if disabled
+        ('gb', 'gb_score', 'GradientBoosting'),
+        ('nn', 'nn_score', 'NeuralNetwork'),  # Will be skipped if disabled
+        ('ada', 'ada_score', 'AdaBoost'),  # Will be skipped if disabled
+        ('if', 'if_score', 'IsolationForest'),  # Will be skipped if disabled
+        ('km', 'km_score', 'KMeans')
+    ]
+    
     def __init__(self):
         self.enabled = ML_LAYER_CONFIG["EnsembleVoting"]["enabled"]
         self.priority = ML_LAYER_CONFIG["EnsembleVoting"]["priority"]
@@ -1032,6 +1135,14 @@ class EnsembleVotingLayer:
             'km': 0.16  # Increased (was 0.13)
         }
         
+        # Analyze latency (all layers, served models)
+        self.metrics = {
+            'analyze_count': 0,
+            'avg_latency_ms': 0.0,
+            'last_latency_ms': 0.0,
+            'max_latency_ms': 0.0
+        }
+        
         logger.info("✅ EnsembleVoting Layer initialized (ACTIVE) - Master orchestrator")
         logger.info(f"   Active layers: 5/9 (LSTM, XGBoost, RF, GB, KMeans)")
         logger.info(f"   Weight distribution: {self.weights}")
@@ -1047,6 +1158,7 @@ class EnsembleVotingLayer:
                 raise ValueError("Insufficient price data")
             
             prices = np.array(prices, dtype=np.float64)
+            start = time.perf_counter()
             
             scores = self._collect_layer_scores(prices, volumes)
             
@@ -1057,14 +1169,21 @@ class EnsembleVotingLayer:
             if isinstance(final_score, np.ndarray):
                 final_score = float(final_score.item())
             
+            latency_ms = (time.perf_counter() - start) * 1000
+            self._record_latency(latency_ms)
+            
             active_count = len(scores)
-            logger.info(f"✅ Ensemble voting: {final_score:.2f} (confidence: {confidence:.1%}, active: {active_count}/9)")
+            logger.info(
+                f"✅ Ensemble voting: {final_score:.2f} (confidence: {confidence:.1%}, "
+                f"active: {active_count}/9, {latency_ms:.1f}ms)"
+            )
             
             return {
                 'ensemble_score': final_score,
                 'confidence': confidence,
                 'layer_count': active_count,
-                'layer_scores': scores
+                'layer_scores': scores,
+                'latency_ms': round(latency_ms, 3)
             }
         
         except Exception as e:
@@ -1075,22 +1194,9 @@ class EnsembleVotingLayer:
         """Collect scores from ACTIVE layers only"""
         scores = {}
         
-        # Layer mapping
-        layer_names = [
-            ('lstm', 'lstm_score'),
-            ('xgboost', 'xgboost_score'),
-            ('rf', 'rf_score'),
-            ('svm', 'svm_score'),  # Will be skipped if disabled
-            ('gb', 'gb_score'),
-            ('nn', 'nn_score'),  # Will be skipped if disabled
-            ('ada', 'ada_score'),  # Will be skipped if disabled
-            ('if', 'if_score'),  # Will be skipped if disabled
-            ('km', 'km_score')
-        ]
-        
-        for idx, (name, key) in enumerate(layer_names):
+        for idx, (name, key, config_name) in enumerate(self.LAYER_KEYS):
             # Skip disabled layers
-            if not ML_LAYER_CONFIG[name.upper() if name != 'gb' else 'GradientBoosting']["enabled"]:
+            if not ML_LAYER_CONFIG[config_name]["enabled"]:
                 logger.debug(f"⏭️ Skipping disabled layer: {name}")
                 continue
             
@@ -1131,6 +1237,31 @@ class EnsembleVotingLayer:
         
         return np.clip(float(final), 0, 1)
     
+    def _record_latency(self, latency_ms: float):
+        count = self.metrics['analyze_count'] + 1
+        avg = self.metrics['avg_latency_ms']
+        self.metrics['analyze_count'] = count
+        self.metrics['avg_latency_ms'] = avg + (latency_ms - avg) / count
+        self.metrics['last_latency_ms'] = latency_ms
+        if latency_ms > self.metrics['max_latency_ms']:
+            self.metrics['max_latency_ms'] = latency_ms
+    
+    def get_metrics(self) -> Dict:
+        """Ensemble latency + per-layer retrain cadence and inference latency"""
+        layers = {}
+        for layer, (name, _, config_name) in zip(self.layers, self.LAYER_KEYS):
+            lifecycle = getattr(layer, 'lifecycle', None)
+            if ML_LAYER_CONFIG[config_name]["enabled"] and lifecycle is not None:
+                layers[name] = lifecycle.get_metrics()
+        
+        return {
+            'analyze_count': self.metrics['analyze_count'],
+            'avg_latency_ms': round(self.metrics['avg_latency_ms'], 3),
+            'last_latency_ms': round(self.metrics['last_latency_ms'], 3),
+            'max_latency_ms': round(self.metrics['max_latency_ms'], 3),
+            'layers': layers
+        }
+    
     def _calculate_confidence(self, scores):
         """Calculate ensemble confidence"""
         if not scores:
@@ -0,0 +1,459 @@
+"""
+🔄 DEMIR AI v8.0 - ML MODEL LIFECYCLE
+
+Train once, persist, serve from memory.
+
+Each ML layer owns a ModelLifecycle. The fitted model stays in memory and
+every analyze() call is a single predict. A retrain is triggered when:
+- no model exists yet (initial, trained inline on the first call)
+- the model is older than retrain_interval (scheduled)
+- the live features drift outside the training distribution (drift)
+
+Scheduled/drift retrains run on a background thread while the current
+model keeps serving. Every trained model is stored in models/versions via
+utils.model_versioning.ModelVersioning and promoted to production, so a
+restart warm-starts from the last production version instead of refitting.
+Only the newest ML_MODEL_KEEP_VERSIONS versions per model stay on disk.
+"""
+
+import os
+import time
+import pickle
+import logging
+import tempfile
+import threading
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+try:
+    from utils.model_versioning import ModelVersioning
+    MODEL_VERSIONING_AVAILABLE = True
+except ImportError:
+    MODEL_VERSIONING_AVAILABLE = False
+    logger.warning("⚠️ ModelVersioning not available - ML models will not be persisted")
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+MODEL_VERSIONS_DIR = os.getenv('ML_MODEL_VERSIONS_DIR', 'models/versions')
+RETRAIN_INTERVAL_HOURS = float(os.getenv('ML_RETRAIN_INTERVAL_HOURS', '6'))
+# Stored versions kept per model (older ones are deleted after a promote)
+KEEP_VERSIONS = int(os.getenv('ML_MODEL_KEEP_VERSIONS', '5'))
+
+# Share of recent inference rows outside the training [1%, 99%] range that
+# counts as drift, evaluated over the last DRIFT_WINDOW predictions
+DRIFT_THRESHOLD = 0.30
+DRIFT_WINDOW = 100
+DRIFT_MIN_SAMPLES = 30
+
+# Never retrain the same model more often than this (seconds)
+MIN_RETRAIN_GAP_SECONDS = 300
+
+# Minimum rows for a sliding-window training set
+MIN_TRAINING_ROWS = 20
+
+_versioning = None
+_versioning_lock = threading.Lock()
+# ModelVersioning mutates its registry and rewrites the registry file without
+# locking; every read/write of the shared instance goes through this lock
+_registry_lock = threading.Lock()
+
+
+def get_model_versioning() -> Optional['ModelVersioning']:
+    """Shared registry for all ML layers (None if persistence is unavailable)"""
+    global _versioning
+    if not MODEL_VERSIONING_AVAILABLE:
+        return None
+    if _versioning is None:
+        with _versioning_lock:
+            if _versioning is None:
+                try:
+                    _versioning = ModelVersioning(
+                        registry_dir=MODEL_VERSIONS_DIR,
+                        models_dir=MODEL_VERSIONS_DIR
+                    )
+                except Exception as e:
+                    logger.warning(f"⚠️ Model registry unavailable: {e}")
+                    return None
+    return _versioning
+
+
+class ModelLifecycle:
+    """
+    In-memory model + retrain policy + persistence for one ML layer
+
+    Usage (inside a layer):
+        lifecycle = ModelLifecycle('xgboost')
+        lifecycle.ensure_model(train_fn, prices, volumes)   # no-op when fresh
+        with lifecycle.inference(features):
+            proba = lifecycle.model.predict_proba(features)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        retrain_interval_hours: float = RETRAIN_INTERVAL_HOURS,
+        drift_threshold: float = DRIFT_THRESHOLD,
+        drift_window: int = DRIFT_WINDOW,
+        persist: bool = True,
+        serialize: Optional[Callable[[Any], Any]] = None,
+        deserialize: Optional[Callable[[Any], Any]] = None
+    ):
+        """
+        Args:
+            name: Registry model name (e.g. 'ml_xgboost')
+            retrain_interval_hours: Scheduled retrain cadence
+            drift_threshold: Out-of-range share that triggers a drift retrain
+            drift_window: Number of recent inference rows checked for drift
+            persist: Store trained models in the model registry
+            serialize: model -> picklable payload (default: model itself)
+            deserialize: payload -> model (default: payload itself)
+        """
+        self.name = name
+        self.retrain_interval = retrain_interval_hours * 3600
+        self.drift_threshold = drift_threshold
+        self.persist = persist
+        self._serialize = serialize or (lambda model: model)
+        self._deserialize = deserialize or (lambda payload: payload)
+
+        # Served model (swapped atomically after a retrain)
+        self.model: Any = None
+        self.version: Optional[str] = None
+        self.trained_at: Optional[float] = None
+
+        # Training feature range for drift detection
+        self._feature_low: Optional[np.ndarray] = None
+        self._feature_high: Optional[np.ndarray] = None
+        self._out_of_range: deque = deque(maxlen=drift_window)
+
+        self._train_lock = threading.Lock()
+        self._training_thread: Optional[threading.Thread] = None
+        self._last_retrain_attempt = 0.0
+
+        self.metrics = {
+            'retrain_count': 0,
+            'retrain_failures': 0,
+            'retrain_reasons': {'initial': 0, 'scheduled': 0, 'drift': 0},
+            'last_retrain_reason': None,
+            'last_train_ms': 0.0,
+            'train_samples': 0,
+            'inference_count': 0,
+            'avg_inference_ms': 0.0,
+            'max_inference_ms': 0.0,
+            'loaded_from_registry': False
+        }
+
+        if self.persist:
+            self._load_production()
+
+    # ========================================================================
+    # PERSISTENCE
+    # ========================================================================
+
+    def _load_production(self):
+        """Warm-start from the latest production version in the registry"""
+        versioning = get_model_versioning()
+        if versioning is None:
+            return
+
+        with _registry_lock:
+            entries = [dict(entry) for entry in versioning.list_versions(self.name)]
+
+        for entry in reversed(entries):
+            if entry.get('status') != 'production':
+                continue
+            try:
+                with open(entry['path'], 'rb') as f:
+                    state = pickle.load(f)
+                self._install(
+                    self._deserialize(state['payload']),
+                    state.get('feature_low'),
+                    state.get('feature_high'),
+                    state.get('trained_at')
+                )
+                self.version = entry['version']
+                with _registry_lock:
+                    versioning.active_versions[self.name] = entry['version']
+                self.metrics['loaded_from_registry'] = True
+                self.metrics['train_samples'] = entry.get('metadata', {}).get('train_samples', 0)
+                logger.info(f"📦 {self.name}: loaded {self.version} from registry")
+            except Exception as e:
+                logger.warning(f"⚠️ {self.name}: could not load {entry.get('version')}: {e}")
+                continue
+            return
+
+    def _persist(self, model: Any, metrics: Dict[str, float], train_samples: int):
+        """Register + promote the freshly trained model"""
+        versioning = get_model_versioning()
+        if versioning is None:
+            return
+
+        state = {
+            'payload': self._serialize(model),
+            'feature_low': self._feature_low,
+            'feature_high': self._feature_high,
+            'trained_at': self.trained_at
+        }
+        fd, tmp_path = tempfile.mkstemp(suffix='.pkl')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(state, f)
+            with _registry_lock:
+                version = versioning.register_model(
+                    self.name,
+                    tmp_path,
+                    metrics,
+                    metadata={
+                        'train_samples': train_samples,
+                        'reason': self.metrics['last_retrain_reason']
+                    }
+                )
+                promoted = bool(version) and versioning.promote_to_production(self.name, version)
+                if promoted:
+                    versioning.prune_versions(self.name, KEEP_VERSIONS)
+            if promoted:
+                self.version = version
+        except Exception as e:
+            logger.warning(f"⚠️ {self.name}: model persistence failed: {e}")
+        finally:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    # ========================================================================
+    # RETRAIN POLICY
+    # ========================================================================
+
+    def _install(self, model, feature_low, feature_high, trained_at):
+        self._feature_low = feature_low
+        self._feature_high = feature_high
+        self._out_of_range.clear()
+        self.trained_at = trained_at or time.time()
+        self.model = model
+
+    def drift_ratio(self) -> float:
+        """Share of recent inference rows outside the training range"""
+        if not self._out_of_range:
+            return 0.0
+        return sum(self._out_of_range) / len(self._out_of_range)
+
+    def retrain_reason(self) -> Optional[str]:
+        """'initial' / 'scheduled' / 'drift' or None when the model is fresh"""
+        if self.model is None:
+            return 'initial'
+        if time.time() - self.trained_at >= self.retrain_interval:
+            return 'scheduled'
+        if (len(self._out_of_range) >= DRIFT_MIN_SAMPLES and
+                self.drift_ratio() >= self.drift_threshold):
+            return 'drift'
+        return None
+
+    def ensure_model(
+        self,
+        train_fn: Callable[..., Tuple[Any, np.ndarray, Dict[str, float]]],
+        *args
+    ) -> bool:
+        """
+        Make sure a model is being served, retraining if the policy says so
+
+        train_fn(*args) must return (model, X_train, metrics). The first
+        training runs inline; later retrains run in the background while
+        the current model keeps serving.
+
+        Returns:
+            True if a model is available for inference
+        """
+        reason = self.retrain_reason()
+        if reason is None:
+            return True
+
+        if reason == 'initial':
+            with self._train_lock:
+                if self.model is None:
+                    self._train(reason, train_fn, args)
+            return self.model is not None
+
+        now = time.time()
+        if now - self._last_retrain_attempt < MIN_RETRAIN_GAP_SECONDS:
+            return True
+        if self._training_thread is not None and self._training_thread.is_alive():
+            return True
+
+        self._last_retrain_attempt = now
+        self._training_thread = threading.Thread(
+            target=self._train_guarded,
+            args=(reason, train_fn, args),
+            name=f"retrain-{self.name}",
+            daemon=True
+        )
+        self._training_thread.start()
+        return True
+
+    def _train_guarded(self, reason, train_fn, args):
+        with self._train_lock:
+            self._train(reason, train_fn, args)
+
+    def _train(self, reason, train_fn, args):
+        self._last_retrain_attempt = time.time()
+        start = time.perf_counter()
+        try:
+            model, X_train, train_metrics = train_fn(*args)
+        except Exception as e:
+            self.metrics['retrain_failures'] += 1
+            logger.warning(f"⚠️ {self.name}: {reason} training failed: {e}")
+            return
+
+        X_train = np.asarray(X_train, dtype=np.float64)
+        X_train = X_train.reshape(len(X_train), -1)
+        self._install(
+            model,
+            np.percentile(X_train, 1, axis=0),
+            np.percentile(X_train, 99, axis=0),
+            time.time()
+        )
+
+        train_ms = (time.perf_counter() - start) * 1000
+        self.metrics['retrain_count'] += 1
+        self.metrics['retrain_reasons'][reason] += 1
+        self.metrics['last_retrain_reason'] = reason
+        self.metrics['last_train_ms'] = round(train_ms, 2)
+        self.metrics['train_samples'] = len(X_train)
+
+        if self.persist:
+            self._persist(model, train_metrics, len(X_train))
+
+        logger.info(
+            f"🔄 {self.name}: retrained ({reason}) | samples={len(X_train)} | "
+            f"{train_ms:.0f}ms | version={self.version}"
+        )
+
+    # ========================================================================
+    # INFERENCE
+    # ========================================================================
+
+    def observe(self, features: np.ndarray):
+        """Track whether a live feature row falls outside the training range"""
+        if self._feature_low is None:
+            return
+        row = np.asarray(features, dtype=np.float64).reshape(-1)
+        if row.shape != self._feature_low.shape:
+            return
+        outside = np.any((row < self._feature_low) | (row > self._feature_high))
+        self._out_of_range.append(bool(outside))
+
+    def inference(self, features: Optional[np.ndarray] = None) -> '_InferenceTimer':
+        """Context manager that times one prediction and feeds drift tracking"""
+        if features is not None:
+            self.observe(features)
+        return _InferenceTimer(self)
+
+    def _record_inference(self, elapsed_ms: float):
+        count = self.metrics['inference_count'] + 1
+        avg = self.metrics['avg_inference_ms']
+        self.metrics['inference_count'] = count
+        self.metrics['avg_inference_ms'] = avg + (elapsed_ms - avg) / count
+        if elapsed_ms > self.metrics['max_inference_ms']:
+            self.metrics['max_inference_ms'] = elapsed_ms
+
+    # ========================================================================
+    # METRICS
+    # ========================================================================
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Retrain cadence, drift and inference latency for this model"""
+        trained_at = self.trained_at
+        return {
+            **self.metrics,
+            'retrain_reasons': dict(self.metrics['retrain_reasons']),
+            'avg_inference_ms': round(self.metrics['avg_inference_ms'], 3),
+            'max_inference_ms': round(self.metrics['max_inference_ms'], 3),
+            'version': self.version,
+            'trained_at': datetime.fromtimestamp(trained_at, timezone.utc).isoformat() if trained_at else None,
+            'model_age_seconds': round(time.time() - trained_at, 1) if trained_at else None,
+            'retrain_interval_hours': self.retrain_interval / 3600,
+            'drift_ratio': round(self.drift_ratio(), 4),
+            'retraining': self._training_thread is not None and self._training_thread.is_alive()
+        }
+
+
+class _InferenceTimer:
+    __slots__ = ('lifecycle', 'start')
+
+    def __init__(self, lifecycle: ModelLifecycle):
+        self.lifecycle = lifecycle
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.lifecycle._record_inference((time.perf_counter() - self.start) * 1000)
+        return False
+
+
+def sliding_training_set(
+    prices: np.ndarray,
+    volumes: Optional[np.ndarray],
+    feature_fn: Callable[[np.ndarray, Optional[np.ndarray]], np.ndarray],
+    window: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Build (X, y) from one price series
+
+    Row i uses the `window` bars ending at bar i (the same features the
+    layer computes at inference time); the label is whether bar i+1 closes
+    higher than bar i.
+    """
+    rows, labels = [], []
+    for end in range(window, len(prices)):
+        vol_window = volumes[end - window:end] if volumes is not None else None
+        rows.append(np.asarray(feature_fn(prices[end - window:end], vol_window)).reshape(-1))
+        labels.append(int(prices[end] > prices[end - 1]))
+
+    if len(rows) < MIN_TRAINING_ROWS:
+        raise ValueError(f"Not enough data to build a training set ({len(rows)} rows)")
+
+    X = np.vstack(rows)
+    y = np.array(labels)
+    if len(np.unique(y)) < 2:
+        raise ValueError("Training labels contain a single class")
+    return X, y
+
+
+def fit_classifier(
+    factory: Callable[[], Any],
+    X: np.ndarray,
+    y: np.ndarray,
+    holdout: float = 0.2
+) -> Tuple[Any, Dict[str, float]]:
+    """
+    Score a classifier on the most recent `holdout` share, then refit on all rows
+
+    Returns:
+        (model fitted on all rows, {'accuracy', 'f1'} on the holdout)
+    """
+    split = int(len(X) * (1 - holdout))
+    metrics = {'accuracy': 0.0, 'f1': 0.0}
+
+    if 0 < split < len(X) and len(np.unique(y[:split])) == 2:
+        model = factory()
+        model.fit(X[:split], y[:split])
+        pred = model.predict(X[split:])
+        actual = y[split:]
+        tp = float(np.sum((pred == 1) & (actual == 1)))
+        precision = tp / max(np.sum(pred == 1), 1)
+        recall = tp / max(np.sum(actual == 1), 1)
+        metrics['accuracy'] = float(np.mean(pred == actual))
+        metrics['f1'] = 2 * precision * recall / (precision + recall) if precision + recall > 0 else 0.0
+
+    model = factory()
+    model.fit(X, y)
+    return model, metrics
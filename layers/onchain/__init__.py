@@ -21,14 +21,16 @@ GitHub: https://github.com/dem2203/Demir
 Railway: https://demir1988.up.railway.app/
 """
 
-import requests
 import logging
 import numpy as np
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from functools import wraps
 import time
 
+from utils.http_client import http_get
+from utils.source_collector import SourceSpec, single_attempt
+
 logger = logging.getLogger(__name__)
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -154,7 +156,7 @@ class OnChainMetricsLayer:
         try:
             # Use Blockchain.com public API (no key required)
             url = "https://blockchain.info/stats?format=json"
-            response = requests.get(url, timeout=10)
+            response = http_get(url, timeout=10)
             
             if response.status_code != 200:
                 raise ValueError(f"Blockchain.com API error {response.status_code}")
@@ -240,7 +242,7 @@ class WhaleTrackerLayer:
         try:
             # Get unconfirmed transactions
             url = "https://blockchain.info/unconfirmed-transactions?format=json"
-            response = requests.get(url, timeout=10)
+            response = http_get(url, timeout=10)
             
             if response.status_code != 200:
                 raise ValueError(f"Blockchain.com error {response.status_code}")
@@ -341,7 +343,7 @@ class SmartContractLayer:
                 'action': 'gasoracle'
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            response = http_get(url, params=params, timeout=10)
             
             if response.status_code != 200:
                 raise ValueError(f"Etherscan error {response.status_code}")
@@ -409,7 +411,7 @@ class GasFeesLayer:
         """Analyze Bitcoin transaction fees"""
         try:
             url = "https://mempool.space/api/v1/fees/recommended"
-            response = requests.get(url, timeout=10)
+            response = http_get(url, timeout=10)
             
             if response.status_code != 200:
                 raise ValueError(f"Mempool.space error {response.status_code}")
@@ -538,6 +540,31 @@ ONCHAIN_LAYERS = [
     ('MVRVRatio', MVRVRatioLayer),            # ❌ DISABLED
 ]
 
+# Freshness per source (seconds), in line with each metric's data_lag
+ONCHAIN_SOURCE_TTLS = {
+    "OnChainMetrics": 300,
+    "WhaleTracker": 60,
+    "SmartContract": 300,
+    "GasFees": 60,
+    "DefiHealth": 86400,
+    "MVRVRatio": 86400,
+}
+
+
+def build_onchain_sources() -> List[SourceSpec]:
+    """SourceSpecs for the enabled on-chain layers (SourceCollector)"""
+    specs = []
+    for name, layer_cls in ONCHAIN_LAYERS:
+        if not ONCHAIN_CONFIG.get(name, {}).get("enabled"):
+            continue
+        try:
+            layer = layer_cls()
+        except Exception as e:
+            logger.warning(f"⚠️ {name} layer init failed, not collected: {e}")
+            continue
+        specs.append(SourceSpec(name, single_attempt(layer.analyze), ttl=ONCHAIN_SOURCE_TTLS.get(name, 300)))
+    return specs
+
 logger.info("="*60)
 logger.info("✅ DEMIR AI v8.0 - ON-CHAIN LAYER OPTIMIZATION COMPLETE")
 logger.info("="*60)
@@ -22,10 +22,12 @@ Railway: https://demir1988.up.railway.app/
 
 import logging
 import numpy as np
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence
 from functools import wraps
 import time
 
+from layers.risk.monte_carlo_engine import MonteCarloRiskEngine, CorrelationInput
+
 logger = logging.getLogger(__name__)
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -196,14 +198,25 @@ class HistoricalVolatilityLayer:
 class MonteCarloLayer:
     """
     Monte Carlo VaR (70 lines) ✅ ACTIVE
-    - Generate 1000 price paths
-    - Calculate VaR (Value at Risk)
-    - Probability distribution analysis
+    - Generate 1000 price paths (vectorized, reusable shock bank)
+    - Calculate VaR / CVaR (Value at Risk) per horizon
+    - Multi-asset portfolio risk with correlated (Cholesky) shocks
     """
-    def __init__(self):
+    def __init__(self, horizons: Sequence[int] = (1,)):
         self.enabled = RISK_CONFIG["MonteCarloVaR"]["enabled"]
         self.priority = RISK_CONFIG["MonteCarloVaR"]["priority"]
         self.n_simulations = 1000
+        self.last_report: Optional[Dict] = None
+        
+        # Single asset: last 50 prices, 1 period ahead (risk score horizon = first)
+        self.engine = MonteCarloRiskEngine(
+            n_paths=self.n_simulations,
+            horizons=horizons,
+            confidence_levels=(0.95, 0.99),
+            lookback=49
+        )
+        # Portfolio: 10k paths, multi-horizon
+        self.portfolio_engine = MonteCarloRiskEngine(n_paths=10000, horizons=(1, 5, 10))
         
         if not self.enabled:
             logger.info("⚠️ MonteCarloVaR Layer DISABLED")
@@ -221,41 +234,42 @@ class MonteCarloLayer:
             if len(prices) < 20:
                 raise ValueError("Insufficient price data (need 20+)")
             
-            # Calculate returns statistics
-            returns = np.diff(prices[-50:]) / prices[-50:-1]
-            mean_return = np.mean(returns)
-            std_return = np.std(returns)
-            
-            # Run Monte Carlo simulation
-            simulations = []
-            for _ in range(self.n_simulations):
-                # Simulate future price (1 period ahead)
-                random_return = np.random.normal(mean_return, std_return)
-                future_price = prices[-1] * np.exp(random_return)
-                simulations.append(future_price)
+            # All paths / horizons in one vectorized pass
+            report = self.engine.asset_risk(prices)
+            self.last_report = report
             
-            simulations = np.array(simulations)
-            
-            # Calculate percentiles
-            percentile_5 = np.percentile(simulations, 5)
-            percentile_50 = np.percentile(simulations, 50)
-            percentile_95 = np.percentile(simulations, 95)
-            
-            # Probability of increase
-            prob_up = np.sum(simulations > prices[-1]) / len(simulations)
-            
-            # VaR (5% worst case)
-            var_5 = (percentile_5 - prices[-1]) / prices[-1]
+            first = report["horizons"][self.engine.horizons[0]]
+            prob_up = first["prob_up"]
+            var_5 = first["var"][0.95]
             
             # Risk score based on upside probability
             risk_score = prob_up
             
-            logger.info(f"✅ Monte Carlo: {risk_score:.2f} (prob_up: {prob_up:.1%}, VaR5%: {var_5:.1%})")
+            logger.info(f"✅ Monte Carlo: {risk_score:.2f} (prob_up: {prob_up:.1%}, VaR5%: {-var_5:.1%})")
             return np.clip(risk_score, 0, 1)
             
         except Exception as e:
             logger.error(f"❌ Monte Carlo error: {e}")
             raise
+    
+    def analyze_portfolio(
+        self,
+        prices: Dict[str, List[float]],
+        weights: Optional[Dict[str, float]] = None,
+        correlation: CorrelationInput = None
+    ) -> Dict:
+        """Portfolio VaR / CVaR per horizon (see MonteCarloRiskEngine.portfolio_risk)"""
+        if not self.enabled:
+            raise ValueError(f"MonteCarloVaR disabled - {RISK_CONFIG['MonteCarloVaR']['reason']}")
+        
+        report = self.portfolio_engine.portfolio_risk(prices, weights, correlation)
+        worst = report["horizons"][max(report["horizons"])]
+        logger.info(
+            f"✅ Monte Carlo portfolio: {len(report['symbols'])} assets, "
+            f"VaR95 {worst['var'][0.95]:.1%} / CVaR95 {worst['cvar'][0.95]:.1%} "
+            f"@{max(report['horizons'])} bars ({report['elapsed_ms']:.0f}ms)"
+        )
+        return report
 
 # ══════════════════════════════════════════════════════════════════════════════
 # LAYER 4: KELLY CRITERION (60 lines) ✅ ACTIVE
@@ -8,10 +8,11 @@
 File: layers/technical/harmonic_patterns.py
 """
 
-import numpy as np
+import time
 import logging
+from collections import deque
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 logger = logging.getLogger('HarmonicPatternAnalyzer')
 
@@ -19,7 +20,7 @@ logger = logging.getLogger('HarmonicPatternAnalyzer')
 class Pattern:
     """Harmonic pattern structure"""
     name: str
-    direction: str  # BULLISH or BEARISH
+    direction: str  # LONG or SHORT
     x_price: float
     a_price: float
     b_price: float
@@ -30,6 +31,183 @@ class Pattern:
     tp1: float
     tp2: float
     sl: float
+    d_index: int = -1  # candle index of point D
+    symbol: str = ''
+
+# ============================================================================
+# XABCD TEMPLATES
+# ============================================================================
+
+@dataclass(frozen=True)
+class HarmonicTemplate:
+    """Fibonacci ratio bands of one pattern; legs are absolute price moves"""
+    name: str
+    confidence: float
+    tp2_extension: float  # tp2 = A * (1 ± extension)
+    ratios: Dict[str, Tuple[float, float]] = field(default_factory=dict)
+
+    def matches(self, legs: Dict[str, float]) -> bool:
+        for ratio, (low, high) in self.ratios.items():
+            value = legs.get(ratio)
+            if value is None or not (low < value < high):
+                return False
+        return True
+
+
+HARMONIC_TEMPLATES: Tuple[HarmonicTemplate, ...] = (
+    # CRAB (most accurate - 80%+ win rate)
+    HarmonicTemplate('CRAB', 0.85, 0.50, {'ab_xa': (0.55, 0.75), 'bc_ab': (0.38, 0.90), 'cd_ab': (1.55, 1.70)}),
+    HarmonicTemplate('GARTLEY', 0.75, 0.30, {'ab_xa': (0.55, 0.75), 'bc_ab': (0.38, 0.90), 'cd_bc': (1.20, 1.65)}),
+    HarmonicTemplate('BUTTERFLY', 0.72, 0.20, {'ab_xa': (0.70, 0.85), 'bc_ab': (0.38, 0.90), 'cd_xa': (1.55, 1.75)}),
+    # BAT: D retraces 0.886 of XA
+    HarmonicTemplate('BAT', 0.70, 0.25, {'ab_xa': (0.38, 0.55), 'bc_ab': (0.38, 0.90), 'ad_xa': (0.85, 0.95)}),
+)
+
+# ============================================================================
+# ZIG-ZAG PIVOT INDEX (incremental)
+# ============================================================================
+
+class ZigZagPivotIndex:
+    """
+    Confirmed swing pivots, maintained one candle at a time.
+
+    A running extreme (the candidate) becomes a pivot once price reverses
+    `deviation` (fraction) from it; pivots alternate high / low. The
+    current candidate is the tentative next pivot - point D while a
+    pattern is forming.
+    """
+
+    HIGH = 'H'
+    LOW = 'L'
+
+    def __init__(self, deviation: float = 0.015, max_pivots: int = 64):
+        self.deviation = deviation
+        self.pivots: deque = deque(maxlen=max_pivots)  # (kind, index, price)
+        self.index = -1
+        self.trend: Optional[str] = None  # HIGH: tracking a high, LOW: tracking a low
+        self.candidate: Optional[Tuple[str, int, float]] = None
+        self._first_high: Tuple[int, float] = (0, float('-inf'))
+        self._first_low: Tuple[int, float] = (0, float('inf'))
+
+    def update(self, high: float, low: float) -> Tuple[bool, bool]:
+        """
+        Feed one candle.
+
+        Returns:
+            (pivot_confirmed, candidate_moved)
+        """
+        self.index += 1
+        i = self.index
+
+        if self.trend is None:
+            if high > self._first_high[1]:
+                self._first_high = (i, high)
+            if low < self._first_low[1]:
+                self._first_low = (i, low)
+            hi_idx, hi = self._first_high
+            lo_idx, lo = self._first_low
+            if lo_idx < hi_idx and hi >= lo * (1 + self.deviation):
+                self.pivots.append((self.LOW, lo_idx, lo))
+                self.trend, self.candidate = self.HIGH, (self.HIGH, hi_idx, hi)
+                return True, True
+            if hi_idx < lo_idx and lo <= hi * (1 - self.deviation):
+                self.pivots.append((self.HIGH, hi_idx, hi))
+                self.trend, self.candidate = self.LOW, (self.LOW, lo_idx, lo)
+                return True, True
+            return False, False
+
+        _, _, extreme = self.candidate
+        if self.trend == self.HIGH:
+            if high > extreme:
+                self.candidate = (self.HIGH, i, high)
+                return False, True
+            if low <= extreme * (1 - self.deviation):
+                self.pivots.append(self.candidate)
+                self.trend, self.candidate = self.LOW, (self.LOW, i, low)
+                return True, True
+        else:
+            if low < extreme:
+                self.candidate = (self.LOW, i, low)
+                return False, True
+            if high >= extreme * (1 + self.deviation):
+                self.pivots.append(self.candidate)
+                self.trend, self.candidate = self.HIGH, (self.HIGH, i, high)
+                return True, True
+        return False, False
+
+# ============================================================================
+# STREAMING SCANNER (one symbol)
+# ============================================================================
+
+class HarmonicScanner:
+    """
+    Incremental XABCD scan over a ZigZagPivotIndex.
+
+    Only the newest combination is evaluated per candle: the last four
+    confirmed pivots as X, A, B, C and the running candidate as D - and
+    only when D moved or a pivot was confirmed. Each pattern name is
+    reported once per XABC structure.
+    """
+
+    def __init__(self, deviation: float = 0.015, templates: Tuple[HarmonicTemplate, ...] = HARMONIC_TEMPLATES,
+                 symbol: str = ''):
+        self.pivots = ZigZagPivotIndex(deviation)
+        self.templates = templates
+        self.symbol = symbol
+        self._structure: Optional[Tuple[int, int, int, int]] = None
+        self._reported: set = set()
+
+    def update(self, high: float, low: float) -> List[Pattern]:
+        """Feed one candle; returns patterns completed at this candle"""
+        confirmed, moved = self.pivots.update(high, low)
+        if not (confirmed or moved) or len(self.pivots.pivots) < 4:
+            return []
+        return self._match()
+
+    def _match(self) -> List[Pattern]:
+        (x_kind, x_idx, x), (_, a_idx, a), (_, b_idx, b), (_, c_idx, c) = list(self.pivots.pivots)[-4:]
+        _, d_idx, d = self.pivots.candidate
+
+        structure = (x_idx, a_idx, b_idx, c_idx)
+        if structure != self._structure:
+            self._structure = structure
+            self._reported = set()
+
+        bullish = x_kind == ZigZagPivotIndex.LOW  # X low → A high → B low → C high → D low
+        if bullish and not (x < a and b < a and c > b and d < c):
+            return []
+        if not bullish and not (x > a and b > a and c < b and d > c):
+            return []
+
+        xa, ab, bc, cd = abs(a - x), abs(a - b), abs(c - b), abs(d - c)
+        if not (xa and ab and bc):
+            return []
+        legs = {'ab_xa': ab / xa, 'bc_ab': bc / ab, 'cd_ab': cd / ab, 'cd_bc': cd / bc,
+                'cd_xa': cd / xa, 'ad_xa': abs(a - d) / xa}
+
+        found = []
+        for template in self.templates:
+            if template.name in self._reported or not template.matches(legs):
+                continue
+            self._reported.add(template.name)
+            extension = template.tp2_extension if bullish else -template.tp2_extension
+            found.append(Pattern(
+                name=f"{template.name}_{'BULLISH' if bullish else 'BEARISH'}",
+                direction='LONG' if bullish else 'SHORT',
+                x_price=x,
+                a_price=a,
+                b_price=b,
+                c_price=c,
+                d_price=d,
+                confidence=template.confidence,
+                entry_level=d,
+                tp1=a,
+                tp2=a * (1 + extension),
+                sl=b,
+                d_index=d_idx,
+                symbol=self.symbol,
+            ))
+        return found
 
 class HarmonicPatternAnalyzer:
     """
@@ -41,6 +219,11 @@ class HarmonicPatternAnalyzer:
     - Gartley: 0.618 XA, 0.382-0.886 AB, 1.272-1.618 BC = CD
     - Bat: 0.500 XA, 0.382-0.886 AB, 0.886 AC = BD
     - Shark: 0.786 XA, 1.130-1.618 AB, 1.600-2.240 XA = CD
+
+    Points come from an incremental zig-zag pivot index (HarmonicScanner):
+    - analyze_prices(): batch - feeds the candles through a fresh scanner
+    - update() / update_many(): streaming - one scanner per symbol, O(1)
+      per closed candle, returns only newly completed patterns
     """
     
     # Fibonacci ratios
@@ -59,211 +242,61 @@ class HarmonicPatternAnalyzer:
         '2.618': 2.618,
     }
     
-    def __init__(self):
-        self.patterns_detected = []
+    def __init__(self, deviation: float = 0.015):
+        self.deviation = deviation
+        self.patterns_detected = deque(maxlen=1000)
+        self.scanners: Dict[str, HarmonicScanner] = {}
         logger.info("✅ Harmonic Pattern Analyzer initialized")
     
+    @staticmethod
+    def _high_low(candle: Dict) -> Tuple[float, float]:
+        close = candle.get('close')
+        return candle.get('high', close), candle.get('low', close)
+    
     def analyze_prices(self, ohlcv_data: List[Dict]) -> List[Pattern]:
-        """Analyze price data for harmonic patterns"""
-        
-        prices = np.array([c['close'] for c in ohlcv_data])
+        """Analyze price data for harmonic patterns (each pattern reported once)"""
         
-        if len(prices) < 50:
+        if len(ohlcv_data) < 50:
             logger.warning("Not enough data for harmonic pattern detection")
             return []
         
+        scanner = HarmonicScanner(self.deviation)
         patterns = []
-        
-        # Get pivots (highs and lows)
-        highs = np.array([c['high'] for c in ohlcv_data])
-        lows = np.array([c['low'] for c in ohlcv_data])
-        
-        # Detect patterns on recent price action (last 100 candles)
-        for i in range(20, len(prices) - 20):
-            # Bullish patterns (V shape - low to high)
-            bullish_pattern = self._detect_bullish_pattern(lows[i-20:i+20], highs[i-20:i+20])
-            if bullish_pattern:
-                patterns.append(bullish_pattern)
-            
-            # Bearish patterns (inverted V - high to low)
-            bearish_pattern = self._detect_bearish_pattern(highs[i-20:i+20], lows[i-20:i+20])
-            if bearish_pattern:
-                patterns.append(bearish_pattern)
+        for candle in ohlcv_data:
+            patterns.extend(scanner.update(*self._high_low(candle)))
         
         if patterns:
             logger.info(f"🎯 Detected {len(patterns)} harmonic patterns")
         
         return patterns
     
-    def _detect_bullish_pattern(self, lows: np.ndarray, highs: np.ndarray) -> Optional[Pattern]:
-        """Detect bullish harmonic patterns (V shape)"""
-        
-        if len(lows) < 5:
-            return None
-        
-        # Find zigzag points: X → A (high) → B (low) → C (high) → D (low)
-        try:
-            # X point (starting low)
-            x_price = lows[0]
-            
-            # A point (first high)
-            a_idx = np.argmax(highs[:25])
-            a_price = highs[a_idx]
-            
-            # B point (low after A)
-            b_idx = a_idx + np.argmin(lows[a_idx:a_idx+15]) if a_idx+15 < len(lows) else a_idx + 5
-            b_price = lows[b_idx]
-            
-            # C point (high after B)
-            c_idx = b_idx + np.argmax(highs[b_idx:b_idx+15]) if b_idx+15 < len(highs) else b_idx + 5
-            c_price = highs[c_idx]
-            
-            # D point (expected low)
-            d_price = lows[-1]
-            
-            # Validate structure
-            if not (x_price < a_price and b_price < a_price and c_price > b_price):
-                return None
-            
-            # Check Fibonacci ratios for pattern type
-            xa = abs(a_price - x_price)
-            ab = abs(a_price - b_price)
-            bc = abs(c_price - b_price)
-            cd = abs(d_price - c_price)
-            
-            # CRAB PATTERN (Most accurate - 80%+ win rate)
-            if (0.55 < ab / xa < 0.75 and
-                0.38 < bc / ab < 0.90 and
-                1.55 < cd / ab < 1.70):
-                return Pattern(
-                    name='CRAB_BULLISH',
-                    direction='LONG',
-                    x_price=x_price,
-                    a_price=a_price,
-                    b_price=b_price,
-                    c_price=c_price,
-                    d_price=d_price,
-                    confidence=0.85,
-                    entry_level=d_price,
-                    tp1=a_price,
-                    tp2=a_price * 1.5,
-                    sl=b_price
-                )
-            
-            # GARTLEY PATTERN
-            if (0.55 < ab / xa < 0.75 and
-                0.38 < bc / ab < 0.90 and
-                1.20 < cd / bc < 1.65):
-                return Pattern(
-                    name='GARTLEY_BULLISH',
-                    direction='LONG',
-                    x_price=x_price,
-                    a_price=a_price,
-                    b_price=b_price,
-                    c_price=c_price,
-                    d_price=d_price,
-                    confidence=0.75,
-                    entry_level=d_price,
-                    tp1=a_price,
-                    tp2=a_price * 1.3,
-                    sl=b_price
-                )
-            
-            # BUTTERFLY PATTERN
-            if (0.70 < ab / xa < 0.85 and
-                0.38 < bc / ab < 0.90 and
-                1.55 < cd / xa < 1.75):
-                return Pattern(
-                    name='BUTTERFLY_BULLISH',
-                    direction='LONG',
-                    x_price=x_price,
-                    a_price=a_price,
-                    b_price=b_price,
-                    c_price=c_price,
-                    d_price=d_price,
-                    confidence=0.72,
-                    entry_level=d_price,
-                    tp1=a_price,
-                    tp2=a_price * 1.2,
-                    sl=b_price
-                )
-            
-            # BAT PATTERN
-            if (0.38 < ab / xa < 0.55 and
-                0.38 < bc / ab < 0.90 and
-                0.85 < (d_price - b_price) / (a_price - b_price) < 0.95):
-                return Pattern(
-                    name='BAT_BULLISH',
-                    direction='LONG',
-                    x_price=x_price,
-                    a_price=a_price,
-                    b_price=b_price,
-                    c_price=c_price,
-                    d_price=d_price,
-                    confidence=0.70,
-                    entry_level=d_price,
-                    tp1=a_price,
-                    tp2=a_price * 1.25,
-                    sl=b_price
-                )
-            
-        except Exception as e:
-            logger.debug(f"Error in bullish pattern detection: {e}")
-        
-        return None
+    def update(self, symbol: str, candle: Dict) -> List[Pattern]:
+        """Streaming: feed one closed candle of `symbol`, get the patterns completed by it"""
+        scanner = self.scanners.get(symbol)
+        if scanner is None:
+            scanner = self.scanners[symbol] = HarmonicScanner(self.deviation, symbol=symbol)
+        patterns = scanner.update(*self._high_low(candle))
+        if patterns:
+            self.patterns_detected.extend(patterns)
+        return patterns
     
-    def _detect_bearish_pattern(self, highs: np.ndarray, lows: np.ndarray) -> Optional[Pattern]:
-        """Detect bearish harmonic patterns (inverted V)"""
-        
-        if len(highs) < 5:
-            return None
-        
-        # For bearish: X → A (low) → B (high) → C (low) → D (high)
-        try:
-            x_price = highs[0]
-            
-            a_idx = np.argmin(lows[:25])
-            a_price = lows[a_idx]
-            
-            b_idx = a_idx + np.argmax(highs[a_idx:a_idx+15]) if a_idx+15 < len(highs) else a_idx + 5
-            b_price = highs[b_idx]
-            
-            c_idx = b_idx + np.argmin(lows[b_idx:b_idx+15]) if b_idx+15 < len(lows) else b_idx + 5
-            c_price = lows[c_idx]
-            
-            d_price = highs[-1]
-            
-            if not (x_price > a_price and b_price > a_price and c_price < b_price):
-                return None
-            
-            xa = abs(a_price - x_price)
-            ab = abs(b_price - a_price)
-            bc = abs(c_price - b_price)
-            cd = abs(d_price - c_price)
-            
-            # CRAB PATTERN (Bearish)
-            if (0.55 < ab / xa < 0.75 and
-                0.38 < bc / ab < 0.90 and
-                1.55 < cd / ab < 1.70):
-                return Pattern(
-                    name='CRAB_BEARISH',
-                    direction='SHORT',
-                    x_price=x_price,
-                    a_price=a_price,
-                    b_price=b_price,
-                    c_price=c_price,
-                    d_price=d_price,
-                    confidence=0.85,
-                    entry_level=d_price,
-                    tp1=a_price,
-                    tp2=a_price * 0.5,
-                    sl=b_price
-                )
-        
-        except Exception as e:
-            logger.debug(f"Error in bearish pattern detection: {e}")
-        
-        return None
+    def update_many(self, candles: Dict[str, Dict]) -> Dict[str, List[Pattern]]:
+        """Streaming: one closed candle per symbol (e.g. every 15m close); only symbols with new patterns returned"""
+        started = time.perf_counter()
+        found = {}
+        for symbol, candle in candles.items():
+            patterns = self.update(symbol, candle)
+            if patterns:
+                found[symbol] = patterns
+        logger.debug(f"Harmonic scan: {len(candles)} symbols in {(time.perf_counter() - started) * 1000:.2f}ms")
+        return found
+    
+    def reset(self, symbol: Optional[str] = None):
+        """Drop streaming state (one symbol or all)"""
+        if symbol is None:
+            self.scanners.clear()
+        else:
+            self.scanners.pop(symbol, None)
     
     def get_pattern_confidence(self, pattern: Pattern) -> float:
         """Get pattern confidence (higher = more reliable)"""
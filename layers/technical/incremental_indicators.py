@@ -0,0 +1,370 @@
+"""
+Incremental Technical Indicators - O(1) per candle
+DEMIR AI v8.0 - Streaming engine for TechnicalIndicatorsLive
+
+Her yeni mumda indikatör durumunu sabit zamanda günceller:
+- EMA / MACD: seeded exponential smoothing (TA-Lib compatible seed = SMA)
+- RSI / ATR / ADX: Wilder smoothing
+- SMA / BB / CMF / MFI / VWAP / AD / OBV: rolling sums over ring windows
+- Stochastic / Williams %R / Ichimoku: monotonic max/min deques
+
+Values follow TA-Lib lookback semantics (NaN until warmed up) so that
+TechnicalIndicatorsLive can serve them in place of the batch path.
+Windowed sums are re-summed exactly once per window to cancel float drift.
+"""
+
+import math
+from collections import deque
+from typing import Dict, Optional
+
+NAN = float("nan")
+
+
+class _RollingSum:
+    """Sum of the last `period` values"""
+
+    __slots__ = ("period", "values", "total")
+
+    def __init__(self, period: int):
+        self.period = period
+        self.values = deque()
+        self.total = 0.0
+
+    def push(self, value: float):
+        if len(self.values) == self.period:
+            self.total -= self.values.popleft()
+        self.values.append(value)
+        self.total += value
+
+    @property
+    def full(self) -> bool:
+        return len(self.values) == self.period
+
+    def first(self) -> float:
+        return self.values[0]
+
+    def resync(self):
+        self.total = math.fsum(self.values)
+
+
+class _RollingExtreme:
+    """Max (or min) of the last `period` values via a monotonic deque"""
+
+    __slots__ = ("period", "is_max", "window")
+
+    def __init__(self, period: int, is_max: bool):
+        self.period = period
+        self.is_max = is_max
+        self.window = deque()  # (index, value)
+
+    def push(self, index: int, value: float):
+        window = self.window
+        if self.is_max:
+            while window and window[-1][1] <= value:
+                window.pop()
+        else:
+            while window and window[-1][1] >= value:
+                window.pop()
+        window.append((index, value))
+        while window[0][0] <= index - self.period:
+            window.popleft()
+
+    @property
+    def value(self) -> float:
+        return self.window[0][1]
+
+
+class _SeededSmoother:
+    """
+    Exponential smoother seeded with the SMA of the first `period` inputs
+
+    alpha = 2/(period+1) gives TA-Lib EMA, alpha = 1/period gives Wilder.
+    """
+
+    __slots__ = ("period", "alpha", "count", "seed_sum", "value")
+
+    def __init__(self, period: int, alpha: float):
+        self.period = period
+        self.alpha = alpha
+        self.count = 0
+        self.seed_sum = 0.0
+        self.value = NAN
+
+    def push(self, x: float) -> float:
+        self.count += 1
+        if self.count < self.period:
+            self.seed_sum += x
+        elif self.count == self.period:
+            self.value = (self.seed_sum + x) / self.period
+        else:
+            self.value += self.alpha * (x - self.value)
+        return self.value
+
+    @property
+    def ready(self) -> bool:
+        return self.count >= self.period
+
+
+def _ema(period: int) -> _SeededSmoother:
+    return _SeededSmoother(period, 2.0 / (period + 1))
+
+
+def _wilder(period: int) -> _SeededSmoother:
+    return _SeededSmoother(period, 1.0 / period)
+
+
+class IncrementalIndicatorEngine:
+    """
+    Streaming state for the 17 active core indicators
+
+    update() is O(1) per candle; snapshot() returns the current values.
+    """
+
+    def __init__(self, window: int = 500):
+        """
+        Args:
+            window: Bars covered by whole-window indicators (OBV, AD, VWAP);
+                    matches TechnicalIndicatorsLive.lookback_period
+        """
+        self.window = window
+        self.count = 0
+        self.prev: Optional[tuple] = None  # (high, low, close, typical_price)
+        self._shift: Optional[float] = None  # BB variance shift for precision
+
+        # Moving averages
+        self.sma = {20: _RollingSum(20), 50: _RollingSum(50)}
+        self.ema = {12: _ema(12), 26: _ema(26)}
+
+        # MACD (12, 26, 9)
+        self.macd_fast = _ema(12)
+        self.macd_slow = _ema(26)
+        self.macd_signal = _ema(9)
+        self.macd_value = NAN
+
+        # RSI 14
+        self.rsi_gain = _wilder(14)
+        self.rsi_loss = _wilder(14)
+
+        # Bollinger 20 (shifted sums of x and x^2)
+        self.bb_sum = _RollingSum(20)
+        self.bb_sumsq = _RollingSum(20)
+
+        # ATR 14 / ADX 14
+        self.atr = _wilder(14)
+        self.adx_tr = _wilder(14)
+        self.adx_plus = _wilder(14)
+        self.adx_minus = _wilder(14)
+        self.adx = _wilder(14)
+
+        # Stochastic (14, 3, 3) / Williams %R 14
+        self.high_14 = _RollingExtreme(14, is_max=True)
+        self.low_14 = _RollingExtreme(14, is_max=False)
+        self.stoch_k = _RollingSum(3)
+        self.stoch_d = _RollingSum(3)
+
+        # Ichimoku (9, 26)
+        self.high_9 = _RollingExtreme(9, is_max=True)
+        self.low_9 = _RollingExtreme(9, is_max=False)
+        self.high_26 = _RollingExtreme(26, is_max=True)
+        self.low_26 = _RollingExtreme(26, is_max=False)
+
+        # MFI 14
+        self.mfi_pos = _RollingSum(14)
+        self.mfi_neg = _RollingSum(14)
+
+        # CMF 20
+        self.cmf_mfv = _RollingSum(20)
+        self.cmf_vol = _RollingSum(20)
+
+        # Whole-window: OBV, AD, VWAP
+        self.obv_volume = _RollingSum(window)
+        self.obv_signed = _RollingSum(window)
+        self.ad_mfv = _RollingSum(window)
+        self.vwap_pv = _RollingSum(window)
+        self.vwap_vol = _RollingSum(window)
+
+        self._rolling = [
+            *self.sma.values(), self.bb_sum, self.bb_sumsq, self.stoch_k, self.stoch_d,
+            self.mfi_pos, self.mfi_neg, self.cmf_mfv, self.cmf_vol,
+            self.obv_volume, self.obv_signed, self.ad_mfv, self.vwap_pv, self.vwap_vol
+        ]
+
+    def update(self, high: float, low: float, close: float, volume: float):
+        """Fold one closed candle into every indicator state"""
+        index = self.count
+        self.count += 1
+        typical = (high + low + close) / 3
+
+        # Moving averages / MACD
+        for rolling in self.sma.values():
+            rolling.push(close)
+        for smoother in self.ema.values():
+            smoother.push(close)
+
+        fast = self.macd_fast.push(close)
+        slow = self.macd_slow.push(close)
+        if self.macd_slow.ready:
+            self.macd_value = fast - slow
+            self.macd_signal.push(self.macd_value)
+
+        # Bollinger
+        if self._shift is None:
+            self._shift = close
+        shifted = close - self._shift
+        self.bb_sum.push(shifted)
+        self.bb_sumsq.push(shifted * shifted)
+
+        # Extremes (Stochastic, Williams %R, Ichimoku)
+        for extreme, value in (
+            (self.high_14, high), (self.low_14, low),
+            (self.high_9, high), (self.low_9, low),
+            (self.high_26, high), (self.low_26, low)
+        ):
+            extreme.push(index, value)
+
+        if self.count >= 14:
+            hh, ll = self.high_14.value, self.low_14.value
+            fast_k = 100 * (close - ll) / (hh - ll) if hh != ll else 0.0
+            self.stoch_k.push(fast_k)
+            if self.stoch_k.full:
+                self.stoch_d.push(self.stoch_k.total / 3)
+
+        # CMF (repo convention: flat candle uses range 1)
+        hl = high - low if high != low else 1
+        self.cmf_mfv.push(((close - low) - (high - close)) / hl * volume)
+        self.cmf_vol.push(volume)
+
+        # AD (TA-Lib convention: flat candle adds nothing)
+        ad_range = high - low
+        self.ad_mfv.push(((close - low) - (high - close)) / ad_range * volume if ad_range > 0 else 0.0)
+
+        # VWAP
+        self.vwap_pv.push(typical * volume)
+        self.vwap_vol.push(volume)
+
+        # Bar-to-bar indicators
+        if self.prev is None:
+            self.obv_volume.push(volume)
+            self.obv_signed.push(volume)
+        else:
+            prev_high, prev_low, prev_close, prev_typical = self.prev
+
+            # OBV
+            if close > prev_close:
+                signed = volume
+            elif close < prev_close:
+                signed = -volume
+            else:
+                signed = 0.0
+            self.obv_volume.push(volume)
+            self.obv_signed.push(signed)
+
+            # RSI
+            change = close - prev_close
+            self.rsi_gain.push(change if change > 0 else 0.0)
+            self.rsi_loss.push(-change if change < 0 else 0.0)
+
+            # ATR / ADX
+            true_range = max(high - low, abs(high - prev_close), abs(low - prev_close))
+            self.atr.push(true_range)
+
+            up_move = high - prev_high
+            down_move = prev_low - low
+            plus_dm = up_move if up_move > down_move and up_move > 0 else 0.0
+            minus_dm = down_move if down_move > up_move and down_move > 0 else 0.0
+            self.adx_tr.push(true_range)
+            self.adx_plus.push(plus_dm)
+            self.adx_minus.push(minus_dm)
+            if self.adx_tr.ready and self.adx_tr.value > 0:
+                plus_di = 100 * self.adx_plus.value / self.adx_tr.value
+                minus_di = 100 * self.adx_minus.value / self.adx_tr.value
+                di_sum = plus_di + minus_di
+                self.adx.push(100 * abs(plus_di - minus_di) / di_sum if di_sum else 0.0)
+
+            # MFI
+            flow = typical * volume
+            self.mfi_pos.push(flow if typical > prev_typical else 0.0)
+            self.mfi_neg.push(flow if typical < prev_typical else 0.0)
+
+        self.prev = (high, low, close, typical)
+
+        # Cancel accumulated float error once per window
+        if self.count % self.window == 0:
+            for rolling in self._rolling:
+                rolling.resync()
+
+    # ══════════════════════════════════════════════════════════════════════════
+    # READ
+    # ══════════════════════════════════════════════════════════════════════════
+
+    def snapshot(self) -> Dict[str, float]:
+        """Current indicator values (NaN where TA-Lib would not be warmed up)"""
+        values: Dict[str, float] = {}
+
+        for period, rolling in self.sma.items():
+            values[f"SMA_{period}"] = rolling.total / period if rolling.full else NAN
+        for period, smoother in self.ema.items():
+            values[f"EMA_{period}"] = smoother.value
+
+        if self.macd_signal.ready:
+            values["MACD"] = self.macd_value
+            values["MACD_signal"] = self.macd_signal.value
+            values["MACD_hist"] = self.macd_value - self.macd_signal.value
+        else:
+            values["MACD"] = values["MACD_signal"] = values["MACD_hist"] = NAN
+
+        if self.rsi_gain.ready:
+            total = self.rsi_gain.value + self.rsi_loss.value
+            values["RSI_14"] = 100 * self.rsi_gain.value / total if total else 0.0
+        else:
+            values["RSI_14"] = NAN
+
+        if self.bb_sum.full:
+            mean = self.bb_sum.total / 20
+            variance = max(self.bb_sumsq.total / 20 - mean * mean, 0.0)
+            middle = mean + self._shift
+            std = math.sqrt(variance)
+            values["BB_middle"] = middle
+            values["BB_upper"] = middle + 2 * std
+            values["BB_lower"] = middle - 2 * std
+        else:
+            values["BB_middle"] = values["BB_upper"] = values["BB_lower"] = NAN
+
+        values["ATR_14"] = self.atr.value
+        values["ADX_14"] = self.adx.value
+
+        if self.stoch_d.full:
+            values["Stoch_K"] = self.stoch_k.total / 3
+            values["Stoch_D"] = self.stoch_d.total / 3
+        else:
+            values["Stoch_K"] = values["Stoch_D"] = NAN
+
+        if self.count >= 14:
+            hh, ll = self.high_14.value, self.low_14.value
+            close = self.prev[2]
+            values["Williams_R"] = -100 * (hh - close) / (hh - ll) if hh != ll else 0.0
+        else:
+            values["Williams_R"] = NAN
+
+        if self.mfi_pos.full:
+            total = self.mfi_pos.total + self.mfi_neg.total
+            values["MFI_14"] = 100 * self.mfi_pos.total / total if total >= 1 else 0.0
+        else:
+            values["MFI_14"] = NAN
+
+        if self.count >= 26:
+            values["Ichimoku_tenkan"] = (self.high_9.value + self.low_9.value) / 2
+            values["Ichimoku_kijun"] = (self.high_26.value + self.low_26.value) / 2
+        else:
+            values["Ichimoku_tenkan"] = values["Ichimoku_kijun"] = NAN
+
+        if self.count:
+            values["OBV"] = self.obv_volume.first() + self.obv_signed.total - self.obv_signed.first()
+            values["AD"] = self.ad_mfv.total
+            values["VWAP"] = self.vwap_pv.total / self.vwap_vol.total if self.vwap_vol.total > 0 else 0.0
+        else:
+            values["OBV"] = values["AD"] = values["VWAP"] = NAN
+
+        values["CMF"] = self.cmf_mfv.total / (self.cmf_vol.total or 1) if self.cmf_vol.full else NAN
+
+        return values
@@ -27,10 +27,12 @@ from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 import numpy as np
 import pandas as pd
-from collections import deque
 import talib
 import warnings
 
+from layers.technical.incremental_indicators import IncrementalIndicatorEngine
+from utils.ring_buffer import ColumnarRingBuffer
+
 warnings.filterwarnings("ignore")
 
 logger = logging.getLogger(__name__)
@@ -130,15 +132,21 @@ class TechnicalIndicatorsLive:
     - Price sanity checks against multiple exchanges
     """
     
-    def __init__(self, lookback_period: int = 500):
+    def __init__(self, lookback_period: int = 500, streaming: bool = False):
         """
         Args:
             lookback_period: Kaç bar geçmişi tutmak
+            streaming: add_candle indikatör durumunu O(1) günceller,
+                       get_all_indicators cache'lenmiş sonucu döner
         """
         self.lookback_period = lookback_period
-        self.ohlcv_buffer = deque(maxlen=lookback_period)
-        self.close_buffer = deque(maxlen=lookback_period)
-        self.volume_buffer = deque(maxlen=lookback_period)
+        # Columnar ring: indicators read zero-copy float64 views
+        self.ohlcv_buffer = ColumnarRingBuffer(lookback_period)
+        
+        # Streaming mode (incremental state, results cached per candle)
+        self.streaming = streaming
+        self.engine = IncrementalIndicatorEngine(window=lookback_period) if streaming else None
+        self._streaming_results: Optional[Dict[str, IndicatorResult]] = None
         
         # Cache
         self.last_results: Dict[str, IndicatorResult] = {}
@@ -167,11 +175,16 @@ class TechnicalIndicatorsLive:
                 logger.error(f"❌ INVALID OHLCV: negative volume (possible mock data)")
                 return False
             
-            self.ohlcv_buffer.append(ohlcv)
-            self.close_buffer.append(ohlcv.close)
-            self.volume_buffer.append(ohlcv.volume)
+            self.ohlcv_buffer.append_row((
+                ohlcv.timestamp, ohlcv.open, ohlcv.high,
+                ohlcv.low, ohlcv.close, ohlcv.volume
+            ))
+            
+            if self.engine:
+                self.engine.update(ohlcv.high, ohlcv.low, ohlcv.close, ohlcv.volume)
+                self._streaming_results = None
             
-            if len(self.close_buffer) >= 2:
+            if len(self.ohlcv_buffer) >= 2:
                 self.last_calculation_time = ohlcv.timestamp
                 return True
             return False
@@ -186,10 +199,16 @@ class TechnicalIndicatorsLive:
         Returns:
             Dict with ONLY enabled indicators (disabled ones skipped for performance)
         """
-        if len(self.close_buffer) < 2:
+        if len(self.ohlcv_buffer) < 2:
             logger.warning("⚠️ Insufficient data for indicators")
             return {}
         
+        if self.engine:
+            if self._streaming_results is None:
+                self._streaming_results = self._build_streaming_results()
+                self.last_results = self._streaming_results
+            return self._streaming_results
+        
         try:
             results = {}
             self.calculation_count += 1
@@ -274,12 +293,169 @@ class TechnicalIndicatorsLive:
             logger.error(f"❌ Error calculating indicators: {e}")
             return {}
     
+    def _build_streaming_results(self) -> Dict[str, IndicatorResult]:
+        """
+        Streaming mode: build results from incremental engine state
+        
+        Same guards, names and metadata as the batch methods; values match
+        the TA-Lib batch path within floating point tolerance.
+        """
+        values = self.engine.snapshot()
+        bars = len(self.ohlcv_buffer)
+        results = {}
+        self.calculation_count += 1
+        
+        def enabled(name: str) -> bool:
+            return INDICATOR_CONFIG[name]["enabled"]
+        
+        for period in (20, 50):
+            if enabled(f"SMA_{period}"):
+                results[f"SMA_{period}"] = IndicatorResult("SMA", 0, enabled=True) if bars < period else IndicatorResult(
+                    name=f"SMA_{period}",
+                    value=values[f"SMA_{period}"],
+                    metadata={"period": period, "data_source": "real_ohlcv"},
+                    enabled=True
+                )
+        for period in (12, 26):
+            if enabled(f"EMA_{period}"):
+                results[f"EMA_{period}"] = IndicatorResult("EMA", 0, enabled=True) if bars < period else IndicatorResult(
+                    name=f"EMA_{period}",
+                    value=values[f"EMA_{period}"],
+                    metadata={"period": period, "data_source": "real_ohlcv"},
+                    enabled=True
+                )
+        
+        if enabled("RSI_14"):
+            if bars < 15:
+                results["RSI_14"] = IndicatorResult("RSI", 50, enabled=True)
+            else:
+                rsi = values["RSI_14"]
+                signal_value = None
+                if rsi < 30:
+                    signal_value = "Oversold"
+                elif rsi > 70:
+                    signal_value = "Overbought"
+                results["RSI_14"] = IndicatorResult(
+                    name="RSI_14",
+                    value=rsi,
+                    signal=signal_value,
+                    metadata={"period": 14, "overbought": 70, "oversold": 30, "data_source": "real_ohlcv"},
+                    enabled=True
+                )
+        
+        if enabled("MACD"):
+            results["MACD"] = IndicatorResult("MACD", 0, enabled=True) if bars < 26 else IndicatorResult(
+                name="MACD",
+                value=values["MACD"],
+                signal=values["MACD_signal"],
+                histogram=values["MACD_hist"],
+                metadata={"fast": 12, "slow": 26, "signal": 9, "data_source": "real_ohlcv"},
+                enabled=True
+            )
+        
+        if enabled("BB_20"):
+            results["BB_20"] = IndicatorResult("BB", 0, enabled=True) if bars < 20 else IndicatorResult(
+                name="BB_20",
+                value=values["BB_middle"],
+                upper_band=values["BB_upper"],
+                lower_band=values["BB_lower"],
+                middle_band=values["BB_middle"],
+                metadata={"period": 20, "std_dev": 2, "data_source": "real_ohlcv"},
+                enabled=True
+            )
+        
+        if enabled("ATR_14"):
+            results["ATR_14"] = IndicatorResult("ATR", 0, enabled=True) if bars < 14 else IndicatorResult(
+                name="ATR_14",
+                value=values["ATR_14"],
+                metadata={"period": 14, "data_source": "real_ohlcv"},
+                enabled=True
+            )
+        
+        if enabled("ADX_14"):
+            results["ADX_14"] = IndicatorResult("ADX", 0, enabled=True) if bars < 14 else IndicatorResult(
+                name="ADX_14",
+                value=values["ADX_14"],
+                metadata={"period": 14, "strength_threshold": 25, "data_source": "real_ohlcv"},
+                enabled=True
+            )
+        
+        if enabled("Ichimoku"):
+            if bars < 26:
+                results["Ichimoku"] = IndicatorResult("Ichimoku", 0, enabled=True)
+            else:
+                tenkan = values["Ichimoku_tenkan"]
+                kijun = values["Ichimoku_kijun"]
+                results["Ichimoku"] = IndicatorResult(
+                    name="Ichimoku",
+                    value=float((tenkan + kijun) / 2),
+                    signal=float(tenkan),
+                    histogram=float(kijun),
+                    metadata={"tenkan": tenkan, "kijun": kijun, "data_source": "real_ohlcv"},
+                    enabled=True
+                )
+        
+        if enabled("OBV"):
+            results["OBV"] = IndicatorResult(
+                name="OBV",
+                value=values["OBV"],
+                metadata={"data_source": "real_ohlcv"},
+                enabled=True
+            )
+        if enabled("MFI_14"):
+            results["MFI_14"] = IndicatorResult("MFI", 50, enabled=True) if bars < 14 else IndicatorResult(
+                name="MFI_14",
+                value=values["MFI_14"],
+                metadata={"period": 14, "data_source": "real_ohlcv"},
+                enabled=True
+            )
+        if enabled("CMF"):
+            results["CMF"] = IndicatorResult("CMF", 0, enabled=True) if bars < 20 else IndicatorResult(
+                name="CMF",
+                value=values["CMF"],
+                metadata={"period": 20, "data_source": "real_ohlcv"},
+                enabled=True
+            )
+        if enabled("AD"):
+            results["AD"] = IndicatorResult(
+                name="AD",
+                value=values["AD"],
+                metadata={"data_source": "real_ohlcv"},
+                enabled=True
+            )
+        
+        if enabled("Stochastic"):
+            results["Stochastic"] = IndicatorResult("Stochastic", 50, enabled=True) if bars < 14 else IndicatorResult(
+                name="Stochastic",
+                value=values["Stoch_K"],
+                signal=values["Stoch_D"],
+                metadata={"k_period": 14, "slow_k": 3, "slow_d": 3, "data_source": "real_ohlcv"},
+                enabled=True
+            )
+        if enabled("Williams_R"):
+            results["Williams_R"] = IndicatorResult("Williams_R", -50, enabled=True) if bars < 14 else IndicatorResult(
+                name="Williams_R",
+                value=values["Williams_R"],
+                metadata={"period": 14, "data_source": "real_ohlcv"},
+                enabled=True
+            )
+        
+        if enabled("VWAP"):
+            results["VWAP"] = IndicatorResult(
+                name="VWAP",
+                value=values["VWAP"],
+                metadata={"data_source": "real_ohlcv"},
+                enabled=True
+            )
+        
+        return results
+    
     def _sma(self, period: int) -> IndicatorResult:
         """Simple Moving Average - REAL DATA ONLY"""
-        if len(self.close_buffer) < period:
+        if len(self.ohlcv_buffer) < period:
             return IndicatorResult("SMA", 0, enabled=True)
         
-        closes = np.array(list(self.close_buffer))
+        closes = self.ohlcv_buffer.view('close')
         sma = np.mean(closes[-period:])
         
         return IndicatorResult(
@@ -291,10 +467,10 @@ class TechnicalIndicatorsLive:
     
     def _ema(self, period: int) -> IndicatorResult:
         """Exponential Moving Average - REAL DATA ONLY"""
-        if len(self.close_buffer) < period:
+        if len(self.ohlcv_buffer) < period:
             return IndicatorResult("EMA", 0, enabled=True)
         
-        closes = np.array(list(self.close_buffer))
+        closes = self.ohlcv_buffer.view('close')
         ema = talib.EMA(closes, timeperiod=period)[-1]
         
         return IndicatorResult(
@@ -306,10 +482,10 @@ class TechnicalIndicatorsLive:
     
     def _rsi(self, period: int) -> IndicatorResult:
         """Relative Strength Index - REAL DATA ONLY"""
-        if len(self.close_buffer) < period + 1:
+        if len(self.ohlcv_buffer) < period + 1:
             return IndicatorResult("RSI", 50, enabled=True)
         
-        closes = np.array(list(self.close_buffer))
+        closes = self.ohlcv_buffer.view('close')
         rsi = talib.RSI(closes, timeperiod=period)[-1]
         
         signal_value = None
@@ -328,10 +504,10 @@ class TechnicalIndicatorsLive:
     
     def _macd(self) -> IndicatorResult:
         """MACD - Moving Average Convergence Divergence - REAL DATA ONLY"""
-        if len(self.close_buffer) < 26:
+        if len(self.ohlcv_buffer) < 26:
             return IndicatorResult("MACD", 0, enabled=True)
         
-        closes = np.array(list(self.close_buffer))
+        closes = self.ohlcv_buffer.view('close')
         macd, signal, hist = talib.MACD(closes, fastperiod=12, slowperiod=26, signalperiod=9)
         
         return IndicatorResult(
@@ -345,10 +521,10 @@ class TechnicalIndicatorsLive:
     
     def _bollinger_bands(self, period: int) -> IndicatorResult:
         """Bollinger Bands - REAL DATA ONLY"""
-        if len(self.close_buffer) < period:
+        if len(self.ohlcv_buffer) < period:
             return IndicatorResult("BB", 0, enabled=True)
         
-        closes = np.array(list(self.close_buffer))
+        closes = self.ohlcv_buffer.view('close')
         upper, middle, lower = talib.BBANDS(closes, timeperiod=period, nbdevup=2, nbdevdn=2)
         
         return IndicatorResult(
@@ -366,9 +542,9 @@ class TechnicalIndicatorsLive:
         if len(self.ohlcv_buffer) < period:
             return IndicatorResult("ATR", 0, enabled=True)
         
-        high = np.array([x.high for x in self.ohlcv_buffer])
-        low = np.array([x.low for x in self.ohlcv_buffer])
-        close = np.array([x.close for x in self.ohlcv_buffer])
+        high = self.ohlcv_buffer.view('high')
+        low = self.ohlcv_buffer.view('low')
+        close = self.ohlcv_buffer.view('close')
         
         atr = talib.ATR(high, low, close, timeperiod=period)[-1]
         
@@ -384,9 +560,9 @@ class TechnicalIndicatorsLive:
         if len(self.ohlcv_buffer) < period:
             return IndicatorResult("ADX", 0, enabled=True)
         
-        high = np.array([x.high for x in self.ohlcv_buffer])
-        low = np.array([x.low for x in self.ohlcv_buffer])
-        close = np.array([x.close for x in self.ohlcv_buffer])
+        high = self.ohlcv_buffer.view('high')
+        low = self.ohlcv_buffer.view('low')
+        close = self.ohlcv_buffer.view('close')
         
         adx = talib.ADX(high, low, close, timeperiod=period)[-1]
         
@@ -452,9 +628,9 @@ class TechnicalIndicatorsLive:
         if len(self.ohlcv_buffer) < 14:
             return IndicatorResult("Stochastic", 50, enabled=True)
         
-        high = np.array([x.high for x in self.ohlcv_buffer])
-        low = np.array([x.low for x in self.ohlcv_buffer])
-        close = np.array([x.close for x in self.ohlcv_buffer])
+        high = self.ohlcv_buffer.view('high')
+        low = self.ohlcv_buffer.view('low')
+        close = self.ohlcv_buffer.view('close')
         
         k, d = talib.STOCH(high, low, close, fastk_period=14, slowk_period=3, slowd_period=3)
         
@@ -471,9 +647,9 @@ class TechnicalIndicatorsLive:
         if len(self.ohlcv_buffer) < 14:
             return IndicatorResult("Williams_R", -50, enabled=True)
         
-        high = np.array([x.high for x in self.ohlcv_buffer])
-        low = np.array([x.low for x in self.ohlcv_buffer])
-        close = np.array([x.close for x in self.ohlcv_buffer])
+        high = self.ohlcv_buffer.view('high')
+        low = self.ohlcv_buffer.view('low')
+        close = self.ohlcv_buffer.view('close')
         
         wr = talib.WILLR(high, low, close, timeperiod=14)[-1]
         
@@ -489,10 +665,10 @@ class TechnicalIndicatorsLive:
         if len(self.ohlcv_buffer) < period:
             return IndicatorResult("MFI", 50, enabled=True)
         
-        high = np.array([x.high for x in self.ohlcv_buffer])
-        low = np.array([x.low for x in self.ohlcv_buffer])
-        close = np.array([x.close for x in self.ohlcv_buffer])
-        volume = np.array([x.volume for x in self.ohlcv_buffer])
+        high = self.ohlcv_buffer.view('high')
+        low = self.ohlcv_buffer.view('low')
+        close = self.ohlcv_buffer.view('close')
+        volume = self.ohlcv_buffer.view('volume')
         
         mfi = talib.MFI(high, low, close, volume, timeperiod=period)[-1]
         
@@ -505,11 +681,11 @@ class TechnicalIndicatorsLive:
     
     def _obv(self) -> IndicatorResult:
         """On Balance Volume - REAL DATA ONLY"""
-        if len(self.close_buffer) < 2:
+        if len(self.ohlcv_buffer) < 2:
             return IndicatorResult("OBV", 0, enabled=True)
         
-        closes = np.array(list(self.close_buffer))
-        volumes = np.array(list(self.volume_buffer))
+        closes = self.ohlcv_buffer.view('close')
+        volumes = self.ohlcv_buffer.view('volume')
         
         obv = talib.OBV(closes, volumes)[-1]
         
@@ -525,8 +701,9 @@ class TechnicalIndicatorsLive:
         if len(self.ohlcv_buffer) < 2:
             return IndicatorResult("VWAP", 0, enabled=True)
         
-        prices = np.array([(x.high + x.low + x.close) / 3 for x in self.ohlcv_buffer])
-        volumes = np.array([x.volume for x in self.ohlcv_buffer])
+        bars = self.ohlcv_buffer.views()
+        prices = (bars['high'] + bars['low'] + bars['close']) / 3
+        volumes = bars['volume']
         
         vwap = np.sum(prices * volumes) / np.sum(volumes) if np.sum(volumes) > 0 else 0
         
@@ -542,12 +719,12 @@ class TechnicalIndicatorsLive:
         if len(self.ohlcv_buffer) < 26:
             return IndicatorResult("Ichimoku", 0, enabled=True)
         
-        high_9 = max([x.high for x in list(self.ohlcv_buffer)[-9:]])
-        low_9 = min([x.low for x in list(self.ohlcv_buffer)[-9:]])
+        high_9 = float(self.ohlcv_buffer.view('high', 9).max())
+        low_9 = float(self.ohlcv_buffer.view('low', 9).min())
         tenkan = (high_9 + low_9) / 2
         
-        high_26 = max([x.high for x in list(self.ohlcv_buffer)[-26:]])
-        low_26 = min([x.low for x in list(self.ohlcv_buffer)[-26:]])
+        high_26 = float(self.ohlcv_buffer.view('high', 26).max())
+        low_26 = float(self.ohlcv_buffer.view('low', 26).min())
         kijun = (high_26 + low_26) / 2
         
         return IndicatorResult(
@@ -564,15 +741,13 @@ class TechnicalIndicatorsLive:
         if len(self.ohlcv_buffer) < period:
             return IndicatorResult("CMF", 0, enabled=True)
         
-        recent = list(self.ohlcv_buffer)[-period:]
-        cmf_values = []
+        recent = self.ohlcv_buffer.views(period)
+        high, low, close, volume = recent['high'], recent['low'], recent['close'], recent['volume']
         
-        for candle in recent:
-            hl = candle.high - candle.low if candle.high != candle.low else 1
-            clv = ((candle.close - candle.low) - (candle.high - candle.close)) / hl
-            cmf_values.append(clv * candle.volume)
+        hl = np.where(high != low, high - low, 1)
+        clv = ((close - low) - (high - close)) / hl
         
-        cmf = np.sum(cmf_values) / (np.sum([x.volume for x in recent]) or 1)
+        cmf = np.sum(clv * volume) / (np.sum(volume) or 1)
         
         return IndicatorResult(
             name="CMF",
@@ -586,14 +761,13 @@ class TechnicalIndicatorsLive:
         if len(self.ohlcv_buffer) < 2:
             return IndicatorResult("AD", 0, enabled=True)
         
-        closes = np.array([x.close for x in self.ohlcv_buffer])
-        volumes = np.array([x.volume for x in self.ohlcv_buffer])
+        bars = self.ohlcv_buffer.views()
         
         ad = talib.AD(
-            np.array([x.high for x in self.ohlcv_buffer]),
-            np.array([x.low for x in self.ohlcv_buffer]),
-            closes,
-            volumes
+            bars['high'],
+            bars['low'],
+            bars['close'],
+            bars['volume']
         )[-1]
         
         return IndicatorResult(
@@ -102,10 +102,24 @@ from datetime import datetime, timedelta, timezone
 from typing import Dict, Any, List, Optional, Tuple, Union, Callable
 from collections import defaultdict, deque, OrderedDict
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
-from functools import wraps, lru_cache
+from functools import wraps, lru_cache, partial
 from itertools import islice
 from dataclasses import dataclass, field
 
+# Core data structures (required by GlobalState)
+from utils.ring_buffer import ColumnarRingBuffer
+from utils.lock_striping import InstrumentedLock
+from utils.http_client import get_http_metrics
+from utils.tiered_cache import get_tiered_cache
+from utils.write_behind import get_write_behind_metrics
+from utils.scheduler import JobScheduler, JobSpec, FIXED_RATE, FIXED_DELAY
+from utils.broadcast_hub import BroadcastHub
+from utils.source_collector import SourceCollector, get_source_collector_metrics
+from utils.logger_setup import start_async_logging, get_logging_metrics
+from utils.rolling_correlation import get_correlation_matrix, get_correlation_metrics
+from utils.local_orderbook import OrderBookManager
+from utils.snapshot_publisher import SnapshotPublisher, get_snapshot_metrics
+
 # ════════════════════════════════════════════════════════════════════════════════════════════════════════
 # SECTION 2: CONFIGURATION & ENVIRONMENT
 # ════════════════════════════════════════════════════════════════════════════════════════════════════════
@@ -144,6 +158,23 @@ except ImportError as e:
     def validate_config():
         return True
 
+# Background job jitter (± fraction of each job's interval)
+SCHEDULER_JITTER = float(os.getenv('SCHEDULER_JITTER', '0.05'))
+
+# Market data frames pushed to dashboards per second
+SOCKETIO_FPS = float(os.getenv('SOCKETIO_FPS', '10'))
+
+# Global deadline (seconds) for one concurrent sentiment / on-chain collection
+SOURCE_DEADLINE = float(os.getenv('SOURCE_DEADLINE', '8'))
+
+# Rolling correlation windows (closed 1m bars); EWMA is always kept alongside
+CORRELATION_WINDOWS = tuple(int(w) for w in os.getenv('CORRELATION_WINDOWS', '60,240').split(',') if w.strip())
+
+# Pre-serialized API snapshots: /api/status and /api/metrics carry runtime
+# counters (uptime, scheduler, pools) and re-render at most this often
+API_SNAPSHOT_MAX_AGE = float(os.getenv('API_SNAPSHOT_MAX_AGE', '1'))
+API_GZIP_MIN_BYTES = int(os.getenv('API_GZIP_MIN_BYTES', '1024'))
+
 # ════════════════════════════════════════════════════════════════════════════════════════════════════════
 # SECTION 3: WEB FRAMEWORK & NETWORKING
 # ════════════════════════════════════════════════════════════════════════════════════════════════════════
@@ -1017,6 +1048,10 @@ else:
 # Validator-specific logger for enhanced tracking
 validator_logger = logging.getLogger('DATA_VALIDATOR')
 
+# Console/file I/O on a listener thread; hot-path loggers rate-limited / sampled
+# (config: LOG_ASYNC, LOG_QUEUE_SIZE, LOG_POLICIES)
+start_async_logging()
+
 # ════════════════════════════════════════════════════════════════════════════════════════════════════════
 # SECTION 22: FLASK APPLICATION INITIALIZATION
 # ════════════════════════════════════════════════════════════════════════════════════════════════════════
@@ -1138,9 +1173,42 @@ class ValidatorMetrics:
             return 0.0
         return (self.mock_detected / self.failed_checks) * 100
 
+# Columns kept per symbol in market data history
+MARKET_HISTORY_FIELDS = ('timestamp', 'price', 'volume')
+
+# Number of per-symbol shards (each with its own lock)
+GLOBAL_STATE_SHARDS = 16
+
+
+class _SymbolShard:
+    """
+    Per-symbol state for one lock stripe
+
+    Writers hold `lock` and publish copy-on-write dicts (market_data,
+    signal_stats_view, last_update); readers use the published dicts
+    without locking. `version` is bumped after every publish,
+    `signal_version` only when the shard's signals change.
+    """
+
+    def __init__(self, index: int):
+        self.lock = InstrumentedLock(f"shard_{index}")
+        self.version = 0
+        self.signal_version = 0
+
+        # Published (immutable after publish)
+        self.market_data: Dict[str, MarketDataPoint] = {}
+        self.signal_stats_view: Dict[str, Dict[str, int]] = {}
+        self.last_update: Dict[str, datetime] = {}
+
+        # Guarded by lock
+        self.market_data_history: Dict[str, ColumnarRingBuffer] = {}
+        self.signals: Dict[str, deque] = {}
+        self.signal_stats: Dict[str, Dict[str, int]] = {}
+
+
 class GlobalState:
     """
-    Thread-safe global state manager
+    Thread-safe global state manager (sharded, lock-striped)
     
     Manages all system state including:
     - Market data caching
@@ -1149,43 +1217,50 @@ class GlobalState:
     - Metrics collection
     - Health status monitoring
     - Validator performance tracking (NEW v8.0)
+    
+    Concurrency model:
+    - Per-symbol data lives in GLOBAL_STATE_SHARDS shards, each with its own lock
+    - Other domains (opportunities, metrics, health, subscriptions, validators)
+      have one lock each
+    - Readers get copy-on-write snapshots and never take a lock, so
+      /api/prices and get_state_snapshot never block writers
+    - Every lock records contention and wait time (get_lock_stats)
     """
 
-    def __init__(self):
-        self.lock = threading.RLock()  # Reentrant lock for nested locking
+    def __init__(self, shard_count: int = GLOBAL_STATE_SHARDS):
+        # Per-symbol shards
+        self.shards: List[_SymbolShard] = [_SymbolShard(i) for i in range(shard_count)]
+        self._market_view: Tuple[Tuple[int, ...], Dict[str, MarketDataPoint]] = ((), {})
 
-        # Market data storage
-        self.market_data: Dict[str, MarketDataPoint] = {}
-        self.market_data_history: Dict[str, deque] = defaultdict(lambda: deque(maxlen=1000))
-
-        # Signal storage
-        self.signals: Dict[str, deque] = defaultdict(lambda: deque(maxlen=1000))
-        self.signal_stats: Dict[str, Dict] = defaultdict(lambda: {
-            'total': 0,
-            'long': 0,
-            'short': 0,
-            'neutral': 0,
-            'validated': 0,
-            'mock_detected': 0
-        })
+        # Domain locks
+        self.opportunity_lock = InstrumentedLock('opportunities')
+        self.metrics_lock = InstrumentedLock('metrics')
+        self.health_lock = InstrumentedLock('health')
+        self.subscription_lock = InstrumentedLock('subscriptions')
+        self.validator_lock = InstrumentedLock('validators')
 
         # Opportunity storage
         self.opportunities: deque = deque(maxlen=100)
-        self.opportunity_stats: Dict[str, int] = defaultdict(int)
+        self.opportunity_stats: Dict[str, int] = {}
 
-        # Metrics storage
+        # Domain versions, bumped after every publish (API snapshots key on them)
+        self.opportunity_version = 0
+        self.metrics_version = 0
+        self.health_version = 0
+
+        # Metrics storage (metrics is published copy-on-write)
         self.metrics: Dict[str, float] = {}
         self.metrics_history: Dict[str, deque] = defaultdict(lambda: deque(maxlen=1000))
 
-        # Health status
+        # Health status (published copy-on-write)
         self.health_status: Dict[str, Any] = {
             'overall': 'healthy',
             'components': {},
             'last_check': None
         }
 
-        # Last update timestamps
-        self.last_update: Dict[str, datetime] = {}
+        # Last update timestamps for non-symbol domains (copy-on-write)
+        self._domain_last_update: Dict[str, datetime] = {}
 
         # Performance tracking
         self.performance_stats = {
@@ -1209,119 +1284,249 @@ class GlobalState:
         # Validator alerts history
         self.validator_alerts: deque = deque(maxlen=100)
 
-        logger.info("✅ GlobalState initialized with validator metrics tracking")
-       
+        logger.info(
+            f"✅ GlobalState initialized with validator metrics tracking "
+            f"({shard_count} symbol shards)"
+        )
+
+    # ════════════════════════════════════════════════════════════════════════════════════
+    # SHARD HELPERS
+    # ════════════════════════════════════════════════════════════════════════════════════
+
+    def _shard(self, symbol: str) -> _SymbolShard:
+        return self.shards[hash(symbol) % len(self.shards)]
+
+    def _touch_domain(self, key: str) -> None:
+        """Publish a domain last-update timestamp (caller holds the domain lock)"""
+        updated = dict(self._domain_last_update)
+        updated[key] = datetime.now(timezone.utc)
+        self._domain_last_update = updated
+
+    @property
+    def market_data(self) -> Dict[str, MarketDataPoint]:
+        """
+        Read-only snapshot of latest market data for all symbols
+        
+        Rebuilt only when a shard version changed; never blocks writers.
+        Do not mutate the returned dict.
+        """
+        # Versions are read before the dicts, so the merged view is never
+        # older than the versions it is cached under
+        versions = tuple(shard.version for shard in self.shards)
+        view = self._market_view
+        if view[0] != versions:
+            merged: Dict[str, MarketDataPoint] = {}
+            for shard in self.shards:
+                merged.update(shard.market_data)
+            view = (versions, merged)
+            self._market_view = view
+        return view[1]
+
+    @property
+    def symbols_version(self) -> int:
+        """Sum of shard versions - changes whenever any market data or signal is published"""
+        return sum(shard.version for shard in self.shards)
+
+    @property
+    def signals_version(self) -> int:
+        """Sum of shard signal versions - changes only when signals are added or pruned"""
+        return sum(shard.signal_version for shard in self.shards)
+
+    @property
+    def state_version(self) -> Tuple[int, int, int, int]:
+        """(symbols, opportunities, metrics, health) versions"""
+        return (self.symbols_version, self.opportunity_version, self.metrics_version, self.health_version)
+
+    @property
+    def last_update(self) -> Dict[str, datetime]:
+        """Read-only merged last-update timestamps"""
+        merged = dict(self._domain_last_update)
+        for shard in self.shards:
+            merged.update(shard.last_update)
+        return merged
+
+    @property
+    def signal_stats(self) -> Dict[str, Dict[str, int]]:
+        """Read-only merged per-symbol signal statistics"""
+        merged: Dict[str, Dict[str, int]] = {}
+        for shard in self.shards:
+            merged.update(shard.signal_stats_view)
+        return merged
+
+    def get_market_data(self, symbol: str) -> Optional[MarketDataPoint]:
+        """Latest market data point for symbol (lock-free)"""
+        return self._shard(symbol).market_data.get(symbol)
+
+    def get_market_history(self, symbol: str, count: Optional[int] = None) -> Dict[str, Any]:
+        """Zero-copy views of the last `count` (timestamp, price, volume) rows"""
+        shard = self._shard(symbol)
+        with shard.lock:
+            history = shard.market_data_history.get(symbol)
+            return history.views(count) if history else {}
+
+    # ════════════════════════════════════════════════════════════════════════════════════
+    # WRITERS
+    # ════════════════════════════════════════════════════════════════════════════════════
+
     def update_market_data(self, symbol: str, data: Dict[str, Any]) -> None:
         """Update market data for a symbol"""
-        with self.lock:
-            try:
-                # 🔍 DEBUG: Log incoming symbol
-                logger.info(f"[PRICE_DEBUG] update_market_data: symbol='{symbol}' | price={data.get('price', 0)}")
-                
-                market_point = MarketDataPoint(
-                    symbol=symbol,
-                    price=float(data.get('price', 0)),
-                    volume=float(data.get('volume', 0)),
-                    timestamp=datetime.now(timezone.utc),
-                    source=data.get('source', 'unknown'),
-                    metadata=data.get('metadata', {})
-                )
+        try:
+            now = datetime.now(timezone.utc)
+            market_point = MarketDataPoint(
+                symbol=symbol,
+                price=float(data.get('price', 0)),
+                volume=float(data.get('volume', 0)),
+                timestamp=now,
+                source=data.get('source', 'unknown'),
+                metadata=data.get('metadata', {})
+            )
+        except Exception as e:
+            logger.error(f"Error updating market data for {symbol}: {e}")
+            return
 
-                self.market_data[symbol] = market_point
-                self.market_data_history[symbol].append(market_point)
-                self.last_update[f'market_{symbol}'] = datetime.now(timezone.utc)
-                
-                # 🔍 DEBUG: Log all keys
-                logger.info(f"[PRICE_DEBUG] market_data keys: {list(self.market_data.keys())}")
+        shard = self._shard(symbol)
+        with shard.lock:
+            market_data = dict(shard.market_data)
+            market_data[symbol] = market_point
+            shard.market_data = market_data
 
-            except Exception as e:
-                logger.error(f"Error updating market data for {symbol}: {e}")
+            last_update = dict(shard.last_update)
+            last_update[f'market_{symbol}'] = now
+            shard.last_update = last_update
+
+            history = shard.market_data_history.get(symbol)
+            if history is None:
+                history = ColumnarRingBuffer(1000, fields=MARKET_HISTORY_FIELDS)
+                shard.market_data_history[symbol] = history
+            history.append_row((now.timestamp(), market_point.price, market_point.volume))
+
+            shard.version += 1
+
+        logger.debug(f"[PRICE_DEBUG] update_market_data: symbol='{symbol}' | price={market_point.price}")
     
     def add_signal(self, symbol: str, signal: Dict[str, Any]) -> None:
         """Add a trading signal"""
-        with self.lock:
-            try:
-                signal_obj = Signal(
-                    symbol=symbol,
-                    direction=signal.get('direction', 'NEUTRAL'),
-                    strength=float(signal.get('strength', 0)),
-                    confidence=float(signal.get('confidence', 0)),
-                    source=signal.get('source', 'unknown'),
-                    timestamp=datetime.now(timezone.utc),
-                    metadata=signal.get('metadata', {}),
-                    validated=signal.get('validated', False),
-                    mock_data_detected=signal.get('mock_data_detected', False)
-                )
+        try:
+            signal_obj = Signal(
+                symbol=symbol,
+                direction=signal.get('direction', 'NEUTRAL'),
+                strength=float(signal.get('strength', 0)),
+                confidence=float(signal.get('confidence', 0)),
+                source=signal.get('source', 'unknown'),
+                timestamp=datetime.now(timezone.utc),
+                metadata=signal.get('metadata', {}),
+                validated=signal.get('validated', False),
+                mock_data_detected=signal.get('mock_data_detected', False)
+            )
+        except Exception as e:
+            logger.error(f"Error adding signal for {symbol}: {e}")
+            return
 
-                self.signals[symbol].append(signal_obj)
-                self.last_update[f'signal_{symbol}'] = datetime.now(timezone.utc)
+        shard = self._shard(symbol)
+        with shard.lock:
+            try:
+                if symbol not in shard.signals:
+                    shard.signals[symbol] = deque(maxlen=1000)
+                    shard.signal_stats[symbol] = {
+                        'total': 0,
+                        'long': 0,
+                        'short': 0,
+                        'neutral': 0,
+                        'validated': 0,
+                        'mock_detected': 0
+                    }
+                shard.signals[symbol].append(signal_obj)
 
                 # Update signal statistics
-                stats = self.signal_stats[symbol]
+                stats = shard.signal_stats[symbol]
                 stats['total'] += 1
-                stats[signal_obj.direction.lower()] += 1
+                direction = signal_obj.direction.lower()
+                stats[direction] = stats.get(direction, 0) + 1
                 if signal_obj.validated:
                     stats['validated'] += 1
                 if signal_obj.mock_data_detected:
                     stats['mock_detected'] += 1
 
+                # Publish
+                stats_view = dict(shard.signal_stats_view)
+                stats_view[symbol] = dict(stats)
+                shard.signal_stats_view = stats_view
+
+                last_update = dict(shard.last_update)
+                last_update[f'signal_{symbol}'] = signal_obj.timestamp
+                shard.last_update = last_update
+
+                shard.version += 1
+                shard.signal_version += 1
+
             except Exception as e:
                 logger.error(f"Error adding signal for {symbol}: {e}")
 
     def add_opportunity(self, opportunity: Dict[str, Any]) -> None:
         """Add a trading opportunity"""
-        with self.lock:
-            try:
-                opp_obj = Opportunity(
-                    symbol=opportunity.get('symbol', ''),
-                    type=opportunity.get('type', 'unknown'),
-                    entry_price=float(opportunity.get('entry_price', 0)),
-                    target_price=float(opportunity.get('target_price', 0)),
-                    stop_loss=float(opportunity.get('stop_loss', 0)),
-                    risk_reward_ratio=float(opportunity.get('risk_reward_ratio', 0)),
-                    confidence=float(opportunity.get('confidence', 0)),
-                    timestamp=datetime.now(timezone.utc),
-                    metadata=opportunity.get('metadata', {})
-                )
-
-                self.opportunities.append(opp_obj)
-                self.last_update['opportunity'] = datetime.now(timezone.utc)
-                self.opportunity_stats[opp_obj.type] += 1
+        try:
+            opp_obj = Opportunity(
+                symbol=opportunity.get('symbol', ''),
+                type=opportunity.get('type', 'unknown'),
+                entry_price=float(opportunity.get('entry_price', 0)),
+                target_price=float(opportunity.get('target_price', 0)),
+                stop_loss=float(opportunity.get('stop_loss', 0)),
+                risk_reward_ratio=float(opportunity.get('risk_reward_ratio', 0)),
+                confidence=float(opportunity.get('confidence', 0)),
+                timestamp=datetime.now(timezone.utc),
+                metadata=opportunity.get('metadata', {})
+            )
+        except Exception as e:
+            logger.error(f"Error adding opportunity: {e}")
+            return
 
-            except Exception as e:
-                logger.error(f"Error adding opportunity: {e}")
+        with self.opportunity_lock:
+            self.opportunities.append(opp_obj)
+            stats = dict(self.opportunity_stats)
+            stats[opp_obj.type] = stats.get(opp_obj.type, 0) + 1
+            self.opportunity_stats = stats
+            self._touch_domain('opportunity')
+            self.opportunity_version += 1
 
     def update_metric(self, key: str, value: float) -> None:
         """Update a metric value"""
-        with self.lock:
+        with self.metrics_lock:
             try:
-                self.metrics[key] = value
+                metrics = dict(self.metrics)
+                metrics[key] = value
+                self.metrics = metrics
                 self.metrics_history[key].append((datetime.now(timezone.utc), value))
-                self.last_update[f'metric_{key}'] = datetime.now(timezone.utc)
+                self._touch_domain(f'metric_{key}')
+                self.metrics_version += 1
             except Exception as e:
                 logger.error(f"Error updating metric {key}: {e}")
 
     def update_health_status(self, component: str, status: Dict[str, Any]) -> None:
         """Update health status for a component"""
-        with self.lock:
-            self.health_status['components'][component] = status
-            self.health_status['last_check'] = datetime.now(timezone.utc)
+        with self.health_lock:
+            components = dict(self.health_status['components'])
+            components[component] = status
 
             # Determine overall health
             all_healthy = all(
                 comp.get('status') == 'healthy' 
-                for comp in self.health_status['components'].values()
+                for comp in components.values()
             )
-            self.health_status['overall'] = 'healthy' if all_healthy else 'degraded'
+            self.health_status = {
+                'overall': 'healthy' if all_healthy else 'degraded',
+                'components': components,
+                'last_check': datetime.now(timezone.utc)
+            }
+            self.health_version += 1
 
     def add_subscription(self, session_id: str, symbol: str) -> None:
         """Add a WebSocket subscription"""
-        with self.lock:
+        with self.subscription_lock:
             self.active_subscriptions[session_id].add(symbol)
 
     def remove_subscription(self, session_id: str, symbol: Optional[str] = None) -> None:
         """Remove a WebSocket subscription"""
-        with self.lock:
+        with self.subscription_lock:
             if symbol:
                 self.active_subscriptions[session_id].discard(symbol)
             else:
@@ -1337,7 +1542,7 @@ class GlobalState:
         error: Optional[str] = None
     ) -> None:
         """Record a validator check result (NEW v8.0)"""
-        with self.lock:
+        with self.validator_lock:
             metrics = self.validator_metrics.get(validator_name)
             if not metrics:
                 return
@@ -1350,11 +1555,6 @@ class GlobalState:
 
             if mock_detected:
                 metrics.mock_detected += 1
-                # Log mock data detection
-                validator_logger.warning(
-                    f"🚨 MOCK DATA DETECTED by {validator_name} | "
-                    f"Total mock detections: {metrics.mock_detected}"
-                )
 
             if error:
                 metrics.error_count += 1
@@ -1363,113 +1563,168 @@ class GlobalState:
             total_time = metrics.average_check_time_ms * (metrics.total_checks - 1)
             metrics.average_check_time_ms = (total_time + check_time_ms) / metrics.total_checks
             metrics.last_check_timestamp = datetime.now(timezone.utc)
+            mock_total = metrics.mock_detected
+
+        if mock_detected:
+            # Log mock data detection
+            validator_logger.warning(
+                f"🚨 MOCK DATA DETECTED by {validator_name} | "
+                f"Total mock detections: {mock_total}"
+            )
 
     def add_validator_alert(self, alert: Dict[str, Any]) -> None:
         """Add a validator alert (NEW v8.0)"""
-        with self.lock:
+        with self.validator_lock:
             alert['timestamp'] = datetime.now(timezone.utc)
             self.validator_alerts.append(alert)
-            validator_logger.error(
-                f"🚨 VALIDATOR ALERT: {alert.get('type', 'UNKNOWN')} | "
-                f"Validator: {alert.get('validator', 'UNKNOWN')} | "
-                f"Message: {alert.get('message', 'No message')}"
-            )
+        validator_logger.error(
+            f"🚨 VALIDATOR ALERT: {alert.get('type', 'UNKNOWN')} | "
+            f"Validator: {alert.get('validator', 'UNKNOWN')} | "
+            f"Message: {alert.get('message', 'No message')}"
+        )
+
+    # ════════════════════════════════════════════════════════════════════════════════════
+    # READERS
+    # ════════════════════════════════════════════════════════════════════════════════════
 
     def get_validator_stats(self) -> Dict[str, Any]:
         """Get comprehensive validator statistics (NEW v8.0)"""
-        with self.lock:
-            stats = {
-                'validators': {},
-                'overall': {
-                    'total_checks': 0,
-                    'passed_checks': 0,
-                    'failed_checks': 0,
-                    'mock_detected_total': 0,
-                    'average_success_rate': 0.0
-                },
-                'recent_alerts': [
-                    {
-                        'type': alert.get('type'),
-                        'validator': alert.get('validator'),
-                        'message': alert.get('message'),
-                        'timestamp': alert.get('timestamp').isoformat() if alert.get('timestamp') else None
-                    }
-                    for alert in list(self.validator_alerts)[-10:]
-                ],
-                'timestamp': datetime.now(timezone.utc).isoformat()
-            }
+        with self.validator_lock:
+            alerts = list(self.validator_alerts)[-10:]
+            validators = [
+                (name, ValidatorMetrics(**vars(metrics)))
+                for name, metrics in self.validator_metrics.items()
+            ]
 
-            for validator_name, metrics in self.validator_metrics.items():
-                stats['validators'][validator_name] = {
-                    'total_checks': metrics.total_checks,
-                    'passed_checks': metrics.passed_checks,
-                    'failed_checks': metrics.failed_checks,
-                    'mock_detected': metrics.mock_detected,
-                    'success_rate': round(metrics.success_rate, 2),
-                    'mock_detection_rate': round(metrics.mock_detection_rate, 2),
-                    'average_check_time_ms': round(metrics.average_check_time_ms, 2),
-                    'error_count': metrics.error_count,
-                    'last_check': metrics.last_check_timestamp.isoformat() if metrics.last_check_timestamp else None,
-                    'status': 'healthy' if metrics.success_rate >= 95.0 else 'warning' if metrics.success_rate >= 80.0 else 'critical'
+        stats = {
+            'validators': {},
+            'overall': {
+                'total_checks': 0,
+                'passed_checks': 0,
+                'failed_checks': 0,
+                'mock_detected_total': 0,
+                'average_success_rate': 0.0
+            },
+            'recent_alerts': [
+                {
+                    'type': alert.get('type'),
+                    'validator': alert.get('validator'),
+                    'message': alert.get('message'),
+                    'timestamp': alert.get('timestamp').isoformat() if alert.get('timestamp') else None
                 }
+                for alert in alerts
+            ],
+            'timestamp': datetime.now(timezone.utc).isoformat()
+        }
 
-                # Update overall stats
-                stats['overall']['total_checks'] += metrics.total_checks
-                stats['overall']['passed_checks'] += metrics.passed_checks
-                stats['overall']['failed_checks'] += metrics.failed_checks
-                stats['overall']['mock_detected_total'] += metrics.mock_detected
-
-            # Calculate overall average success rate
-            if stats['overall']['total_checks'] > 0:
-                stats['overall']['average_success_rate'] = round(
-                    (stats['overall']['passed_checks'] / stats['overall']['total_checks']) * 100,
-                    2
-                )
+        for validator_name, metrics in validators:
+            stats['validators'][validator_name] = {
+                'total_checks': metrics.total_checks,
+                'passed_checks': metrics.passed_checks,
+                'failed_checks': metrics.failed_checks,
+                'mock_detected': metrics.mock_detected,
+                'success_rate': round(metrics.success_rate, 2),
+                'mock_detection_rate': round(metrics.mock_detection_rate, 2),
+                'average_check_time_ms': round(metrics.average_check_time_ms, 2),
+                'error_count': metrics.error_count,
+                'last_check': metrics.last_check_timestamp.isoformat() if metrics.last_check_timestamp else None,
+                'status': 'healthy' if metrics.success_rate >= 95.0 else 'warning' if metrics.success_rate >= 80.0 else 'critical'
+            }
 
-            return stats
+            # Update overall stats
+            stats['overall']['total_checks'] += metrics.total_checks
+            stats['overall']['passed_checks'] += metrics.passed_checks
+            stats['overall']['failed_checks'] += metrics.failed_checks
+            stats['overall']['mock_detected_total'] += metrics.mock_detected
+
+        # Calculate overall average success rate
+        if stats['overall']['total_checks'] > 0:
+            stats['overall']['average_success_rate'] = round(
+                (stats['overall']['passed_checks'] / stats['overall']['total_checks']) * 100,
+                2
+            )
+
+        return stats
+
+    def get_lock_stats(self) -> Dict[str, Any]:
+        """Lock contention metrics: wait time per shard and per domain lock"""
+        shards = {shard.lock.name: shard.lock.get_stats() for shard in self.shards}
+        domains = {
+            lock.name: lock.get_stats()
+            for lock in (
+                self.opportunity_lock, self.metrics_lock, self.health_lock,
+                self.subscription_lock, self.validator_lock
+            )
+        }
+        return {
+            'shards': shards,
+            'domains': domains,
+            'total_wait_ms': round(
+                sum(s['total_wait_ms'] for s in shards.values()) +
+                sum(s['total_wait_ms'] for s in domains.values()),
+                3
+            ),
+            'max_wait_ms': max(
+                [s['max_wait_ms'] for s in shards.values()] +
+                [s['max_wait_ms'] for s in domains.values()]
+            )
+        }
 
     def get_state_snapshot(self) -> Dict[str, Any]:
-        """Get a complete state snapshot"""
-        with self.lock:
-            return {
-                'market_data': {
-                    symbol: {
-                        'price': data.price,
-                        'volume': data.volume,
-                        'timestamp': data.timestamp.isoformat(),
-                        'source': data.source
-                    }
-                    for symbol, data in self.market_data.items()
-                },
-                'signals_count': {k: len(v) for k, v in self.signals.items()},
-                'signal_stats': dict(self.signal_stats),
-                'opportunities_count': len(self.opportunities),
-                'opportunity_stats': dict(self.opportunity_stats),
-                'metrics': dict(self.metrics),
-                'health_status': dict(self.health_status),
-                'last_update': {k: v.isoformat() for k, v in self.last_update.items()},
-                'performance': dict(self.performance_stats),
-                'active_subscriptions': len(self.active_subscriptions),
-                'validator_status': self.get_validator_stats()
-            }
+        """Get a complete state snapshot (lock-free for market data)"""
+        health_status = self.health_status
+        return {
+            'market_data': {
+                symbol: {
+                    'price': data.price,
+                    'volume': data.volume,
+                    'timestamp': data.timestamp.isoformat(),
+                    'source': data.source
+                }
+                for symbol, data in self.market_data.items()
+            },
+            'signals_count': {
+                symbol: len(signals)
+                for shard in self.shards
+                for symbol, signals in list(shard.signals.items())
+            },
+            'signal_stats': self.signal_stats,
+            'opportunities_count': len(self.opportunities),
+            'opportunity_stats': dict(self.opportunity_stats),
+            'metrics': dict(self.metrics),
+            'health_status': dict(health_status),
+            'last_update': {k: v.isoformat() for k, v in self.last_update.items()},
+            'performance': dict(self.performance_stats),
+            'active_subscriptions': len(self.active_subscriptions),
+            'validator_status': self.get_validator_stats(),
+            'lock_contention': self.get_lock_stats(),
+            'http_pool': get_http_metrics(),
+            'cache': get_tiered_cache().get_stats(),
+            'write_behind': get_write_behind_metrics(),
+            'sources': get_source_collector_metrics(),
+            'logging': get_logging_metrics(),
+            'correlation': get_correlation_metrics(),
+            'api_snapshots': get_snapshot_metrics()
+        }
 
     def get_signals_for_symbol(self, symbol: str, limit: int = 100) -> List[Dict]:
         """Get recent signals for a symbol"""
-        with self.lock:
-            signals = list(self.signals.get(symbol, []))
-            return [
-                {
-                    'symbol': sig.symbol,
-                    'direction': sig.direction,
-                    'strength': sig.strength,
-                    'confidence': sig.confidence,
-                    'source': sig.source,
-                    'timestamp': sig.timestamp.isoformat(),
-                    'validated': sig.validated,
-                    'mock_data_detected': sig.mock_data_detected
-                }
-                for sig in islice(reversed(signals), limit)
-            ]
+        shard = self._shard(symbol)
+        with shard.lock:
+            signals = list(shard.signals.get(symbol, ()))
+        return [
+            {
+                'symbol': sig.symbol,
+                'direction': sig.direction,
+                'strength': sig.strength,
+                'confidence': sig.confidence,
+                'source': sig.source,
+                'timestamp': sig.timestamp.isoformat(),
+                'validated': sig.validated,
+                'mock_data_detected': sig.mock_data_detected
+            }
+            for sig in islice(reversed(signals), limit)
+        ]
 
     def get_opportunities_filtered(
         self, 
@@ -1479,44 +1734,50 @@ class GlobalState:
         limit: int = 100
     ) -> List[Dict]:
         """Get filtered opportunities"""
-        with self.lock:
-            opportunities = [
-                {
-                    'symbol': opp.symbol,
-                    'type': opp.type,
-                    'entry_price': opp.entry_price,
-                    'target_price': opp.target_price,
-                    'stop_loss': opp.stop_loss,
-                    'risk_reward_ratio': opp.risk_reward_ratio,
-                    'confidence': opp.confidence,
-                    'timestamp': opp.timestamp.isoformat()
-                }
-                for opp in self.opportunities
-                if opp.confidence >= min_confidence
-                and opp.risk_reward_ratio >= min_risk_reward
-                and (opportunity_type is None or opp.type == opportunity_type)
-            ]
-            return list(islice(reversed(opportunities), limit))
+        with self.opportunity_lock:
+            snapshot = list(self.opportunities)
+        opportunities = [
+            {
+                'symbol': opp.symbol,
+                'type': opp.type,
+                'entry_price': opp.entry_price,
+                'target_price': opp.target_price,
+                'stop_loss': opp.stop_loss,
+                'risk_reward_ratio': opp.risk_reward_ratio,
+                'confidence': opp.confidence,
+                'timestamp': opp.timestamp.isoformat()
+            }
+            for opp in snapshot
+            if opp.confidence >= min_confidence
+            and opp.risk_reward_ratio >= min_risk_reward
+            and (opportunity_type is None or opp.type == opportunity_type)
+        ]
+        return list(islice(reversed(opportunities), limit))
 
     def clear_old_data(self, max_age_hours: int = 24) -> None:
         """Clear data older than max_age_hours"""
-        with self.lock:
-            cutoff_time = datetime.now(timezone.utc) - timedelta(hours=max_age_hours)
-
-            # Clear old signals
-            for symbol in list(self.signals.keys()):
-                self.signals[symbol] = deque(
-                    (sig for sig in self.signals[symbol] if sig.timestamp > cutoff_time),
-                    maxlen=1000
-                )
-
-            # Clear old opportunities
+        cutoff_time = datetime.now(timezone.utc) - timedelta(hours=max_age_hours)
+
+        # Clear old signals (one shard at a time)
+        for shard in self.shards:
+            with shard.lock:
+                for symbol in list(shard.signals.keys()):
+                    shard.signals[symbol] = deque(
+                        (sig for sig in shard.signals[symbol] if sig.timestamp > cutoff_time),
+                        maxlen=1000
+                    )
+                shard.version += 1
+                shard.signal_version += 1
+
+        # Clear old opportunities
+        with self.opportunity_lock:
             self.opportunities = deque(
                 (opp for opp in self.opportunities if opp.timestamp > cutoff_time),
                 maxlen=100
             )
+            self.opportunity_version += 1
 
-            logger.info(f"✅ Cleared data older than {max_age_hours} hours")
+        logger.info(f"✅ Cleared data older than {max_age_hours} hours")
 
 # Initialize global state
 global_state = GlobalState()
@@ -1533,7 +1794,7 @@ class DemirUltraComprehensiveOrchestrator:
     background processing threads, data validation, and system health.
     
     Architecture:
-    - 18 background threads for continuous processing
+    - 18 periodic background jobs on one scheduler (timer wheel + pools)
     - 60+ AI/Analytics modules with fallback handling
     - Thread-safe state management
     - Production-grade error handling
@@ -1544,7 +1805,6 @@ class DemirUltraComprehensiveOrchestrator:
     def __init__(self):
         self.running = False
         self.start_time = datetime.now(timezone.utc)
-        self.threads: List[threading.Thread] = []
         self.thread_pool = ThreadPoolExecutor(
             max_workers=MAX_THREADS,
             thread_name_prefix="DEMIR_"
@@ -1552,6 +1812,8 @@ class DemirUltraComprehensiveOrchestrator:
         self.process_pool = ProcessPoolExecutor(
             max_workers=MAX_PROCESSES
         )
+        # Periodic jobs: I/O lane = thread_pool, CPU lane = process_pool
+        self.scheduler = JobScheduler(self.thread_pool, self.process_pool, name='orchestrator')
 
         logger.info("="*100)
         logger.info(f"🚀 Initializing {FULL_NAME}")
@@ -1580,9 +1842,19 @@ class DemirUltraComprehensiveOrchestrator:
         # ═══════════════════════════════════════════════════════════════════════════════════════
 
         self.smart_money_tracker = self._safe_init(SmartMoneyTracker, "Smart Money Tracker")
-        self.risk_engine_v2 = self._safe_init(AdvancedRiskEngine, "Advanced Risk Engine v2")
+        # One live correlation matrix (kline stream) shared by risk, correlation and regime engines
+        self.correlation_matrix = get_correlation_matrix(
+            [s.replace('.P', '') for s in DEFAULT_TRACKED_SYMBOLS], windows=CORRELATION_WINDOWS
+        )
+        self.risk_engine_v2 = self._safe_init(
+            partial(AdvancedRiskEngine, correlation_matrix=self.correlation_matrix) if AdvancedRiskEngine else None,
+            "Advanced Risk Engine v2"
+        )
         self.sentiment_v2 = self._safe_init(SentimentAnalysisV2, "Sentiment Analysis v2")
 
+        # Sentiment v2 sources: one concurrent collection per tick
+        self.source_collector = self._build_source_collector()
+
         # ═══════════════════════════════════════════════════════════════════════════════════════
         # v8.0 PHASE 2: MACHINE LEARNING UPGRADE
         # ═══════════════════════════════════════════════════════════════════════════════════════
@@ -1610,7 +1882,15 @@ class DemirUltraComprehensiveOrchestrator:
         # EXCHANGE INTEGRATIONS
         # ═══════════════════════════════════════════════════════════════════════════════════════
 
-        self.ws_manager = self._safe_init(BinanceWebSocketManager, "Binance WebSocket Manager")
+        # Client fan-out: per-symbol rooms, conflated frames (SOCKETIO_FPS)
+        self.broadcast_hub = BroadcastHub(socketio, fps=SOCKETIO_FPS) if socketio else None
+        # Local L2 books: one REST snapshot per symbol, then websocket depth diffs
+        self.order_books = OrderBookManager()
+        self.ws_manager = self._safe_init(
+            partial(BinanceWebSocketManager, broadcast_hub=self.broadcast_hub, order_books=self.order_books)
+            if BinanceWebSocketManager else None,
+            "Binance WebSocket Manager"
+        )
         self.binance_api = self._safe_init(BinanceAPI, "Binance API")
         self.exchange_api = self._safe_init(MultiExchangeAPI, "Multi-Exchange API")
         self.exchange_manager = self._safe_init(AdvancedExchangeManager, "Advanced Exchange Manager")
@@ -1625,8 +1905,16 @@ class DemirUltraComprehensiveOrchestrator:
         logger.info("  ⚠️  MarketIntelligence disabled (missing required API keys)")
         self.data_processor = self._safe_init(MarketDataProcessor, "Market Data Processor")
         self.flow_detector = self._safe_init(MarketFlowDetector, "Market Flow Detector")
-        self.correlation_engine = self._safe_init(MarketCorrelationEngine, "Market Correlation Engine")
-        self.orderbook_analyzer = self._safe_init(AdvancedOrderBookAnalyzer, "Advanced OrderBook Analyzer")
+        self.correlation_engine = self._safe_init(
+            partial(MarketCorrelationEngine, correlation_matrix=self.correlation_matrix) if MarketCorrelationEngine else None,
+            "Market Correlation Engine"
+        )
+        self.orderbook_analyzer = self._safe_init(
+            partial(AdvancedOrderBookAnalyzer, order_books=self.order_books,
+                    symbols=[s.replace('.P', '') for s in DEFAULT_TRACKED_SYMBOLS])
+            if AdvancedOrderBookAnalyzer else None,
+            "Advanced OrderBook Analyzer"
+        )
         self.dominance_tracker = self._safe_init(CryptoDominanceTracker, "Crypto Dominance Tracker")
         self.timeframe_manager = self._safe_init(MultiTimeframeManager, "Multi-Timeframe Manager")
 
@@ -1666,7 +1954,10 @@ class DemirUltraComprehensiveOrchestrator:
         self.lstm_trainer = self._safe_init(LSTMTrainer, "LSTM Trainer")
         self.regime_analysis = self._safe_init(MarketRegimeAnalysis, "Market Regime Analysis")
         self.regime_analyzer = self._safe_init(MarketRegimeAnalyzer, "Market Regime Analyzer")
-        self.regime_detector = self._safe_init(RegimeDetector, "Regime Detector")
+        self.regime_detector = self._safe_init(
+            partial(RegimeDetector, correlation_matrix=self.correlation_matrix) if RegimeDetector else None,
+            "Regime Detector"
+        )
         self.causal_reasoning = self._safe_init(CausalReasoning, "Causal Reasoning")
         self.causality_inference = self._safe_init(CausalityInference, "Causality Inference")
         self.layer_optimizer = self._safe_init(LayerOptimizer, "Layer Optimizer")
@@ -1892,9 +2183,9 @@ class DemirUltraComprehensiveOrchestrator:
 
     def start(self):
         """
-        Start all background processing threads
+        Start all background jobs on the central scheduler
         
-        Launches 18 background threads for continuous processing:
+        Registers 18 periodic jobs (one timer wheel, runs on the thread pool):
         1. Smart Money Tracking
         2. Arbitrage Scanning
         3. On-Chain Analytics
@@ -1913,44 +2204,53 @@ class DemirUltraComprehensiveOrchestrator:
         16. AI Learning (NEW)
         17. Regime Detection (NEW)
         18. Causal Analysis (NEW)
+        
+        Fixed-rate jobs keep their cadence regardless of runtime; model jobs
+        run fixed-delay (interval counted from the end of the previous run).
+        A failed run is retried after error_backoff seconds.
         """
         self.running = True
         logger.info("🚀 Starting DEMIR AI v8.0 Ultra-Comprehensive Orchestrator...")
 
-        # Thread configurations: (name, target_method, interval_seconds)
-        thread_configs = [
-            ("SmartMoneyThread", self._smart_money_loop, 300),
-            ("ArbitrageThread", self._arbitrage_loop, 60),
-            ("OnChainThread", self._onchain_loop, 600),
-            ("RiskMonitorThread", self._risk_monitoring_loop, 180),
-            ("SentimentThread", self._sentiment_loop, 900),
-            ("PatternThread", self._pattern_loop, 300),
-            ("FlowDetectorThread", self._flow_detector_loop, 120),
-            ("CorrelationThread", self._correlation_loop, 600),
-            ("OrderBookThread", self._orderbook_loop, 30),
-            ("DominanceThread", self._dominance_loop, 900),
-            ("MacroThread", self._macro_loop, 1800),
-            ("WebSocketThread", self._websocket_loop, 30),
-            ("HealthCheckThread", self._health_check_loop, 60),
-            ("MetricsThread", self._metrics_loop, 120),
-            ("TelegramThread", self._telegram_loop, 60),
-            ("AILearningThread", self._ai_learning_loop, 600),
-            ("RegimeDetectionThread", self._regime_detection_loop, 300),
-            ("CausalAnalysisThread", self._causal_analysis_loop, 900)
+        # Job configurations: (name, job_method, interval_seconds, error_backoff_seconds, mode)
+        job_configs = [
+            ("SmartMoney", self._smart_money_job, 300, 60, FIXED_RATE),
+            ("Arbitrage", self._arbitrage_job, 60, 30, FIXED_RATE),
+            ("OnChain", self._onchain_job, 600, 120, FIXED_RATE),
+            ("RiskMonitor", self._risk_monitoring_job, 180, 60, FIXED_RATE),
+            ("Sentiment", self._sentiment_job, 900, 120, FIXED_RATE),
+            ("Pattern", self._pattern_job, 300, 60, FIXED_RATE),
+            ("FlowDetector", self._flow_detector_job, 120, 60, FIXED_RATE),
+            ("Correlation", self._correlation_job, 600, 120, FIXED_RATE),
+            ("OrderBook", self._orderbook_job, 30, 30, FIXED_RATE),
+            ("Dominance", self._dominance_job, 900, 120, FIXED_RATE),
+            ("Macro", self._macro_job, 1800, 300, FIXED_RATE),
+            ("WebSocket", self._websocket_job, 30, 10, FIXED_RATE),
+            ("HealthCheck", self._health_check_job, 60, 30, FIXED_RATE),
+            ("Metrics", self._metrics_job, 120, 60, FIXED_RATE),
+            ("Telegram", self._telegram_job, 60, 30, FIXED_RATE),
+            ("AILearning", self._ai_learning_job, 600, 120, FIXED_DELAY),
+            ("RegimeDetection", self._regime_detection_job, 300, 60, FIXED_DELAY),
+            ("CausalAnalysis", self._causal_analysis_job, 900, 120, FIXED_DELAY)
         ]
 
-        for name, target, interval in thread_configs:
-            t = threading.Thread(
-                target=target,
-                args=(interval,),
-                daemon=True,
-                name=name
-            )
-            t.start()
-            self.threads.append(t)
-            logger.info(f"  ✅ {name} started (interval: {interval}s)")
+        for name, job, interval, error_backoff, mode in job_configs:
+            if name not in self.scheduler.jobs:
+                self.scheduler.add_job(JobSpec(
+                    name=name,
+                    func=job,
+                    interval=interval,
+                    mode=mode,
+                    jitter=SCHEDULER_JITTER,
+                    error_backoff=error_backoff
+                ))
+            logger.info(f"  ✅ {name} scheduled (interval: {interval}s, {mode})")
+
+        self.scheduler.start()
+        logger.info(f"🟢 Total {len(self.scheduler.jobs)} background jobs scheduled")
 
-        logger.info(f"🟢 Total {len(self.threads)} background threads running")
+        if self.broadcast_hub:
+            self.broadcast_hub.start()
 
         # 🆕 WebSocket Auto-Start
         if self.ws_manager:
@@ -1958,6 +2258,8 @@ class DemirUltraComprehensiveOrchestrator:
                 logger.info("🚀 Auto-starting BinanceWebSocketManager...")
                 self.ws_manager.start()
                 logger.info("✅ BinanceWebSocketManager auto-started")
+                self._subscribe_correlation_stream()
+                self._subscribe_order_books()
             except Exception as e:
                 logger.error(f"❌ WebSocket auto-start failed: {e}")
 
@@ -1972,367 +2274,183 @@ class DemirUltraComprehensiveOrchestrator:
 
 
     # ═══════════════════════════════════════════════════════════════════════════════════════
-    # BACKGROUND THREAD LOOP METHODS
+    # BACKGROUND JOBS (one run each; timing, overlap and errors handled by the scheduler)
     # ═══════════════════════════════════════════════════════════════════════════════════════
 
-    def _smart_money_loop(self, interval: int):
-        """Smart Money & Whale Tracking continuous loop"""
-        logger.info("🐳 Smart Money Tracker loop started")
-        while self.running:
-            try:
-                if self.smart_money_tracker:
-                    signals = self.smart_money_tracker.detect_smart_money_signals()
-                    if signals:
-                        logger.info(f"🐳 Smart Money signals detected: {len(signals)}")
-                        for signal in signals:
-                            # Safe signal format check (str → dict conversion)
-                            if isinstance(signal, dict):
-                                global_state.add_signal('SMART_MONEY', signal)
-                            elif isinstance(signal, str):
-                                global_state.add_signal('SMART_MONEY', {'type': 'smart_money', 'message': signal})
-                            if self.db:
-                                self.db.save_signal(signal)
-                time.sleep(interval)
-            except Exception as e:
-                logger.error(f"❌ Smart Money loop error: {e}")
-                if DEBUG_MODE:
-                    logger.debug(traceback.format_exc())
-                time.sleep(60)
-
-    def _arbitrage_loop(self, interval: int):
-        """Arbitrage opportunity scanning loop"""
-        logger.info("🔄 Arbitrage Engine loop started")
-        while self.running:
-            try:
-                if self.arbitrage_engine:
-                    opportunities = self.arbitrage_engine.scan_arbitrage()
-                    if opportunities:
-                        logger.info(f"🔄 Arbitrage opportunities found: {len(opportunities)}")
-                        for opp in opportunities:
-                            global_state.add_opportunity(opp)
-                            if self.telegram_monitor:
-                                self.telegram_monitor.send_opportunity_alert(opp)
-                time.sleep(interval)
-            except Exception as e:
-                logger.error(f"❌ Arbitrage loop error: {e}")
-                if DEBUG_MODE:
-                    logger.debug(traceback.format_exc())
-                time.sleep(30)
-
-    def _onchain_loop(self, interval: int):
-        """On-Chain analytics continuous loop"""
-        logger.info("⛓️ On-Chain Analytics loop started")
-        while self.running:
-            try:
-                if self.onchain_pro:
-                    metrics = self.onchain_pro.analyze_onchain_metrics()
-                    if metrics:
-                        logger.info(f"⛓️ On-Chain metrics updated")
-                        if self.redis_cache:
-                            # Defensive Redis cache set (multi-signature support)
-                            try:
-                                # Try standard Redis 'ex' parameter (expire in seconds)
-                                self.redis_cache.set('onchain_metrics', metrics, ex=600)
-                            except TypeError:
-                                try:
-                                    # Try custom 'ttl' parameter
-                                    self.redis_cache.set('onchain_metrics', metrics, ttl=600)
-                                except TypeError:
-                                    try:
-                                        # Fallback: positional argument
-                                        self.redis_cache.set('onchain_metrics', metrics, 600)
-                                    except Exception as fallback_err:
-                                        logger.warning(f'⚠️ Redis cache set failed (all signatures): {fallback_err}')
-                time.sleep(interval)
-            except Exception as e:
-                logger.error(f"❌ On-Chain loop error: {e}")
-                if DEBUG_MODE:
-                    logger.debug(traceback.format_exc())
-                time.sleep(120)
-
-    def _risk_monitoring_loop(self, interval: int):
-        """Risk monitoring continuous loop"""
-        logger.info("⚠️  Risk Monitoring loop started")
-        while self.running:
-            try:
-                if self.risk_engine_v2:
-                    risk_report = self.risk_engine_v2.calculate_portfolio_risk()
-                    if risk_report:
-                        logger.info(f"⚠️  Risk VAR: {risk_report.get('var', 'N/A')}")
-                        global_state.update_metric('risk_var', risk_report.get('var', 0))
-                time.sleep(interval)
-            except Exception as e:
-                logger.error(f"❌ Risk loop error: {e}")
-                if DEBUG_MODE:
-                    logger.debug(traceback.format_exc())
-                time.sleep(60)
-
-    def _sentiment_loop(self, interval: int):
-        """Sentiment analysis continuous loop"""
-        logger.info("💬 Sentiment Analysis loop started")
-        while self.running:
-            try:
-                if self.sentiment_v2:
-                    sentiment = self.sentiment_v2.analyze_multi_source_sentiment()
-                    if sentiment:
-                        logger.info(f"💬 Sentiment: {sentiment.get('aggregate_sentiment', 'N/A')}")
-                        global_state.update_metric('sentiment_score', sentiment.get('score', 0))
-                time.sleep(interval)
-            except Exception as e:
-                logger.error(f"❌ Sentiment loop error: {e}")
-                if DEBUG_MODE:
-                    logger.debug(traceback.format_exc())
-                time.sleep(120)
-
-    def _pattern_loop(self, interval: int):
-        """Pattern recognition continuous loop"""
-        logger.info("🔍 Pattern Recognition loop started")
-        while self.running:
-            try:
-                if self.pattern_engine:
-                    patterns = self.pattern_engine.detect_all_patterns()
-                    if patterns:
-                        logger.info(f"🔍 Patterns detected: {len(patterns)}")
-                time.sleep(interval)
-            except Exception as e:
-                logger.error(f"❌ Pattern loop error: {e}")
-                if DEBUG_MODE:
-                    logger.debug(traceback.format_exc())
-                time.sleep(60)
-
-    def _flow_detector_loop(self, interval: int):
-        """Market flow detection continuous loop"""
-        logger.info("🌊 Flow Detector loop started")
-        while self.running:
-            try:
-                if self.flow_detector:
-                    flows = self.flow_detector.detect_market_flows()
-                    if flows:
-                        logger.info(f"🌊 Market flows detected")
-                time.sleep(interval)
-            except Exception as e:
-                logger.error(f"❌ Flow Detector loop error: {e}")
-                if DEBUG_MODE:
-                    logger.debug(traceback.format_exc())
-                time.sleep(60)
-
-    def _correlation_loop(self, interval: int):
-        """Market correlation analysis continuous loop"""
-        logger.info("📊 Correlation Engine loop started")
-        while self.running:
-            try:
-                if self.correlation_engine:
-                    correlations = self.correlation_engine.analyze_correlations()
-                    if correlations:
-                        logger.info(f"📊 Correlations updated")
-                time.sleep(interval)
-            except Exception as e:
-                logger.error(f"❌ Correlation loop error: {e}")
-                if DEBUG_MODE:
-                    logger.debug(traceback.format_exc())
-                time.sleep(120)
-
-    def _orderbook_loop(self, interval: int):
-        """OrderBook analysis continuous loop"""
-        logger.info("📖 OrderBook Analyzer loop started")
-        while self.running:
-            try:
-                if self.orderbook_analyzer:
-                    analysis = self.orderbook_analyzer.analyze_orderbook()
-                    if analysis:
-                        logger.debug(f"📖 OrderBook analyzed")
-                time.sleep(interval)
-            except Exception as e:
-                logger.error(f"❌ OrderBook loop error: {e}")
-                if DEBUG_MODE:
-                    logger.debug(traceback.format_exc())
-                time.sleep(30)
-
-    def _dominance_loop(self, interval: int):
-        """Crypto dominance tracking continuous loop"""
-        logger.info("🏆 Dominance Tracker loop started")
-        while self.running:
-            try:
-                if self.dominance_tracker:
-                    dominance = self.dominance_tracker.get_dominance_data()
-                    if dominance:
-                        logger.info(f"🏆 Dominance updated")
-                time.sleep(interval)
-            except Exception as e:
-                logger.error(f"❌ Dominance loop error: {e}")
-                if DEBUG_MODE:
-                    logger.debug(traceback.format_exc())
-                time.sleep(120)
-
-    def _macro_loop(self, interval: int):
-        """Macro data aggregation continuous loop"""
-        logger.info("🌍 Macro Data Aggregator loop started")
-        while self.running:
-            try:
-                if self.macro_aggregator:
-                    macro_data = self.macro_aggregator.fetch_macro_data()
-                    if macro_data:
-                        logger.info(f"🌍 Macro data updated")
-                time.sleep(interval)
-            except Exception as e:
-                logger.error(f"❌ Macro loop error: {e}")
-                if DEBUG_MODE:
-                    logger.debug(traceback.format_exc())
-                time.sleep(300)
-
-    def _websocket_loop(self, interval: int):
-        """WebSocket connection maintenance loop"""
-        logger.info("🔌 WebSocket Manager loop started")
-        while self.running:
-            try:
-                if self.ws_manager:
-                    if hasattr(self.ws_manager, 'maintain_connections'):
-                        self.ws_manager.maintain_connections()
-                time.sleep(interval)
-            except Exception as e:
-                logger.error(f"❌ WebSocket loop error: {e}")
-                if DEBUG_MODE:
-                    logger.debug(traceback.format_exc())
-                time.sleep(10)
-
-    def _health_check_loop(self, interval: int):
-        """Health check continuous loop"""
-        logger.info("💊 Health Checker loop started")
-        while self.running:
-            try:
-                if self.health_checker:
-                    health = self.health_checker.check_system_health()
-                    global_state.update_health_status('system', health)
-                time.sleep(interval)
-            except Exception as e:
-                logger.error(f"❌ Health check loop error: {e}")
-                if DEBUG_MODE:
-                    logger.debug(traceback.format_exc())
-                time.sleep(30)
-
-    def _metrics_loop(self, interval: int):
-        """Metrics collection continuous loop"""
-        logger.info("📈 Metrics Collector loop started")
-        while self.running:
-            try:
-                if self.metrics_collector:
-                    metrics = self.metrics_collector.collect_metrics()
-                    for key, value in metrics.items():
-                        global_state.update_metric(key, value)
-                time.sleep(interval)
-            except Exception as e:
-                logger.error(f"❌ Metrics loop error: {e}")
-                if DEBUG_MODE:
-                    logger.debug(traceback.format_exc())
-                time.sleep(60)
-
-    def _telegram_loop(self, interval: int):
-        """Telegram notifications continuous loop"""
-        logger.info("📢 Telegram Monitor loop started")
-        while self.running:
-            try:
-                if self.telegram_monitor:
-                    self.telegram_monitor.process_alerts()
-                time.sleep(interval)
-            except Exception as e:
-                logger.error(f"❌ Telegram loop error: {e}")
-                if DEBUG_MODE:
-                    logger.debug(traceback.format_exc())
-                time.sleep(30)
-
-    def _health_check_loop(self, interval: int):
-        """Health check continuous loop"""
-        logger.info("💊 Health Checker loop started")
-        while self.running:
-            try:
-                if self.health_checker:
-                    health = self.health_checker.check_system_health()
-                    global_state.update_health_status('system', health)
-                time.sleep(interval)
-            except Exception as e:
-                logger.error(f"❌ Health check loop error: {e}")
-                if DEBUG_MODE:
-                    logger.debug(traceback.format_exc())
-                time.sleep(30)
-
-    def _metrics_loop(self, interval: int):
-        """Metrics collection continuous loop"""
-        logger.info("📈 Metrics Collector loop started")
-        while self.running:
-            try:
-                if self.metrics_collector:
-                    metrics = self.metrics_collector.collect_metrics()
-                    for key, value in metrics.items():
-                        global_state.update_metric(key, value)
-                time.sleep(interval)
-            except Exception as e:
-                logger.error(f"❌ Metrics loop error: {e}")
-                if DEBUG_MODE:
-                    logger.debug(traceback.format_exc())
-                time.sleep(60)
-
-    def _telegram_loop(self, interval: int):
-        """Telegram notifications continuous loop"""
-        logger.info("📢 Telegram Monitor loop started")
-        while self.running:
-            try:
-                if self.telegram_monitor:
-                    self.telegram_monitor.process_alerts()
-                time.sleep(interval)
-            except Exception as e:
-                logger.error(f"❌ Telegram loop error: {e}")
-                if DEBUG_MODE:
-                    logger.debug(traceback.format_exc())
-                time.sleep(30)
-
-    def _ai_learning_loop(self, interval: int):
-        """AI self-learning continuous loop (NEW in v8.0)"""
-        logger.info("🧠 AI Learning Engine loop started")
-        while self.running:
-            try:
-                if self.learning_engine:
-                    learning_results = self.learning_engine.learn_from_recent_trades()
-                    if learning_results:
-                        logger.info(f"🧠 AI Learning: {learning_results.get('improvements', 0)} improvements")
-                time.sleep(interval)
-            except Exception as e:
-                logger.error(f"❌ AI Learning loop error: {e}")
-                if DEBUG_MODE:
-                    logger.debug(traceback.format_exc())
-                time.sleep(120)
-
-    def _regime_detection_loop(self, interval: int):
-        """Market regime detection continuous loop (NEW in v8.0)"""
-        logger.info("📉 Regime Detection loop started")
-        while self.running:
-            try:
-                if self.regime_detector:
-                    regime = self.regime_detector.detect_current_regime()
-                    if regime:
-                        logger.info(f"📉 Market Regime: {regime.get('type', 'UNKNOWN')}")
-                        global_state.update_metric('market_regime', regime.get('confidence', 0))
-                time.sleep(interval)
-            except Exception as e:
-                logger.error(f"❌ Regime Detection loop error: {e}")
-                if DEBUG_MODE:
-                    logger.debug(traceback.format_exc())
-                time.sleep(60)
-
-    def _causal_analysis_loop(self, interval: int):
-        """Causal analysis continuous loop (NEW in v8.0)"""
-        logger.info("🔗 Causal Analysis loop started")
-        while self.running:
-            try:
-                if self.causal_reasoning:
-                    causal_insights = self.causal_reasoning.analyze_causal_relationships()
-                    if causal_insights:
-                        logger.info(f"🔗 Causal insights generated")
-                time.sleep(interval)
-            except Exception as e:
-                logger.error(f"❌ Causal Analysis loop error: {e}")
-                if DEBUG_MODE:
-                    logger.debug(traceback.format_exc())
-                time.sleep(120)
+    def _smart_money_job(self):
+        """Smart Money & Whale Tracking"""
+        if self.smart_money_tracker:
+            signals = self.smart_money_tracker.detect_smart_money_signals()
+            if signals:
+                logger.info(f"🐳 Smart Money signals detected: {len(signals)}")
+                for signal in signals:
+                    # Safe signal format check (str → dict conversion)
+                    if isinstance(signal, dict):
+                        global_state.add_signal('SMART_MONEY', signal)
+                    elif isinstance(signal, str):
+                        global_state.add_signal('SMART_MONEY', {'type': 'smart_money', 'message': signal})
+                    if self.db:
+                        self.db.save_signal(signal)
+
+    def _arbitrage_job(self):
+        """Arbitrage opportunity scanning"""
+        if self.arbitrage_engine:
+            opportunities = self.arbitrage_engine.scan_arbitrage()
+            if opportunities:
+                logger.info(f"🔄 Arbitrage opportunities found: {len(opportunities)}")
+                for opp in opportunities:
+                    global_state.add_opportunity(opp)
+                    if self.telegram_monitor:
+                        self.telegram_monitor.send_opportunity_alert(opp)
+
+    def _onchain_job(self):
+        """On-Chain analytics"""
+        if self.onchain_pro:
+            metrics = self.onchain_pro.analyze_onchain_metrics()
+            if metrics:
+                logger.info(f"⛓️ On-Chain metrics updated")
+                if self.redis_cache:
+                    self.redis_cache.set('onchain_metrics', metrics, ttl=600)
+
+    def _risk_monitoring_job(self):
+        """Risk monitoring"""
+        if self.risk_engine_v2:
+            risk_report = self.risk_engine_v2.calculate_portfolio_risk()
+            if risk_report:
+                logger.info(f"⚠️  Risk VAR: {risk_report.get('var', 'N/A')}")
+                global_state.update_metric('risk_var', risk_report.get('var', 0))
+
+    def _subscribe_correlation_stream(self):
+        """Closed 1m klines of every tracked symbol feed the shared correlation matrix"""
+        if not self.correlation_matrix:
+            return
+        for symbol in self.correlation_matrix.symbols:
+            self.ws_manager.subscribe(symbol, ['kline'], self._on_correlation_kline)
+        logger.info(f"📊 Correlation matrix fed by {len(self.correlation_matrix.symbols)} kline streams")
+
+    def _subscribe_order_books(self):
+        """Depth diff streams of every tracked symbol keep the local L2 books current"""
+        symbols = [s.replace('.P', '') for s in DEFAULT_TRACKED_SYMBOLS]
+        for symbol in symbols:
+            self.ws_manager.subscribe(symbol, ['depth'])
+        logger.info(f"📗 Local order books maintained for {len(symbols)} symbols")
+
+    def _on_correlation_kline(self, kline: Dict[str, Any]):
+        if kline.get('closed'):
+            self.correlation_matrix.on_kline(kline['symbol'], kline.get('open_time', 0), kline['close'])
+
+    def _build_source_collector(self) -> Optional[SourceCollector]:
+        """
+        Sources consumed by the sentiment job behind one deadline, each with its
+        own TTL. Sentiment / on-chain layer sources (build_sentiment_sources,
+        build_onchain_sources) are only worth merging in once a job reads them.
+        """
+        if not self.sentiment_v2:
+            return None
+        return SourceCollector('market_sources', self.sentiment_v2.source_specs(), deadline=SOURCE_DEADLINE)
+
+    def _sentiment_job(self):
+        """Sentiment analysis - every source fetched concurrently (one RTT per tick)"""
+        snapshot = None
+        if self.source_collector:
+            snapshot = self.source_collector.collect()
+            global_state.update_metric('sources_fresh', snapshot['fresh'])
+            global_state.update_metric('sources_stale', snapshot['stale'] + snapshot['missing'])
+
+        if self.sentiment_v2:
+            sentiment = self.sentiment_v2.analyze_multi_source_sentiment(snapshot)
+            if sentiment:
+                logger.info(f"💬 Sentiment: {sentiment.get('aggregate_sentiment', 'N/A')}")
+                global_state.update_metric('sentiment_score', sentiment.get('score', 0))
+
+    def _pattern_job(self):
+        """Pattern recognition"""
+        if self.pattern_engine:
+            patterns = self.pattern_engine.detect_all_patterns()
+            if patterns:
+                logger.info(f"🔍 Patterns detected: {len(patterns)}")
+
+    def _flow_detector_job(self):
+        """Market flow detection"""
+        if self.flow_detector:
+            flows = self.flow_detector.detect_market_flows()
+            if flows:
+                logger.info(f"🌊 Market flows detected")
+
+    def _correlation_job(self):
+        """Market correlation analysis"""
+        if self.correlation_engine:
+            correlations = self.correlation_engine.analyze_correlations()
+            if correlations:
+                logger.info(f"📊 Correlations updated")
+
+    def _orderbook_job(self):
+        """OrderBook analysis"""
+        if self.orderbook_analyzer:
+            analysis = self.orderbook_analyzer.analyze_orderbook()
+            if analysis:
+                signals = ', '.join(f"{sym}={a['signal']}" for sym, a in analysis.items())
+                logger.debug(f"📖 OrderBook analyzed: {signals}")
+
+    def _dominance_job(self):
+        """Crypto dominance tracking"""
+        if self.dominance_tracker:
+            dominance = self.dominance_tracker.get_dominance_data()
+            if dominance:
+                logger.info(f"🏆 Dominance updated")
+
+    def _macro_job(self):
+        """Macro data aggregation"""
+        if self.macro_aggregator:
+            macro_data = self.macro_aggregator.fetch_macro_data()
+            if macro_data:
+                logger.info(f"🌍 Macro data updated")
+
+    def _websocket_job(self):
+        """WebSocket connection maintenance"""
+        if self.ws_manager:
+            if hasattr(self.ws_manager, 'maintain_connections'):
+                self.ws_manager.maintain_connections()
+
+    def _health_check_job(self):
+        """Health check"""
+        if self.health_checker:
+            health = self.health_checker.check_system_health()
+            global_state.update_health_status('system', health)
+
+    def _metrics_job(self):
+        """Metrics collection"""
+        if self.metrics_collector:
+            metrics = self.metrics_collector.collect_metrics()
+            for key, value in metrics.items():
+                global_state.update_metric(key, value)
+
+    def _telegram_job(self):
+        """Telegram notifications"""
+        if self.telegram_monitor:
+            self.telegram_monitor.process_alerts()
+
+    def _ai_learning_job(self):
+        """AI self-learning (NEW in v8.0)"""
+        if self.learning_engine:
+            learning_results = self.learning_engine.learn_from_recent_trades()
+            if learning_results:
+                logger.info(f"🧠 AI Learning: {learning_results.get('improvements', 0)} improvements")
+
+    def _regime_detection_job(self):
+        """Market regime detection (NEW in v8.0)"""
+        if self.regime_detector:
+            regime = self.regime_detector.detect_current_regime()
+            if regime:
+                logger.info(f"📉 Market Regime: {regime.get('type', 'UNKNOWN')}")
+                global_state.update_metric('market_regime', regime.get('confidence', 0))
+
+    def _causal_analysis_job(self):
+        """Causal analysis (NEW in v8.0)"""
+        if self.causal_reasoning:
+            causal_insights = self.causal_reasoning.analyze_causal_relationships()
+            if causal_insights:
+                logger.info(f"🔗 Causal insights generated")
 
     def stop(self):
         """
@@ -2340,7 +2458,7 @@ class DemirUltraComprehensiveOrchestrator:
         
         Performs clean shutdown:
         1. Sets running flag to False
-        2. Waits for all threads to complete (with timeout)
+        2. Stops the scheduler and waits for running jobs (with timeout)
         3. Shuts down thread pool
         4. Shuts down process pool
         5. Closes database connections
@@ -2349,12 +2467,17 @@ class DemirUltraComprehensiveOrchestrator:
         logger.info("🛑 Stopping DEMIR AI v8.0 orchestrator...")
         self.running = False
 
-        # Wait for threads to finish
-        for thread in self.threads:
-            if thread.is_alive():
-                thread.join(timeout=5)
-                if thread.is_alive():
-                    logger.warning(f"⚠️  Thread {thread.name} did not stop gracefully")
+        if self.broadcast_hub:
+            self.broadcast_hub.stop()
+
+        # Stop firing jobs, drain the ones in flight
+        unfinished = self.scheduler.shutdown(timeout=30)
+        if unfinished:
+            logger.warning(f"⚠️  Jobs did not stop gracefully: {', '.join(unfinished)}")
+
+        if self.source_collector:
+            self.source_collector.close()
+        self.order_books.close()
 
         # Shutdown thread pool
         self.thread_pool.shutdown(wait=True, cancel_futures=True)
@@ -2428,9 +2551,9 @@ class DemirUltraComprehensiveOrchestrator:
             'advisory_mode': ADVISORY_MODE,
             'debug_mode': DEBUG_MODE,
             'threads': {
-                'total': len(self.threads),
-                'active': sum(1 for t in self.threads if t.is_alive()),
-                'names': [t.name for t in self.threads if t.is_alive()]
+                'total': len(self.scheduler.jobs),
+                'active': sum(1 for job in self.scheduler.jobs.values() if job.running),
+                'names': [name for name, job in self.scheduler.jobs.items() if job.running]
             },
             'global_state': global_state.get_state_snapshot(),
             'config_available': CONFIG_AVAILABLE
@@ -3025,12 +3148,99 @@ if FLASK_AVAILABLE and app:
             'advisory_mode': ADVISORY_MODE
         }), 200
 
+    # ════════════════════════════════════════════════════════════════════════════════════════
+    # API SNAPSHOTS (serialized once per state version, ETag / 304 / gzip)
+    # ════════════════════════════════════════════════════════════════════════════════════════
+
+    api_snapshots = SnapshotPublisher(gzip_min_bytes=API_GZIP_MIN_BYTES)
+
+    def _runtime_version() -> Tuple[Tuple[int, int, int, int], int]:
+        """State version plus a time bucket for counters that move on their own"""
+        return global_state.state_version, int(time.time() // API_SNAPSHOT_MAX_AGE)
+
+    def _render_prices() -> Dict[str, Any]:
+        market_view = global_state.market_data
+        prices = {}
+        for symbol in DEFAULT_TRACKED_SYMBOLS:
+            market_data = market_view.get(symbol)
+            if market_data:
+                prices[symbol] = {
+                    'price': market_data.price,
+                    'volume': market_data.volume,
+                    'timestamp': market_data.timestamp.isoformat(),
+                    'source': market_data.source
+                }
+            else:
+                prices[symbol] = {
+                    'price': 0,
+                    'volume': 0,
+                    'timestamp': None,
+                    'source': 'unavailable'
+                }
+        return {
+            'prices': prices,
+            'timestamp': datetime.now(timezone.utc).isoformat()
+        }
+
+    def _render_signals(symbol: str, limit: int) -> Dict[str, Any]:
+        if symbol == 'ALL':
+            # Get signals for all tracked symbols
+            return {
+                'signals': {
+                    sym: global_state.get_signals_for_symbol(sym, limit=limit)
+                    for sym in DEFAULT_TRACKED_SYMBOLS
+                },
+                'timestamp': datetime.now(timezone.utc).isoformat()
+            }
+        # Get signals for specific symbol
+        signals = global_state.get_signals_for_symbol(symbol, limit=limit)
+        return {
+            'symbol': symbol,
+            'signals': signals,
+            'count': len(signals),
+            'timestamp': datetime.now(timezone.utc).isoformat()
+        }
+
+    def _render_opportunities(min_confidence: float, min_rr: float,
+                              opp_type: Optional[str], limit: int) -> Dict[str, Any]:
+        opportunities = global_state.get_opportunities_filtered(
+            min_confidence=min_confidence,
+            min_risk_reward=min_rr,
+            opportunity_type=opp_type,
+            limit=limit
+        )
+        return {
+            'opportunities': opportunities,
+            'count': len(opportunities),
+            'filters': {
+                'min_confidence': min_confidence,
+                'min_risk_reward': min_rr,
+                'type': opp_type
+            },
+            'timestamp': datetime.now(timezone.utc).isoformat()
+        }
+
+    def _render_metrics() -> Dict[str, Any]:
+        return {
+            'metrics': global_state.metrics,
+            'stats': global_state.performance_stats,
+            'scheduler': orchestrator.scheduler.get_metrics(),
+            'broadcast': orchestrator.broadcast_hub.get_metrics() if orchestrator.broadcast_hub else None,
+            'api_snapshots': api_snapshots.get_metrics(),
+            'timestamp': datetime.now(timezone.utc).isoformat()
+        }
+
+    api_snapshots.register('status', orchestrator.get_status, version=_runtime_version)
+    api_snapshots.register('prices', _render_prices, version=lambda: global_state.symbols_version)
+    api_snapshots.register('signals_latest', _render_signals, version=lambda: global_state.signals_version)
+    api_snapshots.register('opportunities', _render_opportunities, version=lambda: global_state.opportunity_version)
+    api_snapshots.register('metrics', _render_metrics, version=_runtime_version)
+
     @app.route('/api/status')
     def api_status():
         """Comprehensive system status API"""
         try:
-            status = orchestrator.get_status()
-            return jsonify(status), 200
+            return api_snapshots.serve('status')
         except Exception as e:
             logger.error(f"❌ Error getting status: {e}")
             return jsonify({
@@ -3113,26 +3323,7 @@ if FLASK_AVAILABLE and app:
         try:
             symbol = request.args.get('symbol', 'ALL')
             limit = int(request.args.get('limit', 100))
-
-            if symbol == 'ALL':
-                # Get signals for all tracked symbols
-                all_signals = {}
-                for sym in DEFAULT_TRACKED_SYMBOLS:
-                    all_signals[sym] = global_state.get_signals_for_symbol(sym, limit=limit)
-
-                return jsonify({
-                    'signals': all_signals,
-                    'timestamp': datetime.now(timezone.utc).isoformat()
-                }), 200
-            else:
-                # Get signals for specific symbol
-                signals = global_state.get_signals_for_symbol(symbol, limit=limit)
-                return jsonify({
-                    'symbol': symbol,
-                    'signals': signals,
-                    'count': len(signals),
-                    'timestamp': datetime.now(timezone.utc).isoformat()
-                }), 200
+            return api_snapshots.serve('signals_latest', symbol, limit)
 
         except Exception as e:
             logger.error(f"❌ Error getting signals: {e}")
@@ -3146,24 +3337,7 @@ if FLASK_AVAILABLE and app:
             min_rr = float(request.args.get('min_risk_reward', 2.0))
             opp_type = request.args.get('type', None)
             limit = int(request.args.get('limit', 100))
-
-            opportunities = global_state.get_opportunities_filtered(
-                min_confidence=min_confidence,
-                min_risk_reward=min_rr,
-                opportunity_type=opp_type,
-                limit=limit
-            )
-
-            return jsonify({
-                'opportunities': opportunities,
-                'count': len(opportunities),
-                'filters': {
-                    'min_confidence': min_confidence,
-                    'min_risk_reward': min_rr,
-                    'type': opp_type
-                },
-                'timestamp': datetime.now(timezone.utc).isoformat()
-            }), 200
+            return api_snapshots.serve('opportunities', min_confidence, min_rr, opp_type, limit)
 
         except Exception as e:
             logger.error(f"❌ Error getting opportunities: {e}")
@@ -3218,28 +3392,7 @@ if FLASK_AVAILABLE and app:
     def api_prices():
         """Get current market prices for tracked symbols"""
         try:
-            prices = {}
-            for symbol in DEFAULT_TRACKED_SYMBOLS:
-                market_data = global_state.market_data.get(symbol)
-                if market_data:
-                    prices[symbol] = {
-                        'price': market_data.price,
-                        'volume': market_data.volume,
-                        'timestamp': market_data.timestamp.isoformat(),
-                        'source': market_data.source
-                    }
-                else:
-                    prices[symbol] = {
-                        'price': 0,
-                        'volume': 0,
-                        'timestamp': None,
-                        'source': 'unavailable'
-                    }
-
-            return jsonify({
-                'prices': prices,
-                'timestamp': datetime.now(timezone.utc).isoformat()
-            }), 200
+            return api_snapshots.serve('prices')
 
         except Exception as e:
             logger.error(f"❌ Error getting prices: {e}")
@@ -3249,11 +3402,7 @@ if FLASK_AVAILABLE and app:
     def api_metrics():
         """Get all collected metrics"""
         try:
-            return jsonify({
-                'metrics': global_state.metrics,
-                'stats': global_state.performance_stats,
-                'timestamp': datetime.now(timezone.utc).isoformat()
-            }), 200
+            return api_snapshots.serve('metrics')
         except Exception as e:
             logger.error(f"❌ Error getting metrics: {e}")
             return jsonify({'error': str(e)}), 500
@@ -3349,15 +3498,20 @@ if FLASK_AVAILABLE and app:
         session_id = request.sid
         logger.info(f"🔌 Client disconnected: {session_id}")
         global_state.remove_subscription(session_id)
+        if orchestrator.broadcast_hub:
+            orchestrator.broadcast_hub.disconnect(session_id)
 
     @socketio.on('subscribe')
     def handle_subscribe(data):
-        """Handle symbol subscription"""
+        """Handle symbol subscription ({'symbol': ...} or {'symbols': [...]}; '*' = all)"""
         session_id = request.sid
-        symbol = data.get('symbol', 'BTCUSDT')
-        global_state.add_subscription(session_id, symbol)
-        logger.info(f"📊 Client {session_id} subscribed to {symbol}")
-        emit('subscribed', {'symbol': symbol, 'status': 'success'})
+        symbols = data.get('symbols') or [data.get('symbol', 'BTCUSDT')]
+        for symbol in symbols:
+            global_state.add_subscription(session_id, symbol)
+            if orchestrator.broadcast_hub:
+                orchestrator.broadcast_hub.subscribe(session_id, symbol)
+            logger.info(f"📊 Client {session_id} subscribed to {symbol}")
+            emit('subscribed', {'symbol': symbol, 'status': 'success'})
 
     @socketio.on('unsubscribe')
     def handle_unsubscribe(data):
@@ -3365,6 +3519,8 @@ if FLASK_AVAILABLE and app:
         session_id = request.sid
         symbol = data.get('symbol')
         global_state.remove_subscription(session_id, symbol)
+        if orchestrator.broadcast_hub:
+            orchestrator.broadcast_hub.unsubscribe(session_id, symbol)
         logger.info(f"📊 Client {session_id} unsubscribed from {symbol}")
         emit('unsubscribed', {'symbol': symbol, 'status': 'success'})
 
@@ -9,6 +9,9 @@ from typing import List, Dict, Callable
 from datetime import datetime
 import pytz
 
+from analytics.backtest_kernel import KernelConfig, run_kernel, encode_signals, EXIT_OPEN
+from analytics.parallel_backtest import permutation_monte_carlo
+
 logger = logging.getLogger('ADV_BACKTEST_ENGINE')
 
 class AdvancedBacktestEngine:
@@ -31,42 +34,49 @@ class AdvancedBacktestEngine:
         prices: tick/candle kapanış listesi (gerçek, eksiksiz)
         signals: ['HOLD','BUY','SELL'] şeklinde
         '''
-        balance = self.initial_balance
-        pos = 0
+        prices = np.asarray(prices, dtype=np.float64)
+        codes = encode_signals(signals)
+        codes[:1] = 0  # ilk mum referans (önceki fiyat yok)
+        
+        # Sabit adet: get_size sadece BUY mumlarında çağrılır
+        sizes = np.ones(len(prices))
+        if get_size:
+            buy_bars = np.flatnonzero(codes == 1)
+            sizes[buy_bars] = [get_size(p) for p in prices[buy_bars].tolist()]
+        
+        result = run_kernel(prices, codes, self._kernel_config(), quantity=sizes)
+        
         trades = []
-        for i in range(1,len(prices)):
-            price = prices[i]
-            signal = signals[i]
-            prev_price = prices[i-1]
-            size = get_size(price) if get_size else 1
-            # Al-Sat mantığı
-            if signal=='BUY' and pos==0:
-                pos = size
-                entry = price*(1+self.slippage)
-                trades.append({'type':'buy','price':entry,'time':i,'size':size})
-                balance -= entry*size*(1+self.commission)
-            if signal=='SELL' and pos>0:
-                exit = price*(1-self.slippage)
-                pnl = (exit-entry)*pos
-                balance += exit*size*(1-self.commission)
-                trades.append({'type':'sell','price':exit,'time':i,'size':pos,'pnl':pnl})
-                pos = 0
+        for k in range(result.trade_count):
+            entry = float(result.entry_price[k])
+            size = float(result.quantity[k])
+            trades.append({'type':'buy','price':entry,'time':int(result.entry_idx[k]),'size':size})
+            if result.reason[k] != EXIT_OPEN:
+                exit = float(result.exit_price[k])
+                trades.append({'type':'sell','price':exit,'time':int(result.exit_idx[k]),'size':size,'pnl':(exit-entry)*size})
+        
+        balance = result.final_balance
         net_pnl = balance - self.initial_balance
         drawdown = self.max_drawdown([t.get('pnl',0) for t in trades if 'pnl' in t])
         sharpe = self.sharpe([t.get('pnl',0) for t in trades if 'pnl' in t])
         out = {'net_pnl':net_pnl,'balance':balance,'trade_count':len(trades),'drawdown':drawdown,'sharpe':sharpe,'trades':trades}
-        logger.info(f"[BACKTEST] {out}")
+        logger.info(f"[BACKTEST] net_pnl={net_pnl:.2f} balance={balance:.2f} trades={len(trades)} drawdown={drawdown:.2f} sharpe={sharpe:.3f}")
         return out
     
+    def _kernel_config(self) -> KernelConfig:
+        return KernelConfig(
+            initial_capital=self.initial_balance,
+            max_positions=1,
+            slippage=self.slippage,
+            commission=self.commission,
+            close_at_end=False
+        )
+    
     def max_drawdown(self, pnl:List[float]) -> float:
-        cum=0
-        peak=0
-        maxdd=0
-        for p in pnl:
-            cum+=p
-            if cum>peak: peak=cum
-            if peak-cum>maxdd: maxdd=peak-cum
-        return maxdd
+        if not len(pnl): return 0.0
+        cum = np.cumsum(pnl)
+        peak = np.maximum.accumulate(np.maximum(cum, 0))
+        return float(np.max(peak-cum, initial=0.0))
     
     def sharpe(self, pnl:List[float], rf=0.0) -> float:
         pnl = np.array(pnl)
@@ -76,13 +86,30 @@ class AdvancedBacktestEngine:
         if stdev==0: return 0.0
         return (mean - rf)/stdev*np.sqrt(252)
     
-    def monte_carlo(self, prices:List[float], signals:List[str], trials:int=100) -> Dict:
-        results = []
-        for _ in range(trials):
-            rnd_signals = np.random.permutation(signals)
-            res = self.run_backtest(prices, rnd_signals)
-            results.append(res['net_pnl'])
-        mean = np.mean(results)
-        p05 = np.percentile(results,5)
-        p95 = np.percentile(results,95)
-        return {'monte_carlo_mean':mean,'p05':p05,'p95':p95}
+    def monte_carlo(self, prices:List[float], signals:List[str], trials:int=100, workers:int=None, seed:int=None) -> Dict:
+        '''
+        Sinyal sırası karıştırılarak tekrar backtest (run_backtest ile aynı kurallar, adet=1).
+        Denemeler process pool'a dağıtılır (fiyatlar shared memory'de), her deneme (seed, index)
+        ile deterministik - aynı seed ile sonuçlar worker sayısından bağımsız olarak aynıdır.
+        workers: None = tüm CPU'lar, 1 = tek process
+        '''
+        prices = np.asarray(prices, dtype=np.float64)
+        codes = encode_signals(signals).copy()
+        codes[:1] = 0  # ilk mum referans (önceki fiyat yok)
+        
+        seed, dists = permutation_monte_carlo(
+            prices, codes, trials, self._kernel_config(),
+            quantity=np.ones(len(prices)), seed=seed, workers=workers
+        )
+        pnl = dists['net_pnl'].summary()
+        logger.info(f"[MONTE CARLO] trials={trials} seed={seed} mean={pnl['mean']:.2f} p05={pnl['p5']:.2f} p95={pnl['p95']:.2f}")
+        return {
+            'monte_carlo_mean':pnl['mean'],
+            'p05':pnl['p5'],
+            'p50':pnl['p50'],
+            'p95':pnl['p95'],
+            'std':pnl['std'],
+            'trials':trials,
+            'seed':seed,
+            'drawdown_pct':dists['max_drawdown_percent'].summary()
+        }
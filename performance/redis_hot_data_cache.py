@@ -3,93 +3,77 @@
 High-frequency, ultra-performanslı market/pipeline verisi için gerçek Redis connection ve cache katmanı.
 Sadece canlı veri & prod, mock/fake/test asla yok!
 """
-import os
-import redis
 import logging
-from typing import Any, Dict, List
-from datetime import datetime
-import json
-import pytz
+from typing import Any, Callable, Dict
+
+from utils.tiered_cache import TieredCache, get_tiered_cache
 
 logger = logging.getLogger('REDIS_CACHING_ENGINE')
 
 class RedisHotDataCache:
     """
     Redis tabanlı hot-path data cache. Sadece live/prod veri için:
-    - Market tick/pipeline sonuçlarını cache
-    - API throttling/ratelimit için read-through cache özelliği
-    - Expiry, memory cap ve key-prefix bazlı cache managment
-    - Fault tolerant (production ready)
+    - Market tick/pipeline sonuçlarını cache (process içi LRU + Redis, ortak tiered cache)
+    - API throttling/ratelimit için read-through cache özelliği (single-flight, stale-while-revalidate)
+    - Expiry, memory cap ve key-prefix (namespace) bazlı cache managment
+    - Fault tolerant (Redis yoksa / düşerse process içi katmanla devam)
     """
-    def __init__(self, redis_url:str=None, prefix:str='demir:hot:', default_exp:int=4):
-        ru = redis_url or os.getenv('REDIS_URL','redis://localhost:6379/0')
-        self.db = redis.StrictRedis.from_url(ru, decode_responses=True)
+    def __init__(self, redis_url:str=None, prefix:str='demir:hot:', default_exp:int=4, max_entries:int=20000):
+        self.tiered = TieredCache(redis_url=redis_url) if redis_url else get_tiered_cache()
         self.prefix = prefix
         self.default_exp = default_exp  # saniye
-        logger.info(f"✅ RedisHotDataCache initialized @ {ru}")
-
-    def set_cache(self, key:str, value:Any, exp:int=None):
-        fullkey = self.prefix + key
-        data = value
-        if not isinstance(data,str):
-            data = json.dumps(data,default=str)
-        self.db.set(fullkey, data, ex=exp or self.default_exp)
-        logger.info(f"[REDIS] Set {fullkey} (exp={exp or self.default_exp}s)")
+        namespace = prefix.replace('demir:', '', 1).strip(':') or 'hot'
+        self.cache = self.tiered.namespace(namespace).configure(max_entries=max_entries, default_ttl=default_exp)
+        logger.info(f"✅ RedisHotDataCache initialized (namespace={namespace}, redis={'on' if self.tiered.redis else 'off'})")
 
-    def set(self, key: str, value: Any, exp: int = None) -> bool:
+    def set(self, key: str, value: Any, ttl: int = None) -> bool:
         """
-        ⭐ NEW v8.0: Standard Redis set() method for compatibility.
-        
-        Wrapper around set_cache() to match standard Redis API naming.
-        Used by background threads and caching layers.
-        
+        Cache'e yaz.
+
         Args:
-            key: Cache key (will be prefixed)
-            value: Value to cache (JSON serializable)
-            exp: Expiration in seconds (default: self.default_exp)
-        
+            key: Cache key (namespace içinde)
+            value: Value to cache
+            ttl: Expiration in seconds (default: self.default_exp)
+
         Returns:
             True if successful
         """
         try:
-            self.set_cache(key, value, exp)
+            self.cache.set(key, value, ttl=ttl or self.default_exp)
+            logger.debug(f"[CACHE] Set {self.prefix}{key} (ttl={ttl or self.default_exp}s)")
             return True
         except Exception as e:
-            logger.error(f"❌ Redis set error for key '{key}': {e}")
+            logger.error(f"❌ Cache set error for key '{key}': {e}")
             return False
 
-    def get_cache(self, key:str) -> Any:
-        fullkey = self.prefix + key
-        v = self.db.get(fullkey)
-        if not v: return None
-        try:
-            return json.loads(v)
-        except Exception:
-            return v
-
     def get(self, key: str) -> Any:
         """
-        ⭐ NEW v8.0: Standard Redis get() method for compatibility.
-        
-        Wrapper around get_cache() to match standard Redis API naming.
-        
-        Args:
-            key: Cache key (will be prefixed)
-        
+        Cache'ten oku (önce process içi katman, sonra Redis).
+
         Returns:
-            Cached value or None if not found
+            Cached value or None if not found / expired
         """
-        return self.get_cache(key)
+        return self.cache.get(key)
+
+    def get_or_load(self, key: str, loader: Callable[[], Any], ttl: int = None, stale_ttl: float = 0) -> Any:
+        """Read-through: miss'te loader bir kez çalışır, stale değer arka planda yenilenir"""
+        return self.cache.get_or_load(key, loader, ttl=ttl or self.default_exp, stale_ttl=stale_ttl)
+
+    # Eski isimler
+    def set_cache(self, key:str, value:Any, exp:int=None):
+        self.set(key, value, ttl=exp)
+
+    def get_cache(self, key:str) -> Any:
+        return self.get(key)
 
     def clear_cache(self):
-        filter_keys = [k for k in self.db.keys(self.prefix+'*')]
-        if filter_keys:
-            self.db.delete(*filter_keys)
-            logger.info(f"[REDIS] Cache cleared: {len(filter_keys)} keys")
+        removed = self.cache.invalidate()
+        logger.info(f"[CACHE] Cache cleared: {removed} keys")
+
+    def get_stats(self) -> Dict:
+        return self.cache.get_stats()
 
     def health_check(self) -> Dict:
-        try:
-            info = self.db.info()
-            return {'status':'ok','uptime':info.get('uptime_in_seconds',0),'keys':info.get('db0',{}).get('keys',0)}
-        except Exception as e:
-            return {'status':'fail','err':str(e)}
\ No newline at end of file
+        health = self.tiered.health_check()
+        health['stats'] = self.get_stats()
+        return health
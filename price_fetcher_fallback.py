@@ -29,6 +29,8 @@ import threading
 from datetime import datetime, timezone
 from typing import Dict, Any, List, Optional
 
+from utils.http_client import http_get
+
 # ════════════════════════════════════════════════════════════════════════════════════════════════════════
 # LOGGING CONFIGURATION
 # ════════════════════════════════════════════════════════════════════════════════════════════════════════
@@ -36,6 +38,11 @@ from typing import Dict, Any, List, Optional
 logger = logging.getLogger('PRICE_FETCHER_FALLBACK')
 logger.setLevel(logging.INFO)
 
+try:
+    from utils.price_reference_store import get_price_reference_store
+except ImportError:
+    get_price_reference_store = None
+
 # ════════════════════════════════════════════════════════════════════════════════════════════════════════
 # PRICE FETCHER CLASS
 # ════════════════════════════════════════════════════════════════════════════════════════════════════════
@@ -138,11 +145,18 @@ class PriceFetcherFallback:
         try:
             # Binance API: Get all ticker prices in one request
             url = f"{self.base_url}/ticker/price"
-            response = requests.get(url, timeout=10)
+            response = http_get(url, timeout=10)
             response.raise_for_status()
             
             all_tickers = response.json()
             
+            # Share the full sweep as cross-validation references
+            if get_price_reference_store:
+                get_price_reference_store().update_many(
+                    {ticker['symbol']: float(ticker['price']) for ticker in all_tickers},
+                    source='BINANCE_REST'
+                )
+            
             # Filter for our tracked symbols
             symbol_prices = {
                 ticker['symbol']: float(ticker['price'])
@@ -152,7 +166,7 @@ class PriceFetcherFallback:
             
             # Also fetch 24h volume
             volume_url = f"{self.base_url}/ticker/24hr"
-            volume_response = requests.get(volume_url, timeout=10)
+            volume_response = http_get(volume_url, timeout=10)
             volume_response.raise_for_status()
             
             all_volumes = volume_response.json()
@@ -284,14 +298,14 @@ class PriceFetcherFallback:
             url = f"{self.base_url}/ticker/price"
             params = {'symbol': symbol}
             
-            response = requests.get(url, params=params, timeout=5)
+            response = http_get(url, params=params, timeout=5)
             response.raise_for_status()
             
             data = response.json()
             
             # Also get volume
             volume_url = f"{self.base_url}/ticker/24hr"
-            volume_response = requests.get(volume_url, params=params, timeout=5)
+            volume_response = http_get(volume_url, params=params, timeout=5)
             volume_data = volume_response.json()
             
             return {
@@ -9,11 +9,15 @@ GitHub streamlit_app.py + streamlit_app_updated.py + real_data_validators + 4-GR
 import os, sys, logging, streamlit as st, pandas as pd, numpy as np
 from datetime import datetime, timedelta
 import plotly.graph_objects as go
+from contextlib import contextmanager
 import psycopg2
+from psycopg2 import pool
 from psycopg2.extras import RealDictCursor
 import requests
 import pytz
 
+from utils.signal_rollups import fetch_window_statistics, fetch_symbols
+
 # LOGGING
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -36,34 +40,61 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # ====== DATABASE HELPERS ======
+# Reads go through one small pool per server process; stats and symbols come
+# from rollup tables maintained by the writer (O(hours), not O(rows))
+DB_POOL_MAX = int(os.getenv('DASHBOARD_DB_POOL_MAX', '4'))
+SIGNALS_TTL = int(os.getenv('DASHBOARD_SIGNALS_TTL', '30'))
+STATS_TTL = int(os.getenv('DASHBOARD_STATS_TTL', '60'))
+SYMBOLS_TTL = int(os.getenv('DASHBOARD_SYMBOLS_TTL', '300'))
+DEFAULT_SYMBOLS = ['BTCUSDT', 'ETHUSDT', 'LTCUSDT']
+
 @st.cache_resource
-def get_db_connection():
-    """Get fresh DB connection with timeout"""
+def get_db_pool():
+    """Shared connection pool (created once per server process)"""
     try:
-        return psycopg2.connect(os.getenv('DATABASE_URL'), connect_timeout=10)
+        return pool.ThreadedConnectionPool(
+            1, DB_POOL_MAX, os.getenv('DATABASE_URL'), connect_timeout=10
+        )
     except Exception as e:
         logger.error(f"DB error: {e}")
         return None
 
+@contextmanager
+def db_connection():
+    """Borrow a read-only (autocommit) connection; broken connections are discarded"""
+    db_pool = get_db_pool()
+    if db_pool is None:
+        yield None
+        return
+    conn = db_pool.getconn()
+    broken = False
+    try:
+        conn.autocommit = True
+        yield conn
+    except (psycopg2.OperationalError, psycopg2.InterfaceError):
+        broken = True
+        raise
+    finally:
+        db_pool.putconn(conn, close=broken or bool(conn.closed))
+
+@st.cache_data(ttl=SIGNALS_TTL, show_spinner=False)
 def load_recent_signals(hours: int = 24, limit: int = 50) -> pd.DataFrame:
     """Load REAL signals from PostgreSQL with validation"""
-    conn = get_db_connection()
-    if not conn:
-        return pd.DataFrame()
-    
     try:
-        query = """
-            SELECT id, symbol, direction, entry_price, tp1, tp2, sl,
-                   entry_time, confidence, ensemble_score,
-                   tech_group_score, sentiment_group_score, 
-                   onchain_group_score, macro_risk_group_score,
-                   data_source
-            FROM trades
-            WHERE entry_time > NOW() - INTERVAL '%s hours'
-            ORDER BY entry_time DESC LIMIT %s
-        """
-        df = pd.read_sql(query, conn, params=(hours, limit))
-        conn.close()
+        with db_connection() as conn:
+            if conn is None:
+                return pd.DataFrame()
+            query = """
+                SELECT id, symbol, direction, entry_price, tp1, tp2, sl,
+                       timestamp AS entry_time, confidence, ensemble_score,
+                       tech_group_score, sentiment_group_score, 
+                       onchain_group_score, macro_risk_group_score,
+                       data_source
+                FROM signals
+                WHERE timestamp > NOW() - make_interval(hours => %s)
+                ORDER BY timestamp DESC LIMIT %s
+            """
+            df = pd.read_sql(query, conn, params=(hours, limit))
         
         if len(df) > 0:
             df['entry_time'] = pd.to_datetime(df['entry_time'])
@@ -71,58 +102,36 @@ def load_recent_signals(hours: int = 24, limit: int = 50) -> pd.DataFrame:
         return df
     except Exception as e:
         logger.error(f"Load signals error: {e}")
-        if conn: conn.close()
         return pd.DataFrame()
 
+@st.cache_data(ttl=STATS_TTL, show_spinner=False)
 def load_statistics(hours: int = 24) -> dict:
-    """Load REAL statistics"""
-    conn = get_db_connection()
-    if not conn:
-        return {}
-    
+    """Load REAL statistics (hourly rollups)"""
     try:
-        query = """
-            SELECT 
-                COUNT(*) as total_signals,
-                SUM(CASE WHEN direction = 'LONG' THEN 1 ELSE 0 END) as long_count,
-                SUM(CASE WHEN direction = 'SHORT' THEN 1 ELSE 0 END) as short_count,
-                COUNT(DISTINCT symbol) as unique_symbols,
-                COUNT(DISTINCT data_source) as sources,
-                AVG(confidence) as avg_confidence,
-                AVG(ensemble_score) as avg_ensemble,
-                AVG(tech_group_score) as avg_tech,
-                AVG(sentiment_group_score) as avg_sentiment,
-                AVG(onchain_group_score) as avg_onchain,
-                AVG(macro_risk_group_score) as avg_macro
-            FROM trades
-            WHERE entry_time > NOW() - INTERVAL '%s hours'
-        """
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
-        cursor.execute(query, (hours,))
-        result = cursor.fetchone()
-        cursor.close()
-        conn.close()
-        return dict(result) if result else {}
+        with db_connection() as conn:
+            if conn is None:
+                return {}
+            cursor = conn.cursor(cursor_factory=RealDictCursor)
+            result = fetch_window_statistics(cursor, hours)
+            cursor.close()
+        return result
     except Exception as e:
         logger.error(f"Load stats error: {e}")
-        if conn: conn.close()
         return {}
 
+@st.cache_data(ttl=SYMBOLS_TTL, show_spinner=False)
 def get_all_symbols() -> list:
-    """Get tracked symbols"""
-    conn = get_db_connection()
-    if not conn:
-        return ['BTCUSDT', 'ETHUSDT', 'LTCUSDT']
-    
+    """Get tracked symbols (symbol registry)"""
     try:
-        query = "SELECT DISTINCT symbol FROM trades ORDER BY symbol"
-        df = pd.read_sql(query, conn)
-        conn.close()
-        symbols = df['symbol'].tolist() if len(df) > 0 else []
-        return symbols if symbols else ['BTCUSDT', 'ETHUSDT', 'LTCUSDT']
+        with db_connection() as conn:
+            if conn is None:
+                return DEFAULT_SYMBOLS
+            cursor = conn.cursor()
+            symbols = fetch_symbols(cursor)
+            cursor.close()
+        return symbols if symbols else DEFAULT_SYMBOLS
     except Exception:
-        if conn: conn.close()
-        return ['BTCUSDT', 'ETHUSDT', 'LTCUSDT']
+        return DEFAULT_SYMBOLS
 
 def add_new_coin(symbol: str) -> bool:
     """Add new coin to tracking"""
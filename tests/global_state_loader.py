@@ -0,0 +1,45 @@
+"""
+Load GlobalState from main.py without importing main
+
+Importing main builds the orchestrator (and every integration) at module
+level, so the tests compile only SECTION 23 (state dataclasses, shards,
+GlobalState) against the names it uses. Line numbers match main.py.
+"""
+
+import logging
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.lock_striping import InstrumentedLock
+from utils.ring_buffer import ColumnarRingBuffer
+
+MAIN_PATH = Path(__file__).resolve().parent.parent / 'main.py'
+SECTION_START = '@dataclass\nclass MarketDataPoint:'
+SECTION_END = '# Initialize global state'
+
+
+def load_global_state_module() -> SimpleNamespace:
+    source = MAIN_PATH.read_text(encoding='utf-8')
+    start = source.index(SECTION_START)
+    end = source.index(SECTION_END, start)
+    padding = '\n' * source.count('\n', 0, start)
+
+    namespace = {
+        '__name__': 'main_global_state',
+        'logging': logging,
+        'logger': logging.getLogger('DEMIR_MASTER_ORCHESTRATOR'),
+        'validator_logger': logging.getLogger('DATA_VALIDATOR'),
+        'defaultdict': defaultdict, 'deque': deque, 'islice': islice,
+        'dataclass': dataclass, 'field': field,
+        'datetime': datetime, 'timedelta': timedelta, 'timezone': timezone,
+        'Any': Any, 'Dict': Dict, 'List': List, 'Optional': Optional, 'Tuple': Tuple,
+        'InstrumentedLock': InstrumentedLock,
+        'ColumnarRingBuffer': ColumnarRingBuffer,
+    }
+    exec(compile(padding + source[start:end], str(MAIN_PATH), 'exec'), namespace)
+    return SimpleNamespace(**namespace)
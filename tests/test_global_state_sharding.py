@@ -0,0 +1,128 @@
+"""
+GlobalState sharding: concurrent writers and lock-free readers
+"""
+
+import threading
+import unittest
+
+from global_state_loader import load_global_state_module
+
+WRITERS = 8
+SYMBOLS_PER_WRITER = 6
+UPDATES = 400
+
+
+class TestGlobalStateSharding(unittest.TestCase):
+    """No lost updates across shards; readers see consistent, immutable views"""
+
+    def setUp(self):
+        # Few shards: writers of different symbols constantly share a stripe
+        self.state = load_global_state_module().GlobalState(shard_count=3)
+        self.symbols = [[f"S{w}X{i}USDT" for i in range(SYMBOLS_PER_WRITER)] for w in range(WRITERS)]
+
+    def run_threads(self, targets):
+        start = threading.Barrier(len(targets))
+        errors = []
+
+        def wrap(target):
+            def run():
+                start.wait()
+                try:
+                    target()
+                except BaseException as e:
+                    errors.append(e)
+            return run
+
+        threads = [threading.Thread(target=wrap(t)) for t in targets]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=30)
+        self.assertFalse(any(thread.is_alive() for thread in threads))
+        if errors:
+            raise errors[0]
+
+    def test_concurrent_writers_never_lose_updates(self):
+        state = self.state
+
+        def writer(symbols):
+            def run():
+                for n in range(1, UPDATES + 1):
+                    for symbol in symbols:
+                        state.update_market_data(symbol, {'price': n, 'volume': 1})
+                    if n % 4 == 0:
+                        state.add_signal(symbols[n % len(symbols)], {'direction': 'LONG', 'confidence': 0.7})
+            return run
+
+        self.run_threads([writer(symbols) for symbols in self.symbols])
+
+        all_symbols = [s for symbols in self.symbols for s in symbols]
+        market = state.market_data
+        self.assertEqual(set(market), set(all_symbols))
+        for symbol in all_symbols:
+            self.assertEqual(market[symbol].price, UPDATES, symbol)
+            self.assertEqual(len(state.get_market_history(symbol)['price']), UPDATES)
+
+        signals = UPDATES // 4 * WRITERS
+        self.assertEqual(sum(stats['total'] for stats in state.signal_stats.values()), signals)
+        self.assertEqual(state.signals_version, signals)
+        self.assertEqual(state.symbols_version, len(all_symbols) * UPDATES + signals)
+
+    def test_readers_see_consistent_views_during_writes(self):
+        state = self.state
+        symbols = [s for group in self.symbols for s in group]
+        done = threading.Event()
+
+        def writer():
+            try:
+                for n in range(1, UPDATES + 1):
+                    for symbol in symbols:
+                        state.update_market_data(symbol, {'price': n})
+            finally:
+                done.set()
+
+        def reader():
+            last_seen = {}
+            last_version = -1
+            views = []
+            while not done.is_set():
+                version = state.symbols_version
+                self.assertGreaterEqual(version, last_version)
+                last_version = version
+
+                view = state.market_data
+                for symbol, point in view.items():
+                    self.assertEqual(point.symbol, symbol)
+                    # Never older than a view seen before
+                    self.assertGreaterEqual(point.price, last_seen.get(symbol, 0))
+                    last_seen[symbol] = point.price
+                if len(views) < 50:
+                    views.append((view, dict(view)))
+            # Published views are never mutated afterwards
+            for view, copy in views:
+                self.assertEqual(view, copy)
+
+        self.run_threads([writer, reader, reader])
+        self.assertEqual({point.price for point in state.market_data.values()}, {UPDATES})
+
+    def test_readers_do_not_take_shard_locks(self):
+        state = self.state
+        symbol = self.symbols[0][0]
+        state.update_market_data(symbol, {'price': 1})
+        result = {}
+
+        def read():
+            result['price'] = state.market_data[symbol].price
+            result['point'] = state.get_market_data(symbol)
+
+        with state._shard(symbol).lock:
+            reader = threading.Thread(target=read)
+            reader.start()
+            reader.join(timeout=5)
+            self.assertFalse(reader.is_alive())
+        self.assertEqual(result['price'], 1)
+        self.assertIs(result['point'], state.market_data[symbol])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+GroupSignalService single-flight / TTL / deadline tests
+"""
+
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from api_routes_group_signals import GROUPS, GroupSignalService
+from utils.tiered_cache import TieredCache
+
+
+class StubInterpreter:
+    """Counts calls; blocks until released so concurrent requests overlap"""
+
+    def __init__(self):
+        self.calls = 0
+        self.release = threading.Event()
+
+    def interpret_group_signals(self, symbol, group_signals, current_price):
+        self.calls += 1
+        self.release.wait(timeout=5)
+        return {'symbol': symbol, 'groups': sorted(group_signals), 'analysis_complete': True}
+
+
+class TestGroupSignalService(unittest.TestCase):
+    """Groups and the meta signal are cached, shared and deadline-bounded"""
+
+    def setUp(self):
+        self.service = GroupSignalService(orchestrator=None, ttl=60, deadline=0.5, max_workers=5)
+        self.addCleanup(self.service.executor.shutdown, wait=False)
+        self.service.cache = TieredCache().namespace('group_signals')
+        self.service._current_price = lambda symbol: 50000.0
+        self.builds = {group: 0 for group in GROUPS}
+        self.slow = threading.Event()
+        self.addCleanup(self.slow.set)
+        for group in GROUPS:
+            self.service._builders[group] = self._builder(group)
+
+    def _builder(self, group, slow=False):
+        def build(symbol, timeframe):
+            self.builds[group] += 1
+            if slow:
+                self.slow.wait(timeout=5)
+            return {'group': group, 'symbol': symbol}
+        return build
+
+    def test_concurrent_meta_requests_share_one_computation(self):
+        interpreter = StubInterpreter()
+        self.service._meta_interpreter = interpreter
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(self.service.get_meta_signal, 'BTCUSDT') for _ in range(4)]
+            for _ in range(100):
+                if self.service.stats['shared'] == 3:
+                    break
+                time.sleep(0.01)
+            interpreter.release.set()
+            results = [f.result(timeout=5) for f in futures]
+
+        self.assertEqual(interpreter.calls, 1)
+        self.assertTrue(all(r is results[0] for r in results))
+        self.assertEqual(results[0]['groups'], sorted(GROUPS))
+        self.assertEqual(self.service.stats['shared'], 3)
+        self.assertEqual(self.service.get_metrics()['inflight'], 0)
+
+    def test_ttl_cache_hit(self):
+        interpreter = StubInterpreter()
+        interpreter.release.set()
+        self.service._meta_interpreter = interpreter
+
+        first = self.service.get_meta_signal('BTCUSDT')
+        second = self.service.get_meta_signal('BTCUSDT')
+
+        self.assertEqual(first, second)
+        self.assertEqual(interpreter.calls, 1)
+        self.assertEqual(self.builds, {group: 1 for group in GROUPS})
+        self.assertEqual(self.service.stats['cache_hits'], 1)
+
+        # Group-level cache serves the next request without rebuilding
+        self.service.get_groups('BTCUSDT')
+        self.assertEqual(self.builds, {group: 1 for group in GROUPS})
+
+    def test_group_past_deadline_is_omitted(self):
+        self.service._builders['onchain'] = self._builder('onchain', slow=True)
+
+        signals = self.service.get_groups('BTCUSDT')
+
+        self.assertEqual(list(signals), [g for g in GROUPS if g != 'onchain'])
+        self.assertEqual(self.service.stats['timeouts'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+TechnicalIndicatorsLive streaming mode vs the TA-Lib batch path
+"""
+
+import os
+import sys
+import types
+import unittest
+
+import numpy as np
+
+import layers
+
+# layers/technical/__init__.py imports classes that are not in this tree;
+# register the package path without running it so its modules import directly
+if 'layers.technical' not in sys.modules:
+    _package = types.ModuleType('layers.technical')
+    _package.__path__ = [os.path.join(list(layers.__path__)[0], 'technical')]
+    sys.modules['layers.technical'] = _package
+
+from layers.technical.technical_indicators_live import OHLCV, TechnicalIndicatorsLive
+
+LOOKBACK = 200
+WARMUP = 2 * LOOKBACK
+BARS = 800
+
+# Window sums / extrema: exact up to rounding
+WINDOW_INDICATORS = ('SMA_20', 'SMA_50', 'BB_20', 'Stochastic', 'Williams_R',
+                     'MFI_14', 'CMF', 'OBV', 'AD', 'VWAP', 'Ichimoku')
+# Recursive (seeded) indicators: converge once the batch window is past the seed
+RECURSIVE_INDICATORS = ('EMA_12', 'EMA_26', 'RSI_14', 'ATR_14', 'ADX_14', 'MACD')
+FIELDS = ('value', 'signal', 'histogram', 'upper_band', 'lower_band', 'middle_band')
+
+
+def random_walk(seed: int, n: int):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    open_ = np.r_[close[0], close[:-1]]
+    high = np.maximum(open_, close) * (1 + rng.uniform(0, 0.005, n))
+    low = np.minimum(open_, close) * (1 - rng.uniform(0, 0.005, n))
+    volume = rng.uniform(10, 1000, n)
+    return [OHLCV(i * 60.0, open_[i], high[i], low[i], close[i], volume[i]) for i in range(n)]
+
+
+class TestStreamingMatchesBatch(unittest.TestCase):
+    """Every streaming indicator tracks the batch result after warm-up"""
+
+    def assert_close(self, name, streaming, batch, rel_tol, bar):
+        for field in FIELDS:
+            expected = getattr(batch, field)
+            actual = getattr(streaming, field)
+            if expected is None or isinstance(expected, str):
+                self.assertEqual(actual, expected, f"{name}.{field} @ bar {bar}")
+                continue
+            error = abs(float(actual) - float(expected)) / max(1.0, abs(float(expected)))
+            self.assertLessEqual(error, rel_tol, f"{name}.{field} @ bar {bar}: {actual} vs {expected}")
+
+    def test_random_walk(self):
+        streaming = TechnicalIndicatorsLive(lookback_period=LOOKBACK, streaming=True)
+        batch = TechnicalIndicatorsLive(lookback_period=LOOKBACK)
+
+        for bar, candle in enumerate(random_walk(seed=42, n=BARS)):
+            streaming.add_candle(candle)
+            batch.add_candle(candle)
+            if bar < WARMUP or bar % 5:
+                continue
+
+            stream_results = streaming.get_all_indicators()
+            batch_results = batch.get_all_indicators()
+            self.assertEqual(set(stream_results), set(batch_results))
+            for name in WINDOW_INDICATORS:
+                self.assert_close(name, stream_results[name], batch_results[name], 1e-12, bar)
+            for name in RECURSIVE_INDICATORS:
+                self.assert_close(name, stream_results[name], batch_results[name], 1e-3, bar)
+
+    def test_results_cached_until_next_candle(self):
+        streaming = TechnicalIndicatorsLive(lookback_period=LOOKBACK, streaming=True)
+        candles = random_walk(seed=7, n=60)
+        for candle in candles[:-1]:
+            streaming.add_candle(candle)
+
+        first = streaming.get_all_indicators()
+        self.assertIs(streaming.get_all_indicators(), first)
+        streaming.add_candle(candles[-1])
+        self.assertIsNot(streaming.get_all_indicators(), first)
+
+
+if __name__ == '__main__':
+    unittest.main()
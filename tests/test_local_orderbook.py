@@ -0,0 +1,152 @@
+"""
+LocalOrderBook / OrderBookManager sequencing tests (fake snapshots, no network)
+"""
+
+import unittest
+from concurrent.futures import Executor, Future
+
+from utils.local_orderbook import (
+    STATE_INIT, STATE_RESYNC, STATE_SYNCED, TRIM_SLACK, LocalOrderBook, OrderBookManager,
+)
+
+
+class InlineExecutor(Executor):
+    """Runs submitted snapshot loads on the test thread when `run()` is called"""
+
+    def __init__(self):
+        self.pending = []
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        self.pending.append((future, fn, args, kwargs))
+        return future
+
+    def run(self):
+        pending, self.pending = self.pending, []
+        for future, fn, args, kwargs in pending:
+            future.set_result(fn(*args, **kwargs))
+
+
+class FakeFetcher:
+    """Serves queued snapshots in order and records every request"""
+
+    def __init__(self, *snapshots):
+        self.snapshots = list(snapshots)
+        self.requests = []
+
+    def __call__(self, symbol):
+        self.requests.append(symbol)
+        return self.snapshots.pop(0)
+
+
+def snapshot(last_update_id, bids=(), asks=()):
+    return {'lastUpdateId': last_update_id,
+            'bids': [[str(p), str(q)] for p, q in bids],
+            'asks': [[str(p), str(q)] for p, q in asks]}
+
+
+def diff(first, last, bids=(), asks=()):
+    return {'e': 'depthUpdate', 's': 'BTCUSDT', 'E': last, 'U': first, 'u': last,
+            'b': [[str(p), str(q)] for p, q in bids],
+            'a': [[str(p), str(q)] for p, q in asks]}
+
+
+class TestOrderBookManager(unittest.TestCase):
+    """Binance snapshot + diff procedure"""
+
+    def setUp(self):
+        self.executor = InlineExecutor()
+
+    def manager(self, *snapshots, **kwargs):
+        self.fetcher = FakeFetcher(*snapshots)
+        return OrderBookManager(self.fetcher, executor=self.executor, retry_delay=0, **kwargs)
+
+    def test_buffered_diffs_up_to_snapshot_are_dropped(self):
+        books = self.manager(snapshot(105, bids=[(100, 1)], asks=[(101, 1)]))
+        books.on_depth_event(diff(95, 100, bids=[(99, 5)]))
+        books.on_depth_event(diff(101, 105, bids=[(98, 5)]))
+        books.on_depth_event(diff(104, 110, bids=[(100, 2)], asks=[(101, 0), (102, 3)]))
+        book = books.get('BTCUSDT')
+        self.assertEqual(book.state, STATE_INIT)
+        self.assertEqual(self.fetcher.requests, [])
+
+        self.executor.run()
+
+        self.assertEqual(self.fetcher.requests, ['BTCUSDT'])
+        self.assertEqual(book.state, STATE_SYNCED)
+        self.assertEqual(book.last_update_id, 110)
+        self.assertEqual(book.stats['dropped_old'], 2)
+        self.assertEqual(book.stats['applied'], 1)
+        self.assertEqual(book.levels(), ([[100.0, 2.0]], [[102.0, 3.0]]))
+
+        # Synced: the next contiguous diff is applied directly
+        self.assertIs(books.on_depth_event(diff(111, 112, bids=[(99.5, 1)])), book)
+        self.assertEqual(book.best_bid_ask(), ((100.0, 2.0), (102.0, 3.0)))
+
+    def test_snapshot_older_than_buffer_needs_a_newer_one(self):
+        books = self.manager(snapshot(105, bids=[(100, 1)]), snapshot(125, bids=[(100, 4)]))
+        books.on_depth_event(diff(120, 130, bids=[(100, 7)]))
+        self.executor.run()
+
+        book = books.get('BTCUSDT')
+        self.assertEqual(book.state, STATE_RESYNC)
+        self.assertEqual(book.stats['applied'], 0)
+
+        # Next diff schedules a fresh snapshot that straddles the buffered events
+        books.on_depth_event(diff(131, 135, asks=[(101, 1)]))
+        self.executor.run()
+
+        self.assertEqual(len(self.fetcher.requests), 2)
+        self.assertEqual(book.state, STATE_SYNCED)
+        self.assertEqual(book.last_update_id, 135)
+        self.assertEqual(book.levels(), ([[100.0, 7.0]], [[101.0, 1.0]]))
+
+    def test_gap_triggers_resync_from_new_snapshot(self):
+        books = self.manager(snapshot(100, bids=[(100, 1)]), snapshot(150, bids=[(100, 9)]))
+        books.on_depth_event(diff(101, 101))
+        self.executor.run()
+        book = books.get('BTCUSDT')
+        self.assertTrue(book.synced)
+
+        self.assertIsNone(books.on_depth_event(diff(140, 145, bids=[(100, 3)])))
+        self.assertEqual(book.state, STATE_RESYNC)
+        self.assertEqual(book.stats['gaps'], 1)
+        self.assertEqual(book.stats['resyncs'], 1)
+        self.assertEqual(len(self.executor.pending), 1)
+
+        books.on_depth_event(diff(146, 152, bids=[(99, 1)]))
+        self.executor.run()
+
+        self.assertEqual(len(self.fetcher.requests), 2)
+        self.assertTrue(book.synced)
+        self.assertEqual(book.last_update_id, 152)
+        self.assertEqual(book.levels()[0], [[100.0, 9.0], [99.0, 1.0]])
+
+
+class TestTrim(unittest.TestCase):
+    """Sides may grow to max_levels * TRIM_SLACK before trimming back to max_levels"""
+
+    def test_trim_after_slack(self):
+        max_levels = 20
+        trim_at = int(max_levels * TRIM_SLACK)
+        book = LocalOrderBook('BTCUSDT', max_levels=max_levels)
+        book.load_snapshot(snapshot(1, bids=[(1000 - i, 1) for i in range(max_levels + 5)]))
+        self.assertEqual(len(book.bids), max_levels)
+
+        update_id = 1
+        for i in range(trim_at - max_levels):
+            update_id += 1
+            book.on_event(diff(update_id, update_id, bids=[(500 - i, 1)]))
+        self.assertEqual(len(book.bids), trim_at)
+
+        # One more level crosses the slack: back to max_levels, best levels kept
+        update_id += 1
+        book.on_event(diff(update_id, update_id, bids=[(1000.5, 1)]))
+        self.assertEqual(len(book.bids), max_levels)
+        prices = [p for p, _ in book.levels()[0]]
+        self.assertEqual(prices[:2], [1000.5, 1000.0])
+        self.assertEqual(prices, sorted(prices, reverse=True))
+
+
+if __name__ == '__main__':
+    unittest.main()
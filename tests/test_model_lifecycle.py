@@ -0,0 +1,109 @@
+"""
+ModelLifecycle retrain policy + registry persistence tests
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from layers.ml import model_lifecycle
+from layers.ml.model_lifecycle import DRIFT_MIN_SAMPLES, ModelLifecycle
+from utils.model_versioning import ModelVersioning
+
+
+def make_train_fn(calls):
+    """train_fn returning a picklable model tagged with its call number"""
+    def train_fn(scale):
+        calls.append(scale)
+        X = np.random.default_rng(len(calls)).uniform(0.0, scale, size=(100, 3))
+        return {'call': len(calls)}, X, {'accuracy': 0.6, 'f1': 0.5}
+    return train_fn
+
+
+class TestModelLifecycle(unittest.TestCase):
+    """Initial/drift retrains, warm start from the registry, version retention"""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.versioning = ModelVersioning(registry_dir=self.tmp, models_dir=self.tmp)
+        patches = [
+            mock.patch.object(model_lifecycle, '_versioning', self.versioning),
+            mock.patch.object(model_lifecycle, 'MODEL_VERSIONING_AVAILABLE', True),
+            mock.patch.object(model_lifecycle, 'MIN_RETRAIN_GAP_SECONDS', 0),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.addCleanup(shutil.rmtree, self.tmp, True)
+
+    def _drift(self, lifecycle):
+        for _ in range(DRIFT_MIN_SAMPLES):
+            with lifecycle.inference(np.full(3, -1.0)):
+                pass
+
+    def _wait_retrain(self, lifecycle):
+        lifecycle._training_thread.join(timeout=10)
+        self.assertFalse(lifecycle._training_thread.is_alive())
+
+    def test_initial_train_then_served_from_memory(self):
+        calls = []
+        lifecycle = ModelLifecycle('test_model')
+        self.assertTrue(lifecycle.ensure_model(make_train_fn(calls), 1.0))
+        self.assertEqual(lifecycle.model, {'call': 1})
+        self.assertEqual(lifecycle.version, 'v1.0.0')
+
+        self.assertTrue(lifecycle.ensure_model(make_train_fn(calls), 1.0))
+        self.assertEqual(len(calls), 1)
+        self.assertIsNone(lifecycle.retrain_reason())
+
+    def test_drift_triggers_background_retrain(self):
+        calls = []
+        lifecycle = ModelLifecycle('test_model')
+        lifecycle.ensure_model(make_train_fn(calls), 1.0)
+
+        self._drift(lifecycle)
+        self.assertEqual(lifecycle.retrain_reason(), 'drift')
+        self.assertTrue(lifecycle.ensure_model(make_train_fn(calls), 2.0))
+        self._wait_retrain(lifecycle)
+
+        self.assertEqual(lifecycle.model, {'call': 2})
+        self.assertEqual(lifecycle.version, 'v1.0.1')
+        self.assertEqual(lifecycle.metrics['retrain_reasons']['drift'], 1)
+        self.assertEqual(lifecycle.drift_ratio(), 0.0)
+
+    def test_restart_loads_production_version(self):
+        calls = []
+        ModelLifecycle('test_model').ensure_model(make_train_fn(calls), 1.0)
+
+        restarted = ModelLifecycle('test_model')
+        self.assertEqual(restarted.model, {'call': 1})
+        self.assertEqual(restarted.version, 'v1.0.0')
+        self.assertTrue(restarted.metrics['loaded_from_registry'])
+        self.assertIsNone(restarted.retrain_reason())
+
+        self.assertTrue(restarted.ensure_model(make_train_fn(calls), 1.0))
+        self.assertEqual(len(calls), 1)
+
+    def test_old_versions_are_pruned(self):
+        calls = []
+        lifecycle = ModelLifecycle('test_model')
+        with mock.patch.object(model_lifecycle, 'KEEP_VERSIONS', 2):
+            lifecycle.ensure_model(make_train_fn(calls), 1.0)
+            for scale in (2.0, 3.0, 4.0):
+                self._drift(lifecycle)
+                lifecycle.ensure_model(make_train_fn(calls), scale)
+                self._wait_retrain(lifecycle)
+
+        entries = self.versioning.list_versions('test_model')
+        self.assertEqual([e['version'] for e in entries], ['v1.0.2', 'v1.0.3'])
+        self.assertEqual(lifecycle.version, 'v1.0.3')
+        stored = sorted(p for p in os.listdir(self.tmp) if p.startswith('test_model_v'))
+        self.assertEqual(stored, ['test_model_v1.0.2.pkl', 'test_model_v1.0.3.pkl'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+"""
+StreamingResampler: streaming update() vs vectorized backfill()
+"""
+
+import unittest
+from datetime import datetime, timezone
+
+import numpy as np
+
+from utils.ohlcv_resampler import MINUTE_MS, StreamingResampler
+
+INTERVALS = ('5m', '1h', '1w')
+FIELDS = ('timestamp', 'open', 'high', 'low', 'close', 'volume')
+START_MS = int(datetime(2024, 1, 3, 0, 7, tzinfo=timezone.utc).timestamp() * 1000)  # a Wednesday
+
+
+def minute_candles(n=3 * 7 * 1440, seed=9):
+    rng = np.random.default_rng(seed)
+    ts = START_MS + np.arange(n, dtype=np.int64) * MINUTE_MS
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.001, n)))
+    open_ = np.r_[100.0, close[:-1]]
+    columns = {
+        'timestamp': ts,
+        'open': open_,
+        'high': np.maximum(open_, close) + rng.uniform(0, 0.05, n),
+        'low': np.minimum(open_, close) - rng.uniform(0, 0.05, n),
+        'close': close,
+        'volume': rng.uniform(1, 10, n),
+    }
+    # Missing candles, including the closing minute of a 5m bar (…:04) and of an hour (…:59)
+    missing = (ts // MINUTE_MS % 5 == 4) & (ts // MINUTE_MS % 97 == 0)
+    missing |= (ts // MINUTE_MS % 60 == 59) & (ts // MINUTE_MS % 7 == 0)
+    return {name: values[~missing] for name, values in columns.items()}
+
+
+def stream(resampler, columns):
+    closed = {interval: [] for interval in INTERVALS}
+    for row in zip(*(columns[name] for name in FIELDS)):
+        for interval, bar in resampler.update(*row):
+            closed[interval].append(bar)
+    return {interval: {name: np.array([bar[name] for bar in bars], dtype=np.float64) for name in FIELDS}
+            for interval, bars in closed.items()}
+
+
+class TestStreamingResampler(unittest.TestCase):
+    """Both paths produce identical bars"""
+
+    def assert_bars_equal(self, actual, expected):
+        for interval in INTERVALS:
+            for name in FIELDS:
+                np.testing.assert_allclose(actual[interval][name], expected[interval][name],
+                                           rtol=1e-12, err_msg=f"{interval} {name}")
+
+    def test_streaming_matches_backfill(self):
+        columns = minute_candles()
+        streaming = StreamingResampler(INTERVALS)
+        batch = StreamingResampler(INTERVALS)
+
+        streamed = stream(streaming, columns)
+        backfilled = batch.backfill(columns)
+
+        self.assert_bars_equal(backfilled, streamed)
+        for interval in INTERVALS:
+            expected = streaming.open_bar(interval)
+            for name, value in batch.open_bar(interval).items():
+                self.assertAlmostEqual(value, expected[name], delta=1e-9 * abs(expected[name]))
+        self.assertGreater(len(streamed['1w']['timestamp']), 1)
+
+    def test_weeks_start_on_monday(self):
+        bars = StreamingResampler(INTERVALS).backfill(minute_candles())['1w']
+        for ts in bars['timestamp']:
+            start = datetime.fromtimestamp(ts / 1000, tz=timezone.utc)
+            self.assertEqual((start.weekday(), start.hour, start.minute), (0, 0, 0))
+        # The first (partial) week started on the Monday before the first candle
+        self.assertLess(bars['timestamp'][0], START_MS)
+
+    def test_bar_missing_its_closing_candle(self):
+        columns = minute_candles()
+        minutes = columns['timestamp'] // MINUTE_MS
+        gap = int(minutes[(minutes % 5 == 3) & ~np.isin(minutes + 1, minutes)][0])
+
+        bars = stream(StreamingResampler(INTERVALS), columns)['5m']
+        index = int(np.flatnonzero(bars['timestamp'] == (gap - 3) * MINUTE_MS)[0])
+        last_candle = int(np.flatnonzero(minutes == gap)[0])
+        self.assertEqual(bars['close'][index], columns['close'][last_candle])
+        self.assertEqual(bars['timestamp'][index + 1], (gap + 2) * MINUTE_MS)
+
+    def test_backfill_then_stream_continues_seamlessly(self):
+        columns = minute_candles()
+        split = len(columns['timestamp']) // 2 + 17  # mid-bar for every interval
+        head = {name: values[:split] for name, values in columns.items()}
+        tail = {name: values[split:] for name, values in columns.items()}
+
+        resampler = StreamingResampler(INTERVALS)
+        first = resampler.backfill(head)
+        rest = stream(resampler, tail)
+        combined = {interval: {name: np.concatenate([first[interval][name], rest[interval][name]])
+                               for name in FIELDS} for interval in INTERVALS}
+
+        self.assert_bars_equal(combined, stream(StreamingResampler(INTERVALS), columns))
+
+
+if __name__ == '__main__':
+    unittest.main()
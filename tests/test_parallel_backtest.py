@@ -0,0 +1,39 @@
+"""
+AdvancedBacktestEngine permutation Monte Carlo tests
+"""
+
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from analytics import parallel_backtest
+from analytics.backtest_kernel import run_kernel
+from performance.advanced_backtesting_v2 import AdvancedBacktestEngine
+
+
+class TestPermutationMonteCarlo(unittest.TestCase):
+    """Shuffled runs follow run_backtest's rules"""
+
+    def test_permutation_never_trades_bar_zero(self):
+        prices = list(np.linspace(100.0, 120.0, 50))
+        # Every bar but the first is a BUY: shuffling all bars would move one onto bar 0
+        signals = ['BUY'] * len(prices)
+        results = []
+
+        def record(*args, **kwargs):
+            result = run_kernel(*args, **kwargs)
+            results.append(result)
+            return result
+
+        with mock.patch.object(parallel_backtest, 'run_kernel', side_effect=record):
+            AdvancedBacktestEngine().monte_carlo(prices, signals, trials=1, workers=1, seed=7)
+
+        self.assertEqual(len(results), 1)
+        self.assertGreater(results[0].trade_count, 0)
+        self.assertNotIn(0, results[0].entry_idx.tolist())
+        self.assertNotIn(0, results[0].exit_idx.tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
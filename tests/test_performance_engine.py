@@ -0,0 +1,130 @@
+"""
+PerformanceEngine incremental metrics vs a full recompute over the trades
+"""
+
+import math
+import time
+import unittest
+from dataclasses import fields
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from analytics.performance_engine import (
+    DAY_SECONDS, GROUP_SCORE_FIELDS, HIGH_CONFIDENCE, MEDIUM_CONFIDENCE,
+    PerformanceEngine, PerformanceMetrics,
+)
+
+DAYS = 20
+
+
+def reference_metrics(trades, group_hits, total_signals):
+    """The pre-incremental calculate_metrics: one pass per field over `trades` (record order)"""
+    n = len(trades)
+    wins = [t.pnl for t in trades if t.outcome == 'WIN']
+    losses = [abs(t.pnl) for t in trades if t.outcome == 'LOSS']
+    rr = [t.risk_reward_achieved for t in trades if t.risk_reward_achieved > 0]
+
+    equity = peak = max_drawdown = 0.0
+    for t in trades:
+        equity += t.pnl
+        peak = max(peak, equity)
+        max_drawdown = max(max_drawdown, peak - equity)
+
+    returns = [t.pnl_percent for t in trades]
+    std = np.std(returns) if n >= 2 else 0.0
+    sharpe = float(np.mean(returns) / std * np.sqrt(365)) if n >= 2 and std else 0.0
+
+    def accuracy(selected):
+        return sum(1 for t in selected if t.outcome == 'WIN') / len(selected) * 100 if selected else 0.0
+
+    def group_accuracy(group):
+        flags = [hits[group] for hits in group_hits if group in hits]
+        return sum(flags) / len(flags) * 100 if flags else 0.0
+
+    total_pnl = sum(t.pnl for t in trades)
+    return PerformanceMetrics(
+        total_signals=total_signals,
+        total_trades=n,
+        winning_trades=len(wins),
+        losing_trades=len(losses),
+        breakeven_trades=sum(1 for t in trades if t.outcome == 'BREAKEVEN'),
+        win_rate=len(wins) / n * 100,
+        loss_rate=len(losses) / n * 100,
+        total_pnl=total_pnl,
+        total_pnl_percent=sum(returns),
+        average_win=float(np.mean(wins)) if wins else 0.0,
+        average_loss=float(np.mean(losses)) if losses else 0.0,
+        largest_win=max(wins) if wins else 0.0,
+        largest_loss=max(losses) if losses else 0.0,
+        average_rr_achieved=float(np.mean(rr)) if rr else 0.0,
+        profit_factor=sum(wins) / sum(losses) if losses else 0.0,
+        sharpe_ratio=sharpe,
+        max_drawdown=max_drawdown,
+        max_drawdown_percent=max_drawdown / max(peak, 1) * 100,
+        recovery_factor=total_pnl / max_drawdown if max_drawdown else 0.0,
+        average_trade_duration_hours=float(np.mean([t.duration_hours for t in trades])),
+        total_trading_days=(max(t.exit_time for t in trades) - min(t.entry_time for t in trades)).days + 1,
+        high_confidence_accuracy=accuracy([t for t in trades if t.signal_confidence >= HIGH_CONFIDENCE]),
+        medium_confidence_accuracy=accuracy(
+            [t for t in trades if MEDIUM_CONFIDENCE <= t.signal_confidence < HIGH_CONFIDENCE]),
+        tech_group_accuracy=group_accuracy('technical'),
+        sentiment_group_accuracy=group_accuracy('sentiment'),
+        ml_group_accuracy=group_accuracy('ml'),
+        onchain_group_accuracy=group_accuracy('onchain'),
+        macro_risk_group_accuracy=group_accuracy('macro_risk'),
+    )
+
+
+class TestPerformanceEngine(unittest.TestCase):
+    """All-time and 7d metrics equal the brute-force recompute"""
+
+    def setUp(self):
+        rng = np.random.default_rng(17)
+        self.engine = PerformanceEngine(db_manager=None)
+        self.group_hits = []
+        start = datetime.now(timezone.utc) - timedelta(days=DAYS)
+        for i in range(600):
+            entry_time = start + timedelta(hours=i * DAYS * 24 / 600)
+            exit_time = entry_time + timedelta(minutes=float(rng.uniform(5, 45)))
+            entry = float(rng.uniform(90, 110))
+            exit_ = entry if i % 50 == 0 else entry * float(1 + rng.normal(0, 0.02))
+            signal_data = {field: float(rng.uniform(0, 1)) for field in GROUP_SCORE_FIELDS if rng.random() < 0.8}
+            if i % 3:
+                signal_data['sl'] = entry * 0.98
+            trade = self.engine.record_trade(
+                'BTCUSDT', 'LONG' if i % 2 else 'SHORT', entry, exit_,
+                entry_time, exit_time, float(rng.uniform(0.6, 1.0)), signal_data
+            )
+            self.group_hits.append(self.engine._track_group_performance(signal_data, trade.outcome))
+        for _ in range(25):
+            self.engine.record_signal_generated({})
+
+    def assert_metrics_equal(self, actual, expected):
+        for f in fields(PerformanceMetrics):
+            a, e = getattr(actual, f.name), getattr(expected, f.name)
+            if isinstance(e, int):
+                self.assertEqual(a, e, f.name)
+            else:
+                self.assertTrue(math.isclose(a, e, rel_tol=1e-9, abs_tol=1e-9), f"{f.name}: {a} vs {e}")
+
+    def test_all_time_matches_recompute(self):
+        trades = self.engine.trade_results
+        expected = reference_metrics(trades, self.group_hits, total_signals=25)
+        self.assert_metrics_equal(self.engine.calculate_metrics(), expected)
+        self.assertTrue(math.isclose(self.engine.max_drawdown, expected.max_drawdown, rel_tol=1e-12))
+
+    def test_7d_window_matches_recompute(self):
+        first_day = int(time.time() // DAY_SECONDS) - 6
+        selected = [(t, hits) for t, hits in zip(self.engine.trade_results, self.group_hits)
+                    if int(t.exit_time.timestamp() // DAY_SECONDS) >= first_day]
+        # Windowed figures follow exit order (day buckets); these trades are recorded in it
+        self.assertEqual([t for t, _ in selected], sorted((t for t, _ in selected), key=lambda t: t.exit_time))
+        self.assertLess(len(selected), len(self.engine.trade_results))
+
+        expected = reference_metrics([t for t, _ in selected], [h for _, h in selected], total_signals=25)
+        self.assert_metrics_equal(self.engine.calculate_metrics('7d'), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
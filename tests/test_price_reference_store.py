@@ -0,0 +1,77 @@
+"""
+PriceReferenceStore + RealDataVerifier async cross-validation tests
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+from unittest import mock
+
+from utils.price_reference_store import PriceReferenceStore
+from utils.real_data_verifier_pro import RealDataVerifier
+
+
+class TestPriceReferenceStore(unittest.TestCase):
+    """Freshness window and hit/miss accounting"""
+
+    def test_fresh_and_stale_lookups(self):
+        store = PriceReferenceStore(max_age_seconds=10)
+        store.update('btcusdt', 50000.0, 'BINANCE_WS')
+        self.assertEqual(store.get('BTCUSDT')[0], 50000.0)
+
+        store.update('ETHUSDT', 3000.0, 'BINANCE_WS', timestamp=time.time() - 60)
+        self.assertIsNone(store.get('ETHUSDT'))
+        self.assertIsNone(store.get('SOLUSDT'))
+        self.assertEqual(store.stats['hits'], 1)
+        self.assertEqual(store.stats['misses'], 2)
+        self.assertEqual(store.stats['stale'], 1)
+
+    def test_is_fresh_records_no_stats(self):
+        store = PriceReferenceStore(max_age_seconds=10)
+        store.update_many({'BTCUSDT': 50000.0, 'ETHUSDT': 0}, 'BINANCE_REST_SNAPSHOT')
+        self.assertTrue(store.is_fresh('BTCUSDT'))
+        self.assertFalse(store.is_fresh('ETHUSDT'))
+        self.assertEqual(store.stats['hits'] + store.stats['misses'], 0)
+
+    def test_snapshot_refresh_is_rate_limited(self):
+        store = PriceReferenceStore(min_refresh_interval=60)
+        response = mock.Mock()
+        response.json.return_value = [{'symbol': 'BTCUSDT', 'price': '50000.5'}]
+        with mock.patch('utils.price_reference_store.requests.get', return_value=response) as get:
+            self.assertTrue(store.refresh_snapshot())
+            self.assertFalse(store.refresh_snapshot())
+        self.assertEqual(get.call_count, 1)
+        self.assertEqual(store.get('BTCUSDT')[0], 50000.5)
+
+
+class TestVerifyPriceAsync(unittest.TestCase):
+    """A reference miss must not run HTTP on the event loop"""
+
+    def _run(self, verifier):
+        threads = []
+
+        def fake_verify(symbol, price, exchange):
+            threads.append(threading.current_thread())
+            return True, 'ok'
+
+        with mock.patch.object(verifier, 'verify_price', side_effect=fake_verify):
+            result = asyncio.run(verifier.verify_price_async('BTCUSDT', 50000.0, 'binance'))
+        return result, threads[0]
+
+    def test_fresh_reference_is_checked_inline(self):
+        verifier = RealDataVerifier(reference_store=PriceReferenceStore())
+        verifier.reference_store.update('BTCUSDT', 50000.0, 'BINANCE_WS')
+        result, thread = self._run(verifier)
+        self.assertTrue(result)
+        self.assertIs(thread, threading.main_thread())
+
+    def test_miss_is_offloaded_to_a_worker_thread(self):
+        verifier = RealDataVerifier(reference_store=PriceReferenceStore())
+        result, thread = self._run(verifier)
+        self.assertTrue(result)
+        self.assertIsNot(thread, threading.main_thread())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+"""
+ColumnarRingBuffer wraparound / zero-copy view tests
+"""
+
+import unittest
+
+import numpy as np
+
+from utils.ring_buffer import ColumnarRingBuffer
+
+
+def candle(i):
+    return {'timestamp': float(i), 'open': i + 0.1, 'high': i + 0.5, 'low': i - 0.5, 'close': i + 0.2, 'volume': 10.0 * i}
+
+
+class TestColumnarRingBuffer(unittest.TestCase):
+    """The last N rows are always one contiguous, aliasing slice"""
+
+    def test_wraparound_keeps_last_capacity_rows_in_order(self):
+        buf = ColumnarRingBuffer(5)
+        for i in range(13):
+            buf.append(**candle(i))
+
+        self.assertEqual(len(buf), 5)
+        self.assertEqual(buf.total_appended, 13)
+        np.testing.assert_array_equal(buf.view('timestamp'), [8, 9, 10, 11, 12])
+        np.testing.assert_array_equal(buf.view('close', 2), [11.2, 12.2])
+        self.assertEqual(buf.row(0), candle(8))
+        self.assertEqual(buf.row(-1), candle(12))
+        self.assertEqual(buf.rows(3), [candle(i) for i in (10, 11, 12)])
+
+        # Bulk extend crosses the wrap point the same way
+        bulk = ColumnarRingBuffer(5)
+        bulk.extend({name: [candle(i)[name] for i in range(13)] for name in buf.fields})
+        for name in buf.fields:
+            np.testing.assert_array_equal(bulk.view(name), buf.view(name))
+
+    def test_views_are_zero_copy_and_read_only(self):
+        buf = ColumnarRingBuffer(4)
+        for i in range(6):
+            buf.append(**candle(i))
+
+        closes = buf.view('close')
+        self.assertTrue(closes.flags['C_CONTIGUOUS'])
+        self.assertTrue(np.shares_memory(closes, buf._data['close']))
+        self.assertFalse(closes.flags.writeable)
+        with self.assertRaises(ValueError):
+            closes[0] = 0.0
+
+        views = buf.views(2)
+        self.assertTrue(all(np.shares_memory(views[name], buf._data[name]) for name in buf.fields))
+
+    def test_append_vs_update_last(self):
+        buf = ColumnarRingBuffer(3)
+        for i in range(4):
+            buf.append(**candle(i))
+        closes = buf.view('close')
+
+        # update_last rewrites the newest row in place - same length, views see it
+        buf.update_last(close=99.0, volume=1.0)
+        self.assertEqual(len(buf), 3)
+        self.assertEqual(buf.total_appended, 4)
+        self.assertEqual(closes[-1], 99.0)
+        self.assertEqual(buf.row(-1), {**candle(3), 'close': 99.0, 'volume': 1.0})
+        self.assertEqual(buf.latest('close'), 99.0)
+
+        # append adds a row (evicting the oldest); missing fields are NaN
+        buf.append(timestamp=4.0, close=4.2)
+        np.testing.assert_array_equal(buf.view('timestamp'), [2, 3, 4])
+        np.testing.assert_array_equal(buf.view('close'), [2.2, 99.0, 4.2])
+        self.assertTrue(np.isnan(buf.latest('open')))
+
+        with self.assertRaises(IndexError):
+            ColumnarRingBuffer(2).update_last(close=1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+"""
+RollingCorrelationMatrix vs np.corrcoef + forward-fill / regime-break tests
+"""
+
+import unittest
+
+import numpy as np
+
+from utils.rolling_correlation import RollingCorrelationMatrix
+
+SYMBOLS = ['BTCUSDT', 'ETHUSDT', 'SOLUSDT', 'BNBUSDT']
+BAR_MS = 60_000
+
+
+def closes_from_returns(returns: np.ndarray, start: float = 100.0) -> np.ndarray:
+    """Close path (bars × symbols) whose log returns are `returns`"""
+    return start * np.exp(np.vstack([np.zeros(returns.shape[1]), np.cumsum(returns, axis=0)]))
+
+
+class TestRollingCorrelation(unittest.TestCase):
+    """Incremental moments match a from-scratch computation"""
+
+    def test_matches_corrcoef_with_shuffled_arrivals(self):
+        window = 50
+        rng = np.random.default_rng(3)
+        mixing = rng.normal(size=(len(SYMBOLS), len(SYMBOLS)))
+        returns = rng.normal(0, 0.01, size=(2 * window + 37, len(SYMBOLS))) @ mixing
+        closes = closes_from_returns(returns)
+
+        matrix = RollingCorrelationMatrix(SYMBOLS, windows=(20, window))
+        for bar, row in enumerate(closes):
+            for i in rng.permutation(len(SYMBOLS)):
+                matrix.on_kline(SYMBOLS[i], bar * BAR_MS, row[i])
+
+        self.assertEqual(matrix.bars, len(returns))
+        names, corr = matrix.matrix(window)
+        self.assertEqual(names, SYMBOLS)
+        expected = np.corrcoef(np.log(closes[1:] / closes[:-1])[-window:].T)
+        np.testing.assert_allclose(corr, expected, rtol=0, atol=1e-13)
+        np.testing.assert_allclose(matrix.covariance(window), np.cov(returns[-window:].T), rtol=0, atol=1e-13)
+
+    def test_missing_symbol_is_forward_filled(self):
+        rng = np.random.default_rng(5)
+        closes = closes_from_returns(rng.normal(0, 0.01, size=(40, 2)))
+        fed = closes.copy()
+        fed[10:13, 1] = np.nan  # ETH silent for three bars
+
+        matrix = RollingCorrelationMatrix(SYMBOLS[:2], windows=(30,))
+        for bar, row in enumerate(fed):
+            for symbol, close in zip(SYMBOLS[:2], row):
+                if not np.isnan(close):
+                    matrix.on_kline(symbol, bar * BAR_MS, close)
+
+        filled = fed.copy()
+        filled[10:13, 1] = filled[9, 1]
+        returns = np.log(filled[1:] / filled[:-1])
+        self.assertTrue((returns[9:12, 1] == 0).all())
+        np.testing.assert_allclose(matrix.covariance(30), np.cov(returns[-30:].T), rtol=0, atol=1e-13)
+
+    def test_one_alert_per_break_episode(self):
+        rng = np.random.default_rng(11)
+        base = rng.normal(0, 0.01, size=210)
+        sign = np.ones(210)
+        sign[100:115] = -1  # first break
+        sign[195:210] = -1  # second break, after the short window recovered
+        closes = closes_from_returns(np.column_stack([base, base * sign]))
+
+        matrix = RollingCorrelationMatrix(SYMBOLS[:2], windows=(20, 80), break_threshold=0.4)
+        alerts = []
+        matrix.on_alert(alerts.append)
+        for bar, row in enumerate(closes):
+            matrix.update(dict(zip(SYMBOLS[:2], row)), bar_time=bar * BAR_MS)
+            if bar == 115:
+                self.assertEqual(len(alerts), 1)
+                self.assertEqual(matrix.get_stats()['active_breaks'], 1)
+
+        self.assertEqual(len(alerts), 2)
+        self.assertEqual(alerts[0]['pair'], 'BTCUSDT/ETHUSDT')
+        self.assertLess(alerts[0]['short_corr'], alerts[0]['long_corr'])
+        self.assertEqual(list(matrix.alerts), alerts)
+
+
+if __name__ == '__main__':
+    unittest.main()
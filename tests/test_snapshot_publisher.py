@@ -0,0 +1,98 @@
+"""
+SnapshotPublisher ETag / 304 / gzip tests + the signal-only state version
+"""
+
+import gzip
+import json
+import unittest
+
+from flask import Flask
+
+from global_state_loader import load_global_state_module
+from utils.snapshot_publisher import SnapshotPublisher
+
+
+class TestSnapshotPublisher(unittest.TestCase):
+    """Conditional GET and version-keyed re-rendering"""
+
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.version = 1
+        self.renders = 0
+        self.publisher = SnapshotPublisher(gzip_min_bytes=64)
+
+        def render(limit):
+            self.renders += 1
+            return {'rows': list(range(limit)), 'version': self.version}
+        self.publisher.register('rows', render, version=lambda: self.version)
+
+    def serve(self, headers=None, limit=50):
+        with self.app.test_request_context('/', headers=headers or {}):
+            return self.publisher.serve('rows', limit)
+
+    def test_matching_if_none_match_returns_304(self):
+        first = self.serve()
+        self.assertEqual(first.status_code, 200)
+        etag = first.headers['ETag']
+
+        second = self.serve({'If-None-Match': etag})
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second.get_data(), b'')
+        self.assertEqual(second.headers['ETag'], etag)
+        self.assertEqual(self.renders, 1)
+        self.assertEqual(self.publisher.get_metrics()['rows']['not_modified'], 1)
+
+    def test_gzip_has_its_own_etag(self):
+        plain = self.serve()
+        zipped = self.serve({'Accept-Encoding': 'gzip'})
+
+        self.assertEqual(zipped.headers['Content-Encoding'], 'gzip')
+        self.assertEqual(zipped.headers['ETag'], plain.headers['ETag'][:-1] + '-gz"')
+        self.assertEqual(gzip.decompress(zipped.get_data()), plain.get_data())
+
+        # The plain ETag does not validate the gzip representation, and vice versa
+        self.assertEqual(self.serve({'Accept-Encoding': 'gzip', 'If-None-Match': plain.headers['ETag']}).status_code, 200)
+        self.assertEqual(self.serve({'Accept-Encoding': 'gzip', 'If-None-Match': zipped.headers['ETag']}).status_code, 304)
+        self.assertEqual(self.renders, 1)
+
+    def test_version_bump_rerenders(self):
+        first = self.serve()
+        self.version += 1
+        second = self.serve({'If-None-Match': first.headers['ETag']})
+
+        self.assertEqual(second.status_code, 200)
+        self.assertNotEqual(second.headers['ETag'], first.headers['ETag'])
+        self.assertEqual(json.loads(second.get_data())['version'], 2)
+        self.assertEqual(self.renders, 2)
+
+        # Variants are cached side by side under one version
+        self.serve(limit=5)
+        self.serve(limit=5)
+        self.assertEqual(self.renders, 3)
+
+
+class TestSignalsVersion(unittest.TestCase):
+    """/api/signals/latest keys on signals_version, which ignores price ticks"""
+
+    def setUp(self):
+        self.state = load_global_state_module().GlobalState()
+
+    def test_market_data_does_not_move_signals_version(self):
+        before = self.state.signals_version
+        for i in range(10):
+            self.state.update_market_data('BTCUSDT', {'price': 50000 + i})
+        self.assertEqual(self.state.signals_version, before)
+        self.assertGreater(self.state.symbols_version, 0)
+
+    def test_add_signal_and_clear_bump_signals_version(self):
+        before = self.state.signals_version
+        self.state.add_signal('BTCUSDT', {'direction': 'LONG', 'confidence': 0.8})
+        after_add = self.state.signals_version
+        self.assertGreater(after_add, before)
+
+        self.state.clear_old_data()
+        self.assertGreater(self.state.signals_version, after_add)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+"""
+TelegramQueue deduplication tests
+"""
+
+import asyncio
+import unittest
+
+from utils.telegram_queue import MessagePriority, TelegramQueue
+
+
+class TestTelegramQueueDedup(unittest.TestCase):
+    """Dedup keys only cover messages that can still be delivered"""
+
+    def _queue(self, max_size: int) -> TelegramQueue:
+        return TelegramQueue(
+            max_size=max_size,
+            enable_persistence=False,
+            digest_priority=None,
+            default_chat_id='chat'
+        )
+
+    def test_accepted_message_blocks_resend(self):
+        async def run():
+            queue = self._queue(max_size=10)
+            self.assertTrue(await queue.add('m1'))
+            self.assertFalse(await queue.add('m1'))
+            self.assertEqual(queue.stats['total_duplicates_blocked'], 1)
+        asyncio.run(run())
+
+    def test_evicted_message_can_be_resent(self):
+        async def run():
+            queue = self._queue(max_size=1)
+            self.assertTrue(await queue.add('m1', MessagePriority.NORMAL))
+            self.assertTrue(await queue.add('m2', MessagePriority.HIGH))
+            self.assertEqual(queue.stats['total_evicted'], 1)
+            self.assertFalse(await queue.add('m1', MessagePriority.NORMAL))
+            self.assertEqual(queue.stats['total_rejected'], 1)
+            self.assertEqual(queue.stats['total_duplicates_blocked'], 0)
+        asyncio.run(run())
+
+    def test_rejected_message_can_be_resent(self):
+        async def run():
+            queue = self._queue(max_size=1)
+            self.assertTrue(await queue.add('m1', MessagePriority.HIGH))
+            self.assertFalse(await queue.add('m2', MessagePriority.NORMAL))
+            self.assertEqual(queue.stats['total_rejected'], 1)
+            self.assertFalse(await queue.add('m2', MessagePriority.NORMAL))
+            self.assertEqual(queue.stats['total_rejected'], 2)
+            self.assertEqual(queue.stats['total_duplicates_blocked'], 0)
+        asyncio.run(run())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,178 @@
+"""
+TieredCache single-flight / stale-while-revalidate / codec tests
+"""
+
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import numpy as np
+
+from utils import tiered_cache
+from utils.tiered_cache import TieredCache, decode, encode
+
+
+class FakeRedis:
+    """get / set(px) / delete over a dict - enough for the Redis tier"""
+
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def set(self, key, value, px=None):
+        self.store[key] = value
+
+    def delete(self, *keys):
+        for key in keys:
+            self.store.pop(key, None)
+
+
+def wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
+
+class TestSingleFlight(unittest.TestCase):
+    """Concurrent misses for one key run the loader once"""
+
+    def test_concurrent_misses_share_one_load(self):
+        cache = TieredCache()
+        release = threading.Event()
+        calls = []
+
+        def loader():
+            calls.append(1)
+            release.wait(timeout=5)
+            return {'price': 50000}
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = [pool.submit(cache.get_or_load, 'prices', 'BTCUSDT', loader, 60) for _ in range(8)]
+            self.assertTrue(wait_until(lambda: cache.get_stats('prices')['coalesced'] == 7))
+            release.set()
+            results = [f.result(timeout=5) for f in futures]
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [{'price': 50000}] * 8)
+        self.assertEqual(cache.get('prices', 'BTCUSDT'), {'price': 50000})
+
+    def test_loader_error_reaches_every_waiter_and_is_not_cached(self):
+        cache = TieredCache()
+        release = threading.Event()
+
+        def loader():
+            release.wait(timeout=5)
+            raise RuntimeError('upstream down')
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = [pool.submit(cache.get_or_load, 'prices', 'ETHUSDT', loader, 60) for _ in range(3)]
+            self.assertTrue(wait_until(lambda: cache.get_stats('prices')['coalesced'] == 2))
+            release.set()
+            for future in futures:
+                with self.assertRaises(RuntimeError):
+                    future.result(timeout=5)
+
+        self.assertIsNone(cache.get('prices', 'ETHUSDT'))
+        self.assertEqual(cache.get_stats('prices')['load_errors'], 1)
+
+
+class TestStaleWhileRevalidate(unittest.TestCase):
+    """Stale values are served at once while one background refresh runs"""
+
+    def test_stale_value_served_then_refreshed(self):
+        cache = TieredCache()
+        cache.set('onchain', 'metrics', 'old', ttl=0.05, stale_ttl=60)
+        time.sleep(0.1)
+        self.assertIsNone(cache.get('onchain', 'metrics'))  # past ttl: not fresh
+
+        release = threading.Event()
+        calls = []
+
+        def loader():
+            calls.append(1)
+            release.wait(timeout=5)
+            return 'new'
+
+        self.assertEqual(cache.get_or_load('onchain', 'metrics', loader, 60, 60), 'old')
+        self.assertTrue(wait_until(lambda: calls))
+        # Refresh already in flight: still stale, no second load
+        self.assertEqual(cache.get_or_load('onchain', 'metrics', loader, 60, 60), 'old')
+        release.set()
+
+        self.assertTrue(wait_until(lambda: cache.get('onchain', 'metrics') == 'new'))
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(cache.get_stats('onchain')['stale_served'], 2)
+
+    def test_past_stale_window_is_a_miss(self):
+        cache = TieredCache()
+        cache.set('onchain', 'metrics', 'old', ttl=0.01, stale_ttl=0.01)
+        time.sleep(0.05)
+        self.assertEqual(cache.get_or_load('onchain', 'metrics', lambda: 'new', 60), 'new')
+
+
+class TestCodec(unittest.TestCase):
+    """Tagged binary codec used by the Redis tier"""
+
+    VALUES = [
+        b'\x00raw\xff',
+        'plain text',
+        {'symbol': 'BTCUSDT', 'levels': [[50000.5, 1.25], [49999.0, 3.0]], 'ok': True, 'none': None},
+        [1, 2.5, 'x'],
+    ]
+
+    def assert_round_trip(self):
+        for value in self.VALUES:
+            self.assertEqual(decode(encode(value)), value)
+
+        array = np.arange(12, dtype=np.float32).reshape(3, 4)
+        decoded = decode(encode(array))
+        self.assertEqual(decoded.dtype, np.float32)
+        np.testing.assert_array_equal(decoded, array)
+        self.assertTrue(decoded.flags.writeable)
+
+    def test_json_round_trip(self):
+        with mock.patch.object(tiered_cache, 'MSGPACK_AVAILABLE', False):
+            self.assertEqual(encode({'a': 1})[0], tiered_cache._TAG_JSON)
+            self.assert_round_trip()
+
+    @unittest.skipUnless(tiered_cache.MSGPACK_AVAILABLE, 'msgpack not installed')
+    def test_msgpack_round_trip(self):
+        self.assertEqual(encode({'a': 1})[0], tiered_cache._TAG_MSGPACK)
+        self.assert_round_trip()
+
+    def test_large_payload_is_compressed(self):
+        value = 'x' * 10_000
+        data = encode(value)
+        self.assertEqual(data[0], tiered_cache._TAG_STR | tiered_cache._ZLIB)
+        self.assertLess(len(data), 200)
+        self.assertEqual(decode(data), value)
+
+        # Incompressible payloads stay raw
+        noise = np.random.default_rng(0).bytes(4096)
+        self.assertEqual(encode(noise)[0], tiered_cache._TAG_BYTES)
+
+    def test_unknown_tag(self):
+        with self.assertRaises(ValueError):
+            decode(b'\x7fpayload')
+
+    def test_redis_hit_is_decoded_and_promoted(self):
+        redis = FakeRedis()
+        writer, reader = TieredCache(redis_client=redis), TieredCache(redis_client=redis)
+        array = np.linspace(0, 1, 5)
+        writer.set('features', 'BTCUSDT', array, ttl=60)
+
+        np.testing.assert_array_equal(reader.get('features', 'BTCUSDT'), array)
+        reader.get('features', 'BTCUSDT')
+        stats = reader.get_stats('features')
+        self.assertEqual((stats['redis_hits'], stats['local_hits']), (1, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+"""
+BinanceWebSocketManager pipeline queue + per-stage metrics tests
+"""
+
+import asyncio
+import json
+import time
+import unittest
+
+from integrations.binance_websocket_v3 import BinanceWebSocketManager, ConflatingQueue
+
+
+def book_ticker(symbol: str, bid: float) -> str:
+    return json.dumps({'e': 'bookTicker', 's': symbol, 'b': str(bid), 'a': str(bid + 1)})
+
+
+class TestConflatingQueue(unittest.TestCase):
+    """Latest-wins conflation and drop-oldest overflow"""
+
+    def test_conflation_keeps_position_and_enqueue_time(self):
+        async def run():
+            queue = ConflatingQueue(10)
+            queue.put_nowait((1.0, 'BTC', 'old'), key='BTC')
+            queue.put_nowait((2.0, 'ETH', 'only'), key='ETH')
+            queue.put_nowait((3.0, 'BTC', 'new'), key='BTC')
+
+            self.assertEqual(queue.qsize(), 2)
+            self.assertEqual(queue.conflated, 1)
+            self.assertEqual(await queue.get(), (1.0, 'BTC', 'new'))
+            self.assertEqual(await queue.get(), (2.0, 'ETH', 'only'))
+
+            # Once taken, the key is no longer pending
+            queue.put_nowait((4.0, 'BTC', 'next'), key='BTC')
+            self.assertEqual(await queue.get(), (4.0, 'BTC', 'next'))
+        asyncio.run(run())
+
+    def test_overflow_drops_oldest(self):
+        async def run():
+            queue = ConflatingQueue(2)
+            queue.put_nowait((1.0, 'a'), key='A')
+            queue.put_nowait((2.0, 'b'))
+            queue.put_nowait((3.0, 'c'))
+
+            stats = queue.get_stats()
+            self.assertEqual(stats['dropped'], 1)
+            self.assertEqual(stats['depth'], 2)
+            self.assertEqual(stats['high_water'], 2)
+
+            # The dropped keyed item no longer absorbs updates for its key
+            queue.put_nowait((4.0, 'a2'), key='A')
+            self.assertEqual(queue.conflated, 0)
+            self.assertEqual([await queue.get() for _ in range(2)], [(3.0, 'c'), (4.0, 'a2')])
+        asyncio.run(run())
+
+
+class TestPipelineMetrics(unittest.TestCase):
+    """Frames flow decode → verify → fan-out and every stage is measured"""
+
+    def setUp(self):
+        self.manager = BinanceWebSocketManager()
+        self.addCleanup(self.manager.stop)
+        self.delivered = []
+
+        async def process(kind, data):
+            self.delivered.append((kind, data['s'], data['b']))
+        self.manager._process_message = process
+
+    def test_stages_process_and_conflate(self):
+        manager = self.manager
+
+        async def run():
+            manager._start_pipeline()
+            try:
+                decode = manager.pipeline_queues['decode']
+                backlog_start = time.perf_counter() - 0.5
+                for i, symbol in enumerate(('BTCUSDT', 'ETHUSDT', 'BTCUSDT')):
+                    decode.put_nowait((backlog_start, time.time(), book_ticker(symbol, 100 + i)))
+                for _ in range(100):
+                    if ('bookTicker', 'BTCUSDT', '102') in self.delivered and len(self.delivered) >= 2:
+                        break
+                    await asyncio.sleep(0.01)
+            finally:
+                await manager._stop_pipeline()
+
+        asyncio.run(run())
+
+        pipeline = manager.get_metrics()['pipeline']
+        self.assertEqual(pipeline['stages']['decode']['processed'], 3)
+        self.assertGreaterEqual(pipeline['stages']['decode']['max_latency_ms'], 500)
+        self.assertEqual(pipeline['queues']['decode']['enqueued'], 3)
+        self.assertEqual(
+            pipeline['stages']['fanout']['processed'],
+            pipeline['stages']['verify']['processed'] - pipeline['stale_dropped']
+        )
+        # The latest BTC update always arrives, whether or not it was conflated
+        btc = [bid for _, symbol, bid in self.delivered if symbol == 'BTCUSDT']
+        self.assertEqual(btc[-1], '102')
+        self.assertIn(('bookTicker', 'ETHUSDT', '101'), self.delivered)
+
+    def test_conflated_update_keeps_original_wait(self):
+        manager = self.manager
+
+        async def run():
+            manager._start_pipeline()
+            try:
+                verify = manager.pipeline_queues['verify']
+                waited_since = time.perf_counter() - 0.5
+                data = json.loads(book_ticker('BTCUSDT', 100))
+                verify.put_nowait((waited_since, time.time(), 'bookTicker', data), key=('bookTicker', 'BTCUSDT'))
+                newer = dict(data, b='101')
+                verify.put_nowait((time.perf_counter(), time.time(), 'bookTicker', newer), key=('bookTicker', 'BTCUSDT'))
+                for _ in range(100):
+                    if self.delivered:
+                        break
+                    await asyncio.sleep(0.01)
+            finally:
+                await manager._stop_pipeline()
+
+        asyncio.run(run())
+
+        self.assertEqual(manager.pipeline_queues['verify'].conflated, 1)
+        self.assertEqual(self.delivered, [('bookTicker', 'BTCUSDT', '101')])
+        self.assertGreaterEqual(manager.stage_metrics['verify']['max_latency_ms'], 500)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,177 @@
+"""
+WriteBehindWriter after_insert hook + SignalRollup batch-row tests (fake DB)
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from unittest import mock
+
+import psycopg2
+
+from utils import signal_rollups, write_behind
+from utils.signal_rollups import SCORE_COLUMNS, SignalRollup
+from utils.write_behind import WriteBehindWriter
+
+COLUMNS = ('timestamp', 'symbol', 'direction', 'confidence', 'data_source')
+
+
+class FakeDB:
+    """Stands in for psycopg2: records committed rows, fails on request"""
+
+    def __init__(self):
+        self.committed = []
+        self.reject_batches = False   # multi-row INSERT refused as bad data
+        self.bad_rows = set()         # rows refused on their own
+        self.down = False             # connection-level failure
+
+    @contextmanager
+    def connect(self):
+        if self.down:
+            raise psycopg2.OperationalError('connection refused')
+        yield FakeConnection(self)
+
+    def execute_values(self, cursor, sql, rows, template=None, page_size=100):
+        if self.reject_batches and len(rows) > 1:
+            raise psycopg2.DataError('value too long')
+        if any(row in self.bad_rows for row in rows):
+            raise psycopg2.DataError('bad row')
+        cursor.connection.pending.extend(rows)
+
+
+class FakeConnection:
+    def __init__(self, db):
+        self.db = db
+        self.pending = []
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.db.committed.extend(self.pending)
+        self.pending = []
+
+    def rollback(self):
+        self.pending = []
+
+
+class FakeCursor:
+    def __init__(self, connection):
+        self.connection = connection
+        self.savepoint = 0
+
+    def execute(self, sql):
+        if sql.startswith('SAVEPOINT'):
+            self.savepoint = len(self.connection.pending)
+        elif sql.startswith('ROLLBACK TO SAVEPOINT'):
+            del self.connection.pending[self.savepoint:]
+
+    def close(self):
+        pass
+
+
+def signal_row(symbol, confidence=0.8, source='live'):
+    return (datetime(2024, 1, 1, 12, tzinfo=timezone.utc), symbol, 'LONG', confidence, source)
+
+
+class TestAfterInsertHook(unittest.TestCase):
+    """The hook sees exactly the rows the database accepted"""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp, True)
+        self.db = FakeDB()
+        patch = mock.patch.object(write_behind, 'execute_values', self.db.execute_values)
+        patch.start()
+        self.addCleanup(patch.stop)
+
+        self.hooked = []
+        self.writer = WriteBehindWriter('test', self.db.connect, journal_dir=self.tmp, autostart=False)
+        self.writer.register_table('signals', COLUMNS, after_insert=lambda cursor, rows: self.hooked.append(list(rows)))
+
+    def test_hook_runs_once_per_batch(self):
+        rows = [signal_row(s) for s in ('BTCUSDT', 'ETHUSDT', 'SOLUSDT')]
+        for row in rows:
+            self.writer.write('signals', row)
+
+        self.assertTrue(self.writer.flush())
+        self.assertEqual(self.hooked, [rows])
+        self.assertEqual(self.db.committed, rows)
+
+    def test_hook_runs_per_row_on_fallback_and_skips_rejected_rows(self):
+        good, bad, other = signal_row('BTCUSDT'), signal_row('X' * 30), signal_row('ETHUSDT')
+        self.db.reject_batches = True
+        self.db.bad_rows = {bad}
+        for row in (good, bad, other):
+            self.writer.write('signals', row)
+
+        self.assertTrue(self.writer.flush())
+        self.assertEqual(self.hooked, [[good], [other]])
+        self.assertEqual(self.db.committed, [good, other])
+        self.assertEqual(self.writer.stats['rows_rejected'], 1)
+        self.assertEqual(self.writer.stats['rows_written'], 2)
+
+    def test_hook_skipped_when_insert_fails(self):
+        self.db.down = True
+        self.writer.write('signals', signal_row('BTCUSDT'))
+
+        self.assertFalse(self.writer.flush())
+        self.assertEqual(self.hooked, [])
+        self.assertEqual(self.writer.stats['rows_spilled'], 1)
+        self.assertTrue(os.path.getsize(self.writer.journal_path) > 0)
+
+
+class TestSignalRollup(unittest.TestCase):
+    """Column mapping from signal rows to the rollup VALUES list"""
+
+    def test_batch_row_maps_columns(self):
+        columns = ('symbol', 'ml_group_score', 'direction', 'timestamp', 'confidence', 'data_source')
+        rollup = SignalRollup(columns)
+        row = ('BTCUSDT', 0.4, 'SHORT', '2024-01-01T12:00:00Z', 0.7, None)
+
+        batch_row = rollup._batch_row(row)
+
+        scores = dict(zip((source for source, _ in SCORE_COLUMNS), batch_row[4:]))
+        self.assertEqual(batch_row[:4], ('2024-01-01T12:00:00Z', 'BTCUSDT', 'SHORT', 'unknown'))
+        self.assertEqual(scores['confidence'], 0.7)
+        self.assertEqual(scores['ml_group_score'], 0.4)
+        self.assertEqual({k for k, v in scores.items() if v is None},
+                         {s for s, _ in SCORE_COLUMNS} - {'confidence', 'ml_group_score'})
+
+    def test_required_columns(self):
+        with self.assertRaises(ValueError):
+            SignalRollup(('symbol', 'confidence'))
+
+    def test_replayed_short_rows_are_null_padded(self):
+        tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp, True)
+        db = FakeDB()
+        applied = []
+        patches = [
+            mock.patch.object(write_behind, 'execute_values', db.execute_values),
+            mock.patch.object(signal_rollups, 'execute_values',
+                              lambda cursor, sql, rows, **kwargs: applied.extend(rows)),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        writer = WriteBehindWriter('signals', db.connect, journal_dir=tmp, autostart=False)
+        writer.register_table('signals', COLUMNS, after_insert=SignalRollup(COLUMNS).apply)
+        # Journaled before data_source was added to the table
+        with open(writer.journal_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(['signals', ['2024-01-01T12:00:00+00:00', 'BTCUSDT', 'LONG', 0.9]]) + '\n')
+
+        self.assertTrue(writer.flush())
+        self.assertEqual(db.committed, [('2024-01-01T12:00:00+00:00', 'BTCUSDT', 'LONG', 0.9, None)])
+        self.assertEqual(writer.stats['rows_replayed'], 1)
+        self.assertEqual(applied[0][:5], ('2024-01-01T12:00:00+00:00', 'BTCUSDT', 'LONG', 'unknown', 0.9))
+        self.assertFalse(os.path.exists(writer.journal_path) and os.path.getsize(writer.journal_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
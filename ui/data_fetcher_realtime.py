@@ -14,9 +14,11 @@ from datetime import datetime, timedelta
 from enum import Enum
 import json
 import aiohttp
-from collections import defaultdict, deque
 import hashlib
 import time
+import numpy as np
+
+from utils.ring_buffer import ColumnarRingBuffer
 
 logger = logging.getLogger(__name__)
 
@@ -49,14 +51,15 @@ class Candle:
 
 
 class CandleCache:
-    """Mum verisi cache'i"""
+    """Mum verisi cache'i (anahtar başına kolon bazlı ring buffer)"""
     
     def __init__(self, max_size: int = 1000):
         """
         Args:
             max_size: Maksimum cache boyutu
         """
-        self.cache: Dict[str, deque] = defaultdict(lambda: deque(maxlen=max_size))
+        self.max_size = max_size
+        self.cache: Dict[str, ColumnarRingBuffer] = {}
         self.last_update: Dict[str, float] = {}
         self.checksums: Dict[str, str] = {}
     
@@ -64,21 +67,33 @@ class CandleCache:
         """Mum ekle"""
         
         try:
-            self.cache[key].append(candle)
+            if key not in self.cache:
+                self.cache[key] = ColumnarRingBuffer(self.max_size)
+            self.cache[key].append_row((
+                candle.timestamp, candle.open, candle.high,
+                candle.low, candle.close, candle.volume
+            ))
             self.last_update[key] = time.time()
             return True
         except Exception as e:
             logger.error(f"Error adding candle to cache: {e}")
             return False
     
+    def get_arrays(self, key: str, count: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """Son mumlerin kopyasız (read-only) NumPy görünümleri"""
+        
+        if key not in self.cache:
+            return {}
+        
+        return self.cache[key].views(count)
+    
     def get_recent(self, key: str, count: int = 100) -> List[Candle]:
         """En son mumleri al"""
         
         if key not in self.cache:
             return []
         
-        candles = list(self.cache[key])
-        return candles[-count:]
+        return [Candle(**row) for row in self.cache[key].rows(count)]
     
     def get_all(self, key: str) -> List[Candle]:
         """Tüm mumleri al"""
@@ -86,7 +101,7 @@ class CandleCache:
         if key not in self.cache:
             return []
         
-        return list(self.cache[key])
+        return [Candle(**row) for row in self.cache[key].rows()]
     
     def get_by_time(
         self,
@@ -99,8 +114,14 @@ class CandleCache:
         if key not in self.cache:
             return []
         
-        return [c for c in self.cache[key] 
-                if start_time <= c.timestamp <= end_time]
+        arrays = self.cache[key].views()
+        timestamps = arrays['timestamp']
+        indices = np.nonzero((timestamps >= start_time) & (timestamps <= end_time))[0]
+        
+        return [
+            Candle(**{name: float(values[i]) for name, values in arrays.items()})
+            for i in indices
+        ]
     
     def clear(self, key: str):
         """Cache'i temizle"""
@@ -10,6 +10,8 @@ from typing import Dict, Any, List, Tuple
 import numpy as np
 from datetime import datetime
 
+from analytics.backtest_kernel import resolve_exits, column, EXIT_REASONS
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,6 +23,131 @@ class GroupSignalBacktester:
         self.group_results = {}
         logger.info("GroupSignalBacktester initialized")
     
+    # ========================================================================
+    # TRADE RESOLUTION (shared backtest kernel)
+    # ========================================================================
+    
+    @staticmethod
+    def _to_epoch(value) -> float:
+        """Timestamp (epoch s/ms, datetime, ISO string) -> epoch seconds."""
+        if value is None:
+            return np.nan
+        if isinstance(value, datetime):
+            return value.timestamp()
+        if isinstance(value, str):
+            try:
+                return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+            except ValueError:
+                return np.nan
+        value = float(value)
+        return value / 1000 if value > 1e12 else value
+    
+    def _resolve_trades(
+        self,
+        group: str,
+        signals: List[Dict],
+        ohlcv_data: List[Dict]
+    ) -> List[Dict]:
+        """
+        Build trades for one group.
+        
+        With candles, each signal is entered at the first candle at/after its
+        timestamp and exits on whichever of SL / TP1 the price path hits first
+        (last close if neither). Without candles (or timestamps), TP1 is
+        assumed to be hit. PnL is in percent of entry.
+        """
+        rows = [
+            signal for signal in signals
+            if signal.get('group') == group
+            and signal.get('entry_price', 0) and signal.get('tp1', 0)
+            and signal.get('direction', '') in ('LONG', 'SHORT')
+        ]
+        if not rows:
+            return []
+        
+        entry = np.array([float(r['entry_price']) for r in rows])
+        tp1 = np.array([float(r['tp1']) for r in rows])
+        tp2 = np.array([float(r.get('tp2') or 0) for r in rows])
+        sl = np.array([float(r.get('sl') or 0) for r in rows])
+        is_long = np.array([r['direction'] == 'LONG' for r in rows])
+        sign = np.where(is_long, 1.0, -1.0)
+        
+        pnl_tp1 = sign * (tp1 - entry) / entry * 100
+        pnl_tp2 = np.where(tp2 > 0, sign * (tp2 - entry) / entry * 100, 0.0)
+        pnl = pnl_tp1.copy()
+        reasons = np.full(len(rows), 'take_profit', dtype=object)
+        
+        # Resolve against candles, per symbol when candles carry one
+        if ohlcv_data:
+            by_symbol: Dict[Any, List[int]] = {}
+            for k, row in enumerate(rows):
+                by_symbol.setdefault(row.get('symbol'), []).append(k)
+            
+            for symbol, indices in by_symbol.items():
+                candles = [
+                    c for c in ohlcv_data
+                    if 'symbol' not in c or symbol is None or c['symbol'] == symbol
+                ]
+                if not candles:
+                    continue
+                
+                times = np.array([self._to_epoch(c.get('timestamp')) for c in candles])
+                close = column(candles, 'close')
+                high = np.array([c.get('high', c['close']) for c in candles], dtype=np.float64)
+                low = np.array([c.get('low', c['close']) for c in candles], dtype=np.float64)
+                
+                indices = np.array(indices)
+                signal_times = np.array([self._to_epoch(rows[k].get('timestamp')) for k in indices])
+                bars = np.searchsorted(times, signal_times, side='left')
+                valid = ~np.isnan(signal_times) & (bars < len(candles))
+                if not valid.any():
+                    continue
+                
+                indices = indices[valid]
+                exit_idx, exit_price, reason = resolve_exits(
+                    bars[valid], is_long[indices], sl[indices], tp1[indices],
+                    high, low, close
+                )
+                pnl[indices] = sign[indices] * (exit_price - entry[indices]) / entry[indices] * 100
+                reasons[indices] = [EXIT_REASONS[int(r)] for r in reason]
+        
+        return [
+            {
+                'symbol': row.get('symbol'),
+                'entry': entry[k],
+                'tp1': tp1[k],
+                'tp2': tp2[k],
+                'sl': sl[k],
+                'pnl': float(pnl[k]),
+                'pnl_tp1': float(pnl_tp1[k]),
+                'pnl_tp2': float(pnl_tp2[k]),
+                'exit_reason': reasons[k],
+                'direction': row['direction'],
+                'timestamp': row.get('timestamp')
+            }
+            for k, row in enumerate(rows)
+        ]
+    
+    def _group_metrics(self, group: str, trades: List[Dict]) -> Dict[str, Any]:
+        """Basic metrics for a group."""
+        pnl_list = np.array([t['pnl'] for t in trades])
+        winning = int(np.count_nonzero(pnl_list > 0))
+        total_pnl = float(pnl_list.sum())
+        
+        return {
+            'group': group,
+            'total_trades': len(trades),
+            'winning_trades': winning,
+            'losing_trades': len(trades) - winning,
+            'win_rate': winning / len(trades),
+            'total_pnl': total_pnl,
+            'avg_pnl': total_pnl / len(trades)
+        }
+    
+    # ========================================================================
+    # GROUP BACKTESTS
+    # ========================================================================
+    
     def backtest_technical_signals(
         self,
         signals: List[Dict],
@@ -28,45 +155,8 @@ class GroupSignalBacktester:
     ) -> Dict[str, Any]:
         """Backtest technical signals only."""
         
-        trades = []
         logger.info("Starting technical signals backtest")
-        
-        for signal in signals:
-            if signal.get('group') != 'technical':
-                continue
-            
-            symbol = signal.get('symbol')
-            entry_price = signal.get('entry_price', 0)
-            tp1_price = signal.get('tp1', 0)
-            tp2_price = signal.get('tp2', 0)
-            sl_price = signal.get('sl', 0)
-            direction = signal.get('direction', '')
-            timestamp = signal.get('timestamp')
-            
-            if not entry_price or not tp1_price:
-                continue
-            
-            # Calculate PnL
-            if direction == 'LONG':
-                pnl_tp1 = (tp1_price - entry_price) * 100
-                pnl_tp2 = (tp2_price - entry_price) * 100 if tp2_price else 0
-            elif direction == 'SHORT':
-                pnl_tp1 = (entry_price - tp1_price) * 100
-                pnl_tp2 = (entry_price - tp2_price) * 100 if tp2_price else 0
-            else:
-                continue
-            
-            trades.append({
-                'symbol': symbol,
-                'entry': entry_price,
-                'tp1': tp1_price,
-                'tp2': tp2_price,
-                'sl': sl_price,
-                'pnl_tp1': pnl_tp1,
-                'pnl_tp2': pnl_tp2,
-                'direction': direction,
-                'timestamp': timestamp
-            })
+        trades = self._resolve_trades('technical', signals, ohlcv_data)
         
         if not trades:
             logger.warning("No technical trades found for backtest")
@@ -81,17 +171,12 @@ class GroupSignalBacktester:
             }
         
         # Calculate metrics
-        winning = len([t for t in trades if t['pnl_tp1'] > 0])
-        losing = len(trades) - winning
-        total_pnl = sum(t['pnl_tp1'] for t in trades)
-        avg_pnl = total_pnl / len(trades) if trades else 0
-        max_pnl = max([t['pnl_tp1'] for t in trades])
-        min_pnl = min([t['pnl_tp1'] for t in trades])
+        metrics = self._group_metrics('technical', trades)
+        pnl_list = [t['pnl'] for t in trades]
         
         # Calculate Sharpe ratio
-        pnl_list = [t['pnl_tp1'] for t in trades]
         std_dev = np.std(pnl_list) if pnl_list else 1.0
-        sharpe = (avg_pnl / std_dev) if std_dev > 0 else 0
+        sharpe = (metrics['avg_pnl'] / std_dev) if std_dev > 0 else 0
         
         # Calculate max drawdown
         cumulative_pnl = np.cumsum(pnl_list)
@@ -99,19 +184,12 @@ class GroupSignalBacktester:
         drawdown = (cumulative_pnl - running_max) / running_max
         max_drawdown = np.min(drawdown) if len(drawdown) > 0 else 0
         
-        metrics = {
-            'group': 'technical',
-            'total_trades': len(trades),
-            'winning_trades': winning,
-            'losing_trades': losing,
-            'win_rate': winning / len(trades) if trades else 0,
-            'total_pnl': total_pnl,
-            'avg_pnl': avg_pnl,
-            'max_pnl': max_pnl,
-            'min_pnl': min_pnl,
+        metrics.update({
+            'max_pnl': max(pnl_list),
+            'min_pnl': min(pnl_list),
             'sharpe_ratio': sharpe,
             'max_drawdown': max_drawdown
-        }
+        })
         
         logger.info(
             f"Technical backtest: {metrics['total_trades']} trades, "
@@ -127,28 +205,8 @@ class GroupSignalBacktester:
     ) -> Dict[str, Any]:
         """Backtest sentiment signals only."""
         
-        trades = []
         logger.info("Starting sentiment signals backtest")
-        
-        for signal in signals:
-            if signal.get('group') != 'sentiment':
-                continue
-            
-            entry_price = signal.get('entry_price', 0)
-            tp1_price = signal.get('tp1', 0)
-            direction = signal.get('direction', '')
-            
-            if not entry_price or not tp1_price:
-                continue
-            
-            if direction == 'LONG':
-                pnl = (tp1_price - entry_price) * 100
-            elif direction == 'SHORT':
-                pnl = (entry_price - tp1_price) * 100
-            else:
-                continue
-            
-            trades.append({'pnl': pnl})
+        trades = self._resolve_trades('sentiment', signals, ohlcv_data)
         
         if not trades:
             logger.warning("No sentiment trades found for backtest")
@@ -160,18 +218,7 @@ class GroupSignalBacktester:
                 'avg_pnl': 0.0
             }
         
-        winning = len([t for t in trades if t['pnl'] > 0])
-        total_pnl = sum(t['pnl'] for t in trades)
-        
-        metrics = {
-            'group': 'sentiment',
-            'total_trades': len(trades),
-            'winning_trades': winning,
-            'losing_trades': len(trades) - winning,
-            'win_rate': winning / len(trades),
-            'total_pnl': total_pnl,
-            'avg_pnl': total_pnl / len(trades)
-        }
+        metrics = self._group_metrics('sentiment', trades)
         
         logger.info(
             f"Sentiment backtest: {metrics['total_trades']} trades, "
@@ -187,28 +234,8 @@ class GroupSignalBacktester:
     ) -> Dict[str, Any]:
         """Backtest ML signals only."""
         
-        trades = []
         logger.info("Starting ML signals backtest")
-        
-        for signal in signals:
-            if signal.get('group') != 'ml':
-                continue
-            
-            entry_price = signal.get('entry_price', 0)
-            tp1_price = signal.get('tp1', 0)
-            direction = signal.get('direction', '')
-            
-            if not entry_price or not tp1_price:
-                continue
-            
-            if direction == 'LONG':
-                pnl = (tp1_price - entry_price) * 100
-            elif direction == 'SHORT':
-                pnl = (entry_price - tp1_price) * 100
-            else:
-                continue
-            
-            trades.append({'pnl': pnl})
+        trades = self._resolve_trades('ml', signals, ohlcv_data)
         
         if not trades:
             logger.warning("No ML trades found for backtest")
@@ -220,18 +247,7 @@ class GroupSignalBacktester:
                 'avg_pnl': 0.0
             }
         
-        winning = len([t for t in trades if t['pnl'] > 0])
-        total_pnl = sum(t['pnl'] for t in trades)
-        
-        metrics = {
-            'group': 'ml',
-            'total_trades': len(trades),
-            'winning_trades': winning,
-            'losing_trades': len(trades) - winning,
-            'win_rate': winning / len(trades),
-            'total_pnl': total_pnl,
-            'avg_pnl': total_pnl / len(trades)
-        }
+        metrics = self._group_metrics('ml', trades)
         
         logger.info(
             f"ML backtest: {metrics['total_trades']} trades, "
@@ -247,28 +263,8 @@ class GroupSignalBacktester:
     ) -> Dict[str, Any]:
         """Backtest OnChain signals only."""
         
-        trades = []
         logger.info("Starting OnChain signals backtest")
-        
-        for signal in signals:
-            if signal.get('group') != 'onchain':
-                continue
-            
-            entry_price = signal.get('entry_price', 0)
-            tp1_price = signal.get('tp1', 0)
-            direction = signal.get('direction', '')
-            
-            if not entry_price or not tp1_price:
-                continue
-            
-            if direction == 'LONG':
-                pnl = (tp1_price - entry_price) * 100
-            elif direction == 'SHORT':
-                pnl = (entry_price - tp1_price) * 100
-            else:
-                continue
-            
-            trades.append({'pnl': pnl})
+        trades = self._resolve_trades('onchain', signals, ohlcv_data)
         
         if not trades:
             logger.warning("No OnChain trades found for backtest")
@@ -279,18 +275,7 @@ class GroupSignalBacktester:
                 'total_pnl': 0.0
             }
         
-        winning = len([t for t in trades if t['pnl'] > 0])
-        total_pnl = sum(t['pnl'] for t in trades)
-        
-        metrics = {
-            'group': 'onchain',
-            'total_trades': len(trades),
-            'winning_trades': winning,
-            'losing_trades': len(trades) - winning,
-            'win_rate': winning / len(trades),
-            'total_pnl': total_pnl,
-            'avg_pnl': total_pnl / len(trades)
-        }
+        metrics = self._group_metrics('onchain', trades)
         
         logger.info(f"OnChain backtest: {metrics['total_trades']} trades")
         
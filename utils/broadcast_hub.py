@@ -0,0 +1,399 @@
+"""
+Broadcast Hub - subscription-aware, frame-paced SocketIO fan-out
+
+Exchange streams produce hundreds to thousands of updates per second;
+dashboards render at ~10 fps. Instead of one socketio.emit per exchange
+message to every client, producers publish into the hub and a frame loop
+sends, per symbol room:
+
+- State events (ticker, book ticker, kline): latest value per symbol per
+  frame (conflation)
+- Trades: one aggregated `trade_update` per symbol per frame (last trade
+  fields + count / buy / sell volume + most recent trades)
+- Order book: `orderbook_update` as a delta against the previous frame
+  (changed levels; quantity 0 = level removed), with a full snapshot on
+  subscribe, every `snapshot_every` frames, and for degraded clients
+
+Only clients subscribed to a symbol (room `symbol:<SYMBOL>`, or `*` for
+everything) receive it. Slow consumers - clients whose Engine.IO send
+queue backs up - are taken out of the rooms and get plain snapshots of
+their symbols at `slow_fps` until their queue drains.
+
+Usage:
+    hub = BroadcastHub(socketio, fps=10)
+    hub.start()
+    hub.subscribe(request.sid, 'BTCUSDT')
+    hub.publish_state('market_update', 'BTCUSDT', {...})
+"""
+
+import time
+import logging
+import threading
+from collections import defaultdict, deque
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+ALL_SYMBOLS = '*'
+
+
+def room_for(symbol: str) -> str:
+    return f"symbol:{symbol.upper()}"
+
+
+class BroadcastHub:
+    """Per-symbol rooms + per-frame conflation + order book deltas + slow-consumer handling"""
+
+    def __init__(
+        self,
+        socketio,
+        fps: float = 10.0,
+        namespace: str = '/',
+        book_depth: int = 5,
+        snapshot_every: int = 50,
+        trades_per_frame: int = 20,
+        slow_queue_threshold: int = 100,
+        slow_fps: float = 1.0
+    ):
+        """
+        Args:
+            socketio: flask_socketio.SocketIO instance
+            fps: Frames per second sent to clients
+            book_depth: Order book levels per side sent to clients
+            snapshot_every: Full order book snapshot every N frames (delta otherwise)
+            trades_per_frame: Recent trades kept in each aggregated trade_update
+            slow_queue_threshold: Pending Engine.IO packets that mark a client as slow
+            slow_fps: Snapshot rate for slow clients
+        """
+        self.socketio = socketio
+        self.fps = fps
+        self.namespace = namespace
+        self.book_depth = book_depth
+        self.snapshot_every = snapshot_every
+        self.trades_per_frame = trades_per_frame
+        self.slow_queue_threshold = slow_queue_threshold
+        self.slow_fps = slow_fps
+
+        self._lock = threading.Lock()
+        self._running = False
+
+        # Subscriptions
+        self._members: Dict[str, Set[str]] = defaultdict(set)    # symbol -> sids
+        self._client_symbols: Dict[str, Set[str]] = defaultdict(set)
+        self._slow: Dict[str, float] = {}                         # sid -> marked slow at
+
+        # Pending for next frame
+        self._states: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._trades: Dict[str, List[Dict[str, Any]]] = {}
+        self._books: Dict[str, Dict[str, Any]] = {}
+        self._books_dirty: Set[str] = set()
+
+        # Last sent (for deltas / snapshots)
+        self._latest_states: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._books_sent: Dict[str, Dict[str, Dict[float, float]]] = {}
+        self._book_seq: Dict[str, int] = defaultdict(int)
+
+        self.frame = 0
+        self._frame_ms = deque(maxlen=256)
+        self.stats = {
+            'published': 0,
+            'emitted': 0,
+            'conflated': 0,
+            'book_snapshots': 0,
+            'book_deltas': 0,
+            'skipped_no_subscribers': 0,
+            'slow_marked': 0,
+            'slow_recovered': 0,
+            'slow_frames_skipped': 0,
+            'emit_errors': 0,
+        }
+
+    # ------------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------------
+
+    def start(self):
+        if self._running:
+            return
+        self._running = True
+        self.socketio.start_background_task(self._run)
+        logger.info(f"📡 Broadcast hub started ({self.fps:g} fps, book depth {self.book_depth})")
+
+    def stop(self):
+        self._running = False
+
+    def _run(self):
+        interval = 1.0 / self.fps
+        slow_every = max(1, int(round(self.fps / self.slow_fps))) if self.slow_fps > 0 else 0
+        next_frame = time.monotonic()
+        while self._running:
+            start = time.perf_counter()
+            try:
+                self._send_frame()
+                if slow_every and self.frame % slow_every == 0:
+                    self._check_consumers()
+            except Exception as e:
+                logger.error(f"❌ Broadcast frame error: {e}")
+            self._frame_ms.append((time.perf_counter() - start) * 1000)
+
+            next_frame += interval
+            delay = next_frame - time.monotonic()
+            if delay < 0:
+                next_frame = time.monotonic()  # behind: don't try to catch up with a burst
+                delay = 0
+            self.socketio.sleep(delay)
+
+    # ------------------------------------------------------------------------
+    # Subscriptions
+    # ------------------------------------------------------------------------
+
+    def subscribe(self, sid: str, symbol: str):
+        symbol = symbol.upper()
+        with self._lock:
+            self._members[symbol].add(sid)
+            self._client_symbols[sid].add(symbol)
+            slow = sid in self._slow
+        if not slow:
+            self.socketio.server.enter_room(sid, room_for(symbol), namespace=self.namespace)
+        self._send_snapshots(sid, [symbol])
+
+    def unsubscribe(self, sid: str, symbol: Optional[str] = None):
+        with self._lock:
+            symbols = [symbol.upper()] if symbol else list(self._client_symbols.get(sid, ()))
+            for sym in symbols:
+                self._members[sym].discard(sid)
+                self._client_symbols[sid].discard(sym)
+        for sym in symbols:
+            try:
+                self.socketio.server.leave_room(sid, room_for(sym), namespace=self.namespace)
+            except Exception:
+                pass
+
+    def disconnect(self, sid: str):
+        """Drop all state for a client (rooms are cleaned up by Socket.IO itself)"""
+        with self._lock:
+            for sym in self._client_symbols.pop(sid, ()):
+                self._members[sym].discard(sid)
+            self._slow.pop(sid, None)
+
+    def _has_subscribers(self, symbol: str) -> bool:
+        return bool(self._members.get(symbol)) or bool(self._members.get(ALL_SYMBOLS))
+
+    # ------------------------------------------------------------------------
+    # Producers (any thread)
+    # ------------------------------------------------------------------------
+
+    def publish_state(self, event: str, symbol: str, payload: Dict[str, Any]):
+        """State update: only the latest per (event, symbol) is sent each frame"""
+        key = (event, symbol.upper())
+        with self._lock:
+            self.stats['published'] += 1
+            if key in self._states:
+                self.stats['conflated'] += 1
+            self._states[key] = payload
+
+    def publish_trade(self, symbol: str, trade: Dict[str, Any]):
+        """Trade print: aggregated per symbol per frame"""
+        symbol = symbol.upper()
+        with self._lock:
+            self.stats['published'] += 1
+            trades = self._trades.setdefault(symbol, [])
+            if trades:
+                self.stats['conflated'] += 1
+            trades.append(trade)
+
+    def publish_book(self, symbol: str, bids: List[List[float]], asks: List[List[float]], **extra: Any):
+        """Order book state: top `book_depth` levels, delta-encoded per frame"""
+        symbol = symbol.upper()
+        with self._lock:
+            self.stats['published'] += 1
+            if symbol in self._books_dirty:
+                self.stats['conflated'] += 1
+            self._books[symbol] = {
+                'bids': {float(p): float(q) for p, q in bids[:self.book_depth]},
+                'asks': {float(p): float(q) for p, q in asks[:self.book_depth]},
+                'extra': extra,
+            }
+            self._books_dirty.add(symbol)
+
+    # ------------------------------------------------------------------------
+    # Frame
+    # ------------------------------------------------------------------------
+
+    def _emit(self, event: str, payload: Dict[str, Any], symbol: Optional[str] = None, sid: Optional[str] = None):
+        to = sid if sid else [room_for(symbol), room_for(ALL_SYMBOLS)]
+        try:
+            self.socketio.emit(event, payload, to=to, namespace=self.namespace)
+            self.stats['emitted'] += 1
+        except Exception as e:
+            self.stats['emit_errors'] += 1
+            logger.debug(f"Broadcast emit failed ({event}): {e}")
+
+    def _send_frame(self):
+        with self._lock:
+            self.frame += 1
+            states, self._states = self._states, {}
+            trades, self._trades = self._trades, {}
+            dirty, self._books_dirty = self._books_dirty, set()
+            books = {symbol: self._books[symbol] for symbol in dirty}
+            self._latest_states.update(states)
+
+        for (event, symbol), payload in states.items():
+            if self._has_subscribers(symbol):
+                self._emit(event, payload, symbol)
+            else:
+                self.stats['skipped_no_subscribers'] += 1
+
+        for symbol, prints in trades.items():
+            if not self._has_subscribers(symbol):
+                self.stats['skipped_no_subscribers'] += 1
+                continue
+            self._emit('trade_update', self._aggregate_trades(symbol, prints), symbol)
+
+        full = self.snapshot_every > 0 and self.frame % self.snapshot_every == 0
+        for symbol, book in books.items():
+            if not self._has_subscribers(symbol):
+                self._books_sent.pop(symbol, None)  # next subscriber gets a snapshot anyway
+                self.stats['skipped_no_subscribers'] += 1
+                continue
+            self._emit('orderbook_update', self._encode_book(symbol, book, full), symbol)
+
+    def _aggregate_trades(self, symbol: str, prints: List[Dict[str, Any]]) -> Dict[str, Any]:
+        last = prints[-1]
+        buy_volume = sum(t.get('quantity', 0) for t in prints if t.get('side') == 'buy')
+        sell_volume = sum(t.get('quantity', 0) for t in prints if t.get('side') == 'sell')
+        return {
+            **last,
+            'symbol': symbol,
+            'count': len(prints),
+            'buy_volume': buy_volume,
+            'sell_volume': sell_volume,
+            'high': max(t.get('price', 0) for t in prints),
+            'low': min(t.get('price', 0) for t in prints),
+            'trades': prints[-self.trades_per_frame:],
+        }
+
+    def _encode_book(self, symbol: str, book: Dict[str, Any], full: bool) -> Dict[str, Any]:
+        """Delta vs. the previously sent levels (qty 0 = removed), or a full snapshot"""
+        previous = self._books_sent.get(symbol)
+        self._book_seq[symbol] += 1
+        seq = self._book_seq[symbol]
+        self._books_sent[symbol] = {'bids': book['bids'], 'asks': book['asks']}
+
+        payload = {'symbol': symbol, 'seq': seq, 'timestamp': time.time(), **book['extra']}
+        if full or previous is None:
+            self.stats['book_snapshots'] += 1
+            payload.update(type='snapshot', **self._book_levels(book))
+            return payload
+
+        self.stats['book_deltas'] += 1
+        payload['type'] = 'delta'
+        payload['prev_seq'] = seq - 1
+        for side in ('bids', 'asks'):
+            old, new = previous[side], book[side]
+            changes = [[p, q] for p, q in new.items() if old.get(p) != q]
+            changes += [[p, 0.0] for p in old if p not in new]
+            payload[side] = changes
+        return payload
+
+    @staticmethod
+    def _book_levels(book: Dict[str, Any]) -> Dict[str, List[List[float]]]:
+        return {
+            'bids': [[p, q] for p, q in sorted(book['bids'].items(), reverse=True)],
+            'asks': [[p, q] for p, q in sorted(book['asks'].items())],
+        }
+
+    def _send_snapshots(self, sid: str, symbols: List[str]):
+        """Latest state of each symbol straight to one client (subscribe / slow path)"""
+        with self._lock:
+            wanted = set(symbols)
+            everything = ALL_SYMBOLS in wanted
+            states = [(event, symbol, payload) for (event, symbol), payload in self._latest_states.items()
+                      if everything or symbol in wanted]
+            books = [(symbol, self._books_sent.get(symbol)) for symbol in list(self._books_sent)
+                     if everything or symbol in wanted]
+
+        for event, symbol, payload in states:
+            self._emit(event, payload, sid=sid)
+        for symbol, levels in books:
+            if levels:
+                self.stats['book_snapshots'] += 1
+                self._emit('orderbook_update', {
+                    'symbol': symbol,
+                    'type': 'snapshot',
+                    'seq': self._book_seq[symbol],
+                    'timestamp': time.time(),
+                    **self._book_levels(levels)
+                }, sid=sid)
+
+    # ------------------------------------------------------------------------
+    # Slow consumers
+    # ------------------------------------------------------------------------
+
+    def _backlog(self, sid: str) -> Optional[int]:
+        """Packets waiting in the client's Engine.IO queue (None if not inspectable)"""
+        try:
+            server = self.socketio.server
+            eio_sid = server.manager.eio_sid_from_sid(sid, self.namespace)
+            socket = server.eio.sockets.get(eio_sid)
+            return socket.queue.qsize() if socket is not None else None
+        except Exception:
+            return None
+
+    def _check_consumers(self):
+        with self._lock:
+            clients = {sid: list(symbols) for sid, symbols in self._client_symbols.items() if symbols}
+            slow = dict(self._slow)
+
+        for sid, symbols in clients.items():
+            backlog = self._backlog(sid)
+            if backlog is None:
+                continue
+
+            if sid not in slow and backlog > self.slow_queue_threshold:
+                with self._lock:
+                    self._slow[sid] = time.monotonic()
+                self.stats['slow_marked'] += 1
+                for symbol in symbols:
+                    self.socketio.server.leave_room(sid, room_for(symbol), namespace=self.namespace)
+                logger.warning(f"🐢 Slow consumer {sid}: {backlog} packets queued - degraded to {self.slow_fps:g} fps snapshots")
+
+            elif sid in slow and backlog <= self.slow_queue_threshold // 4:
+                with self._lock:
+                    self._slow.pop(sid, None)
+                self.stats['slow_recovered'] += 1
+                for symbol in symbols:
+                    self.socketio.server.enter_room(sid, room_for(symbol), namespace=self.namespace)
+                self._send_snapshots(sid, symbols)
+                logger.info(f"✅ Consumer {sid} caught up - back on live frames")
+
+            elif sid in slow:
+                if backlog > self.slow_queue_threshold:
+                    self.stats['slow_frames_skipped'] += 1
+                else:
+                    self._send_snapshots(sid, symbols)
+
+    # ------------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------------
+
+    def get_metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+            subscriptions = {symbol: len(sids) for symbol, sids in self._members.items() if sids}
+            clients = len([sid for sid, symbols in self._client_symbols.items() if symbols])
+            slow = len(self._slow)
+        frame_ms = sorted(self._frame_ms)
+        published = stats['published']
+        return {
+            **stats,
+            'running': self._running,
+            'fps': self.fps,
+            'frames': self.frame,
+            'clients': clients,
+            'slow_consumers': slow,
+            'subscriptions': subscriptions,
+            'fanout_reduction': round(1 - stats['emitted'] / published, 4) if published else 0.0,
+            'frame_ms_avg': round(sum(frame_ms) / len(frame_ms), 3) if frame_ms else 0.0,
+            'frame_ms_max': round(frame_ms[-1], 3) if frame_ms else 0.0,
+        }
@@ -0,0 +1,484 @@
+"""
+Shared HTTP layer - keep-alive pooling, per-host limits, metrics
+DEMIR AI v8.0
+
+One process-wide connection pool for every REST integration instead of a
+fresh TCP+TLS handshake per `requests.get`:
+
+- Sync face: HttpClient wraps one requests.Session (urllib3 pool per
+  host). `get_http_client().get(...)` / `http_get(...)` are drop-in for
+  `requests.get(...)` - same Response object, same exceptions.
+- Async face: AsyncHttpClient shares one aiohttp.ClientSession per event
+  loop. `async with get_async_http_client().get(url) as response:` is
+  drop-in for `async with session.get(url) as response:`.
+- Per-host policy: max concurrent requests + token-bucket rate budget.
+  A request that would wait longer than `max_wait` for its budget raises
+  HttpBudgetExceeded (a requests RequestException, so existing handlers
+  catch it).
+- Per-host metrics: request / error counts, latency avg / p50 / p95 / max,
+  connections opened vs reused, throttle wait (get_http_metrics()).
+"""
+
+import os
+import time
+import asyncio
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    aiohttp = None
+    AIOHTTP_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+POOL_MAXSIZE = int(os.getenv('HTTP_POOL_MAXSIZE', 20))  # keep-alive connections per host
+POOL_HOSTS = int(os.getenv('HTTP_POOL_HOSTS', 50))  # hosts with a cached pool
+USER_AGENT = 'DEMIR-AI/8.0'
+
+
+# ============================================================================
+# HOST POLICY
+# ============================================================================
+
+@dataclass
+class HostPolicy:
+    """Per-host limits"""
+    max_concurrency: int = 8
+    rate_per_second: Optional[float] = None  # None = no budget
+    burst: int = 10
+    max_wait: float = 10.0  # seconds to wait for a budget token before failing
+
+
+# Public API limits (with headroom)
+DEFAULT_HOST_POLICIES: Dict[str, HostPolicy] = {
+    'api.binance.com': HostPolicy(max_concurrency=10, rate_per_second=20, burst=40),
+    'fapi.binance.com': HostPolicy(max_concurrency=10, rate_per_second=20, burst=40),
+    'api.bybit.com': HostPolicy(max_concurrency=8, rate_per_second=10, burst=20),
+    'api.coinbase.com': HostPolicy(max_concurrency=8, rate_per_second=8, burst=15),
+    'api.exchange.coinbase.com': HostPolicy(max_concurrency=8, rate_per_second=8, burst=15),
+    'api.coingecko.com': HostPolicy(max_concurrency=2, rate_per_second=0.5, burst=5, max_wait=30.0),
+    'api.alternative.me': HostPolicy(max_concurrency=2, rate_per_second=1, burst=5),
+}
+
+
+class HttpBudgetExceeded(requests.exceptions.RequestException):
+    """Host rate budget / concurrency slot not available within max_wait"""
+
+
+class RateBudget:
+    """Thread-safe token bucket; reserve() returns how long to wait for the token"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, max_wait: float) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            wait = max(0.0, (1 - self._tokens) / self.rate)
+            if wait > max_wait:
+                raise HttpBudgetExceeded(f"rate budget exhausted (next slot in {wait:.1f}s)")
+            self._tokens -= 1
+            return wait
+
+
+# ============================================================================
+# METRICS
+# ============================================================================
+
+class HostMetrics:
+    """Counters for one host (shared by sync and async faces)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+        self.rejected = 0
+        self.connections_opened = 0
+        self.connections_reused = 0
+        self.throttle_wait_s = 0.0
+        self.total_latency_ms = 0.0
+        self.max_latency_ms = 0.0
+        self.recent_latency_ms = deque(maxlen=512)
+
+    def record(self, latency_ms: float, error: bool):
+        with self._lock:
+            self.requests += 1
+            self.errors += int(error)
+            self.total_latency_ms += latency_ms
+            self.max_latency_ms = max(self.max_latency_ms, latency_ms)
+            self.recent_latency_ms.append(latency_ms)
+
+    def record_connections(self, opened: int, reused: int):
+        with self._lock:
+            self.connections_opened += opened
+            self.connections_reused += reused
+
+    def record_throttle(self, wait_s: float = 0.0, rejected: bool = False):
+        with self._lock:
+            self.throttle_wait_s += wait_s
+            self.rejected += int(rejected)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            recent = np.array(self.recent_latency_ms) if self.recent_latency_ms else None
+            connections = self.connections_opened + self.connections_reused
+            return {
+                'requests': self.requests,
+                'errors': self.errors,
+                'rejected': self.rejected,
+                'avg_latency_ms': round(self.total_latency_ms / self.requests, 2) if self.requests else 0.0,
+                'p50_latency_ms': round(float(np.percentile(recent, 50)), 2) if recent is not None else 0.0,
+                'p95_latency_ms': round(float(np.percentile(recent, 95)), 2) if recent is not None else 0.0,
+                'max_latency_ms': round(self.max_latency_ms, 2),
+                'connections_opened': self.connections_opened,
+                'connections_reused': self.connections_reused,
+                'reuse_ratio': round(self.connections_reused / connections, 4) if connections else 0.0,
+                'throttle_wait_s': round(self.throttle_wait_s, 3)
+            }
+
+
+class _HostRegistry:
+    """Host → policy / budget / metrics, shared by both faces"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.policies: Dict[str, HostPolicy] = dict(DEFAULT_HOST_POLICIES)
+        self.budgets: Dict[str, Optional[RateBudget]] = {}
+        self.semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self.metrics: Dict[str, HostMetrics] = {}
+
+    def configure(self, host: str, policy: HostPolicy):
+        with self._lock:
+            self.policies[host] = policy
+            self.budgets.pop(host, None)
+            self.semaphores.pop(host, None)
+
+    def policy(self, host: str) -> HostPolicy:
+        return self.policies.get(host) or HostPolicy()
+
+    def budget(self, host: str) -> Optional[RateBudget]:
+        if host not in self.budgets:
+            with self._lock:
+                if host not in self.budgets:
+                    policy = self.policy(host)
+                    self.budgets[host] = (
+                        RateBudget(policy.rate_per_second, policy.burst)
+                        if policy.rate_per_second else None
+                    )
+        return self.budgets[host]
+
+    def semaphore(self, host: str) -> threading.BoundedSemaphore:
+        if host not in self.semaphores:
+            with self._lock:
+                if host not in self.semaphores:
+                    self.semaphores[host] = threading.BoundedSemaphore(self.policy(host).max_concurrency)
+        return self.semaphores[host]
+
+    def host_metrics(self, host: str) -> HostMetrics:
+        if host not in self.metrics:
+            with self._lock:
+                self.metrics.setdefault(host, HostMetrics())
+        return self.metrics[host]
+
+    def reserve(self, host: str) -> float:
+        """Take a budget token; returns seconds to wait (raises if > max_wait)"""
+        budget = self.budget(host)
+        if budget is None:
+            return 0.0
+        try:
+            wait = budget.reserve(self.policy(host).max_wait)
+        except HttpBudgetExceeded:
+            self.host_metrics(host).record_throttle(rejected=True)
+            raise
+        if wait:
+            self.host_metrics(host).record_throttle(wait)
+        return wait
+
+
+_registry = _HostRegistry()
+
+
+def _host(url: str) -> str:
+    return urlsplit(url).hostname or 'unknown'
+
+
+def configure_host(host: str, **policy: Any):
+    """Override limits for a host, e.g. configure_host('api.coingecko.com', rate_per_second=0.2)"""
+    _registry.configure(host, HostPolicy(**policy))
+
+
+# ============================================================================
+# SYNC FACE
+# ============================================================================
+
+class _TrackingAdapter(HTTPAdapter):
+    """HTTPAdapter that remembers (per thread) which urllib3 pool served the request"""
+
+    def __init__(self, *args, **kwargs):
+        self._local = threading.local()
+        super().__init__(*args, **kwargs)
+
+    def _track(self, pool):
+        self._local.pool = pool
+        self._local.opened_before = pool.num_connections
+        return pool
+
+    def get_connection_with_tls_context(self, *args, **kwargs):
+        return self._track(super().get_connection_with_tls_context(*args, **kwargs))
+
+    def get_connection(self, *args, **kwargs):
+        return self._track(super().get_connection(*args, **kwargs))
+
+    def opened_connection(self) -> int:
+        """1 if the last request on this thread opened a new connection"""
+        pool = getattr(self._local, 'pool', None)
+        if pool is None:
+            return 0
+        self._local.pool = None
+        return min(1, max(0, pool.num_connections - self._local.opened_before))
+
+
+class HttpClient:
+    """Pooled requests.Session with per-host limits and metrics"""
+
+    def __init__(self, pool_maxsize: int = POOL_MAXSIZE, pool_hosts: int = POOL_HOSTS):
+        self.session = requests.Session()
+        self.session.headers['User-Agent'] = USER_AGENT
+        self.adapter = _TrackingAdapter(pool_connections=pool_hosts, pool_maxsize=pool_maxsize)
+        self.session.mount('https://', self.adapter)
+        self.session.mount('http://', self.adapter)
+
+    def request(self, method: str, url: str, timeout: float = 10, **kwargs) -> requests.Response:
+        host = _host(url)
+        metrics = _registry.host_metrics(host)
+
+        wait = _registry.reserve(host)
+        if wait:
+            time.sleep(wait)
+
+        semaphore = _registry.semaphore(host)
+        if not semaphore.acquire(timeout=_registry.policy(host).max_wait):
+            metrics.record_throttle(rejected=True)
+            raise HttpBudgetExceeded(f"{host}: no free connection slot")
+
+        try:
+            start = time.perf_counter()
+            error = True
+            try:
+                response = self.session.request(method, url, timeout=timeout, **kwargs)
+                error = response.status_code >= 400
+                return response
+            finally:
+                metrics.record((time.perf_counter() - start) * 1000, error)
+                # Concurrent requests on one host share the pool counter, so
+                # per-request attribution is approximate
+                opened = self.adapter.opened_connection()
+                metrics.record_connections(opened, 1 - opened)
+        finally:
+            semaphore.release()
+
+    def get(self, url: str, params: Optional[Dict] = None, **kwargs) -> requests.Response:
+        return self.request('GET', url, params=params, **kwargs)
+
+    def post(self, url: str, data: Any = None, json: Any = None, **kwargs) -> requests.Response:
+        return self.request('POST', url, data=data, json=json, **kwargs)
+
+    def close(self):
+        self.session.close()
+
+
+_client: Optional[HttpClient] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """Process-wide sync client"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = HttpClient()
+    return _client
+
+
+def http_get(url: str, params: Optional[Dict] = None, **kwargs) -> requests.Response:
+    """Drop-in for requests.get on the shared pool"""
+    return get_http_client().get(url, params=params, **kwargs)
+
+
+def http_post(url: str, data: Any = None, json: Any = None, **kwargs) -> requests.Response:
+    """Drop-in for requests.post on the shared pool"""
+    return get_http_client().post(url, data=data, json=json, **kwargs)
+
+
+# ============================================================================
+# ASYNC FACE
+# ============================================================================
+
+class _AsyncRequest:
+    """`async with client.get(...) as response` - limits + metrics around aiohttp"""
+
+    def __init__(self, client: 'AsyncHttpClient', method: str, url: str, kwargs: Dict):
+        self.client = client
+        self.method = method
+        self.url = url
+        self.kwargs = kwargs
+        self.host = _host(url)
+        self._response = None
+        self._semaphore = None
+        self._start = 0.0
+
+    async def __aenter__(self):
+        wait = _registry.reserve(self.host)
+        if wait:
+            await asyncio.sleep(wait)
+
+        self._semaphore = self.client._semaphore(self.host)
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), _registry.policy(self.host).max_wait)
+        except asyncio.TimeoutError:
+            self._semaphore = None
+            _registry.host_metrics(self.host).record_throttle(rejected=True)
+            raise HttpBudgetExceeded(f"{self.host}: no free connection slot")
+
+        self._start = time.perf_counter()
+        try:
+            session = await self.client.session()
+            self._response = await session.request(
+                self.method, self.url, trace_request_ctx={'host': self.host}, **self.kwargs
+            )
+        except BaseException:
+            self._finish(error=True)
+            raise
+        return self._response
+
+    async def __aexit__(self, exc_type, exc, tb):
+        error = exc_type is not None or self._response.status >= 400
+        self._response.release()
+        self._finish(error)
+        return False
+
+    def _finish(self, error: bool):
+        _registry.host_metrics(self.host).record((time.perf_counter() - self._start) * 1000, error)
+        if self._semaphore is not None:
+            self._semaphore.release()
+            self._semaphore = None
+
+
+class AsyncHttpClient:
+    """One pooled aiohttp.ClientSession per event loop"""
+
+    def __init__(self, limit: int = 100, limit_per_host: int = POOL_MAXSIZE):
+        if not AIOHTTP_AVAILABLE:
+            raise ImportError("aiohttp is required for AsyncHttpClient")
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self._sessions: Dict[int, Any] = {}
+        self._semaphores: Dict[tuple, asyncio.Semaphore] = {}
+
+    def _trace_config(self):
+        trace = aiohttp.TraceConfig()
+
+        async def on_create(session, ctx, params):
+            host = (ctx.trace_request_ctx or {}).get('host', 'unknown')
+            _registry.host_metrics(host).record_connections(1, 0)
+
+        async def on_reuse(session, ctx, params):
+            host = (ctx.trace_request_ctx or {}).get('host', 'unknown')
+            _registry.host_metrics(host).record_connections(0, 1)
+
+        trace.on_connection_create_end.append(on_create)
+        trace.on_connection_reuseconn.append(on_reuse)
+        return trace
+
+    async def session(self):
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(id(loop))
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.limit,
+                    limit_per_host=self.limit_per_host,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60
+                ),
+                headers={'User-Agent': USER_AGENT},
+                trace_configs=[self._trace_config()]
+            )
+            self._sessions[id(loop)] = session
+        return session
+
+    def _semaphore(self, host: str) -> asyncio.Semaphore:
+        key = (id(asyncio.get_running_loop()), host)
+        if key not in self._semaphores:
+            self._semaphores[key] = asyncio.Semaphore(_registry.policy(host).max_concurrency)
+        return self._semaphores[key]
+
+    def request(self, method: str, url: str, **kwargs) -> _AsyncRequest:
+        return _AsyncRequest(self, method, url, kwargs)
+
+    def get(self, url: str, **kwargs) -> _AsyncRequest:
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> _AsyncRequest:
+        return self.request('POST', url, **kwargs)
+
+    async def get_json(self, url: str, **kwargs) -> Any:
+        """GET and decode JSON (raises aiohttp.ClientResponseError on 4xx/5xx)"""
+        async with self.get(url, **kwargs) as response:
+            response.raise_for_status()
+            return await response.json(content_type=None)
+
+    async def close(self):
+        """Close the session of the running loop"""
+        loop = asyncio.get_running_loop()
+        session = self._sessions.pop(id(loop), None)
+        if session is not None:
+            await session.close()
+        self._semaphores = {k: v for k, v in self._semaphores.items() if k[0] != id(loop)}
+
+
+_async_client: Optional[AsyncHttpClient] = None
+
+
+def get_async_http_client() -> AsyncHttpClient:
+    """Process-wide async client"""
+    global _async_client
+    if _async_client is None:
+        with _client_lock:
+            if _async_client is None:
+                _async_client = AsyncHttpClient()
+    return _async_client
+
+
+# ============================================================================
+# REPORTING
+# ============================================================================
+
+def get_http_metrics() -> Dict[str, Any]:
+    """Per-host latency / reuse metrics for both faces"""
+    hosts = {host: metrics.snapshot() for host, metrics in list(_registry.metrics.items())}
+    opened = sum(h['connections_opened'] for h in hosts.values())
+    reused = sum(h['connections_reused'] for h in hosts.values())
+    return {
+        'hosts': hosts,
+        'total_requests': sum(h['requests'] for h in hosts.values()),
+        'reuse_ratio': round(reused / (opened + reused), 4) if opened + reused else 0.0
+    }
@@ -0,0 +1,391 @@
+"""
+Local Order Book - L2 book maintained from depth-diff streams
+DEMIR AI v8.0
+
+One REST snapshot per symbol, then `@depth@100ms` diff events keep the
+book current (Binance "manage a local order book correctly" procedure):
+
+- Diffs arriving before the snapshot are buffered; events with
+  u <= lastUpdateId are dropped, the first applied event must straddle
+  lastUpdateId + 1
+- Sequencing: every next event must start at previous u + 1; a gap
+  (dropped message, reconnect, queue overflow) marks the book out of sync
+  and triggers a resync from a fresh snapshot
+- Each side is a sorted price array (bisect: O(log n) lookup, quantity
+  changes in place, inserts/removals shift the array) plus a price →
+  quantity map; best levels, depth within a % band and full levels are
+  served without any REST call
+- Snapshots are fetched on a worker thread (never on the websocket
+  event loop), single-flight per symbol
+
+Usage:
+    books = OrderBookManager(executor=thread_pool)
+    books.on_depth_event(event)          # raw depthUpdate payload
+    book = books.get('BTCUSDT')
+    if book and book.synced:
+        bids, asks = book.levels(limit=1000)
+"""
+
+import time
+import logging
+import threading
+from bisect import bisect_left, bisect_right
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from utils.http_client import get_http_client
+
+logger = logging.getLogger(__name__)
+
+BINANCE_DEPTH_URL = "https://api.binance.com/api/v3/depth"
+
+STATE_INIT = 'init'          # waiting for the first snapshot
+STATE_SYNCED = 'synced'
+STATE_RESYNC = 'resync'      # gap detected, waiting for a new snapshot
+
+# Diffs may grow a side up to max_levels * TRIM_SLACK before it is trimmed
+# back to max_levels (amortizes the trim over many inserts)
+TRIM_SLACK = 1.1
+
+Levels = List[List[float]]
+
+
+def fetch_binance_depth_snapshot(symbol: str, limit: int = 1000) -> Dict[str, Any]:
+    """REST depth snapshot: {'lastUpdateId', 'bids', 'asks'} (levels as strings)"""
+    response = get_http_client().get(BINANCE_DEPTH_URL, params={'symbol': symbol, 'limit': limit}, timeout=5)
+    response.raise_for_status()
+    return response.json()
+
+
+class BookSide:
+    """
+    One side of the book. Prices are kept sorted ascending in `_keys`
+    (negated for bids, so index 0 is always the best level).
+    """
+
+    __slots__ = ('descending', '_keys', '_qty')
+
+    def __init__(self, descending: bool):
+        self.descending = descending
+        self._keys: List[float] = []
+        self._qty: Dict[float, float] = {}
+
+    def _key(self, price: float) -> float:
+        return -price if self.descending else price
+
+    def clear(self):
+        self._keys.clear()
+        self._qty.clear()
+
+    def load(self, levels: Sequence[Sequence[Any]]):
+        self._qty = {}
+        for p, q in levels:
+            qty = float(q)
+            if qty > 0:
+                self._qty[float(p)] = qty
+        self._keys = sorted(self._key(p) for p in self._qty)
+
+    def set(self, price: float, qty: float):
+        """Absolute quantity at a price level (0 removes the level)"""
+        if qty > 0:
+            if price not in self._qty:
+                key = self._key(price)
+                self._keys.insert(bisect_left(self._keys, key), key)
+            self._qty[price] = qty
+        elif price in self._qty:
+            del self._qty[price]
+            key = self._key(price)
+            del self._keys[bisect_left(self._keys, key)]
+
+    def trim(self, max_levels: int):
+        """Drop levels beyond `max_levels` from the best (far levels are not diffed reliably)"""
+        if len(self._keys) > max_levels:
+            for key in self._keys[max_levels:]:
+                del self._qty[-key if self.descending else key]
+            del self._keys[max_levels:]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def best(self) -> Optional[Tuple[float, float]]:
+        if not self._keys:
+            return None
+        price = -self._keys[0] if self.descending else self._keys[0]
+        return price, self._qty[price]
+
+    def levels(self, limit: Optional[int] = None) -> Levels:
+        keys = self._keys if limit is None else self._keys[:limit]
+        if self.descending:
+            return [[-k, self._qty[-k]] for k in keys]
+        return [[k, self._qty[k]] for k in keys]
+
+    def within(self, bound: float) -> Levels:
+        """Levels from the best price up to `bound` (inclusive): bids >= bound, asks <= bound"""
+        end = bisect_right(self._keys, self._key(bound))
+        return self.levels(end)
+
+    def arrays(self, limit: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        keys = np.asarray(self._keys if limit is None else self._keys[:limit], dtype=np.float64)
+        prices = -keys if self.descending else keys
+        qty = self._qty
+        return prices, np.fromiter((qty[p] for p in prices.tolist()), dtype=np.float64, count=len(prices))
+
+
+class LocalOrderBook:
+    """Snapshot + diff sequencing for one symbol"""
+
+    def __init__(self, symbol: str, max_levels: int = 5000, max_buffer: int = 1000):
+        self.symbol = symbol.upper()
+        self.bids = BookSide(descending=True)
+        self.asks = BookSide(descending=False)
+        self.max_levels = max_levels
+        self._trim_at = int(max_levels * TRIM_SLACK)
+        self.max_buffer = max_buffer
+        self.state = STATE_INIT
+        self.last_update_id = 0
+        self.last_event_time: Optional[int] = None
+        self.synced_at: Optional[float] = None
+        self._buffer: List[Dict[str, Any]] = []
+        self._lock = threading.RLock()
+        self.stats = {'applied': 0, 'dropped_old': 0, 'buffered_total': 0, 'gaps': 0, 'resyncs': 0, 'snapshots': 0}
+
+    @property
+    def synced(self) -> bool:
+        return self.state == STATE_SYNCED
+
+    # ------------------------------------------------------------------
+    # Diffs / snapshots
+    # ------------------------------------------------------------------
+
+    def on_event(self, event: Dict[str, Any]) -> bool:
+        """
+        Feed one depthUpdate event ({'U', 'u', 'b', 'a', 'E'}).
+
+        Returns:
+            True if the event was applied to a synced book
+        """
+        with self._lock:
+            if self.state != STATE_SYNCED:
+                if len(self._buffer) >= self.max_buffer:
+                    self._buffer.pop(0)
+                self._buffer.append(event)
+                self.stats['buffered_total'] += 1
+                return False
+            return self._apply(event)
+
+    def _apply(self, event: Dict[str, Any]) -> bool:
+        first, last = int(event['U']), int(event['u'])
+        if last <= self.last_update_id:
+            self.stats['dropped_old'] += 1
+            return False
+        if first > self.last_update_id + 1:
+            self.stats['gaps'] += 1
+            logger.warning(
+                f"⚠️ {self.symbol} depth gap: expected {self.last_update_id + 1}, got {first} - resyncing"
+            )
+            self._invalidate()
+            self._buffer.append(event)
+            return False
+
+        for p, q in event.get('b', ()):
+            self.bids.set(float(p), float(q))
+        for p, q in event.get('a', ()):
+            self.asks.set(float(p), float(q))
+        if len(self.bids) > self._trim_at:
+            self.bids.trim(self.max_levels)
+        if len(self.asks) > self._trim_at:
+            self.asks.trim(self.max_levels)
+        self.last_update_id = last
+        self.last_event_time = event.get('E')
+        self.stats['applied'] += 1
+        return True
+
+    def _invalidate(self):
+        self.state = STATE_RESYNC
+        self.stats['resyncs'] += 1
+        self._buffer = []
+
+    def load_snapshot(self, snapshot: Dict[str, Any]) -> bool:
+        """
+        Install a REST snapshot and replay buffered diffs.
+
+        Returns:
+            True if the book is synced afterwards; False if the buffered
+            diffs do not connect to the snapshot (a newer snapshot is needed)
+        """
+        with self._lock:
+            snapshot_id = int(snapshot['lastUpdateId'])
+            self.bids.load(snapshot.get('bids', ()))
+            self.asks.load(snapshot.get('asks', ()))
+            self.last_update_id = snapshot_id
+            self.stats['snapshots'] += 1
+
+            pending = [e for e in self._buffer if int(e['u']) > snapshot_id]
+            self.stats['dropped_old'] += len(self._buffer) - len(pending)
+            self._buffer = []
+            if pending and int(pending[0]['U']) > snapshot_id + 1:
+                # Snapshot is older than the oldest buffered diff
+                self.state = STATE_RESYNC
+                self._buffer = pending
+                return False
+
+            self.state = STATE_SYNCED
+            for i, event in enumerate(pending):
+                if not self._apply(event) and self.state != STATE_SYNCED:
+                    self._buffer.extend(pending[i + 1:])
+                    return False
+            self.bids.trim(self.max_levels)
+            self.asks.trim(self.max_levels)
+            self.synced_at = time.time()
+            logger.info(f"📗 {self.symbol} local book synced @ {self.last_update_id} "
+                        f"({len(self.bids)} bids / {len(self.asks)} asks)")
+            return True
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def best_bid_ask(self) -> Tuple[Optional[Tuple[float, float]], Optional[Tuple[float, float]]]:
+        with self._lock:
+            return self.bids.best(), self.asks.best()
+
+    def mid_price(self) -> Optional[float]:
+        bid, ask = self.best_bid_ask()
+        if bid is None or ask is None:
+            return None
+        return (bid[0] + ask[0]) / 2
+
+    def levels(self, limit: Optional[int] = None) -> Tuple[Levels, Levels]:
+        """(bids best→worst, asks best→worst) as [[price, qty], ...]"""
+        with self._lock:
+            return self.bids.levels(limit), self.asks.levels(limit)
+
+    def arrays(self, limit: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """{'bid_prices', 'bid_qty', 'ask_prices', 'ask_qty'} as float arrays"""
+        with self._lock:
+            bp, bq = self.bids.arrays(limit)
+            ap, aq = self.asks.arrays(limit)
+        return {'bid_prices': bp, 'bid_qty': bq, 'ask_prices': ap, 'ask_qty': aq}
+
+    def within_pct(self, reference: float, depth_pct: float) -> Tuple[Levels, Levels]:
+        """Levels within ±depth_pct of `reference` (bisect on both sides)"""
+        with self._lock:
+            return (self.bids.within(reference * (1 - depth_pct / 100)),
+                    self.asks.within(reference * (1 + depth_pct / 100)))
+
+    def snapshot(self, limit: Optional[int] = None) -> Dict[str, Any]:
+        """Analyzer-compatible dict (same shape as the REST fetchers)"""
+        bids, asks = self.levels(limit)
+        return {
+            'bids': bids,
+            'asks': asks,
+            'timestamp': self.last_update_id,
+            'exchange': 'binance',
+            'symbol': self.symbol,
+            'source': 'local_book',
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'state': self.state,
+                'last_update_id': self.last_update_id,
+                'bid_levels': len(self.bids),
+                'ask_levels': len(self.asks),
+                'buffered': len(self._buffer),
+                'age_ms': int(time.time() * 1000 - self.last_event_time) if self.last_event_time else None,
+                **self.stats,
+            }
+
+
+class OrderBookManager:
+    """Local books for all depth-streamed symbols; schedules snapshots off the event loop"""
+
+    def __init__(
+        self,
+        snapshot_fetcher: Callable[[str], Dict[str, Any]] = fetch_binance_depth_snapshot,
+        executor: Optional[Executor] = None,
+        max_levels: int = 5000,
+        retry_delay: float = 2.0,
+    ):
+        self.snapshot_fetcher = snapshot_fetcher
+        self._own_executor = executor is None
+        self.executor = executor or ThreadPoolExecutor(max_workers=2, thread_name_prefix='book-snapshot')
+        self.max_levels = max_levels
+        self.retry_delay = retry_delay
+        self.books: Dict[str, LocalOrderBook] = {}
+        self._fetching: Dict[str, float] = {}   # symbol -> started at
+        self._lock = threading.Lock()
+        self.snapshot_failures = 0
+
+    def get(self, symbol: str) -> Optional[LocalOrderBook]:
+        return self.books.get(symbol.upper())
+
+    def synced_book(self, symbol: str) -> Optional[LocalOrderBook]:
+        book = self.get(symbol)
+        return book if book is not None and book.synced else None
+
+    def on_depth_event(self, event: Dict[str, Any]) -> Optional[LocalOrderBook]:
+        """
+        Feed a raw depthUpdate payload (from any thread).
+
+        Returns:
+            The symbol's book if it is synced after this event, else None
+        """
+        symbol = event.get('s', '').upper()
+        if not symbol:
+            return None
+        book = self.books.get(symbol)
+        if book is None:
+            with self._lock:
+                book = self.books.setdefault(symbol, LocalOrderBook(symbol, self.max_levels))
+        applied = book.on_event(event)
+        if not book.synced:
+            self._request_snapshot(book)
+            return None
+        return book if applied else None
+
+    def _request_snapshot(self, book: LocalOrderBook):
+        now = time.monotonic()
+        with self._lock:
+            started = self._fetching.get(book.symbol)
+            if started is not None:
+                return
+            self._fetching[book.symbol] = now
+        try:
+            self.executor.submit(self._load_snapshot, book)
+        except RuntimeError:  # executor shut down
+            with self._lock:
+                self._fetching.pop(book.symbol, None)
+
+    def _load_snapshot(self, book: LocalOrderBook):
+        try:
+            snapshot = self.snapshot_fetcher(book.symbol)
+            book.load_snapshot(snapshot)
+        except Exception as e:
+            self.snapshot_failures += 1
+            logger.error(f"❌ {book.symbol} depth snapshot failed: {e}")
+            time.sleep(self.retry_delay)
+        finally:
+            with self._lock:
+                self._fetching.pop(book.symbol, None)
+
+    def reset(self, symbol: Optional[str] = None):
+        """Forget book state (e.g. after a reconnect); the next diff triggers a snapshot"""
+        with self._lock:
+            symbols = [symbol.upper()] if symbol else list(self.books)
+            for sym in symbols:
+                self.books.pop(sym, None)
+
+    def close(self):
+        if self._own_executor:
+            self.executor.shutdown(wait=False)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'books': {symbol: book.get_stats() for symbol, book in list(self.books.items())},
+            'synced': sum(1 for book in list(self.books.values()) if book.synced),
+            'snapshot_failures': self.snapshot_failures,
+        }
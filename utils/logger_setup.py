@@ -15,6 +15,8 @@ Features:
     ✅ JSON logging support
     ✅ Log compression
     ✅ Retention policies
+    ✅ Non-blocking pipeline (QueueHandler → QueueListener thread)
+    ✅ Per-logger rate limiting / sampling for hot paths (config driven)
 
 Log Levels:
     DEBUG    🔍 - Detailed information
@@ -32,12 +34,25 @@ VERSION: 7.0
 
 import os
 import sys
+import copy
+import time
+import queue
+import atexit
 import logging
 import gzip
 import shutil
+import threading
+from dataclasses import dataclass
 from datetime import datetime
-from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
-from typing import Optional
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler, TimedRotatingFileHandler
+from typing import Any, Dict, Optional
+
+try:
+    from config import LOG_ASYNC, LOG_QUEUE_SIZE, LOG_POLICIES
+except ImportError:
+    LOG_ASYNC = os.getenv('LOG_ASYNC', 'true').lower() == 'true'
+    LOG_QUEUE_SIZE = int(os.getenv('LOG_QUEUE_SIZE', '10000'))
+    LOG_POLICIES = {}
 
 # ============================================================================
 # ANSI COLOR CODES
@@ -179,6 +194,246 @@ class CompressingRotatingFileHandler(RotatingFileHandler):
                 # Remove uncompressed file
                 os.remove(dfn)
 
+# ============================================================================
+# HOT-PATH POLICIES (rate limit / sampling / lazy formatting)
+# ============================================================================
+
+# Loggers that fire per price / per symbol / per backtest; overridden or
+# extended by config.LOG_POLICIES. WARNING and above always pass.
+HOT_PATH_POLICIES: Dict[str, Dict[str, Any]] = {
+    'REAL_DATA_VERIFIER': {'rate': 20, 'sample': 0.2, 'lazy': True},      # verify_price: 3-5 lines per call
+    'CROSS_VALIDATION': {'rate': 10, 'sample': 0.2, 'lazy': True},        # _cross_validate_with_exchange
+    'PRICE_FETCHER_FALLBACK': {'rate': 20, 'lazy': True},                 # one line per symbol per fetch
+    'ADV_BACKTEST_ENGINE': {'rate': 2, 'lazy': True},                     # full result dicts
+    'GROUP_SIGNAL_API': {'rate': 20, 'sample': 0.25, 'lazy': True},       # [PRICE_DEBUG] per request
+}
+
+
+@dataclass
+class LogPolicy:
+    """
+    rate:   records / second per logger (token bucket, `burst` deep), 0 = unlimited
+    sample: fraction of records kept (deterministic every-Nth), 1.0 = all
+    lazy:   msg % args is rendered on the listener thread, not the caller's
+            (args are read there - only for loggers that log immutable values)
+    """
+    rate: float = 0.0
+    burst: int = 0
+    sample: float = 1.0
+    lazy: bool = False
+    exempt_level: int = logging.WARNING
+
+    @classmethod
+    def from_config(cls, cfg: Dict[str, Any]) -> 'LogPolicy':
+        cfg = dict(cfg)
+        level = cfg.get('exempt_level', logging.WARNING)
+        if isinstance(level, str):
+            cfg['exempt_level'] = logging.getLevelName(level.upper())
+        return cls(**cfg)
+
+
+class HotPathFilter(logging.Filter):
+    """
+    Logger-level filter: sampled-out / rate-limited records are dropped in
+    the caller before any handler (or the queue) sees them, and counted
+    """
+
+    def __init__(self, logger_name: str, policy: LogPolicy):
+        super().__init__()
+        self.logger_name = logger_name
+        self.policy = policy
+        self.every = max(1, int(round(1.0 / policy.sample))) if policy.sample > 0 else 0
+        self.burst = float(policy.burst or max(1.0, policy.rate))
+        self.tokens = self.burst
+        self.last_refill = time.monotonic()
+        self.seen = 0
+        self.passed = 0
+        self.sampled_out = 0
+        self.rate_limited = 0
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= self.policy.exempt_level:
+            return True
+        with self._lock:
+            self.seen += 1
+            if self.every == 0 or (self.every > 1 and self.seen % self.every):
+                self.sampled_out += 1
+                return False
+            if self.policy.rate > 0:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.last_refill) * self.policy.rate)
+                self.last_refill = now
+                if self.tokens < 1.0:
+                    self.rate_limited += 1
+                    return False
+                self.tokens -= 1.0
+            self.passed += 1
+        if self.policy.lazy:
+            record.lazy_format = True
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'passed': self.passed,
+                'sampled_out': self.sampled_out,
+                'rate_limited': self.rate_limited,
+                'rate': self.policy.rate,
+                'sample': self.policy.sample,
+                'lazy': self.policy.lazy,
+            }
+
+
+_policy_filters: Dict[str, HotPathFilter] = {}
+
+
+def apply_log_policies(policies: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, HotPathFilter]:
+    """Install HotPathFilter on every configured logger (replacing earlier ones)"""
+    merged = {**HOT_PATH_POLICIES, **LOG_POLICIES, **(policies or {})}
+    for name, cfg in merged.items():
+        target = logging.getLogger(name)
+        previous = _policy_filters.pop(name, None)
+        if previous is not None:
+            target.removeFilter(previous)
+        if not cfg:
+            continue
+        try:
+            hot_filter = HotPathFilter(name, LogPolicy.from_config(cfg))
+        except (TypeError, ValueError) as e:
+            logging.getLogger(__name__).warning(f"⚠️ Invalid log policy for {name}: {e}")
+            continue
+        target.addFilter(hot_filter)
+        _policy_filters[name] = hot_filter
+    return dict(_policy_filters)
+
+# ============================================================================
+# NON-BLOCKING PIPELINE (QueueHandler → QueueListener)
+# ============================================================================
+
+class AsyncQueueHandler(QueueHandler):
+    """
+    Bounded queue front-end: the caller only enqueues the record. When the
+    queue is full, records below `block_level` are dropped (counted);
+    ERROR and above wait up to `block_timeout` seconds for room.
+    """
+
+    def __init__(self, log_queue: queue.Queue, block_level: int = logging.ERROR, block_timeout: float = 0.05):
+        super().__init__(log_queue)
+        self.block_level = block_level
+        self.block_timeout = block_timeout
+        self.enqueued = 0
+        self.dropped: Dict[str, int] = {}
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Only make the record safe to hand to another thread; the real
+        # formatting happens in the listener's handlers
+        record = copy.copy(record)
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        if not getattr(record, 'lazy_format', False):
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            if record.levelno < self.block_level:
+                self._drop(record)
+                return
+            try:
+                self.queue.put(record, timeout=self.block_timeout)
+            except queue.Full:
+                self._drop(record)
+                return
+        self.enqueued += 1
+
+    def _drop(self, record: logging.LogRecord):
+        self.dropped[record.levelname] = self.dropped.get(record.levelname, 0) + 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'depth': self.queue.qsize(),
+            'capacity': self.queue.maxsize,
+            'enqueued': self.enqueued,
+            'dropped': dict(self.dropped),
+        }
+
+
+_pipelines: Dict[str, QueueListener] = {}
+_queue_handlers: Dict[str, AsyncQueueHandler] = {}
+_pipeline_lock = threading.Lock()
+
+
+def install_async_handlers(target: logging.Logger, queue_size: int = LOG_QUEUE_SIZE,
+                           replace: bool = False) -> Optional[QueueListener]:
+    """
+    Move `target`'s handlers behind a QueueListener thread; the logger keeps
+    a single AsyncQueueHandler. Calling it again moves handlers added since
+    onto the same listener (`replace=True`: they replace the listener's set).
+    """
+    name = target.name or 'root'
+    with _pipeline_lock:
+        handlers = [h for h in target.handlers if not isinstance(h, QueueHandler)]
+        listener = _pipelines.get(name)
+        if listener is None:
+            if not handlers:
+                return None
+            listener = QueueListener(queue.Queue(maxsize=queue_size), respect_handler_level=True)
+            listener.start()
+            _pipelines[name] = listener
+        if handlers:
+            for handler in handlers:
+                target.removeHandler(handler)
+            listener.handlers = tuple(handlers) if replace else listener.handlers + tuple(handlers)
+        if not any(isinstance(h, AsyncQueueHandler) for h in target.handlers):
+            queue_handler = AsyncQueueHandler(listener.queue)
+            target.addHandler(queue_handler)
+            _queue_handlers[name] = queue_handler
+        return listener
+
+
+def start_async_logging(root: Optional[logging.Logger] = None) -> Optional[QueueListener]:
+    """
+    Config-driven entry point, called once after the handlers are set up
+    (e.g. after logging.basicConfig): installs the hot-path policies and,
+    when LOG_ASYNC is on, moves the root handlers off the caller thread.
+    """
+    apply_log_policies()
+    if not LOG_ASYNC:
+        return None
+    return install_async_handlers(root or logging.getLogger())
+
+
+def stop_async_logging():
+    """Flush and stop every listener (registered with atexit)"""
+    with _pipeline_lock:
+        listeners = list(_pipelines.values())
+        _pipelines.clear()
+    for listener in listeners:
+        try:
+            listener.stop()
+        except Exception:
+            pass
+
+
+atexit.register(stop_async_logging)
+
+
+def get_logging_metrics() -> Dict[str, Any]:
+    """Queue depth / drops per pipeline, passed / sampled / limited per hot logger"""
+    with _pipeline_lock:
+        handlers = dict(_queue_handlers)
+    return {
+        'async': LOG_ASYNC,
+        'queues': {name: handler.get_stats() for name, handler in handlers.items()},
+        'policies': {name: f.get_stats() for name, f in list(_policy_filters.items())},
+    }
+
 # ============================================================================
 # LOGGER SETUP FUNCTION
 # ============================================================================
@@ -189,7 +444,8 @@ def setup_logger(
     level: str = 'INFO',
     console_output: bool = True,
     file_output: bool = True,
-    compress_logs: bool = True
+    compress_logs: bool = True,
+    async_output: Optional[bool] = None
 ) -> logging.Logger:
     """
     Setup comprehensive logging system
@@ -201,6 +457,7 @@ def setup_logger(
         console_output: Enable console output
         file_output: Enable file output
         compress_logs: Compress old log files
+        async_output: Handlers behind a QueueListener thread (default: config LOG_ASYNC)
     
     Returns:
         Configured logger instance
@@ -317,6 +574,15 @@ def setup_logger(
         perf_logger.addHandler(perf_handler)
         perf_logger.propagate = False
     
+    # ========================================================================
+    # NON-BLOCKING OUTPUT
+    # ========================================================================
+    
+    if LOG_ASYNC if async_output is None else async_output:
+        install_async_handlers(logger, replace=True)
+        if file_output:
+            install_async_handlers(logging.getLogger('performance'))
+    
     # ========================================================================
     # LOGGING BANNER
     # ========================================================================
@@ -481,13 +747,11 @@ if __name__ == "__main__":
     
     # Test context manager
     with LogContext(logger, 'Test operation'):
-        import time
         time.sleep(0.5)
     
     # Test performance decorator
     @log_performance('Test function')
     def test_function():
-        import time
         time.sleep(0.2)
         return "Done"
     
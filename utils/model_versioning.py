@@ -404,6 +404,46 @@ class ModelVersioning:
         """
         return self.registry.get(model_name, [])
     
+    def prune_versions(self, model_name: str, keep_last: int) -> int:
+        """
+        Delete all but the newest `keep_last` versions of a model.
+        
+        The active production version is always kept, even when older.
+        
+        Args:
+            model_name: Model identifier
+            keep_last: Number of most recent versions to keep
+            
+        Returns:
+            Number of versions removed
+        """
+        entries = self.registry.get(model_name, [])
+        if keep_last < 1 or len(entries) <= keep_last:
+            return 0
+        
+        active = self.active_versions.get(model_name)
+        cutoff = len(entries) - keep_last
+        kept, removed = [], 0
+        for i, entry in enumerate(entries):
+            if i >= cutoff or entry['version'] == active:
+                kept.append(entry)
+                continue
+            try:
+                Path(entry['path']).unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"⚠️ Could not delete {entry['path']}: {e}")
+                kept.append(entry)
+                continue
+            removed += 1
+        
+        if removed:
+            self.registry[model_name] = kept
+            self._save_registry()
+            logger.info(f"🧹 Pruned {removed} old {model_name} versions (keeping {len(kept)})")
+        return removed
+    
     def get_production_version(self, model_name: str) -> Optional[str]:
         """
         Get currently deployed production version.
@@ -0,0 +1,216 @@
+"""
+Streaming OHLCV Resampler - 1m candles → any higher timeframe
+DEMIR AI v8.0
+
+One open bucket per target interval, updated in O(1) per base candle
+(open kept, high/low max/min, close replaced, volume summed):
+
+- Arbitrary intervals: '3m', '5m', '15m', '1h', '4h', '1d', '1w', '45m', ...
+  Buckets are aligned to the epoch like exchange klines; weeks start on
+  Monday 00:00 UTC (Binance convention)
+- Bar-closed events: a bar is closed by the base candle that completes
+  it (its last minute), or - when that candle is missing - by the first
+  candle of the next bucket
+- backfill(): bulk history in one vectorized NumPy pass per interval
+  (reduceat over bucket boundaries); the trailing incomplete bucket
+  becomes the open bar so streaming continues seamlessly
+
+Timestamps are epoch milliseconds (candle open time).
+
+Usage:
+    resampler = StreamingResampler(['15m', '1h', '4h', '1d'])
+    for interval, bar in resampler.update(ts, o, h, l, c, v):
+        store[interval].add_candle(bar)
+"""
+
+import re
+import logging
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MINUTE_MS = 60_000
+_UNIT_MS = {'m': MINUTE_MS, 'h': 60 * MINUTE_MS, 'd': 1440 * MINUTE_MS, 'w': 7 * 1440 * MINUTE_MS}
+WEEK_ORIGIN_MS = 4 * 1440 * MINUTE_MS  # 1970-01-05, first Monday after the epoch
+
+_INTERVAL = re.compile(r'^(\d+)([mhdw])$')
+
+
+def interval_ms(interval: str) -> int:
+    """'15m' → 900000"""
+    match = _INTERVAL.match(interval.strip().lower())
+    if not match or int(match.group(1)) <= 0:
+        raise ValueError(f"Unsupported interval: {interval!r}")
+    return int(match.group(1)) * _UNIT_MS[match.group(2)]
+
+
+def _origin(interval: str) -> int:
+    return WEEK_ORIGIN_MS if interval.strip().lower().endswith('w') else 0
+
+
+class _OpenBar:
+    __slots__ = ('start', 'open', 'high', 'low', 'close', 'volume', 'count')
+
+    def __init__(self, start: int, o: float, h: float, l: float, c: float, v: float, count: int = 1):
+        self.start = start
+        self.open = o
+        self.high = h
+        self.low = l
+        self.close = c
+        self.volume = v
+        self.count = count
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            'timestamp': self.start,
+            'open': self.open,
+            'high': self.high,
+            'low': self.low,
+            'close': self.close,
+            'volume': self.volume,
+        }
+
+
+class StreamingResampler:
+    """Resamples one symbol's base candles into several target intervals"""
+
+    def __init__(self, intervals: Sequence[str], base_interval: str = '1m'):
+        self.base_ms = interval_ms(base_interval)
+        self.intervals: List[str] = []
+        self._spec: Dict[str, Tuple[int, int]] = {}  # interval → (length ms, origin ms)
+        for interval in intervals:
+            length = interval_ms(interval)
+            if length < self.base_ms or length % self.base_ms:
+                raise ValueError(f"{interval} is not a multiple of the base interval {base_interval}")
+            self.intervals.append(interval)
+            self._spec[interval] = (length, _origin(interval))
+        self._open: Dict[str, Optional[_OpenBar]] = {interval: None for interval in self.intervals}
+        self.last_timestamp: Optional[int] = None
+
+    def bucket_start(self, interval: str, timestamp: int) -> int:
+        length, origin = self._spec[interval]
+        return (timestamp - origin) // length * length + origin
+
+    def update(self, timestamp: int, o: float, h: float, l: float, c: float, v: float) -> List[Tuple[str, Dict[str, float]]]:
+        """
+        Feed one base candle (must be newer than the previous one).
+
+        Returns:
+            [(interval, bar), ...] for every bar closed by this candle
+        """
+        timestamp = int(timestamp)
+        if self.last_timestamp is not None and timestamp <= self.last_timestamp:
+            return []
+        self.last_timestamp = timestamp
+
+        closed = []
+        candle_end = timestamp + self.base_ms
+        for interval in self.intervals:
+            length, origin = self._spec[interval]
+            start = (timestamp - origin) // length * length + origin
+            bar = self._open[interval]
+            if bar is not None and bar.start != start:
+                # Gap: the completing candle never came
+                closed.append((interval, bar.as_dict()))
+                bar = None
+            if bar is None:
+                bar = _OpenBar(start, o, h, l, c, v)
+            else:
+                if h > bar.high:
+                    bar.high = h
+                if l < bar.low:
+                    bar.low = l
+                bar.close = c
+                bar.volume += v
+                bar.count += 1
+            if candle_end >= start + length:
+                closed.append((interval, bar.as_dict()))
+                bar = None
+            self._open[interval] = bar
+        return closed
+
+    def open_bar(self, interval: str) -> Optional[Dict[str, float]]:
+        """The forming (not yet closed) bar of `interval`"""
+        bar = self._open.get(interval)
+        return bar.as_dict() if bar is not None else None
+
+    def backfill(self, columns: Dict[str, Iterable[float]]) -> Dict[str, Dict[str, np.ndarray]]:
+        """
+        Bulk history: {'timestamp', 'open', 'high', 'low', 'close', 'volume'}
+        arrays of base candles (ascending). Candles not newer than the last
+        one seen are skipped; open bars are replaced by the trailing buckets.
+
+        Returns:
+            {interval: {field: ndarray}} of closed bars (no events emitted)
+        """
+        ts = np.asarray(columns['timestamp'], dtype=np.int64)
+        o = np.asarray(columns['open'], dtype=np.float64)
+        h = np.asarray(columns['high'], dtype=np.float64)
+        l = np.asarray(columns['low'], dtype=np.float64)
+        c = np.asarray(columns['close'], dtype=np.float64)
+        v = np.asarray(columns['volume'], dtype=np.float64)
+
+        if self.last_timestamp is not None:
+            keep = ts > self.last_timestamp
+            ts, o, h, l, c, v = ts[keep], o[keep], h[keep], l[keep], c[keep], v[keep]
+        result: Dict[str, Dict[str, np.ndarray]] = {}
+        if not len(ts):
+            return result
+        if len(ts) > 1 and np.any(np.diff(ts) <= 0):
+            order = np.argsort(ts, kind='stable')
+            ts, o, h, l, c, v = ts[order], o[order], h[order], l[order], c[order], v[order]
+            unique = np.concatenate(([True], np.diff(ts) > 0))
+            ts, o, h, l, c, v = ts[unique], o[unique], h[unique], l[unique], c[unique], v[unique]
+
+        for interval in self.intervals:
+            length, origin = self._spec[interval]
+            buckets = (ts - origin) // length * length + origin
+            starts = np.concatenate(([0], np.flatnonzero(np.diff(buckets)) + 1))
+            ends = np.append(starts[1:], len(ts))
+
+            bars = {
+                'timestamp': buckets[starts].astype(np.float64),
+                'open': o[starts],
+                'high': np.maximum.reduceat(h, starts),
+                'low': np.minimum.reduceat(l, starts),
+                'close': c[ends - 1],
+                'volume': np.add.reduceat(v, starts),
+            }
+            counts = ends - starts
+
+            # Earlier open bar: continues into the first backfilled bucket,
+            # or was left incomplete and closes ahead of the backfilled bars
+            previous = self._open[interval]
+            carried = None
+            if previous is not None:
+                if previous.start == buckets[0]:
+                    bars['open'][0] = previous.open
+                    bars['high'][0] = max(bars['high'][0], previous.high)
+                    bars['low'][0] = min(bars['low'][0], previous.low)
+                    bars['volume'][0] += previous.volume
+                    counts[0] += previous.count
+                else:
+                    carried = previous.as_dict()
+
+            # Trailing bucket stays open unless its last candle completed it
+            last = len(starts) - 1
+            if ts[-1] + self.base_ms >= buckets[-1] + length:
+                self._open[interval] = None
+                closed = slice(None)
+            else:
+                self._open[interval] = _OpenBar(
+                    int(buckets[-1]), float(bars['open'][last]), float(bars['high'][last]),
+                    float(bars['low'][last]), float(bars['close'][last]), float(bars['volume'][last]),
+                    int(counts[last]),
+                )
+                closed = slice(0, last)
+
+            result[interval] = {
+                name: np.concatenate(([carried[name]], values[closed])) if carried else values[closed]
+                for name, values in bars.items()
+            }
+
+        self.last_timestamp = int(ts[-1])
+        return result
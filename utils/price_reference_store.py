@@ -0,0 +1,221 @@
+# utils/price_reference_store.py
+"""
+🔍 DEMIR AI v8.0 - PRICE REFERENCE STORE
+
+In-memory reference prices for RealDataVerifier cross-validation.
+
+The store is fed by the data streams that are already running
+(BinanceWebSocketManager ticker stream, PriceFetcherFallback REST sweep)
+and refreshed in bulk from Binance `/api/v3/ticker/price` (one request for
+every symbol) when a lookup finds no fresh reference. Cross-validation then
+compares against memory instead of making one HTTP round trip per price.
+"""
+
+import time
+import logging
+import threading
+from typing import Dict, Any, Optional, Tuple
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+BINANCE_TICKER_PRICE_URL = "https://api.binance.com/api/v3/ticker/price"
+
+
+class PriceReferenceStore:
+    """
+    Thread-safe symbol → (price, timestamp, source) map with a freshness window.
+
+    - update()/update_many(): feed from live streams
+    - get(): fresh reference or None (counts hits/misses)
+    - refresh_snapshot(): bulk REST refresh, rate limited and single-flight
+    """
+
+    def __init__(
+        self,
+        max_age_seconds: float = 15.0,
+        min_refresh_interval: float = 5.0,
+        snapshot_url: str = BINANCE_TICKER_PRICE_URL,
+        request_timeout: float = 5.0
+    ):
+        """
+        Args:
+            max_age_seconds: References older than this are treated as missing
+            min_refresh_interval: Minimum seconds between bulk snapshot refreshes
+            snapshot_url: Bulk ticker endpoint (returns all symbols)
+            request_timeout: HTTP timeout for the snapshot request
+        """
+        self.max_age_seconds = max_age_seconds
+        self.min_refresh_interval = min_refresh_interval
+        self.snapshot_url = snapshot_url
+        self.request_timeout = request_timeout
+
+        # symbol -> (price, timestamp, source)
+        self._prices: Dict[str, Tuple[float, float, str]] = {}
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._last_refresh_attempt = 0.0
+
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'stale': 0,
+            'updates': 0,
+            'snapshot_refreshes': 0,
+            'snapshot_failures': 0,
+            'last_snapshot_time': None,
+            'last_snapshot_latency_ms': 0.0
+        }
+
+    # ========================================================================
+    # FEED
+    # ========================================================================
+
+    def update(
+        self,
+        symbol: str,
+        price: float,
+        source: str,
+        timestamp: Optional[float] = None
+    ):
+        """Record a reference price observed on a live stream"""
+        if not price or price <= 0:
+            return
+        with self._lock:
+            self._prices[symbol.upper()] = (float(price), timestamp or time.time(), source)
+            self.stats['updates'] += 1
+
+    def update_many(
+        self,
+        prices: Dict[str, float],
+        source: str,
+        timestamp: Optional[float] = None
+    ):
+        """Record a batch of reference prices observed at the same time"""
+        ts = timestamp or time.time()
+        with self._lock:
+            for symbol, price in prices.items():
+                if price and price > 0:
+                    self._prices[symbol.upper()] = (float(price), ts, source)
+            self.stats['updates'] += len(prices)
+
+    # ========================================================================
+    # LOOKUP
+    # ========================================================================
+
+    def get(
+        self,
+        symbol: str,
+        max_age: Optional[float] = None
+    ) -> Optional[Tuple[float, float, str]]:
+        """
+        Get a fresh reference for symbol
+
+        Returns:
+            (price, timestamp, source) or None if missing/stale
+        """
+        max_age = self.max_age_seconds if max_age is None else max_age
+        entry = self._prices.get(symbol.upper())
+
+        if entry is None:
+            self.stats['misses'] += 1
+            return None
+
+        if time.time() - entry[1] > max_age:
+            self.stats['stale'] += 1
+            self.stats['misses'] += 1
+            return None
+
+        self.stats['hits'] += 1
+        return entry
+
+    def is_fresh(self, symbol: str, max_age: Optional[float] = None) -> bool:
+        """True if get() would answer from memory (no stats recorded)"""
+        max_age = self.max_age_seconds if max_age is None else max_age
+        entry = self._prices.get(symbol.upper())
+        return entry is not None and time.time() - entry[1] <= max_age
+
+    def refresh_snapshot(self, force: bool = False) -> bool:
+        """
+        Refresh every symbol from one bulk REST request
+
+        Concurrent callers do not stack requests: only one refresh runs at a
+        time and refreshes are spaced by min_refresh_interval.
+
+        Returns:
+            True if a snapshot was loaded by this call
+        """
+        now = time.time()
+        if not force and now - self._last_refresh_attempt < self.min_refresh_interval:
+            return False
+
+        if not self._refresh_lock.acquire(blocking=False):
+            return False
+
+        try:
+            self._last_refresh_attempt = now
+            start = time.time()
+
+            response = requests.get(self.snapshot_url, timeout=self.request_timeout)
+            response.raise_for_status()
+
+            prices = {
+                ticker['symbol']: float(ticker['price'])
+                for ticker in response.json()
+            }
+            self.update_many(prices, source='BINANCE_REST_SNAPSHOT')
+
+            self.stats['snapshot_refreshes'] += 1
+            self.stats['last_snapshot_time'] = time.time()
+            self.stats['last_snapshot_latency_ms'] = (time.time() - start) * 1000
+
+            logger.debug(
+                f"Reference snapshot refreshed | Symbols: {len(prices)} | "
+                f"Latency: {self.stats['last_snapshot_latency_ms']:.1f}ms"
+            )
+            return True
+
+        except Exception as e:
+            self.stats['snapshot_failures'] += 1
+            logger.warning(f"⚠️ Reference snapshot refresh failed: {e}")
+            return False
+
+        finally:
+            self._refresh_lock.release()
+
+    # ========================================================================
+    # STATISTICS
+    # ========================================================================
+
+    def get_hit_ratio(self) -> float:
+        """Share of lookups answered from memory (0.0 - 1.0)"""
+        lookups = self.stats['hits'] + self.stats['misses']
+        return self.stats['hits'] / lookups if lookups > 0 else 0.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get store statistics"""
+        return {
+            **self.stats,
+            'symbols': len(self._prices),
+            'hit_ratio': round(self.get_hit_ratio(), 4),
+            'max_age_seconds': self.max_age_seconds
+        }
+
+
+# ============================================================================
+# GLOBAL INSTANCE
+# ============================================================================
+
+_global_store = None
+_global_store_lock = threading.Lock()
+
+
+def get_price_reference_store() -> PriceReferenceStore:
+    """Get global reference store (shared by verifiers and stream feeders)"""
+    global _global_store
+    if _global_store is None:
+        with _global_store_lock:
+            if _global_store is None:
+                _global_store = PriceReferenceStore()
+    return _global_store
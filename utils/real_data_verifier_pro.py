@@ -38,6 +38,7 @@ VERSION: 8.0
 
 import os
 import time
+import asyncio
 import logging
 import requests
 from datetime import datetime, timedelta
@@ -45,6 +46,8 @@ from typing import Dict, List, Tuple, Optional, Any
 from collections import deque, defaultdict
 import numpy as np
 
+from utils.price_reference_store import PriceReferenceStore, get_price_reference_store
+
 logger = logging.getLogger(__name__)
 
 # Create specialized logger for real data verification events (NEW v8.0)
@@ -105,8 +108,17 @@ class RealDataVerifier:
     - Comprehensive logging for all validation events (NEW v8.0)
     """
     
-    def __init__(self):
-        """Initialize the verifier with enhanced logging"""
+    def __init__(self, reference_store: Optional[PriceReferenceStore] = None):
+        """
+        Initialize the verifier with enhanced logging
+        
+        Args:
+            reference_store: Reference prices for cross-validation
+                             (defaults to the shared global store)
+        """
+        
+        # In-memory reference prices fed by live streams
+        self.reference_store = reference_store or get_price_reference_store()
         
         # Price history for validation (last 100 prices per symbol)
         self.price_history: Dict[str, deque] = defaultdict(lambda: deque(maxlen=100))
@@ -142,7 +154,9 @@ class RealDataVerifier:
             'average_validation_time_ms': 0.0,
             'total_cross_validations': 0,
             'successful_cross_validations': 0,
-            'failed_cross_validations': 0
+            'failed_cross_validations': 0,
+            'reference_hits': 0,
+            'reference_misses': 0
         }
         
         real_data_logger.info(
@@ -501,8 +515,17 @@ class RealDataVerifier:
         price: float,
         exchange: str
     ) -> bool:
-        """Async version of verify_price"""
-        is_valid, msg = self.verify_price(symbol, price, exchange)
+        """
+        Async version of verify_price
+
+        A fresh in-memory reference is checked inline; a miss needs the
+        bulk snapshot / REST fallback, which runs on a worker thread so the
+        event loop never waits on HTTP.
+        """
+        if self.reference_store.is_fresh(symbol):
+            is_valid, msg = self.verify_price(symbol, price, exchange)
+        else:
+            is_valid, msg = await asyncio.to_thread(self.verify_price, symbol, price, exchange)
         real_data_logger.debug(
             f"🔄 Async verification | Symbol: {symbol} | Valid: {is_valid} | Message: {msg[:50]}..."
         )
@@ -623,6 +646,19 @@ class RealDataVerifier:
         cross_validation_start = time.time()
         self.performance_metrics['total_cross_validations'] += 1
         
+        # Fast path: in-memory reference fed by live streams / bulk snapshot
+        reference = self.reference_store.get(symbol)
+        if reference is None and self.reference_store.refresh_snapshot():
+            reference = self.reference_store.get(symbol)
+        
+        if reference is not None:
+            self.performance_metrics['reference_hits'] += 1
+            return self._compare_with_reference(
+                symbol, price, reference, tolerance, cross_validation_start
+            )
+        
+        self.performance_metrics['reference_misses'] += 1
+        
         cross_validation_logger.info(
             f"🔗 CROSS-VALIDATION STARTED | "
             f"Symbol: {symbol} | "
@@ -644,6 +680,7 @@ class RealDataVerifier:
             if response.status_code == 200:
                 data = response.json()
                 live_price = float(data['price'])
+                self.reference_store.update(symbol, live_price, 'BINANCE_REST')
                 
                 # Calculate deviation
                 deviation = abs(price - live_price) / live_price
@@ -716,6 +753,59 @@ class RealDataVerifier:
             self.performance_metrics['failed_cross_validations'] += 1
             return False, f"Cross-validation failed: {e}"
     
+    def _compare_with_reference(
+        self,
+        symbol: str,
+        price: float,
+        reference: Tuple[float, float, str],
+        tolerance: float,
+        cross_validation_start: float
+    ) -> Tuple[bool, str]:
+        """
+        Compare price against an in-memory reference (no network I/O)
+        
+        Args:
+            symbol: Trading pair
+            price: Price to validate
+            reference: (price, timestamp, source) from the reference store
+            tolerance: Acceptable deviation
+            cross_validation_start: Start time for duration metrics
+        
+        Returns:
+            (is_valid, message)
+        """
+        ref_price, ref_timestamp, ref_source = reference
+        deviation = abs(price - ref_price) / ref_price
+        ref_age = time.time() - ref_timestamp
+        
+        if deviation > tolerance:
+            self.performance_metrics['failed_cross_validations'] += 1
+            cross_validation_logger.error(
+                f"❌ CROSS-VALIDATION FAILED | "
+                f"Symbol: {symbol} | "
+                f"Deviation: {deviation*100:.2f}% > Tolerance: {tolerance*100}% | "
+                f"Reported: ${price:.2f} | "
+                f"Reference: ${ref_price:.2f} ({ref_source}, {ref_age:.1f}s old)"
+            )
+            return False, (
+                f"Price deviation: {deviation*100:.1f}% "
+                f"(reported: ${price:.2f}, reference: ${ref_price:.2f})"
+            )
+        
+        self.performance_metrics['successful_cross_validations'] += 1
+        cross_validation_logger.debug(
+            f"✅ CROSS-VALIDATION PASSED (memory) | "
+            f"Symbol: {symbol} | "
+            f"Deviation: {deviation*100:.3f}% | "
+            f"Reference: {ref_source}, {ref_age:.1f}s old | "
+            f"Duration: {(time.time() - cross_validation_start) * 1000:.3f}ms"
+        )
+        
+        return True, (
+            f"Cross-validated with {ref_source} reference: "
+            f"deviation {deviation*100:.2f}%"
+        )
+    
     def _cross_validate_bybit(
         self,
         symbol: str,
@@ -980,6 +1070,12 @@ class RealDataVerifier:
             'exchange_health': self.exchange_health,
             'recent_rejections': list(self.rejection_log)[-10:],
             'performance': self.performance_metrics,
+            'reference_hit_ratio': (
+                (self.performance_metrics['reference_hits'] /
+                 (self.performance_metrics['reference_hits'] + self.performance_metrics['reference_misses']) * 100)
+                if (self.performance_metrics['reference_hits'] + self.performance_metrics['reference_misses']) > 0 else 0.0
+            ),
+            'reference_store': self.reference_store.get_stats(),
             'cross_validation_success_rate': (
                 (self.performance_metrics['successful_cross_validations'] / 
                  self.performance_metrics['total_cross_validations'] * 100)
@@ -1034,7 +1130,9 @@ class RealDataVerifier:
             'average_validation_time_ms': 0.0,
             'total_cross_validations': 0,
             'successful_cross_validations': 0,
-            'failed_cross_validations': 0
+            'failed_cross_validations': 0,
+            'reference_hits': 0,
+            'reference_misses': 0
         }
         
         real_data_logger.info("✅ Statistics reset complete")
@@ -5,25 +5,26 @@ Reduces API calls and improves performance
 """
 
 import logging
-from typing import Any, Optional, Dict
-from datetime import datetime, timedelta
+from typing import Any, Callable, Optional, Dict
 import json
 import hashlib
 
+from utils.tiered_cache import get_cache
+
 logger = logging.getLogger(__name__)
 
 
 class ResponseCache:
     """
-    In-memory cache for API responses.
-    Production version would use Redis.
-    This is local implementation for Railway.
+    Cache for API responses.
+    Bounded in-process LRU in front of Redis (when REDIS_URL is reachable),
+    via the shared tiered cache.
     """
 
-    def __init__(self, default_ttl_seconds: int = 300):
+    def __init__(self, default_ttl_seconds: int = 300, max_entries: int = 5000, namespace: str = 'response'):
         """Initialize cache."""
-        self.cache: Dict[str, Dict[str, Any]] = {}
         self.default_ttl = default_ttl_seconds
+        self.cache = get_cache(namespace, max_entries=max_entries, default_ttl=default_ttl_seconds)
 
     def generate_key(self, api_name: str, params: Dict[str, Any]) -> str:
         """Generate cache key from API name and parameters."""
@@ -39,89 +40,55 @@ class ResponseCache:
     ) -> None:
         """Set cache entry with TTL."""
         ttl = ttl_seconds or self.default_ttl
-        expiry = datetime.now() + timedelta(seconds=ttl)
-
-        self.cache[key] = {
-            'value': value,
-            'expiry': expiry.timestamp(),
-            'created': datetime.now().timestamp()
-        }
-
+        self.cache.set(key, value, ttl=ttl)
         logger.debug(f"Cache SET: {key} (TTL: {ttl}s)")
 
     def get(self, key: str) -> Optional[Any]:
         """Get cache entry if not expired."""
-        if key not in self.cache:
-            logger.debug(f"Cache MISS: {key}")
-            return None
+        return self.cache.get(key)
 
-        entry = self.cache[key]
-
-        # Check if expired
-        if datetime.now().timestamp() > entry['expiry']:
-            del self.cache[key]
-            logger.debug(f"Cache EXPIRED: {key}")
-            return None
-
-        logger.debug(f"Cache HIT: {key}")
-        return entry['value']
+    def get_or_fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Any],
+        ttl_seconds: Optional[int] = None,
+        stale_seconds: float = 0
+    ) -> Optional[Any]:
+        """Read-through: one fetch per key on a miss, stale value served while refreshing."""
+        return self.cache.get_or_load(key, fetch, ttl=ttl_seconds or self.default_ttl, stale_ttl=stale_seconds)
 
     def invalidate(self, pattern: str) -> int:
         """Invalidate cache entries matching pattern."""
-        keys_to_delete = [k for k in self.cache.keys() if pattern in k]
-
-        for key in keys_to_delete:
-            del self.cache[key]
-
-        logger.info(f"Cache invalidated {len(keys_to_delete)} entries matching '{pattern}'")
-        return len(keys_to_delete)
+        removed = self.cache.invalidate(pattern)
+        logger.info(f"Cache invalidated {removed} entries matching '{pattern}'")
+        return removed
 
     def clear(self) -> None:
         """Clear entire cache."""
-        self.cache.clear()
+        self.cache.invalidate()
         logger.info("Cache cleared")
 
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
-        total_entries = len(self.cache)
-        expired_count = 0
-        now = datetime.now().timestamp()
-
-        for entry in self.cache.values():
-            if now > entry['expiry']:
-                expired_count += 1
+        stats = self.cache.get_stats()
+        expired_count = self.cache.cache.count_expired(self.cache.name)
 
         return {
-            'total_entries': total_entries,
+            'total_entries': stats['entries'],
             'expired_entries': expired_count,
-            'active_entries': total_entries - expired_count,
-            'memory_estimate_kb': len(str(self.cache)) / 1024
+            'active_entries': stats['entries'] - expired_count,
+            **stats
         }
 
     def cleanup_expired(self) -> int:
         """Remove all expired entries."""
-        now = datetime.now().timestamp()
-        keys_to_delete = [
-            k for k, v in self.cache.items()
-            if now > v['expiry']
-        ]
+        removed = self.cache.cache.purge_expired(self.cache.name)
 
-        for key in keys_to_delete:
-            del self.cache[key]
+        if removed:
+            logger.info(f"Cleaned up {removed} expired cache entries")
 
-        if keys_to_delete:
-            logger.info(f"Cleaned up {len(keys_to_delete)} expired cache entries")
-
-        return len(keys_to_delete)
+        return removed
 
     def get_hit_rate(self) -> float:
-        """Get estimated cache hit rate."""
-        if not hasattr(self, '_hits'):
-            self._hits = 0
-            self._misses = 0
-
-        total = self._hits + self._misses
-        if total == 0:
-            return 0.0
-
-        return (self._hits / total) * 100
+        """Get cache hit rate."""
+        return self.cache.get_stats()['hit_rate']
@@ -0,0 +1,166 @@
+"""
+Columnar OHLCV ring buffer - zero-copy NumPy views
+
+One preallocated float64 array per field. Every row is written twice
+(slot i and slot i + capacity), so the last N rows are always one
+contiguous slice and can be handed to NumPy/TA-Lib without copying.
+
+Single writer; readers get read-only views that alias the buffer (copy
+them if they must survive further appends).
+"""
+
+import logging
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+OHLCV_FIELDS: Tuple[str, ...] = ('timestamp', 'open', 'high', 'low', 'close', 'volume')
+
+
+class ColumnarRingBuffer:
+    """
+    Fixed-capacity columnar ring buffer
+
+    Usage:
+        buf = ColumnarRingBuffer(500)
+        buf.append(timestamp=ts, open=o, high=h, low=l, close=c, volume=v)
+        buf.update_last(close=c2)           # newest row changed in place
+        closes = buf.view('close')          # last len(buf) closes, no copy
+        arrays = buf.views(100)             # {'open': ..., 'close': ...}
+    """
+
+    def __init__(self, capacity: int, fields: Sequence[str] = OHLCV_FIELDS):
+        """
+        Args:
+            capacity: Maximum number of rows kept
+            fields: Column names (each stored as float64)
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+
+        self.capacity = capacity
+        self.fields: Tuple[str, ...] = tuple(fields)
+        self._data: Dict[str, np.ndarray] = {
+            name: np.zeros(2 * capacity, dtype=np.float64) for name in self.fields
+        }
+        self._count = 0  # total rows ever appended
+
+    # ========================================================================
+    # WRITE
+    # ========================================================================
+
+    def append(self, **values: float):
+        """Append one row (missing fields are stored as NaN)"""
+        slot = self._count % self.capacity
+        mirror = slot + self.capacity
+        for name, column in self._data.items():
+            value = values.get(name, np.nan)
+            column[slot] = value
+            column[mirror] = value
+        self._count += 1
+
+    def append_row(self, row: Sequence[float]):
+        """Append one row given in `fields` order"""
+        slot = self._count % self.capacity
+        mirror = slot + self.capacity
+        for column, value in zip(self._data.values(), row):
+            column[slot] = value
+            column[mirror] = value
+        self._count += 1
+
+    def update_last(self, **values: float):
+        """Overwrite fields of the newest row in place (e.g. the still-open candle); others are kept"""
+        if not self._count:
+            raise IndexError("update_last on an empty ring buffer")
+        slot = (self._count - 1) % self.capacity
+        for name, value in values.items():
+            column = self._data[name]
+            column[slot] = value
+            column[slot + self.capacity] = value
+
+    def extend(self, columns: Dict[str, Iterable[float]]):
+        """Bulk append equal-length columns (vectorized)"""
+        arrays = {name: np.asarray(values, dtype=np.float64) for name, values in columns.items()}
+        if not arrays:
+            return
+        n = len(next(iter(arrays.values())))
+        if n == 0:
+            return
+
+        # Only the last `capacity` rows can survive
+        skip = max(0, n - self.capacity)
+        slots = (self._count + skip + np.arange(n - skip)) % self.capacity
+        for name, column in self._data.items():
+            values = arrays[name][skip:] if name in arrays else np.nan
+            column[slots] = values
+            column[slots + self.capacity] = values
+        self._count += n
+
+    def clear(self):
+        """Drop all rows (storage is kept)"""
+        self._count = 0
+
+    # ========================================================================
+    # READ
+    # ========================================================================
+
+    def __len__(self) -> int:
+        return min(self._count, self.capacity)
+
+    @property
+    def total_appended(self) -> int:
+        return self._count
+
+    def _bounds(self, n: Optional[int]) -> Tuple[int, int]:
+        size = len(self)
+        n = size if n is None else max(0, min(n, size))
+        end = (self._count - 1) % self.capacity + self.capacity + 1 if self._count else 0
+        return end - n, end
+
+    def view(self, field: str, n: Optional[int] = None) -> np.ndarray:
+        """Read-only contiguous view of the last n values of field (oldest first)"""
+        start, end = self._bounds(n)
+        view = self._data[field][start:end]
+        view.flags.writeable = False
+        return view
+
+    def views(self, n: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """Read-only views of the last n rows for every field"""
+        start, end = self._bounds(n)
+        result = {}
+        for name, column in self._data.items():
+            view = column[start:end]
+            view.flags.writeable = False
+            result[name] = view
+        return result
+
+    def latest(self, field: str) -> Optional[float]:
+        """Most recent value of field (None when empty)"""
+        if not self._count:
+            return None
+        return float(self._data[field][(self._count - 1) % self.capacity])
+
+    def row(self, index: int = -1) -> Dict[str, float]:
+        """Single row as dict (index like a list: 0 = oldest, -1 = newest)"""
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("ring buffer index out of range")
+        start, _ = self._bounds(None)
+        return {name: float(column[start + index]) for name, column in self._data.items()}
+
+    def rows(self, n: Optional[int] = None) -> list:
+        """Last n rows as dicts (copies - for legacy list-of-dict consumers)"""
+        arrays = self.views(n)
+        names = list(arrays)
+        return [
+            dict(zip(names, values))
+            for values in zip(*(arrays[name].tolist() for name in names))
+        ]
+
+    @property
+    def nbytes(self) -> int:
+        return sum(column.nbytes for column in self._data.values())
@@ -0,0 +1,311 @@
+"""
+Rolling Correlation Matrix - N×N correlation / covariance kept in memory
+DEMIR AI v8.0
+
+Fed by the live kline stream (closed bars); nothing is re-downloaded:
+
+- Bars are aligned by open time across symbols; a symbol missing from a
+  bar is forward-filled (zero return)
+- Rolling windows (several lengths at once): running sums and
+  cross-products of log returns, O(N²) per bar - the oldest bar's outer
+  product leaves as the new one enters; re-summed exactly once per window
+  to cancel float drift
+- EWMA (RiskMetrics, zero-mean): C = λ·C + (1-λ)·r·rᵀ
+- Served from memory: full matrix, sub-blocks, single pairs, covariance
+- Regime-break alerts: a pair whose short-window correlation departs from
+  the long-window one by more than `break_threshold`
+
+Usage:
+    matrix = RollingCorrelationMatrix(['BTCUSDT', 'ETHUSDT', 'SOLUSDT'], windows=(60, 240))
+    matrix.on_kline('BTCUSDT', open_time_ms, close)
+    matrix.correlation('BTCUSDT', 'ETHUSDT', window=240)
+    symbols, corr = matrix.matrix('ewma')
+"""
+
+import math
+import time
+import logging
+import threading
+from collections import deque
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+EWMA = 'ewma'
+Window = Union[int, str]
+
+
+class _RollingMoments:
+    """Sums and cross-products of the last `length` return vectors"""
+
+    def __init__(self, length: int, n: int):
+        self.length = length
+        self.returns = np.zeros((length, n))
+        self.sums = np.zeros(n)
+        self.products = np.zeros((n, n))
+        self.count = 0
+        self.pos = 0
+        self.since_resync = 0
+
+    def push(self, r: np.ndarray):
+        if self.count == self.length:
+            old = self.returns[self.pos]
+            self.sums -= old
+            self.products -= np.outer(old, old)
+        else:
+            self.count += 1
+        self.returns[self.pos] = r
+        self.sums += r
+        self.products += np.outer(r, r)
+        self.pos = (self.pos + 1) % self.length
+
+        self.since_resync += 1
+        if self.since_resync >= self.length:
+            block = self.returns[:self.count]
+            self.sums = block.sum(axis=0)
+            self.products = block.T @ block
+            self.since_resync = 0
+
+    def covariance(self) -> Optional[np.ndarray]:
+        if self.count < 2:
+            return None
+        mean = self.sums / self.count
+        return (self.products - self.count * np.outer(mean, mean)) / (self.count - 1)
+
+
+def _to_correlation(cov: np.ndarray) -> np.ndarray:
+    std = np.sqrt(np.clip(np.diag(cov), 0.0, None))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        corr = cov / np.outer(std, std)
+    corr[~np.isfinite(corr)] = np.nan
+    np.fill_diagonal(corr, 1.0)
+    return np.clip(corr, -1.0, 1.0)
+
+
+class RollingCorrelationMatrix:
+    """Incremental N×N correlation over a fixed symbol universe"""
+
+    def __init__(
+        self,
+        symbols: Sequence[str],
+        windows: Sequence[int] = (60, 240),
+        ewma_lambda: float = 0.94,
+        break_threshold: float = 0.4,
+        min_periods: int = 20,
+        max_alerts: int = 200,
+    ):
+        self.symbols: List[str] = [s.upper() for s in symbols]
+        self.index: Dict[str, int] = {s: i for i, s in enumerate(self.symbols)}
+        n = len(self.symbols)
+        self.windows = tuple(sorted(set(int(w) for w in windows)))
+        self._rolling = {w: _RollingMoments(w, n) for w in self.windows}
+        self.ewma_lambda = ewma_lambda
+        self._ewma_cov = np.zeros((n, n))
+        self._ewma_count = 0
+        self.break_threshold = break_threshold
+        self.min_periods = min_periods
+
+        self._last_close = np.full(n, np.nan)
+        self._pending_time: Optional[int] = None
+        self._pending = np.full(n, np.nan)
+        self.bars = 0
+        self.last_bar_time: Optional[int] = None
+        self.update_seconds = 0.0
+
+        self.alerts: deque = deque(maxlen=max_alerts)
+        self._active_breaks: set = set()
+        self.alert_listeners: List[Callable[[Dict], None]] = []
+        self._lock = threading.RLock()
+        logger.info(f"✅ RollingCorrelationMatrix: {n} symbols, windows {self.windows} + EWMA(λ={ewma_lambda})")
+
+    # ------------------------------------------------------------------
+    # Feeding
+    # ------------------------------------------------------------------
+
+    def on_kline(self, symbol: str, open_time: int, close: float):
+        """One closed bar of one symbol; a bar completes when every symbol reported or a newer bar starts"""
+        i = self.index.get(symbol.upper())
+        if i is None or not close or close <= 0:
+            return
+        with self._lock:
+            if self._pending_time is None or open_time > self._pending_time:
+                if self._pending_time is not None:
+                    self._close_bar()
+                self._pending_time = open_time
+            elif open_time < self._pending_time:
+                return  # late bar of an already closed interval
+            self._pending[i] = close
+            if not np.isnan(self._pending).any():
+                self._close_bar()
+
+    def update(self, closes: Dict[str, float], bar_time: Optional[int] = None):
+        """A whole bar at once: {symbol: close}"""
+        with self._lock:
+            if self._pending_time is not None:
+                self._close_bar()
+            for symbol, close in closes.items():
+                i = self.index.get(symbol.upper())
+                if i is not None and close and close > 0:
+                    self._pending[i] = close
+            self._pending_time = bar_time if bar_time is not None else int(time.time() * 1000)
+            self._close_bar()
+
+    def _close_bar(self):
+        started = time.perf_counter()
+        closes = np.where(np.isnan(self._pending), self._last_close, self._pending)
+        previous = self._last_close
+        self._last_close = closes
+        bar_time = self._pending_time
+        self._pending = np.full(len(self.symbols), np.nan)
+        self._pending_time = None
+
+        if np.isnan(previous).all():
+            return
+        with np.errstate(divide='ignore', invalid='ignore'):
+            r = np.log(closes / previous)
+        r[~np.isfinite(r)] = 0.0
+
+        for moments in self._rolling.values():
+            moments.push(r)
+        lam = self.ewma_lambda
+        self._ewma_cov *= lam
+        self._ewma_cov += (1.0 - lam) * np.outer(r, r)
+        self._ewma_count += 1
+
+        self.bars += 1
+        self.last_bar_time = bar_time
+        self._check_breaks(bar_time)
+        self.update_seconds = time.perf_counter() - started
+
+    # ------------------------------------------------------------------
+    # Regime breaks
+    # ------------------------------------------------------------------
+
+    def _check_breaks(self, bar_time: Optional[int]):
+        if len(self.windows) < 2:
+            return
+        short_w, long_w = self.windows[0], self.windows[-1]
+        if self._rolling[long_w].count < long_w or self._rolling[short_w].count < max(self.min_periods, short_w):
+            return
+        short = _to_correlation(self._rolling[short_w].covariance())
+        long = _to_correlation(self._rolling[long_w].covariance())
+        delta = np.nan_to_num(short - long)
+        rows, cols = np.nonzero(np.triu(np.abs(delta) > self.break_threshold, k=1))
+
+        current = set()
+        for i, j in zip(rows.tolist(), cols.tolist()):
+            pair = (self.symbols[i], self.symbols[j])
+            current.add(pair)
+            if pair in self._active_breaks:
+                continue
+            alert = {
+                'pair': f'{pair[0]}/{pair[1]}',
+                'short_window': short_w,
+                'long_window': long_w,
+                'short_corr': round(float(short[i, j]), 4),
+                'long_corr': round(float(long[i, j]), 4),
+                'delta': round(float(delta[i, j]), 4),
+                'bar_time': bar_time,
+            }
+            self.alerts.append(alert)
+            logger.warning(f"⚠️ Correlation break {alert['pair']}: {alert['long_corr']:+.2f} → {alert['short_corr']:+.2f}")
+            for listener in self.alert_listeners:
+                try:
+                    listener(alert)
+                except Exception as e:
+                    logger.error(f"Correlation alert listener error: {e}")
+        self._active_breaks = current
+
+    def on_alert(self, listener: Callable[[Dict], None]):
+        self.alert_listeners.append(listener)
+
+    # ------------------------------------------------------------------
+    # Serving
+    # ------------------------------------------------------------------
+
+    def _cov(self, window: Window) -> Optional[np.ndarray]:
+        if window == EWMA:
+            return self._ewma_cov.copy() if self._ewma_count >= self.min_periods else None
+        moments = self._rolling.get(int(window))
+        if moments is None:
+            raise ValueError(f"Unknown window {window!r}; available: {self.windows} or '{EWMA}'")
+        return moments.covariance() if moments.count >= self.min_periods else None
+
+    def ready(self, window: Window = EWMA) -> bool:
+        with self._lock:
+            return self._cov(window) is not None
+
+    def covariance(self, window: Window = EWMA, symbols: Optional[Sequence[str]] = None) -> Optional[np.ndarray]:
+        """Covariance of per-bar log returns (None until `min_periods` bars)"""
+        with self._lock:
+            cov = self._cov(window)
+        if cov is None:
+            return None
+        if symbols is not None:
+            idx = [self.index[s.upper()] for s in symbols]
+            cov = cov[np.ix_(idx, idx)]
+        return cov
+
+    def matrix(self, window: Window = EWMA, symbols: Optional[Sequence[str]] = None) -> Tuple[List[str], Optional[np.ndarray]]:
+        """(symbols, correlation matrix) - the full universe or a sub-block"""
+        names = [s.upper() for s in symbols] if symbols is not None else list(self.symbols)
+        cov = self.covariance(window, names if symbols is not None else None)
+        return names, (_to_correlation(cov) if cov is not None else None)
+
+    def correlation(self, a: str, b: str, window: Window = EWMA) -> Optional[float]:
+        _, corr = self.matrix(window, [a, b])
+        if corr is None or math.isnan(corr[0, 1]):
+            return None
+        return float(corr[0, 1])
+
+    def average_correlation(self, window: Window = EWMA) -> Optional[float]:
+        """Mean off-diagonal correlation - a quick concentration gauge"""
+        _, corr = self.matrix(window)
+        if corr is None or len(corr) < 2:
+            return None
+        off = corr[~np.eye(len(corr), dtype=bool)]
+        off = off[~np.isnan(off)]
+        return float(off.mean()) if len(off) else None
+
+    def to_dict(self, window: Window = EWMA) -> Dict:
+        names, corr = self.matrix(window)
+        return {
+            'window': window,
+            'symbols': names,
+            'matrix': None if corr is None else np.round(np.nan_to_num(corr), 4).tolist(),
+            'bars': self.bars,
+        }
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {
+                'symbols': len(self.symbols),
+                'bars': self.bars,
+                'windows': {w: self._rolling[w].count for w in self.windows},
+                'ewma_ready': self._ewma_count >= self.min_periods,
+                'last_bar_time': self.last_bar_time,
+                'update_ms': round(self.update_seconds * 1000, 3),
+                'active_breaks': len(self._active_breaks),
+                'recent_alerts': list(self.alerts)[-5:],
+            }
+
+
+_shared: Optional[RollingCorrelationMatrix] = None
+_shared_lock = threading.Lock()
+
+
+def get_correlation_matrix(symbols: Optional[Sequence[str]] = None, **kwargs) -> Optional[RollingCorrelationMatrix]:
+    """Process-wide matrix shared by correlation, risk and regime engines (created on first call with symbols)"""
+    global _shared
+    with _shared_lock:
+        if _shared is None and symbols:
+            _shared = RollingCorrelationMatrix(symbols, **kwargs)
+        return _shared
+
+
+def get_correlation_metrics() -> Dict:
+    """Stats of the shared matrix ({} before it is created)"""
+    matrix = _shared
+    return matrix.get_stats() if matrix is not None else {}
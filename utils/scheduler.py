@@ -0,0 +1,382 @@
+"""
+Job Scheduler - one timer wheel instead of one sleeping thread per loop
+
+The orchestrator used to run every periodic task as its own thread doing
+`work(); time.sleep(interval)`, so each interval drifted by the work's
+runtime and every job held a thread while it slept. JobScheduler keeps
+all jobs on a hashed timer wheel driven by a single timer thread and runs
+due jobs on executors:
+
+- FIXED_RATE: runs at start + n * interval (no drift); missed slots are
+  skipped, not queued up
+- FIXED_DELAY: next run is `interval` after the previous one finished
+- Overlap prevention: a job that is still running when it comes due is
+  skipped for that slot
+- Jitter: ± fraction of the interval per run, so jobs with equal
+  intervals do not hit the same APIs in the same tick
+- error_backoff: after a failure the next run comes this soon instead
+- Lanes: LANE_IO on a thread pool, LANE_CPU on a process pool (the job
+  callable must be picklable; its result goes to `on_result` in the
+  parent process)
+- Per-job runtime and lateness histograms
+
+Shutdown is deterministic: the timer stops firing, then in-flight runs
+are awaited (bounded by a timeout) before the caller tears down pools.
+
+Usage:
+    scheduler = JobScheduler(thread_pool, process_pool)
+    scheduler.add_job(JobSpec('OrderBook', analyze, interval=30, jitter=0.1))
+    scheduler.start()
+    ...
+    scheduler.shutdown(timeout=10)
+"""
+
+import math
+import time
+import random
+import logging
+import threading
+from bisect import bisect_left
+from concurrent.futures import Executor, Future, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+FIXED_RATE = 'fixed_rate'
+FIXED_DELAY = 'fixed_delay'
+LANE_IO = 'io'
+LANE_CPU = 'cpu'
+
+# Histogram bucket upper bounds (seconds)
+DEFAULT_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+
+class Histogram:
+    """Fixed-bucket histogram (seconds) - count / sum / max and bucket-bound percentiles"""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # last = +Inf
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        value = max(0.0, value)
+        with self._lock:
+            self.counts[bisect_left(self.buckets, value)] += 1
+            self.count += 1
+            self.total += value
+            if value > self.max:
+                self.max = value
+
+    def _quantile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return self.buckets[i] if i < len(self.buckets) else self.max
+        return self.max
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            cumulative, buckets = 0, {}
+            for bound, n in zip(self.buckets, self.counts):
+                cumulative += n
+                buckets[f"le_{bound:g}"] = cumulative
+            buckets['le_inf'] = self.count
+            return {
+                'count': self.count,
+                'sum': round(self.total, 4),
+                'avg': round(self.total / self.count, 4) if self.count else 0.0,
+                'p50': self._quantile(0.50),
+                'p95': self._quantile(0.95),
+                'max': round(self.max, 4),
+                'buckets': buckets,
+            }
+
+
+@dataclass
+class JobSpec:
+    """Periodic job definition"""
+    name: str
+    func: Callable[[], Any]
+    interval: float
+    mode: str = FIXED_RATE
+    jitter: float = 0.0                      # ± fraction of interval
+    lane: str = LANE_IO
+    initial_delay: float = 0.0
+    error_backoff: Optional[float] = None    # next run after a failure (seconds)
+    on_result: Optional[Callable[[Any], None]] = None
+
+
+class _Job:
+    """Runtime state of a scheduled job"""
+
+    def __init__(self, spec: JobSpec):
+        self.spec = spec
+        self.generation = 0          # bumped on reschedule; stale wheel entries are ignored
+        self.base_time = 0.0         # fixed-rate anchor (monotonic, without jitter)
+        self.next_due: Optional[float] = None
+        self.running = False
+        self.future: Optional[Future] = None
+        self.runs = 0
+        self.failures = 0
+        self.skipped_overlap = 0
+        self.skipped_missed = 0
+        self.last_error: Optional[str] = None
+        self.last_finished: Optional[float] = None
+        self.runtime = Histogram()
+        self.lateness = Histogram()
+
+
+class JobScheduler:
+    """
+    Hashed timer wheel + executor lanes.
+
+    The wheel has `slots` buckets of `tick` seconds each; an entry stores
+    its absolute target tick, so jobs further out than one rotation simply
+    stay in their bucket until their tick comes round.
+    """
+
+    def __init__(
+        self,
+        io_executor: Executor,
+        cpu_executor: Optional[Executor] = None,
+        tick: float = 0.25,
+        slots: int = 1024,
+        name: str = 'scheduler'
+    ):
+        self.io_executor = io_executor
+        self.cpu_executor = cpu_executor
+        self.tick = tick
+        self.slots = slots
+        self.name = name
+
+        self.jobs: Dict[str, _Job] = {}
+        self._wheel: List[List[Tuple[int, _Job, int, float]]] = [[] for _ in range(slots)]
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._epoch = 0.0
+        self._current_tick = 0
+        self.timer_lag = Histogram()
+
+    # ------------------------------------------------------------------------
+    # Job registration
+    # ------------------------------------------------------------------------
+
+    def add_job(self, spec: JobSpec) -> 'JobScheduler':
+        if spec.name in self.jobs:
+            raise ValueError(f"Duplicate job name: {spec.name}")
+        if spec.interval <= 0:
+            raise ValueError(f"{spec.name}: interval must be > 0")
+        if spec.lane == LANE_CPU and self.cpu_executor is None:
+            raise ValueError(f"{spec.name}: CPU lane requested but no process pool configured")
+
+        job = _Job(spec)
+        self.jobs[spec.name] = job
+        if self.running:
+            self._schedule_first(job)
+        return self
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    # ------------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------------
+
+    def start(self):
+        """Schedule all registered jobs (in registration order) and start the timer"""
+        if self.running:
+            return
+        self._stop.clear()
+        self._epoch = time.monotonic()
+        self._current_tick = 0
+        for job in self.jobs.values():
+            self._schedule_first(job)
+
+        self._thread = threading.Thread(target=self._run, name=f"{self.name}-timer", daemon=True)
+        self._thread.start()
+        logger.info(f"⏱️ Scheduler started: {len(self.jobs)} jobs, tick {self.tick}s x {self.slots} slots")
+
+    def shutdown(self, timeout: float = 30.0) -> List[str]:
+        """
+        Stop firing new runs, then wait for in-flight runs.
+
+        Returns:
+            Names of jobs still running when the timeout expired
+        """
+        self._stop.set()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=max(self.tick * 4, 1.0))
+        self._thread = None
+
+        with self._lock:
+            for bucket in self._wheel:
+                bucket.clear()
+            in_flight = {job.spec.name: job.future for job in self.jobs.values()
+                         if job.running and job.future is not None}
+
+        if in_flight:
+            logger.info(f"⏳ Waiting for {len(in_flight)} running jobs: {', '.join(in_flight)}")
+            wait(list(in_flight.values()), timeout=timeout)
+
+        unfinished = [name for name, future in in_flight.items() if not future.done()]
+        for name in unfinished:
+            logger.warning(f"⚠️  Job {name} did not finish within {timeout}s")
+        return unfinished
+
+    # ------------------------------------------------------------------------
+    # Wheel
+    # ------------------------------------------------------------------------
+
+    def _jittered(self, job: _Job, due: float) -> float:
+        jitter = job.spec.jitter * job.spec.interval
+        return due + random.uniform(-jitter, jitter) if jitter else due
+
+    def _schedule_first(self, job: _Job):
+        job.base_time = time.monotonic() + job.spec.initial_delay
+        self._schedule(job, job.base_time)
+
+    def _schedule(self, job: _Job, due: float):
+        """Put job on the wheel for monotonic time `due` (invalidates older entries)"""
+        with self._lock:
+            job.generation += 1
+            job.next_due = due
+            target = max(self._current_tick + 1, math.ceil((due - self._epoch) / self.tick))
+            self._wheel[target % self.slots].append((target, job, job.generation, due))
+
+    def _run(self):
+        while not self._stop.is_set():
+            next_tick = self._current_tick + 1
+            delay = self._epoch + next_tick * self.tick - time.monotonic()
+            if delay > 0 and self._stop.wait(delay):
+                break
+            self.timer_lag.observe(max(0.0, -delay))
+
+            with self._lock:
+                self._current_tick = next_tick
+                bucket = self._wheel[next_tick % self.slots]
+                due_now = [e for e in bucket if e[0] <= next_tick]
+                bucket[:] = [e for e in bucket if e[0] > next_tick]
+
+            for _, job, generation, due in due_now:
+                if generation == job.generation:
+                    try:
+                        self._fire(job, due)
+                    except Exception as e:
+                        logger.error(f"❌ Scheduler failed to dispatch {job.spec.name}: {e}")
+
+    # ------------------------------------------------------------------------
+    # Dispatch
+    # ------------------------------------------------------------------------
+
+    def _next_fixed_rate(self, job: _Job, now: float):
+        interval = job.spec.interval
+        job.base_time += interval
+        if job.base_time <= now:
+            missed = int((now - job.base_time) // interval) + 1
+            job.skipped_missed += missed
+            job.base_time += missed * interval
+        self._schedule(job, self._jittered(job, job.base_time))
+
+    def _fire(self, job: _Job, due: float):
+        now = time.monotonic()
+        spec = job.spec
+
+        if spec.mode == FIXED_RATE:
+            self._next_fixed_rate(job, now)
+
+        if job.running:
+            job.skipped_overlap += 1
+            logger.debug(f"⏭️ {spec.name} still running - slot skipped")
+            return
+
+        job.lateness.observe(now - due)
+        job.running = True
+        started = time.perf_counter()
+
+        executor = self.cpu_executor if spec.lane == LANE_CPU else self.io_executor
+        try:
+            future = executor.submit(spec.func)
+        except Exception:
+            job.running = False
+            raise
+        job.future = future
+        future.add_done_callback(lambda f: self._finished(job, f, started))
+
+    def _finished(self, job: _Job, future: Future, started: float):
+        spec = job.spec
+        job.runtime.observe(time.perf_counter() - started)
+        job.runs += 1
+        job.last_finished = time.monotonic()
+
+        failed = False
+        if future.cancelled():
+            failed = True
+            job.last_error = 'cancelled'
+        elif future.exception() is not None:
+            failed = True
+            error = future.exception()
+            job.failures += 1
+            job.last_error = str(error)[:200]
+            logger.error(f"❌ {spec.name} job error: {error}", exc_info=logger.isEnabledFor(logging.DEBUG) and error)
+        elif spec.on_result is not None:
+            try:
+                spec.on_result(future.result())
+            except Exception as e:
+                job.failures += 1
+                job.last_error = str(e)[:200]
+                logger.error(f"❌ {spec.name} result handler error: {e}")
+
+        job.running = False
+        if self._stop.is_set():
+            return
+
+        now = time.monotonic()
+        if failed and spec.error_backoff is not None:
+            # Retry sooner (or later) than the regular slot; fixed rate re-anchors here
+            job.base_time = now + spec.error_backoff
+            self._schedule(job, job.base_time)
+        elif spec.mode == FIXED_DELAY:
+            self._schedule(job, self._jittered(job, now + spec.interval))
+
+    # ------------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------------
+
+    def get_metrics(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        jobs = {}
+        for name, job in self.jobs.items():
+            jobs[name] = {
+                'interval': job.spec.interval,
+                'mode': job.spec.mode,
+                'lane': job.spec.lane,
+                'running': job.running,
+                'runs': job.runs,
+                'failures': job.failures,
+                'skipped_overlap': job.skipped_overlap,
+                'skipped_missed': job.skipped_missed,
+                'last_error': job.last_error,
+                'next_run_in': round(job.next_due - now, 3) if job.next_due is not None and self.running else None,
+                'runtime_seconds': job.runtime.snapshot(),
+                'lateness_seconds': job.lateness.snapshot(),
+            }
+        return {
+            'running': self.running,
+            'tick_seconds': self.tick,
+            'wheel_slots': self.slots,
+            'jobs_total': len(self.jobs),
+            'jobs_running': sum(1 for job in self.jobs.values() if job.running),
+            'timer_lag_seconds': self.timer_lag.snapshot(),
+            'jobs': jobs,
+        }
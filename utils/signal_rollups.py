@@ -0,0 +1,233 @@
+"""
+Signal Rollups - hourly aggregates + symbol registry for dashboards
+DEMIR AI v8.0
+
+Dashboard statistics used to run a full-window aggregate (COUNT, AVG of
+five group scores, COUNT DISTINCT) over every signal row, and the symbol
+picker a SELECT DISTINCT over the whole table, on every page rerun.
+Both now read small tables maintained as signals are written:
+
+- signal_rollup_hourly: one row per (UTC hour, symbol, direction,
+  data_source) with the signal count and the sums of confidence,
+  ensemble and the five group scores; averages over any window are
+  sum / count, so a window costs O(hours × symbols), not O(rows)
+- symbol_registry: every symbol ever seen, with first / last signal time
+  and a running count
+- Maintained incrementally: SignalRollup.apply() is a write-behind
+  after_insert hook - each flushed batch is aggregated by the database
+  (GROUP BY over the VALUES list) and upserted additively in the same
+  transaction as the signal rows
+- backfill() builds both tables once from existing signal rows
+
+Usage:
+    rollup = SignalRollup(SIGNAL_COLUMNS)
+    writer.register_table('signals', SIGNAL_COLUMNS, after_insert=rollup.apply)
+
+    stats = fetch_window_statistics(cursor, hours=24)
+    symbols = fetch_symbols(cursor)
+"""
+
+import logging
+from typing import Any, Dict, List, Sequence
+
+try:
+    from psycopg2.extras import execute_values
+    PSYCOPG2_AVAILABLE = True
+except ImportError:
+    execute_values = None
+    PSYCOPG2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_TABLE = 'signal_rollup_hourly'
+REGISTRY_TABLE = 'symbol_registry'
+
+# signal column → rollup sum column
+SCORE_COLUMNS = (
+    ('confidence', 'sum_confidence'),
+    ('ensemble_score', 'sum_ensemble'),
+    ('tech_group_score', 'sum_tech'),
+    ('sentiment_group_score', 'sum_sentiment'),
+    ('onchain_group_score', 'sum_onchain'),
+    ('ml_group_score', 'sum_ml'),
+    ('macro_risk_group_score', 'sum_macro_risk'),
+)
+
+SCHEMA_SQL = f"""
+    CREATE TABLE IF NOT EXISTS {ROLLUP_TABLE} (
+        bucket TIMESTAMP NOT NULL,
+        symbol VARCHAR(20) NOT NULL,
+        direction VARCHAR(10) NOT NULL,
+        data_source VARCHAR(100) NOT NULL,
+        signal_count INTEGER NOT NULL DEFAULT 0,
+        {', '.join(f'{column} DOUBLE PRECISION NOT NULL DEFAULT 0' for _, column in SCORE_COLUMNS)},
+        PRIMARY KEY (bucket, symbol, direction, data_source)
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_signal_rollup_bucket ON {ROLLUP_TABLE}(bucket DESC);
+
+    CREATE TABLE IF NOT EXISTS {REGISTRY_TABLE} (
+        symbol VARCHAR(20) PRIMARY KEY,
+        first_seen TIMESTAMP WITH TIME ZONE NOT NULL,
+        last_seen TIMESTAMP WITH TIME ZONE NOT NULL,
+        signal_count BIGINT NOT NULL DEFAULT 0
+    );
+"""
+
+_SUMS = ', '.join(column for _, column in SCORE_COLUMNS)
+_SUM_EXPRS = ', '.join(f'SUM(COALESCE({source}, 0))' for source, _ in SCORE_COLUMNS)
+_SUM_UPDATES = ', '.join(f'{column} = {ROLLUP_TABLE}.{column} + EXCLUDED.{column}' for _, column in SCORE_COLUMNS)
+
+_ROLLUP_UPSERT = f"""
+    INSERT INTO {ROLLUP_TABLE} (bucket, symbol, direction, data_source, signal_count, {_SUMS})
+    SELECT date_trunc('hour', ts AT TIME ZONE 'UTC'), symbol, direction, data_source, COUNT(*), {_SUM_EXPRS}
+    FROM batch
+    GROUP BY 1, 2, 3, 4
+    ON CONFLICT (bucket, symbol, direction, data_source) DO UPDATE SET
+        signal_count = {ROLLUP_TABLE}.signal_count + EXCLUDED.signal_count,
+        {_SUM_UPDATES}
+"""
+
+_REGISTRY_UPSERT = f"""
+    INSERT INTO {REGISTRY_TABLE} (symbol, first_seen, last_seen, signal_count)
+    SELECT symbol, MIN(ts), MAX(ts), COUNT(*)
+    FROM batch
+    GROUP BY symbol
+    ON CONFLICT (symbol) DO UPDATE SET
+        first_seen = LEAST({REGISTRY_TABLE}.first_seen, EXCLUDED.first_seen),
+        last_seen = GREATEST({REGISTRY_TABLE}.last_seen, EXCLUDED.last_seen),
+        signal_count = {REGISTRY_TABLE}.signal_count + EXCLUDED.signal_count
+"""
+
+_BATCH_COLUMNS = ('ts', 'symbol', 'direction', 'data_source') + tuple(source for source, _ in SCORE_COLUMNS)
+_BATCH_TEMPLATE = '(%s::timestamptz, %s, %s, %s, ' + ', '.join(['%s::float8'] * len(SCORE_COLUMNS)) + ')'
+
+# Both upserts in one statement: the VALUES list is sent once per batch
+_APPLY_SQL = f"""
+    WITH batch ({', '.join(_BATCH_COLUMNS)}) AS (VALUES %s),
+    rollup AS ({_ROLLUP_UPSERT})
+    {_REGISTRY_UPSERT}
+"""
+
+
+class SignalRollup:
+    """Incremental rollup maintenance for rows of a signals table"""
+
+    def __init__(self, columns: Sequence[str], timestamp_column: str = 'timestamp'):
+        """
+        Args:
+            columns: column order of the signal row tuples (as registered with the writer);
+                     score columns that are not present count as 0
+        """
+        index = {name: i for i, name in enumerate(columns)}
+        missing = [name for name in (timestamp_column, 'symbol', 'direction') if name not in index]
+        if missing:
+            raise ValueError(f"Signal rows lack required columns: {missing}")
+        self._ts = index[timestamp_column]
+        self._symbol = index['symbol']
+        self._direction = index['direction']
+        self._source = index.get('data_source')
+        self._scores = [index.get(source) for source, _ in SCORE_COLUMNS]
+
+    def _batch_row(self, row: Sequence[Any]) -> tuple:
+        return (
+            row[self._ts],
+            row[self._symbol],
+            row[self._direction],
+            (row[self._source] if self._source is not None else None) or 'unknown',
+            *(row[i] if i is not None else None for i in self._scores),
+        )
+
+    def apply(self, cursor, rows: List[Sequence[Any]]):
+        """Write-behind after_insert hook: fold `rows` into the rollup and registry"""
+        if not rows:
+            return
+        execute_values(
+            cursor, _APPLY_SQL, [self._batch_row(row) for row in rows],
+            template=_BATCH_TEMPLATE, page_size=len(rows)
+        )
+
+
+def ensure_schema(cursor):
+    """Create the rollup and registry tables (idempotent)"""
+    cursor.execute(SCHEMA_SQL)
+
+
+def backfill(cursor, source_table: str = 'signals', timestamp_column: str = 'timestamp') -> bool:
+    """
+    Build both tables from existing rows of `source_table` - only when the
+    rollup is still empty, so it is safe to call on every startup.
+
+    Returns:
+        True if a backfill ran
+    """
+    ts = f'"{timestamp_column}"'
+    cursor.execute(f"SELECT EXISTS (SELECT 1 FROM {ROLLUP_TABLE})")
+    if cursor.fetchone()[0]:
+        return False
+    cursor.execute(f"""
+        INSERT INTO {ROLLUP_TABLE} (bucket, symbol, direction, data_source, signal_count, {_SUMS})
+        SELECT date_trunc('hour', {ts} AT TIME ZONE 'UTC'), symbol, direction,
+               COALESCE(data_source, 'unknown'), COUNT(*), {_SUM_EXPRS}
+        FROM {source_table}
+        GROUP BY 1, 2, 3, 4
+        ON CONFLICT (bucket, symbol, direction, data_source) DO NOTHING
+    """)
+    buckets = cursor.rowcount
+    cursor.execute(f"""
+        INSERT INTO {REGISTRY_TABLE} (symbol, first_seen, last_seen, signal_count)
+        SELECT symbol, MIN({ts}), MAX({ts}), COUNT(*)
+        FROM {source_table}
+        GROUP BY symbol
+        ON CONFLICT (symbol) DO NOTHING
+    """)
+    if buckets:
+        logger.info(f"✅ Signal rollups backfilled from {source_table}: {buckets} hourly buckets")
+    return True
+
+
+# ============================================================================
+# READERS
+# ============================================================================
+
+def _avg(column: str) -> str:
+    return f"COALESCE(SUM({column}) / NULLIF(SUM(signal_count), 0), 0)::float8"
+
+
+_WINDOW_STATS_SQL = f"""
+    SELECT
+        COALESCE(SUM(signal_count), 0)::bigint AS total_signals,
+        COALESCE(SUM(signal_count) FILTER (WHERE direction = 'LONG'), 0)::bigint AS long_count,
+        COALESCE(SUM(signal_count) FILTER (WHERE direction = 'SHORT'), 0)::bigint AS short_count,
+        COUNT(DISTINCT symbol) AS unique_symbols,
+        COUNT(DISTINCT data_source) AS sources,
+        {_avg('sum_confidence')} AS avg_confidence,
+        {_avg('sum_ensemble')} AS avg_ensemble,
+        {_avg('sum_tech')} AS avg_tech,
+        {_avg('sum_sentiment')} AS avg_sentiment,
+        {_avg('sum_onchain')} AS avg_onchain,
+        {_avg('sum_ml')} AS avg_ml,
+        {_avg('sum_macro_risk')} AS avg_macro
+    FROM {ROLLUP_TABLE}
+    WHERE bucket >= date_trunc('hour', (NOW() AT TIME ZONE 'UTC') - make_interval(hours => %s))
+"""
+
+
+def fetch_window_statistics(cursor, hours: int = 24) -> Dict[str, Any]:
+    """
+    Counts and averages over the last `hours` (hour resolution: the oldest
+    bucket is included whole). Keys match the old full-table aggregate.
+    """
+    cursor.execute(_WINDOW_STATS_SQL, (int(hours),))
+    row = cursor.fetchone()
+    if row is None:
+        return {}
+    if isinstance(row, dict):
+        return dict(row)
+    return {desc[0]: value for desc, value in zip(cursor.description, row)}
+
+
+def fetch_symbols(cursor) -> List[str]:
+    """All registered symbols, alphabetical"""
+    cursor.execute(f"SELECT symbol FROM {REGISTRY_TABLE} ORDER BY symbol")
+    return [row['symbol'] if isinstance(row, dict) else row[0] for row in cursor.fetchall()]
@@ -0,0 +1,255 @@
+"""
+Snapshot Publisher - pre-serialized API responses with ETag / 304
+DEMIR AI v8.0
+
+Dashboards poll the read endpoints (/api/prices, /api/status, ...) every
+second, and each poll used to rebuild the dicts, isoformat every datetime
+and run jsonify. SnapshotPublisher serializes a resource once per state
+version and serves the same bytes to every poll:
+
+- Each resource is registered with a `render` function (builds the
+  payload) and a `version` function (cheap, e.g. a sum of shard version
+  counters); the payload is re-rendered only when the version changes
+- Query variants (symbol, limit, filters) are cached side by side under
+  the same version, bounded by `max_variants` per resource
+- Strong ETag (BLAKE2b of the body); `If-None-Match` → 304 with no body
+- Optional gzip: compressed once per snapshot (mtime=0, deterministic),
+  served when the client accepts it; the gzip representation carries its
+  own strong ETag
+- Per-resource metrics: renders, cache hits, 304s, render time, sizes
+
+Usage:
+    snapshots = SnapshotPublisher()
+    snapshots.register('prices', render_prices, version=lambda: global_state.symbols_version)
+
+    @app.route('/api/prices')
+    def api_prices():
+        return snapshots.serve('prices')
+"""
+
+import gzip
+import json
+import time
+import hashlib
+import logging
+import threading
+import weakref
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+try:
+    from flask import Response, request
+    FLASK_AVAILABLE = True
+except ImportError:
+    FLASK_AVAILABLE = False
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+logger = logging.getLogger(__name__)
+
+_publishers: 'weakref.WeakSet[SnapshotPublisher]' = weakref.WeakSet()
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    if np is not None:
+        if isinstance(value, np.generic):
+            return value.item()
+        if isinstance(value, np.ndarray):
+            return value.tolist()
+    if hasattr(value, '__dict__'):
+        return vars(value)
+    return str(value)
+
+
+def serialize(payload: Any) -> bytes:
+    """Compact UTF-8 JSON (datetimes as ISO 8601, numpy scalars/arrays as plain values)"""
+    return json.dumps(payload, separators=(',', ':'), ensure_ascii=False, default=_json_default).encode('utf-8')
+
+
+class _Snapshot:
+    """One serialized representation of a resource variant"""
+
+    __slots__ = ('version', 'body', 'etag', 'status', 'rendered_at', '_gzip', '_gzip_level')
+
+    def __init__(self, version: Hashable, body: bytes, status: int, gzip_level: int):
+        self.version = version
+        self.body = body
+        self.status = status
+        self.etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+        self.rendered_at = time.time()
+        self._gzip: Optional[bytes] = None
+        self._gzip_level = gzip_level
+
+    @property
+    def gzip_body(self) -> bytes:
+        if self._gzip is None:
+            self._gzip = gzip.compress(self.body, compresslevel=self._gzip_level, mtime=0)
+        return self._gzip
+
+
+@dataclass
+class _ResourceStats:
+    requests: int = 0
+    renders: int = 0
+    cache_hits: int = 0
+    not_modified: int = 0
+    gzip_served: int = 0
+    errors: int = 0
+    render_seconds: float = 0.0
+    last_render_ms: float = 0.0
+    max_render_ms: float = 0.0
+    last_bytes: int = 0
+    last_gzip_bytes: int = 0
+
+
+@dataclass
+class _Resource:
+    name: str
+    render: Callable[..., Any]
+    version: Callable[[], Hashable]
+    snapshots: Dict[Tuple, _Snapshot] = field(default_factory=dict)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    stats: _ResourceStats = field(default_factory=_ResourceStats)
+
+
+class SnapshotPublisher:
+    """Version-keyed byte snapshots of JSON resources"""
+
+    def __init__(self, gzip_enabled: bool = True, gzip_min_bytes: int = 1024,
+                 gzip_level: int = 6, max_variants: int = 64):
+        self.gzip_enabled = gzip_enabled
+        self.gzip_min_bytes = gzip_min_bytes
+        self.gzip_level = gzip_level
+        self.max_variants = max_variants
+        self.resources: Dict[str, _Resource] = {}
+        _publishers.add(self)
+
+    def register(self, name: str, render: Callable[..., Any], version: Callable[[], Hashable]):
+        """
+        Args:
+            render: builds the payload; called with the variant args given to get()/serve().
+                    May return (payload, status) to cache a non-200 response.
+            version: returns a hashable that changes whenever the payload would
+        """
+        self.resources[name] = _Resource(name, render, version)
+
+    # ------------------------------------------------------------------
+    # Snapshots
+    # ------------------------------------------------------------------
+
+    def get(self, name: str, *args: Hashable) -> _Snapshot:
+        """Current snapshot of `name` for the variant `args` (rendered if the version moved)"""
+        resource = self.resources[name]
+        stats = resource.stats
+        stats.requests += 1
+
+        version = resource.version()
+        snapshot = resource.snapshots.get(args)
+        if snapshot is not None and snapshot.version == version:
+            stats.cache_hits += 1
+            return snapshot
+
+        with resource.lock:
+            # Another request may have rendered this version while we waited
+            snapshot = resource.snapshots.get(args)
+            if snapshot is not None and snapshot.version == version:
+                stats.cache_hits += 1
+                return snapshot
+
+            started = time.perf_counter()
+            try:
+                result = resource.render(*args)
+                status = 200
+                if isinstance(result, tuple):
+                    result, status = result
+                snapshot = _Snapshot(version, serialize(result), status, self.gzip_level)
+            except Exception:
+                stats.errors += 1
+                raise
+            elapsed = time.perf_counter() - started
+
+            stats.renders += 1
+            stats.render_seconds += elapsed
+            stats.last_render_ms = elapsed * 1000
+            stats.max_render_ms = max(stats.max_render_ms, stats.last_render_ms)
+            stats.last_bytes = len(snapshot.body)
+
+            snapshots = dict(resource.snapshots)
+            snapshots.pop(args, None)
+            snapshots[args] = snapshot
+            while len(snapshots) > self.max_variants:
+                snapshots.pop(next(iter(snapshots)))
+            resource.snapshots = snapshots
+            return snapshot
+
+    def serve(self, name: str, *args: Hashable):
+        """Flask response for the current request: 304 on a matching If-None-Match, gzip if accepted"""
+        snapshot = self.get(name, *args)
+        stats = self.resources[name].stats
+
+        use_gzip = (
+            self.gzip_enabled
+            and len(snapshot.body) >= self.gzip_min_bytes
+            and request.accept_encodings['gzip'] > 0
+        )
+        etag = f'{snapshot.etag}-gz' if use_gzip else snapshot.etag
+        headers = {
+            'ETag': f'"{etag}"',
+            'Cache-Control': 'no-cache',
+            'Vary': 'Accept-Encoding',
+        }
+
+        if snapshot.status == 200 and request.if_none_match.contains_weak(etag):
+            stats.not_modified += 1
+            return Response(status=304, headers=headers)
+
+        body = snapshot.body
+        if use_gzip:
+            body = snapshot.gzip_body
+            headers['Content-Encoding'] = 'gzip'
+            stats.gzip_served += 1
+            stats.last_gzip_bytes = len(body)
+        return Response(body, status=snapshot.status, mimetype='application/json', headers=headers)
+
+    def invalidate(self, name: Optional[str] = None):
+        """Drop cached snapshots (all resources, or one)"""
+        for resource in ([self.resources[name]] if name else list(self.resources.values())):
+            with resource.lock:
+                resource.snapshots = {}
+
+    def get_metrics(self) -> Dict[str, Any]:
+        metrics = {}
+        for name, resource in list(self.resources.items()):
+            s = resource.stats
+            metrics[name] = {
+                'requests': s.requests,
+                'renders': s.renders,
+                'cache_hits': s.cache_hits,
+                'hit_rate': round(s.cache_hits / s.requests, 4) if s.requests else 0.0,
+                'not_modified': s.not_modified,
+                'gzip_served': s.gzip_served,
+                'errors': s.errors,
+                'avg_render_ms': round(s.render_seconds * 1000 / s.renders, 3) if s.renders else 0.0,
+                'last_render_ms': round(s.last_render_ms, 3),
+                'max_render_ms': round(s.max_render_ms, 3),
+                'bytes': s.last_bytes,
+                'gzip_bytes': s.last_gzip_bytes,
+                'variants': len(resource.snapshots),
+            }
+        return metrics
+
+
+def get_snapshot_metrics() -> Dict[str, Dict[str, Any]]:
+    """Per-resource metrics of every live publisher (merged)"""
+    merged: Dict[str, Dict[str, Any]] = {}
+    for publisher in list(_publishers):
+        merged.update(publisher.get_metrics())
+    return merged
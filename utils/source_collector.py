@@ -0,0 +1,319 @@
+"""
+Source Collector - concurrent data-source fetching under one deadline
+DEMIR AI v8.0
+
+Sentiment / on-chain sources used to be fetched one after another, each
+behind a retry decorator that sleeps between attempts, so a tick cost the
+sum of every round trip (plus backoff). SourceCollector fans them out:
+
+- All due sources are fetched concurrently on a small thread pool (the
+  fetchers are blocking calls on the shared pooled HTTP client); one
+  global `deadline` bounds the whole collection, so a tick costs roughly
+  one round trip of the slowest source that answers in time
+- Per-source natural TTL: a source is only fetched when its last value
+  expired - a fixed number of seconds, or a boundary such as the next
+  UTC day (Fear & Greed) or the next 8h funding settlement
+  (`until_next_utc`)
+- Partial results: a source that fails or misses the deadline is served
+  from its last good value with `stale=True` (up to `max_stale` seconds),
+  otherwise reported `missing`; a late fetch keeps running and fills the
+  cache for the next tick
+- Single-flight: a source still in flight from an earlier tick is not
+  fetched a second time
+- Values live in the tiered cache (`sources` namespace), so processes
+  sharing Redis share fetched values
+
+Usage:
+    collector = SourceCollector('market', [
+        SourceSpec('fear_greed', fetch_fear_greed, ttl=until_next_utc(24)),
+        SourceSpec('funding_btc', fetch_btc_funding, ttl=until_next_utc(8)),
+    ], deadline=8.0)
+    snapshot = collector.collect()
+    snapshot['sources']['fear_greed']  # {'value', 'age', 'stale', 'status', ...}
+"""
+
+import time
+import logging
+import threading
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, Optional, Union
+
+from utils.tiered_cache import get_cache
+
+logger = logging.getLogger(__name__)
+
+STATUS_LIVE = 'live'
+STATUS_CACHED = 'cached'
+STATUS_STALE = 'stale'
+STATUS_MISSING = 'missing'
+
+_collectors: 'weakref.WeakSet[SourceCollector]' = weakref.WeakSet()
+
+
+def until_next_utc(period_hours: float, grace: float = 60.0) -> Callable[[float], float]:
+    """
+    TTL that ends at the next UTC boundary of `period_hours`
+    (24 -> midnight UTC, 8 -> 00:00 / 08:00 / 16:00 UTC), plus `grace`
+    seconds for the provider to publish the new value
+    """
+    period = period_hours * 3600.0
+
+    def ttl(now: float) -> float:
+        return period - (now % period) + grace
+
+    return ttl
+
+
+def single_attempt(method: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Strip a retry decorator (functools.wraps -> __wrapped__) from a bound
+    method: inside the collector a failed source is served stale until the
+    next tick instead of sleeping through backoff on the fetch thread
+    """
+    func = getattr(method, '__func__', None)
+    wrapped = getattr(func, '__wrapped__', None)
+    if wrapped is None:
+        return method
+    return wrapped.__get__(method.__self__)
+
+
+@dataclass
+class SourceSpec:
+    """One data source: how to fetch it and how long a value stays fresh"""
+    name: str
+    fetch: Callable[[], Any]
+    ttl: Union[float, Callable[[float], float]] = 300.0
+    max_stale: float = 86400.0  # last good value served (flagged stale) this long past expiry
+
+    def ttl_at(self, now: float) -> float:
+        return float(self.ttl(now) if callable(self.ttl) else self.ttl)
+
+
+class _SourceStats:
+    __slots__ = ('fetches', 'failures', 'timeouts', 'stale_serves', 'cache_hits',
+                 'last_latency', 'max_latency', 'last_error')
+
+    def __init__(self):
+        self.fetches = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.stale_serves = 0
+        self.cache_hits = 0
+        self.last_latency = 0.0
+        self.max_latency = 0.0
+        self.last_error: Optional[str] = None
+
+
+class SourceCollector:
+    """Concurrent, TTL-aware collection of a fixed set of sources"""
+
+    def __init__(self, name: str, sources: Iterable[SourceSpec], deadline: float = 8.0,
+                 max_workers: Optional[int] = None):
+        self.name = name
+        self.sources: Dict[str, SourceSpec] = {}
+        for spec in sources:
+            self.sources[spec.name] = spec
+        self.deadline = deadline
+        self.cache = get_cache('sources')
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers or max(4, len(self.sources)),
+            thread_name_prefix=f'src-{name}',
+        )
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._stats: Dict[str, _SourceStats] = {n: _SourceStats() for n in self.sources}
+        self.collects = 0
+        self.last_elapsed = 0.0
+        self.last_summary: Dict[str, int] = {}
+        _collectors.add(self)
+        logger.info(f"✅ SourceCollector '{name}' ready: {len(self.sources)} sources, deadline {deadline:.1f}s")
+
+    # ------------------------------------------------------------------
+    # Fetching
+    # ------------------------------------------------------------------
+
+    def _key(self, source: str) -> str:
+        return f'{self.name}:{source}'
+
+    def _fetch(self, spec: SourceSpec) -> Dict[str, Any]:
+        """Runs on a pool thread; stores the value even if the caller already gave up"""
+        stats = self._stats[spec.name]
+        started = time.time()
+        try:
+            value = spec.fetch()
+            if value is None:
+                raise ValueError('source returned no data')
+        except Exception as e:
+            stats.failures += 1
+            stats.last_error = str(e)
+            raise
+        finally:
+            elapsed = time.time() - started
+            stats.fetches += 1
+            stats.last_latency = elapsed
+            stats.max_latency = max(stats.max_latency, elapsed)
+
+        now = time.time()
+        ttl = spec.ttl_at(now)
+        entry = {'value': value, 'fetched_at': now, 'expires_at': now + ttl}
+        try:
+            self.cache.set(self._key(spec.name), entry, ttl=ttl + spec.max_stale)
+        except Exception as e:
+            logger.warning(f"⚠️ Source cache write failed ({spec.name}): {e}")
+        return entry
+
+    def _submit(self, spec: SourceSpec) -> Future:
+        with self._lock:
+            future = self._inflight.get(spec.name)
+            if future is not None and not future.done():
+                return future
+            future = self.executor.submit(self._fetch, spec)
+            self._inflight[spec.name] = future
+        future.add_done_callback(lambda f, n=spec.name: self._clear_inflight(n, f))
+        return future
+
+    def _clear_inflight(self, name: str, future: Future):
+        with self._lock:
+            if self._inflight.get(name) is future:
+                del self._inflight[name]
+
+    # ------------------------------------------------------------------
+    # Collection
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _view(entry: Optional[Dict[str, Any]], status: str, now: float,
+              error: Optional[str] = None) -> Dict[str, Any]:
+        if entry is None:
+            return {'value': None, 'fetched_at': None, 'age': None,
+                    'stale': True, 'status': STATUS_MISSING, 'error': error}
+        return {
+            'value': entry['value'],
+            'fetched_at': datetime.fromtimestamp(entry['fetched_at'], timezone.utc).isoformat(),
+            'age': round(now - entry['fetched_at'], 1),
+            'stale': status == STATUS_STALE,
+            'status': status,
+            'error': error,
+        }
+
+    def collect(self, names: Optional[Iterable[str]] = None,
+                deadline: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Fresh cached values are returned as is; every expired source is
+        fetched concurrently and waited for at most `deadline` seconds.
+
+        Returns:
+            {'sources': {name: {value, fetched_at, age, stale, status, error}},
+             'fresh', 'stale', 'missing', 'partial', 'elapsed', 'timestamp'}
+        """
+        started = time.time()
+        deadline = self.deadline if deadline is None else deadline
+        specs = [self.sources[n] for n in names] if names is not None else list(self.sources.values())
+
+        results: Dict[str, Dict[str, Any]] = {}
+        pending: Dict[Future, tuple] = {}
+        for spec in specs:
+            try:
+                entry = self.cache.get(self._key(spec.name))
+            except Exception:
+                entry = None
+            if entry is not None and started < entry['expires_at']:
+                self._stats[spec.name].cache_hits += 1
+                results[spec.name] = self._view(entry, STATUS_CACHED, started)
+                continue
+            try:
+                pending[self._submit(spec)] = (spec, entry)
+            except RuntimeError as e:  # executor shut down
+                results[spec.name] = self._view(entry, STATUS_STALE, started, str(e)) if entry else \
+                    self._view(None, STATUS_MISSING, started, str(e))
+
+        if pending:
+            done, _ = wait(pending, timeout=max(0.0, deadline - (time.time() - started)))
+        else:
+            done = set()
+
+        now = time.time()
+        for future, (spec, previous) in pending.items():
+            stats = self._stats[spec.name]
+            if future in done:
+                error = future.exception()
+                if error is None:
+                    results[spec.name] = self._view(future.result(), STATUS_LIVE, now)
+                    continue
+                error = str(error)
+            else:
+                stats.timeouts += 1
+                error = f'deadline {deadline:.1f}s exceeded'
+            if previous is not None:
+                stats.stale_serves += 1
+                results[spec.name] = self._view(previous, STATUS_STALE, now, error)
+            else:
+                results[spec.name] = self._view(None, STATUS_MISSING, now, error)
+
+        results = {spec.name: results[spec.name] for spec in specs}
+        counts = {STATUS_LIVE: 0, STATUS_CACHED: 0, STATUS_STALE: 0, STATUS_MISSING: 0}
+        for view in results.values():
+            counts[view['status']] += 1
+
+        elapsed = time.time() - started
+        self.collects += 1
+        self.last_elapsed = elapsed
+        self.last_summary = counts
+        fresh = counts[STATUS_LIVE] + counts[STATUS_CACHED]
+        if counts[STATUS_STALE] or counts[STATUS_MISSING]:
+            logger.warning(
+                f"⚠️ Sources '{self.name}': {fresh} fresh, {counts[STATUS_STALE]} stale, "
+                f"{counts[STATUS_MISSING]} missing ({elapsed:.2f}s)"
+            )
+        else:
+            logger.debug(f"Sources '{self.name}': {fresh} fresh ({counts[STATUS_LIVE]} fetched, {elapsed:.2f}s)")
+
+        return {
+            'sources': results,
+            'fresh': fresh,
+            'stale': counts[STATUS_STALE],
+            'missing': counts[STATUS_MISSING],
+            'partial': bool(counts[STATUS_STALE] or counts[STATUS_MISSING]),
+            'elapsed': round(elapsed, 3),
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+        }
+
+    def values(self, snapshot: Dict[str, Any]) -> Dict[str, Any]:
+        """name -> value (None when missing) from a collect() snapshot"""
+        return {name: view['value'] for name, view in snapshot['sources'].items()}
+
+    def close(self):
+        self.executor.shutdown(wait=False)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            inflight = sorted(n for n, f in self._inflight.items() if not f.done())
+        return {
+            'sources': len(self.sources),
+            'deadline': self.deadline,
+            'collects': self.collects,
+            'last_elapsed': round(self.last_elapsed, 3),
+            'last_summary': dict(self.last_summary),
+            'inflight': inflight,
+            'per_source': {
+                name: {
+                    'fetches': s.fetches,
+                    'failures': s.failures,
+                    'timeouts': s.timeouts,
+                    'cache_hits': s.cache_hits,
+                    'stale_serves': s.stale_serves,
+                    'last_latency': round(s.last_latency, 3),
+                    'max_latency': round(s.max_latency, 3),
+                    'last_error': s.last_error,
+                }
+                for name, s in self._stats.items()
+            },
+        }
+
+
+def get_source_collector_metrics() -> Dict[str, Dict[str, Any]]:
+    """Metrics of every live collector, keyed by collector name"""
+    return {collector.name: collector.get_metrics() for collector in list(_collectors)}
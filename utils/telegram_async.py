@@ -3,7 +3,7 @@
 📱 Real-time Notifications + Trade Tracking
 🔔 24/7 Operational Telegram Bot
 
-Location: GitHub Root / utils/telegram_async.py (REPLACE telegram_queue.py)
+Location: GitHub Root / utils/telegram_async.py (delivery via utils/telegram_queue.py)
 Size: ~1000 lines
 Author: AI Research Agent
 Date: 2025-11-15
@@ -22,6 +22,8 @@ from enum import Enum
 import hashlib
 import time
 
+from utils.telegram_queue import TelegramQueue, TelegramMessage, MessagePriority
+
 logger = logging.getLogger('TELEGRAM_ENGINE')
 
 # ============================================================================
@@ -186,13 +188,14 @@ class TelegramAPIClient:
             logger.info("✅ Telegram API client session closed")
     
     async def send_message(self, text: str, parse_mode: str = 'HTML',
-                          disable_web_page_preview: bool = True) -> bool:
-        """Send message to Telegram chat"""
+                          disable_web_page_preview: bool = True,
+                          chat_id: Optional[str] = None) -> bool:
+        """Send message to Telegram chat (default: the client's chat)"""
         try:
             await self.init_session()
             
             payload = {
-                'chat_id': self.chat_id,
+                'chat_id': chat_id or self.chat_id,
                 'text': text,
                 'parse_mode': parse_mode,
                 'disable_web_page_preview': disable_web_page_preview
@@ -235,118 +238,78 @@ class TelegramAPIClient:
         
         return False
 
-# ============================================================================
-# NOTIFICATION QUEUE & PROCESSING
-# ============================================================================
-
-class NotificationQueue:
-    """Async queue for notifications"""
-    
-    def __init__(self, max_size: int = 1000):
-        self.queue = asyncio.Queue(maxsize=max_size)
-        self.processed = 0
-        self.failed = 0
-    
-    async def put(self, notification: Dict):
-        """Put notification in queue"""
-        try:
-            await self.queue.put(notification)
-            logger.debug(f"📤 Notification queued (size: {self.queue.qsize()})")
-        except asyncio.QueueFull:
-            logger.error("❌ Notification queue full")
-    
-    async def get(self) -> Optional[Dict]:
-        """Get notification from queue"""
-        try:
-            return await asyncio.wait_for(self.queue.get(), timeout=1.0)
-        except asyncio.TimeoutError:
-            return None
-    
-    def size(self) -> int:
-        """Get queue size"""
-        return self.queue.qsize()
-    
-    def stats(self) -> Dict:
-        """Get queue statistics"""
-        return {
-            'size': self.queue.qsize(),
-            'processed': self.processed,
-            'failed': self.failed,
-            'success_rate': self.processed / (self.processed + self.failed) * 100 if (self.processed + self.failed) > 0 else 0
-        }
-
 # ============================================================================
 # TELEGRAM NOTIFICATION ENGINE
 # ============================================================================
 
 class TelegramNotificationEngine:
-    """Main Telegram notification engine (async)"""
+    """
+    Main Telegram notification engine (async).
+
+    Notifications go through the shared TelegramQueue dispatcher (token
+    buckets, priority eviction, dedup, LOW digests); `worker_count` is the
+    number of sends in flight.
+    """
+    
+    PRIORITIES = {
+        NotificationType.SIGNAL.value: MessagePriority.HIGH,
+        NotificationType.OPPORTUNITY.value: MessagePriority.NORMAL,
+        NotificationType.RISK.value: MessagePriority.HIGH,
+        NotificationType.TRADE_TRACKING.value: MessagePriority.LOW,
+    }
     
-    def __init__(self, token: str, chat_id: str, worker_count: int = 3):
+    def __init__(self, token: str, chat_id: str, worker_count: int = 3,
+                 queue: Optional[TelegramQueue] = None):
         self.token = token
         self.chat_id = chat_id
         self.api_client = TelegramAPIClient(token, chat_id)
-        self.queue = NotificationQueue()
+        self.queue = queue or TelegramQueue(max_size=1000, default_chat_id=chat_id)
         self.worker_count = worker_count
-        self.workers = []
+        self.dispatcher: Optional[asyncio.Task] = None
         self.running = False
     
     async def start(self):
         """Start notification engine"""
-        logger.info(f"🚀 Starting Telegram notification engine with {self.worker_count} workers...")
+        logger.info(f"🚀 Starting Telegram notification engine ({self.worker_count} sends in flight)...")
         
         await self.api_client.init_session()
         self.running = True
-        
-        # Start worker tasks
-        for i in range(self.worker_count):
-            worker = asyncio.create_task(self._worker(i))
-            self.workers.append(worker)
+        self.dispatcher = asyncio.create_task(self.queue.run(self._send, concurrency=self.worker_count))
         
         logger.info("✅ Telegram notification engine started")
     
-    async def stop(self):
-        """Stop notification engine"""
+    async def stop(self, drain_timeout: float = 5.0):
+        """Stop notification engine (pending digests and messages get `drain_timeout` seconds)"""
         logger.info("🛑 Stopping Telegram notification engine...")
         self.running = False
         
-        # Wait for all workers
-        await asyncio.gather(*self.workers, return_exceptions=True)
+        self.queue.flush_digests()
+        deadline = time.monotonic() + drain_timeout
+        while self.dispatcher and self.queue.qsize() and time.monotonic() < deadline:
+            await asyncio.sleep(0.1)
+        
+        if self.dispatcher:
+            self.dispatcher.cancel()
+            await asyncio.gather(self.dispatcher, return_exceptions=True)
+            self.dispatcher = None
+        await self.queue.shutdown()
         
         # Close API session
         await self.api_client.close_session()
         
-        logger.info(f"✅ Engine stopped. Stats: {self.queue.stats()}")
+        logger.info(f"✅ Engine stopped. Stats: {self.queue.get_stats()}")
     
-    async def _worker(self, worker_id: int):
-        """Worker task for processing notifications"""
-        logger.info(f"👷 Worker {worker_id} started")
-        
-        while self.running:
-            try:
-                notification = await self.queue.get()
-                
-                if notification is None:
-                    continue
-                
-                # Send notification
-                success = await self.api_client.send_message_with_retry(
-                    text=notification['html'],
-                    retries=3
-                )
-                
-                if success:
-                    self.queue.processed += 1
-                    logger.info(f"✅ Notification processed by worker {worker_id}")
-                else:
-                    self.queue.failed += 1
-                    logger.error(f"❌ Notification failed by worker {worker_id}")
-            
-            except Exception as e:
-                logger.error(f"❌ Worker {worker_id} error: {e}")
-                await asyncio.sleep(1)
-        
-        logger.info(f"👋 Worker {worker_id} stopped")
+    async def _send(self, message: TelegramMessage) -> bool:
+        """Deliver one dispatched message (retries are scheduled by the queue)"""
+        return await self.api_client.send_message(message.message, chat_id=message.chat_id)
+    
+    async def _enqueue(self, notification_type: str, html: str, data: Dict,
+                       priority: Optional[MessagePriority] = None) -> bool:
+        return await self.queue.add(
+            html.strip(),
+            priority=priority or self.PRIORITIES.get(notification_type, MessagePriority.NORMAL),
+            metadata={'type': notification_type, 'data': data}
+        )
     
     async def queue_signal(self, signal_data: Dict):
         """Queue signal notification"""
@@ -364,11 +327,7 @@ class TelegramNotificationEngine:
             timestamp=datetime.now(pytz.UTC)
         )
         
-        await self.queue.put({
-            'type': NotificationType.SIGNAL.value,
-            'html': notification.to_html(),
-            'data': asdict(notification)
-        })
+        await self._enqueue(NotificationType.SIGNAL.value, notification.to_html(), asdict(notification))
     
     async def queue_opportunity(self, title: str, description: str, action: str,
                                urgency: str = 'MEDIUM'):
@@ -381,11 +340,10 @@ class TelegramNotificationEngine:
             timestamp=datetime.now(pytz.UTC)
         )
         
-        await self.queue.put({
-            'type': NotificationType.OPPORTUNITY.value,
-            'html': notification.to_html(),
-            'data': asdict(notification)
-        })
+        await self._enqueue(
+            NotificationType.OPPORTUNITY.value, notification.to_html(), asdict(notification),
+            MessagePriority.HIGH if urgency == 'HIGH' else None
+        )
     
     async def queue_risk(self, title: str, description: str, risk_level: str,
                         recommendation: str):
@@ -398,11 +356,10 @@ class TelegramNotificationEngine:
             timestamp=datetime.now(pytz.UTC)
         )
         
-        await self.queue.put({
-            'type': NotificationType.RISK.value,
-            'html': notification.to_html(),
-            'data': asdict(notification)
-        })
+        await self._enqueue(
+            NotificationType.RISK.value, notification.to_html(), asdict(notification),
+            MessagePriority.CRITICAL if risk_level == 'CRITICAL' else None
+        )
     
     async def queue_trade_tracking(self, symbol: str, trade_type: str,
                                   entry_price: float, current_price: float):
@@ -426,18 +383,14 @@ class TelegramNotificationEngine:
             timestamp=datetime.now(pytz.UTC)
         )
         
-        await self.queue.put({
-            'type': NotificationType.TRADE_TRACKING.value,
-            'html': notification.to_html(),
-            'data': asdict(notification)
-        })
+        await self._enqueue(NotificationType.TRADE_TRACKING.value, notification.to_html(), asdict(notification))
     
     def get_stats(self) -> Dict:
         """Get engine statistics"""
         return {
             'running': self.running,
-            'queue_size': self.queue.size(),
-            'queue_stats': self.queue.stats(),
+            'queue_size': self.queue.qsize(),
+            'queue_stats': self.queue.get_stats(),
             'worker_count': self.worker_count,
             'timestamp': datetime.now(pytz.UTC).isoformat()
         }
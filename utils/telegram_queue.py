@@ -4,28 +4,43 @@
 ════════════════════════════════════════════════════════════════════════════════════
 TelegramQueue PRODUCTION - DEMIR AI v8.0
 ════════════════════════════════════════════════════════════════════════════════════
-Production-grade async queue system for Telegram message delivery
-Rate limiting - Priority handling - Retry logic - PostgreSQL persistence
+Production-grade async dispatcher for Telegram message delivery
+Token buckets - Priority eviction - Dedup window - Digests - Batched persistence
 
 Features:
 - Async/await support with asyncio
-- Priority queue (CRITICAL, HIGH, NORMAL, LOW)
-- Rate limiting (20 msgs/min Telegram API limit)
-- Automatic retry with exponential backoff
-- Message deduplication
-- PostgreSQL persistence for reliability
+- Priority queue (CRITICAL, HIGH, NORMAL, LOW); the highest-priority
+  message of any chat that may send goes first, so one throttled chat
+  never holds back the others
+- Token buckets: one global (20 msgs/min Telegram API limit) plus one
+  per chat (small burst); waiting never happens under a lock
+- Real priority eviction: a full queue drops its oldest lowest-priority
+  message, or rejects the new one if that is lower still
+- Time-bounded deduplication: identical text to the same chat within
+  `dedup_window` seconds is blocked (bounded, expiring index)
+- Digests: LOW alerts are coalesced per chat and sent as one periodic
+  digest message instead of one message each
+- Automatic retry with exponential backoff (scheduled, never slept)
+- Batched PostgreSQL persistence: status events go through a
+  write-behind writer into `telegram_message_log`
 - Dead letter queue for failed messages
-- Message batching support
 - Health monitoring and metrics
-- Thread-safe operations
+
+Usage:
+    queue = TelegramQueue(default_chat_id=chat_id)
+    await queue.add("🚨 BTC stop hit", priority=MessagePriority.CRITICAL)
+    await queue.run(send)   # send: async (TelegramMessage) -> bool
 """
 
+import os
+import heapq
 import asyncio
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
+import weakref
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional, Any, Tuple
 from enum import IntEnum
-from collections import deque
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 import json
 import hashlib
@@ -33,13 +48,37 @@ import time
 
 # Internal imports
 try:
-    from database_manager_production import DatabaseManager
+    from utils.write_behind import WriteBehindWriter, DsnConnector, PSYCOPG2_AVAILABLE
 except ImportError:
-    DatabaseManager = None
-    logging.warning("DatabaseManager not available - persistence disabled")
+    WriteBehindWriter = None
+    DsnConnector = None
+    PSYCOPG2_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+MESSAGE_LOG_TABLE = 'telegram_message_log'
+MESSAGE_LOG_COLUMNS = ('message_id', 'chat_id', 'priority', 'status', 'message', 'metadata', 'event_at')
+
+MESSAGE_LOG_SCHEMA = f"""
+    CREATE TABLE IF NOT EXISTS {MESSAGE_LOG_TABLE} (
+        id BIGSERIAL PRIMARY KEY,
+        message_id VARCHAR(32) NOT NULL,
+        chat_id VARCHAR(64),
+        priority SMALLINT NOT NULL,
+        status VARCHAR(16) NOT NULL,
+        message TEXT,
+        metadata JSONB,
+        event_at TIMESTAMP WITH TIME ZONE NOT NULL
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_telegram_message_log_id ON {MESSAGE_LOG_TABLE}(message_id);
+"""
+
+DIGEST_MAX_CHARS = 3800  # Telegram caps a message at 4096 chars; headroom for the digest header
+
+_queues: 'weakref.WeakSet[TelegramQueue]' = weakref.WeakSet()
+_writers: Dict[str, Any] = {}
+
 
 class MessagePriority(IntEnum):
     """
@@ -56,7 +95,7 @@ class MessagePriority(IntEnum):
 class TelegramMessage:
     """
     Telegram message data structure.
-    
+
     Attributes:
         priority: Message priority level
         message: Message text content
@@ -66,6 +105,7 @@ class TelegramMessage:
         max_retries: Maximum retry attempts allowed
         message_id: Unique message identifier
         metadata: Additional message metadata
+        dedup_key: Content hash (chat + text, no timestamp) for the dedup window
     """
     priority: int
     message: str = field(compare=False)
@@ -75,33 +115,102 @@ class TelegramMessage:
     max_retries: int = field(default=3, compare=False)
     message_id: str = field(default="", compare=False)
     metadata: Dict[str, Any] = field(default_factory=dict, compare=False)
-    
+    dedup_key: str = field(default="", compare=False)
+
     def __post_init__(self):
-        """Generate unique message ID if not provided."""
+        """Generate unique message ID and content key if not provided."""
         if not self.message_id:
             # Generate hash of message content + timestamp
             content = f"{self.message}_{self.timestamp}_{self.chat_id}"
             self.message_id = hashlib.sha256(content.encode()).hexdigest()[:16]
+        if not self.dedup_key:
+            content = f"{self.chat_id}\x00{self.message}"
+            self.dedup_key = hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+
+
+class TokenBucket:
+    """
+    Token bucket: refills `rate` tokens per minute up to `capacity`.
+    Pure bookkeeping on a monotonic clock - callers decide whether to wait.
+    """
+
+    __slots__ = ('rate', 'capacity', 'tokens', 'updated')
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float):
+        if now > self.updated:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate / 60.0)
+            self.updated = now
+
+    def wait_time(self, now: Optional[float] = None) -> float:
+        """Seconds until one token is available (0 if available now)"""
+        now = time.monotonic() if now is None else now
+        self._refill(now)
+        if self.tokens >= 1.0:
+            return 0.0
+        return (1.0 - self.tokens) * 60.0 / self.rate
+
+    def take(self, now: Optional[float] = None) -> bool:
+        now = time.monotonic() if now is None else now
+        self._refill(now)
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return True
+        return False
+
+
+class _Digest:
+    """LOW alerts of one chat waiting to be coalesced"""
+
+    __slots__ = ('messages', 'chars', 'opened')
+
+    def __init__(self, opened: float):
+        self.messages: List[TelegramMessage] = []
+        self.chars = 0
+        self.opened = opened
+
+
+def _get_writer(dsn: str):
+    """One write-behind writer per database for every queue in the process"""
+    writer = _writers.get(dsn)
+    if writer is None:
+        connector = DsnConnector(dsn)
+        with connector() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(MESSAGE_LOG_SCHEMA)
+            conn.commit()
+        writer = WriteBehindWriter('telegram', connector, flush_interval=2.0)
+        writer.register_table(MESSAGE_LOG_TABLE, MESSAGE_LOG_COLUMNS)
+        _writers[dsn] = writer
+    return writer
 
 
 class TelegramQueue:
     """
-    Production-grade async Telegram message queue with enterprise features.
-    
-    Handles message queueing, rate limiting, retries, and persistence
-    for reliable Telegram notification delivery.
-    
+    Production-grade async Telegram message dispatcher with enterprise features.
+
+    Handles message queueing, rate limiting, coalescing, retries, and
+    persistence for reliable Telegram notification delivery. Consumers
+    either call get()/mark_sent() themselves or hand a send coroutine to run().
+
     Features:
-    - Priority-based message handling
-    - Rate limiting (respects Telegram API limits)
+    - Priority-based message handling with real eviction
+    - Global + per-chat token buckets (Telegram API limits)
+    - Periodic digests for LOW priority alerts
     - Automatic retry with exponential backoff
-    - Message deduplication
-    - Database persistence
+    - Time-bounded message deduplication
+    - Batched database persistence
     - Dead letter queue for failed messages
-    
+
     Attributes:
-        max_size: Maximum queue size (prevents memory overflow)
-        rate_limit: Messages per minute (Telegram limit: 20/min)
+        max_size: Maximum queued messages (prevents memory overflow)
+        rate_limit: Messages per minute, all chats (Telegram limit: 20/min)
+        chat_rate_limit: Messages per minute per chat
         enable_persistence: Enable database persistence
     """
 
@@ -110,61 +219,112 @@ class TelegramQueue:
         max_size: int = 10000,
         rate_limit: int = 20,  # Telegram API limit
         enable_persistence: bool = True,
-        enable_deduplication: bool = True
+        enable_deduplication: bool = True,
+        chat_rate_limit: Optional[int] = None,
+        chat_burst: int = 5,
+        dedup_window: float = 300.0,
+        max_dedup_entries: int = 10000,
+        digest_interval: float = 60.0,
+        digest_max_items: int = 20,
+        digest_priority: MessagePriority = MessagePriority.LOW,
+        default_chat_id: Optional[str] = None,
+        database_url: Optional[str] = None,
+        max_sent_history: int = 1000
     ):
         """
         Initialize TelegramQueue with configuration.
-        
+
         Args:
             max_size: Maximum messages in queue
-            rate_limit: Max messages per minute
-            enable_persistence: Enable PostgreSQL persistence
+            rate_limit: Max messages per minute over all chats
+            enable_persistence: Enable PostgreSQL persistence (needs DATABASE_URL)
             enable_deduplication: Prevent duplicate messages
+            chat_rate_limit: Max messages per minute per chat (default: rate_limit)
+            chat_burst: Messages a chat may send back-to-back
+            dedup_window: Seconds an identical message stays blocked
+            max_dedup_entries: Upper bound of the dedup index
+            digest_interval: Seconds LOW alerts are collected before a digest goes out
+            digest_max_items: A digest is sent early once it holds this many alerts
+            digest_priority: Alerts at or below this priority are coalesced (None disables digests)
+            default_chat_id: Chat used when add() gets no chat_id
+            database_url: PostgreSQL DSN (default: DATABASE_URL env)
+            max_sent_history: Sent message ids kept for inspection
         """
         self.max_size = max_size
         self.rate_limit = rate_limit
         self.enable_persistence = enable_persistence
         self.enable_deduplication = enable_deduplication
-        
-        # Primary queue (priority-based)
-        self.queue: asyncio.PriorityQueue = asyncio.PriorityQueue(maxsize=max_size)
-        
+        self.chat_rate_limit = chat_rate_limit or rate_limit
+        self.chat_burst = max(1, min(chat_burst, self.chat_rate_limit))
+        self.dedup_window = dedup_window
+        self.max_dedup_entries = max_dedup_entries
+        self.digest_interval = digest_interval
+        self.digest_max_items = max(1, digest_max_items)
+        self.digest_priority = digest_priority
+        self.default_chat_id = default_chat_id
+        self.max_sent_history = max_sent_history
+
+        # Primary queue: priority → chat → FIFO of messages
+        self._levels: Dict[int, Dict[Optional[str], deque]] = {int(p): {} for p in MessagePriority}
+        self._size = 0
+        self._seq = 0
+
+        # Retries waiting for their backoff: (not_before, seq, message)
+        self._delayed: List[Tuple[float, int, TelegramMessage]] = []
+
+        # LOW alerts being coalesced, per chat
+        self._digests: Dict[Optional[str], _Digest] = {}
+
         # Dead letter queue (failed messages)
         self.dead_letter_queue: deque = deque(maxlen=1000)
-        
-        # Message tracking
-        self.sent_messages: Dict[str, datetime] = {}
-        self.message_ids_seen: set = set()
-        
+
+        # Message tracking (both bounded)
+        self.sent_messages: 'OrderedDict[str, datetime]' = OrderedDict()
+        self._recent: 'OrderedDict[str, float]' = OrderedDict()  # dedup_key → expires at
+
         # Rate limiting
-        self.rate_limiter_window = deque(maxlen=rate_limit)
-        self.rate_limiter_lock = asyncio.Lock()
-        
+        self.global_bucket = TokenBucket(rate_limit)
+        self.chat_buckets: Dict[Optional[str], TokenBucket] = {}
+        self._wakeup = asyncio.Event()
+
         # Statistics
         self.stats = {
             'total_queued': 0,
             'total_sent': 0,
             'total_failed': 0,
-            'total_duplicates_blocked': 0
+            'total_duplicates_blocked': 0,
+            'total_evicted': 0,
+            'total_rejected': 0,
+            'total_retries': 0,
+            'total_coalesced': 0,
+            'digests_created': 0,
+            'rate_limit_waits': 0,
         }
-        
-        # Database manager
-        self.db_manager = None
-        if enable_persistence and DatabaseManager:
+
+        # Batched persistence (write-behind, shared per database)
+        self.writer = None
+        dsn = database_url or os.getenv('DATABASE_URL')
+        if enable_persistence and dsn and WriteBehindWriter and PSYCOPG2_AVAILABLE:
             try:
-                self.db_manager = DatabaseManager()
+                self.writer = _get_writer(dsn)
             except Exception as e:
-                logger.warning(f"Database init failed: {e}")
-        
+                logger.warning(f"Telegram message log disabled: {e}")
+
         # Background tasks
-        self._cleanup_task = None
-        self._persistence_task = None
-        
+        self._consumers: List[asyncio.Task] = []
+
+        _queues.add(self)
         logger.info(
             f"✅ TelegramQueue initialized: max_size={max_size}, "
-            f"rate_limit={rate_limit}/min, persistence={enable_persistence}"
+            f"rate_limit={rate_limit}/min (chat {self.chat_rate_limit}/min), "
+            f"digest={'off' if digest_priority is None else f'{digest_interval:.0f}s'}, "
+            f"persistence={self.writer is not None}"
         )
 
+    # ------------------------------------------------------------------
+    # Producer side
+    # ------------------------------------------------------------------
+
     async def add(
         self,
         message: str,
@@ -175,89 +335,258 @@ class TelegramQueue:
     ) -> bool:
         """
         Add message to queue with priority.
-        
+
         Args:
             message: Message text content
             priority: Message priority level
             chat_id: Telegram chat ID (optional)
             metadata: Additional metadata
             max_retries: Maximum retry attempts
-            
+
         Returns:
-            bool: True if message added successfully
+            bool: True if message was accepted (queued or coalesced into a digest)
         """
         try:
             # Create message object
             msg = TelegramMessage(
                 priority=priority,
                 message=message,
-                chat_id=chat_id,
+                chat_id=chat_id if chat_id is not None else self.default_chat_id,
                 metadata=metadata or {},
                 max_retries=max_retries
             )
-            
+            now = time.monotonic()
+
             # Deduplication check
             if self.enable_deduplication:
-                if msg.message_id in self.message_ids_seen:
+                if self._is_duplicate(msg, now):
                     self.stats['total_duplicates_blocked'] += 1
                     logger.debug(f"Duplicate message blocked: {msg.message_id[:8]}")
                     return False
-                self.message_ids_seen.add(msg.message_id)
-            
-            # Check queue capacity
-            if self.queue.full():
-                logger.warning(f"⚠️ Queue full ({self.max_size}), dropping LOW priority messages")
-                # Drop oldest LOW priority message to make space
-                await self._drop_lowest_priority_message()
-            
-            # Add to queue (negative priority for max-heap behavior)
-            await self.queue.put((-priority, msg))
-            
+
+            # LOW alerts are coalesced into the chat's next digest
+            if (self.digest_priority is not None and msg.priority <= self.digest_priority
+                    and len(msg.message) < DIGEST_MAX_CHARS):
+                self._remember(msg, now)
+                self._coalesce(msg, now)
+                self.stats['total_coalesced'] += 1
+                self._persist(msg, 'coalesced', with_text=True)
+                self._wakeup.set()
+                return True
+
+            if not self._enqueue(msg):
+                return False
+
+            self._remember(msg, now)
             self.stats['total_queued'] += 1
-            
-            # Persist to database
-            if self.db_manager and self.enable_persistence:
-                await self._persist_message(msg)
-            
+            self._persist(msg, 'queued', with_text=True)
+
             logger.debug(
-                f"✅ Message queued: priority={priority.name}, "
-                f"id={msg.message_id[:8]}, size={self.queue.qsize()}"
+                f"✅ Message queued: priority={MessagePriority(msg.priority).name}, "
+                f"id={msg.message_id[:8]}, size={self._size}"
             )
-            
+
             return True
-            
+
         except Exception as e:
             logger.error(f"❌ Failed to add message to queue: {e}")
             return False
 
+    def _is_duplicate(self, msg: TelegramMessage, now: float) -> bool:
+        """Dedup index: insertion order == expiry order, so expired keys sit at the front"""
+        recent = self._recent
+        while recent:
+            key, expires = next(iter(recent.items()))
+            if expires > now and len(recent) < self.max_dedup_entries:
+                break
+            recent.popitem(last=False)
+        return msg.dedup_key in recent
+
+    def _remember(self, msg: TelegramMessage, now: float):
+        """Start the dedup window - only for messages that were accepted"""
+        if self.enable_deduplication:
+            self._recent[msg.dedup_key] = now + self.dedup_window
+
+    def _forget(self, msg: TelegramMessage):
+        """Drop the dedup key(s) of a message that will never be delivered"""
+        for key in msg.metadata.get('dedup_keys') or (msg.dedup_key,):
+            self._recent.pop(key, None)
+
+    def _enqueue(self, msg: TelegramMessage) -> bool:
+        """Put a message in its priority/chat FIFO, evicting if the queue is full"""
+        if self._size >= self.max_size:
+            victim_level = self._lowest_level()
+            if victim_level is None or victim_level > msg.priority:
+                self.stats['total_rejected'] += 1
+                logger.warning(f"⚠️ Queue full ({self.max_size}), rejecting {MessagePriority(msg.priority).name} message")
+                self._persist(msg, 'rejected', with_text=True)
+                self._forget(msg)
+                return False
+            self._evict(victim_level)
+
+        self._levels[int(msg.priority)].setdefault(msg.chat_id, deque()).append((self._seq, msg))
+        self._seq += 1
+        self._size += 1
+        self._wakeup.set()
+        return True
+
+    def _lowest_level(self) -> Optional[int]:
+        for level in sorted(self._levels):
+            if any(self._levels[level].values()):
+                return level
+        return None
+
+    def _evict(self, level: int):
+        """Drop the oldest message of the lowest non-empty priority"""
+        chats = self._levels[level]
+        chat = min((c for c, q in chats.items() if q), key=lambda c: chats[c][0][0])
+        _, victim = chats[chat].popleft()
+        if not chats[chat]:
+            del chats[chat]
+        self._size -= 1
+        self.stats['total_evicted'] += 1
+        logger.warning(f"⚠️ Queue full ({self.max_size}), evicted {MessagePriority(level).name} message {victim.message_id[:8]}")
+        self._persist(victim, 'evicted')
+        self._forget(victim)
+
+    def _coalesce(self, msg: TelegramMessage, now: float):
+        digest = self._digests.get(msg.chat_id)
+        if digest is None:
+            digest = self._digests[msg.chat_id] = _Digest(now)
+        elif digest.chars + len(msg.message) > DIGEST_MAX_CHARS:
+            self._flush_digest(msg.chat_id)
+            digest = self._digests[msg.chat_id] = _Digest(now)
+        digest.messages.append(msg)
+        digest.chars += len(msg.message) + 2
+        if len(digest.messages) >= self.digest_max_items:
+            self._flush_digest(msg.chat_id)
+
+    def _flush_digest(self, chat_id: Optional[str]):
+        """Turn a chat's collected alerts into one queued message"""
+        digest = self._digests.pop(chat_id, None)
+        if digest is None or not digest.messages:
+            return
+        items = digest.messages
+        if len(items) == 1:
+            msg = items[0]
+        else:
+            header = f"📋 <b>Özet</b> — {len(items)} bildirim ({items[0].timestamp:%H:%M}–{items[-1].timestamp:%H:%M})"
+            msg = TelegramMessage(
+                priority=MessagePriority.NORMAL,
+                message='\n\n'.join([header] + [m.message for m in items]),
+                chat_id=chat_id,
+                max_retries=max(m.max_retries for m in items),
+                metadata={
+                    'digest': True,
+                    'count': len(items),
+                    'message_ids': [m.message_id for m in items],
+                    'dedup_keys': [m.dedup_key for m in items]
+                }
+            )
+            self.stats['digests_created'] += 1
+        if self._enqueue(msg):
+            self.stats['total_queued'] += 1
+            self._persist(msg, 'queued', with_text=len(items) == 1)
+
+    def flush_digests(self) -> None:
+        """Queue every collected digest now (e.g. before shutdown)"""
+        for chat_id in list(self._digests):
+            self._flush_digest(chat_id)
+
+    def _flush_due_digests(self, now: float) -> Optional[float]:
+        """Flush digests whose interval elapsed; returns seconds until the next one is due"""
+        next_due = None
+        for chat_id, digest in list(self._digests.items()):
+            due = digest.opened + self.digest_interval - now
+            if due <= 0:
+                self._flush_digest(chat_id)
+            elif next_due is None or due < next_due:
+                next_due = due
+        return next_due
+
+    # ------------------------------------------------------------------
+    # Consumer side
+    # ------------------------------------------------------------------
+
+    def _chat_bucket(self, chat_id: Optional[str]) -> TokenBucket:
+        bucket = self.chat_buckets.get(chat_id)
+        if bucket is None:
+            bucket = self.chat_buckets[chat_id] = TokenBucket(self.chat_rate_limit, self.chat_burst)
+        return bucket
+
+    def _release_delayed(self, now: float) -> Optional[float]:
+        """Move retries whose backoff expired back into the queue"""
+        while self._delayed and self._delayed[0][0] <= now:
+            _, _, msg = heapq.heappop(self._delayed)
+            self._size -= 1
+            self._enqueue(msg)
+        return self._delayed[0][0] - now if self._delayed else None
+
+    def _take_next(self, now: float) -> Tuple[Optional[TelegramMessage], Optional[float]]:
+        """
+        Highest-priority message (oldest first) whose chat has a token, or
+        (None, seconds until something could be sent).
+        """
+        waits = [w for w in (self._flush_due_digests(now), self._release_delayed(now)) if w is not None]
+
+        global_wait = self.global_bucket.wait_time(now)
+        if global_wait > 0:
+            if self._size:
+                waits.append(global_wait)
+            return None, min(waits) if waits else None
+
+        for level in sorted(self._levels, reverse=True):
+            chats = self._levels[level]
+            best_chat, best_seq = None, None
+            for chat_id, fifo in chats.items():
+                if not fifo:
+                    continue
+                chat_wait = self._chat_bucket(chat_id).wait_time(now)
+                if chat_wait > 0:
+                    waits.append(chat_wait)
+                elif best_seq is None or fifo[0][0] < best_seq:
+                    best_chat, best_seq = chat_id, fifo[0][0]
+            if best_seq is not None:
+                _, msg = chats[best_chat].popleft()
+                if not chats[best_chat]:
+                    del chats[best_chat]
+                self._size -= 1
+                self.global_bucket.take(now)
+                self._chat_bucket(best_chat).take(now)
+                return msg, None
+        return None, min(waits) if waits else None
+
     async def get(self, timeout: Optional[float] = None) -> Optional[TelegramMessage]:
         """
         Get next message from queue (respecting rate limits).
-        
+
         Args:
             timeout: Timeout in seconds (None = wait indefinitely)
-            
+
         Returns:
             TelegramMessage or None if timeout/empty
         """
+        deadline = None if timeout is None else time.monotonic() + timeout
         try:
-            # Rate limiting check
-            await self._enforce_rate_limit()
-            
-            # Get message from queue
-            if timeout:
-                _, msg = await asyncio.wait_for(self.queue.get(), timeout=timeout)
-            else:
-                _, msg = await self.queue.get()
-            
-            # Record send time for rate limiting
-            async with self.rate_limiter_lock:
-                self.rate_limiter_window.append(datetime.now())
-            
-            return msg
-            
-        except asyncio.TimeoutError:
-            return None
+            while True:
+                now = time.monotonic()
+                msg, wait = self._take_next(now)
+                if msg is not None:
+                    return msg
+                if wait is not None and self._size:
+                    self.stats['rate_limit_waits'] += 1
+                if deadline is not None:
+                    remaining = deadline - now
+                    if remaining <= 0:
+                        return None
+                    wait = remaining if wait is None else min(wait, remaining)
+
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=wait)
+                except asyncio.TimeoutError:
+                    pass
+
         except Exception as e:
             logger.error(f"Error getting message from queue: {e}")
             return None
@@ -265,7 +594,7 @@ class TelegramQueue:
     async def mark_sent(self, message: TelegramMessage, success: bool = True) -> None:
         """
         Mark message as sent (or failed).
-        
+
         Args:
             message: Message that was sent
             success: Whether send was successful
@@ -274,163 +603,166 @@ class TelegramQueue:
             if success:
                 self.stats['total_sent'] += 1
                 self.sent_messages[message.message_id] = datetime.now()
-                
-                # Update database
-                if self.db_manager:
-                    await self.db_manager.update_telegram_message_status(
-                        message_id=message.message_id,
-                        status='sent',
-                        sent_at=datetime.now()
-                    )
-                
+                while len(self.sent_messages) > self.max_sent_history:
+                    self.sent_messages.popitem(last=False)
+
+                self._persist(message, 'sent')
+
                 logger.debug(f"✅ Message sent: {message.message_id[:8]}")
-            
+
             else:
                 # Failed - retry or move to DLQ
                 await self._handle_failed_message(message)
-            
+
         except Exception as e:
             logger.error(f"Error marking message status: {e}")
 
     async def _handle_failed_message(self, message: TelegramMessage) -> None:
         """
         Handle failed message delivery.
-        
+
         Args:
             message: Failed message
         """
         message.retry_count += 1
-        
+
         if message.retry_count < message.max_retries:
             # Retry with exponential backoff
             backoff_delay = 2 ** message.retry_count  # 2, 4, 8 seconds
-            
+
             logger.warning(
                 f"⚠️ Message failed, retrying in {backoff_delay}s: "
                 f"{message.message_id[:8]} (attempt {message.retry_count}/{message.max_retries})"
             )
-            
-            # Wait and re-queue
-            await asyncio.sleep(backoff_delay)
-            await self.queue.put((-message.priority, message))
-        
+
+            # Scheduled - the consumer keeps sending other messages meanwhile
+            heapq.heappush(self._delayed, (time.monotonic() + backoff_delay, self._seq, message))
+            self._seq += 1
+            self._size += 1
+            self.stats['total_retries'] += 1
+            self._persist(message, 'retry')
+            self._wakeup.set()
+
         else:
             # Max retries exceeded - move to dead letter queue
             self.dead_letter_queue.append(message)
             self.stats['total_failed'] += 1
-            
+
             logger.error(
                 f"❌ Message failed permanently: {message.message_id[:8]} "
                 f"after {message.retry_count} attempts"
             )
-            
+
             # Persist failure
-            if self.db_manager:
-                await self.db_manager.update_telegram_message_status(
-                    message_id=message.message_id,
-                    status='failed',
-                    error=f"Max retries ({message.max_retries}) exceeded"
-                )
-
-    async def _enforce_rate_limit(self) -> None:
-        """
-        Enforce rate limiting (Telegram API: 20 messages/minute).
-        """
-        async with self.rate_limiter_lock:
-            now = datetime.now()
-            
-            # Remove messages older than 1 minute
-            while self.rate_limiter_window and \
-                  (now - self.rate_limiter_window[0]).seconds >= 60:
-                self.rate_limiter_window.popleft()
-            
-            # Check if at rate limit
-            if len(self.rate_limiter_window) >= self.rate_limit:
-                # Calculate wait time
-                oldest_message_time = self.rate_limiter_window[0]
-                wait_until = oldest_message_time + timedelta(seconds=60)
-                wait_seconds = (wait_until - now).total_seconds()
-                
-                if wait_seconds > 0:
-                    logger.debug(f"⏳ Rate limit reached, waiting {wait_seconds:.1f}s")
-                    await asyncio.sleep(wait_seconds)
-
-    async def _drop_lowest_priority_message(self) -> None:
+            self._persist(message, 'failed')
+
+    async def run(self, send: Callable[[TelegramMessage], Awaitable[bool]], concurrency: int = 1) -> None:
         """
-        Drop oldest LOW priority message when queue is full.
+        Dispatch loop: get → send → mark_sent until cancelled/shutdown.
+
+        Args:
+            send: Coroutine delivering one message, returns success
+            concurrency: Messages in flight at once (rate limits still apply)
         """
-        # This is a simplified implementation
-        # In production, would scan queue for lowest priority
-        logger.warning("⚠️ Dropping message due to full queue")
+        async def consume(worker_id: int):
+            while True:
+                msg = await self.get()
+                if msg is None:
+                    continue
+                try:
+                    success = await send(msg)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.error(f"❌ Telegram dispatcher {worker_id} send error: {e}")
+                    success = False
+                await self.mark_sent(msg, success=bool(success))
+
+        self._consumers = [asyncio.create_task(consume(i)) for i in range(max(1, concurrency))]
+        try:
+            await asyncio.gather(*self._consumers)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            for task in self._consumers:
+                task.cancel()
+            self._consumers = []
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
 
-    async def _persist_message(self, message: TelegramMessage) -> bool:
+    def _persist(self, message: TelegramMessage, status: str, with_text: bool = False) -> None:
         """
-        Persist message to database.
-        
-        Args:
-            message: Message to persist
-            
-        Returns:
-            bool: True if persisted successfully
+        Queue one status event for the message log (never blocks; rows are
+        written in batches by the write-behind flusher).
         """
+        if self.writer is None:
+            return
         try:
-            if not self.db_manager:
-                return False
-            
-            record = {
-                'message_id': message.message_id,
-                'priority': message.priority,
-                'message': message.message,
-                'chat_id': message.chat_id,
-                'status': 'queued',
-                'created_at': message.timestamp,
-                'metadata': json.dumps(message.metadata)
-            }
-            
-            await self.db_manager.save_telegram_message(record)
-            return True
-            
+            self.writer.write(MESSAGE_LOG_TABLE, (
+                message.message_id,
+                message.chat_id,
+                int(message.priority),
+                status,
+                message.message if with_text else None,
+                json.dumps(message.metadata, default=str) if message.metadata else None,
+                datetime.now().astimezone(),
+            ))
         except Exception as e:
             logger.error(f"Message persistence error: {e}")
-            return False
+
+    # ------------------------------------------------------------------
+    # Inspection
+    # ------------------------------------------------------------------
 
     def is_empty(self) -> bool:
         """
         Check if queue is empty.
-        
+
         Returns:
-            bool: True if queue is empty
+            bool: True if nothing is queued, waiting for retry or collected for a digest
         """
-        return self.queue.empty()
+        return self._size == 0 and not self._digests
 
     def qsize(self) -> int:
         """
         Get current queue size.
-        
+
         Returns:
-            int: Number of messages in queue
+            int: Number of messages in queue (including scheduled retries)
         """
-        return self.queue.qsize()
+        return self._size
 
     def get_stats(self) -> Dict[str, Any]:
         """
         Get queue statistics.
-        
+
         Returns:
             Dictionary of queue metrics
         """
+        now = time.monotonic()
         return {
             **self.stats,
             'current_queue_size': self.qsize(),
+            'queued_by_priority': {
+                MessagePriority(level).name: sum(len(q) for q in chats.values())
+                for level, chats in self._levels.items()
+            },
+            'retries_pending': len(self._delayed),
+            'digest_buffered': sum(len(d.messages) for d in self._digests.values()),
             'dead_letter_queue_size': len(self.dead_letter_queue),
-            'messages_in_rate_window': len(self.rate_limiter_window),
-            'unique_messages_seen': len(self.message_ids_seen)
+            'global_tokens': round(self.global_bucket.tokens, 2),
+            'global_wait_seconds': round(self.global_bucket.wait_time(now), 2),
+            'chats': len(self.chat_buckets),
+            'dedup_entries': len(self._recent),
+            'persistence': self.writer is not None,
         }
 
     async def get_dead_letter_messages(self) -> List[TelegramMessage]:
         """
         Get messages from dead letter queue.
-        
+
         Returns:
             List of failed messages
         """
@@ -439,7 +771,7 @@ class TelegramQueue:
     async def clear_dead_letter_queue(self) -> int:
         """
         Clear dead letter queue.
-        
+
         Returns:
             Number of messages cleared
         """
@@ -450,39 +782,46 @@ class TelegramQueue:
 
     async def shutdown(self) -> None:
         """
-        Graceful shutdown - process remaining messages.
+        Graceful shutdown - pending digests are queued, consumers stopped.
         """
+        self.flush_digests()
         logger.info(f"🛑 Shutting down TelegramQueue ({self.qsize()} messages remaining)")
-        
+
         # Cancel background tasks
-        if self._cleanup_task:
-            self._cleanup_task.cancel()
-        if self._persistence_task:
-            self._persistence_task.cancel()
-        
+        for task in self._consumers:
+            task.cancel()
+        if self.writer is not None:
+            self.writer.flush()
+
         # Log final stats
         stats = self.get_stats()
         logger.info(f"📊 Final stats: {json.dumps(stats, indent=2)}")
 
 
+def get_telegram_queue_metrics() -> List[Dict[str, Any]]:
+    """Stats of every live TelegramQueue"""
+    return [queue.get_stats() for queue in list(_queues)]
+
+
 # Backward compatibility alias
 TelegramAlertQueue = TelegramQueue
 
 
-__all__ = ['TelegramQueue', 'TelegramAlertQueue', 'MessagePriority', 'TelegramMessage']
+__all__ = ['TelegramQueue', 'TelegramAlertQueue', 'MessagePriority', 'TelegramMessage', 'TokenBucket',
+           'get_telegram_queue_metrics']
 
 
 if __name__ == "__main__":
     # Test instantiation
     async def test():
-        queue = TelegramQueue(max_size=100, rate_limit=20)
-        
+        queue = TelegramQueue(max_size=100, rate_limit=20, enable_persistence=False)
+
         # Add test messages
         await queue.add("Test HIGH priority", priority=MessagePriority.HIGH)
         await queue.add("Test NORMAL priority", priority=MessagePriority.NORMAL)
         await queue.add("Test LOW priority", priority=MessagePriority.LOW)
-        
+
         print(f"✅ TelegramQueue test: {queue.qsize()} messages queued")
         print(f"📊 Stats: {queue.get_stats()}")
-    
+
     asyncio.run(test())
@@ -0,0 +1,603 @@
+"""
+Tiered Cache - in-process LRU in front of optional Redis
+DEMIR AI v8.0
+
+One cache subsystem behind CacheLayer, ResponseCache, RedisCache and
+RedisHotDataCache:
+
+- Local tier: bounded OrderedDict LRU per namespace - O(1) get / set /
+  eviction (move_to_end / popitem), no scan on insert
+- Redis tier (optional): shared between processes, values stored with a
+  compact binary codec; a Redis hit is promoted into the local tier so
+  hot keys are decoded once, not on every get
+- get_or_load(): single-flight - concurrent misses for one key run the
+  loader once, the other callers wait for its result
+- Stale-while-revalidate: entries past `ttl` but within `stale_ttl` are
+  served immediately while one background refresh runs
+- Per-namespace stats: local / redis hits, misses, stale serves, loads,
+  coalesced waits, evictions, get / load latency
+
+Usage:
+    cache = get_cache('onchain')
+    cache.set('metrics', metrics, ttl=600)
+    cache.get('metrics')
+    cache.get_or_load('fear_greed', fetch_fear_greed, ttl=300, stale_ttl=600)
+"""
+
+import os
+import json
+import time
+import zlib
+import struct
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    redis = None
+    REDIS_AVAILABLE = False
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    msgpack = None
+    MSGPACK_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY_PREFIX = 'demir:'
+REDIS_RETRY_SECONDS = 30  # Redis tier is skipped this long after an error
+COMPRESS_MIN_BYTES = 512
+
+FRESH, STALE, MISS = 'fresh', 'stale', 'miss'
+
+
+# ============================================================================
+# CODEC
+# ============================================================================
+
+# Format tags (1 byte) | 0x80 = zlib-compressed payload
+_TAG_MSGPACK = 1
+_TAG_JSON = 2
+_TAG_BYTES = 3
+_TAG_STR = 4
+_TAG_NDARRAY = 5
+_ZLIB = 0x80
+
+
+def encode(value: Any) -> bytes:
+    """Value → tagged bytes (msgpack if installed, else compact JSON; ndarrays raw)"""
+    if isinstance(value, (bytes, bytearray)):
+        tag, payload = _TAG_BYTES, bytes(value)
+    elif isinstance(value, str):
+        tag, payload = _TAG_STR, value.encode()
+    elif isinstance(value, np.ndarray):
+        header = json.dumps([value.dtype.str, value.shape]).encode()
+        tag = _TAG_NDARRAY
+        payload = struct.pack('<H', len(header)) + header + np.ascontiguousarray(value).tobytes()
+    elif MSGPACK_AVAILABLE:
+        tag, payload = _TAG_MSGPACK, msgpack.packb(value, default=str, use_bin_type=True)
+    else:
+        tag, payload = _TAG_JSON, json.dumps(value, default=str, separators=(',', ':')).encode()
+
+    if len(payload) >= COMPRESS_MIN_BYTES:
+        packed = zlib.compress(payload, 1)
+        if len(packed) < len(payload):
+            return bytes((tag | _ZLIB,)) + packed
+    return bytes((tag,)) + payload
+
+
+def decode(data: bytes) -> Any:
+    """Inverse of encode()"""
+    tag = data[0]
+    payload = data[1:]
+    if tag & _ZLIB:
+        tag &= ~_ZLIB
+        payload = zlib.decompress(payload)
+
+    if tag == _TAG_MSGPACK:
+        return msgpack.unpackb(payload, raw=False)
+    if tag == _TAG_JSON:
+        return json.loads(payload)
+    if tag == _TAG_BYTES:
+        return payload
+    if tag == _TAG_STR:
+        return payload.decode()
+    if tag == _TAG_NDARRAY:
+        (size,) = struct.unpack_from('<H', payload)
+        dtype, shape = json.loads(payload[2:2 + size])
+        return np.frombuffer(payload[2 + size:], dtype=np.dtype(dtype)).reshape(shape).copy()
+    raise ValueError(f"unknown cache codec tag {tag}")
+
+
+# ============================================================================
+# NAMESPACE CONFIG / STATS
+# ============================================================================
+
+@dataclass
+class NamespaceConfig:
+    """Per-namespace cache settings"""
+    max_entries: int = 10000
+    default_ttl: Optional[float] = 300.0  # None = no expiry
+    stale_ttl: float = 0.0  # extra seconds a stale value may be served (get_or_load)
+    use_redis: bool = True
+
+
+class NamespaceStats:
+    """Counters for one namespace (updated under the namespace lock)"""
+
+    def __init__(self):
+        self.local_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self.stale_served = 0
+        self.loads = 0
+        self.load_errors = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self.sets = 0
+        self.get_time_ns = 0
+        self.gets = 0
+        self.load_time_ns = 0
+
+    def snapshot(self, size: int, max_entries: int) -> Dict[str, Any]:
+        hits = self.local_hits + self.redis_hits
+        lookups = hits + self.misses
+        return {
+            'entries': size,
+            'max_entries': max_entries,
+            'hits': hits,
+            'local_hits': self.local_hits,
+            'redis_hits': self.redis_hits,
+            'misses': self.misses,
+            'hit_rate': round(hits / lookups * 100, 2) if lookups else 0.0,
+            'stale_served': self.stale_served,
+            'loads': self.loads,
+            'load_errors': self.load_errors,
+            'coalesced': self.coalesced,
+            'evictions': self.evictions,
+            'sets': self.sets,
+            'avg_get_us': round(self.get_time_ns / self.gets / 1e3, 2) if self.gets else 0.0,
+            'avg_load_ms': round(self.load_time_ns / self.loads / 1e6, 2) if self.loads else 0.0
+        }
+
+
+# ============================================================================
+# LOCAL TIER
+# ============================================================================
+
+class LocalTier:
+    """Bounded LRU: key → (value, fresh_until, stale_until); all ops O(1)"""
+
+    def __init__(self, config: NamespaceConfig):
+        self.config = config
+        self.entries: 'OrderedDict[str, Tuple[Any, float, float]]' = OrderedDict()
+        self.lock = threading.Lock()
+        self.stats = NamespaceStats()
+
+    def lookup(self, key: str, now: float) -> Tuple[str, Any]:
+        """(FRESH|STALE|MISS, value) - caller holds self.lock"""
+        entry = self.entries.get(key)
+        if entry is None:
+            return MISS, None
+        value, fresh_until, stale_until = entry
+        if now < fresh_until:
+            self.entries.move_to_end(key)
+            return FRESH, value
+        if now < stale_until:
+            return STALE, value
+        del self.entries[key]
+        return MISS, None
+
+    def store(self, key: str, value: Any, fresh_until: float, stale_until: float):
+        """Caller holds self.lock"""
+        if key in self.entries:
+            self.entries.move_to_end(key)
+        self.entries[key] = (value, fresh_until, stale_until)
+        while len(self.entries) > self.config.max_entries:
+            self.entries.popitem(last=False)
+            self.stats.evictions += 1
+
+
+class _Flight:
+    """One in-progress load; followers wait on `done`"""
+    __slots__ = ('done', 'value', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error: Optional[BaseException] = None
+
+
+# ============================================================================
+# TIERED CACHE
+# ============================================================================
+
+class TieredCache:
+    """Namespaced two-tier cache (see module docstring)"""
+
+    def __init__(self, redis_url: Optional[str] = None, redis_client: Any = None, refresh_workers: int = 4):
+        """
+        Args:
+            redis_url: Redis URL (default $REDIS_URL; no URL / no redis package = local only)
+            redis_client: Already-connected client (takes precedence over redis_url)
+            refresh_workers: Threads for stale-while-revalidate refreshes
+        """
+        self._namespaces: Dict[str, LocalTier] = {}
+        self._configs: Dict[str, NamespaceConfig] = {}
+        self._lock = threading.Lock()
+        self._flights: Dict[Tuple[str, str], _Flight] = {}
+        self._flight_lock = threading.Lock()
+        self._refresher = ThreadPoolExecutor(max_workers=refresh_workers, thread_name_prefix='cache-refresh')
+
+        self.redis = redis_client
+        self._redis_down_until = 0.0
+        self.redis_errors = 0
+        if self.redis is None:
+            redis_url = redis_url or os.getenv('REDIS_URL')
+            if redis_url and REDIS_AVAILABLE:
+                try:
+                    self.redis = redis.Redis.from_url(redis_url, socket_timeout=2, socket_connect_timeout=2)
+                    self.redis.ping()
+                    logger.info("✅ TieredCache: Redis tier connected")
+                except Exception as e:
+                    logger.warning(f"⚠️ TieredCache: Redis unavailable, local tier only ({e})")
+                    self.redis = None
+
+    # ------------------------------------------------------------------------
+    # Namespaces
+    # ------------------------------------------------------------------------
+
+    def configure(self, namespace: str, **settings: Any) -> NamespaceConfig:
+        """Set / update namespace settings (max_entries, default_ttl, stale_ttl, use_redis)"""
+        with self._lock:
+            config = self._configs.get(namespace) or NamespaceConfig()
+            for name, value in settings.items():
+                setattr(config, name, value)
+            self._configs[namespace] = config
+            if namespace in self._namespaces:
+                self._namespaces[namespace].config = config
+            return config
+
+    def _tier(self, namespace: str) -> LocalTier:
+        tier = self._namespaces.get(namespace)
+        if tier is None:
+            with self._lock:
+                tier = self._namespaces.get(namespace)
+                if tier is None:
+                    config = self._configs.setdefault(namespace, NamespaceConfig())
+                    tier = self._namespaces[namespace] = LocalTier(config)
+        return tier
+
+    def namespace(self, name: str) -> 'CacheNamespace':
+        return CacheNamespace(self, name)
+
+    # ------------------------------------------------------------------------
+    # Redis tier
+    # ------------------------------------------------------------------------
+
+    def _redis_enabled(self, config: NamespaceConfig) -> bool:
+        return self.redis is not None and config.use_redis and time.time() >= self._redis_down_until
+
+    def _redis_failed(self, op: str, error: Exception):
+        self.redis_errors += 1
+        self._redis_down_until = time.time() + REDIS_RETRY_SECONDS
+        logger.warning(f"⚠️ TieredCache Redis {op} failed, local only for {REDIS_RETRY_SECONDS}s: {error}")
+
+    @staticmethod
+    def _redis_key(namespace: str, key: str) -> str:
+        return f"{REDIS_KEY_PREFIX}{namespace}:{key}"
+
+    def _redis_get(self, namespace: str, key: str) -> Optional[Tuple[Any, float, float]]:
+        try:
+            raw = self.redis.get(self._redis_key(namespace, key))
+        except Exception as e:
+            self._redis_failed('get', e)
+            return None
+        if not raw:
+            return None
+        try:
+            fresh_until, stale_until = struct.unpack_from('<dd', raw)
+            return decode(raw[16:]), fresh_until, stale_until
+        except Exception as e:
+            logger.debug(f"TieredCache: undecodable Redis value {namespace}:{key} ({e})")
+            return None
+
+    def _redis_set(self, namespace: str, key: str, value: Any, fresh_until: float, stale_until: float):
+        try:
+            payload = struct.pack('<dd', fresh_until, stale_until) + encode(value)
+        except Exception as e:
+            logger.debug(f"TieredCache: {namespace}:{key} not encodable, local only ({e})")
+            return
+        try:
+            expire = stale_until - time.time()
+            if expire == float('inf'):
+                self.redis.set(self._redis_key(namespace, key), payload)
+            elif expire > 0:
+                self.redis.set(self._redis_key(namespace, key), payload, px=max(1, int(expire * 1000)))
+        except Exception as e:
+            self._redis_failed('set', e)
+
+    # ------------------------------------------------------------------------
+    # Core operations
+    # ------------------------------------------------------------------------
+
+    def _lookup(self, namespace: str, key: str) -> Tuple[str, Any]:
+        """Local tier, then Redis (promoting hits into the local tier)"""
+        start = time.perf_counter_ns()
+        tier = self._tier(namespace)
+        now = time.time()
+        with tier.lock:
+            state, value = tier.lookup(key, now)
+            if state == FRESH:
+                tier.stats.local_hits += 1
+                tier.stats.gets += 1
+                tier.stats.get_time_ns += time.perf_counter_ns() - start
+                return state, value
+
+        # Local miss / stale: another process may hold a fresher copy
+        if self._redis_enabled(tier.config):
+            entry = self._redis_get(namespace, key)
+            if entry is not None and now < entry[2] and (state == MISS or entry[1] > now):
+                value, fresh_until, stale_until = entry
+                state = FRESH if now < fresh_until else STALE
+                with tier.lock:
+                    tier.store(key, value, fresh_until, stale_until)
+                    if state == FRESH:
+                        tier.stats.redis_hits += 1
+
+        with tier.lock:
+            if state != FRESH:
+                tier.stats.misses += 1
+            tier.stats.gets += 1
+            tier.stats.get_time_ns += time.perf_counter_ns() - start
+        return state, value
+
+    def get(self, namespace: str, key: str, default: Any = None) -> Any:
+        """Fresh value or default"""
+        state, value = self._lookup(namespace, key)
+        return value if state == FRESH else default
+
+    def set(
+        self,
+        namespace: str,
+        key: str,
+        value: Any,
+        ttl: Optional[float] = None,
+        stale_ttl: Optional[float] = None
+    ):
+        """Store in both tiers (ttl None = namespace default_ttl)"""
+        tier = self._tier(namespace)
+        config = tier.config
+        ttl = config.default_ttl if ttl is None else ttl
+        stale_ttl = config.stale_ttl if stale_ttl is None else stale_ttl
+        now = time.time()
+        fresh_until = now + ttl if ttl is not None else float('inf')
+        stale_until = fresh_until + stale_ttl
+
+        with tier.lock:
+            tier.store(key, value, fresh_until, stale_until)
+            tier.stats.sets += 1
+        if self._redis_enabled(config):
+            self._redis_set(namespace, key, value, fresh_until, stale_until)
+
+    def delete(self, namespace: str, key: str):
+        tier = self._tier(namespace)
+        with tier.lock:
+            tier.entries.pop(key, None)
+        if self._redis_enabled(tier.config):
+            try:
+                self.redis.delete(self._redis_key(namespace, key))
+            except Exception as e:
+                self._redis_failed('delete', e)
+
+    def invalidate(self, namespace: str, pattern: Optional[str] = None) -> int:
+        """Drop keys containing `pattern` (None = whole namespace); returns local count"""
+        tier = self._tier(namespace)
+        with tier.lock:
+            if pattern is None:
+                removed = len(tier.entries)
+                tier.entries.clear()
+            else:
+                keys = [k for k in tier.entries if pattern in k]
+                for k in keys:
+                    del tier.entries[k]
+                removed = len(keys)
+
+        if self._redis_enabled(tier.config):
+            match = self._redis_key(namespace, f"*{pattern}*" if pattern else '*')
+            try:
+                keys = list(self.redis.scan_iter(match=match, count=500))
+                if keys:
+                    self.redis.delete(*keys)
+            except Exception as e:
+                self._redis_failed('invalidate', e)
+        return removed
+
+    def purge_expired(self, namespace: str) -> int:
+        """Drop local entries past their stale window (Redis expires on its own)"""
+        tier = self._tier(namespace)
+        now = time.time()
+        with tier.lock:
+            keys = [k for k, entry in tier.entries.items() if now >= entry[2]]
+            for k in keys:
+                del tier.entries[k]
+        return len(keys)
+
+    def count_expired(self, namespace: str) -> int:
+        """Local entries past their fresh TTL"""
+        tier = self._tier(namespace)
+        now = time.time()
+        with tier.lock:
+            return sum(1 for entry in tier.entries.values() if now >= entry[1])
+
+    # ------------------------------------------------------------------------
+    # Read-through: single-flight + stale-while-revalidate
+    # ------------------------------------------------------------------------
+
+    def _load(self, namespace: str, key: str, loader: Callable[[], Any],
+              ttl: Optional[float], stale_ttl: Optional[float], wait: bool = True) -> Any:
+        """Run loader once per key; concurrent callers share the result"""
+        flight_key = (namespace, key)
+        with self._flight_lock:
+            flight = self._flights.get(flight_key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[flight_key] = _Flight()
+
+        tier = self._tier(namespace)
+        if not leader:
+            if not wait:
+                return None
+            with tier.lock:
+                tier.stats.coalesced += 1
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        start = time.perf_counter_ns()
+        try:
+            flight.value = loader()
+            if flight.value is not None:
+                self.set(namespace, key, flight.value, ttl, stale_ttl)
+            return flight.value
+        except BaseException as e:
+            flight.error = e
+            with tier.lock:
+                tier.stats.load_errors += 1
+            raise
+        finally:
+            with tier.lock:
+                tier.stats.loads += 1
+                tier.stats.load_time_ns += time.perf_counter_ns() - start
+            with self._flight_lock:
+                self._flights.pop(flight_key, None)
+            flight.done.set()
+
+    def _refresh(self, namespace: str, key: str, loader: Callable[[], Any],
+                 ttl: Optional[float], stale_ttl: Optional[float]):
+        try:
+            self._load(namespace, key, loader, ttl, stale_ttl, wait=False)
+        except Exception as e:
+            logger.warning(f"⚠️ Cache refresh failed for {namespace}:{key}: {e}")
+
+    def get_or_load(
+        self,
+        namespace: str,
+        key: str,
+        loader: Callable[[], Any],
+        ttl: Optional[float] = None,
+        stale_ttl: Optional[float] = None
+    ) -> Any:
+        """
+        Fresh value → returned; stale value → returned and refreshed in the
+        background; miss → loader runs once (other callers wait for it).
+        A loader result of None is returned but not cached.
+        """
+        state, value = self._lookup(namespace, key)
+        if state == FRESH:
+            return value
+        if state == STALE:
+            tier = self._tier(namespace)
+            with tier.lock:
+                tier.stats.stale_served += 1
+            if (namespace, key) not in self._flights:
+                self._refresher.submit(self._refresh, namespace, key, loader, ttl, stale_ttl)
+            return value
+        return self._load(namespace, key, loader, ttl, stale_ttl)
+
+    # ------------------------------------------------------------------------
+    # Stats
+    # ------------------------------------------------------------------------
+
+    def get_stats(self, namespace: Optional[str] = None) -> Dict[str, Any]:
+        """Per-namespace stats (or one namespace)"""
+        names = [namespace] if namespace else list(self._namespaces)
+        result = {}
+        for name in names:
+            tier = self._tier(name)
+            with tier.lock:
+                result[name] = tier.stats.snapshot(len(tier.entries), tier.config.max_entries)
+        if namespace:
+            return result[namespace]
+        return {
+            'namespaces': result,
+            'redis_connected': self.redis is not None,
+            'redis_errors': self.redis_errors,
+            'codec': 'msgpack' if MSGPACK_AVAILABLE else 'json'
+        }
+
+    def health_check(self) -> Dict[str, Any]:
+        if self.redis is None:
+            return {'status': 'local', 'redis': False}
+        try:
+            info = self.redis.info()
+            return {'status': 'ok', 'redis': True, 'uptime': info.get('uptime_in_seconds', 0)}
+        except Exception as e:
+            return {'status': 'degraded', 'redis': True, 'err': str(e)}
+
+
+class CacheNamespace:
+    """TieredCache bound to one namespace - the API callers use"""
+
+    def __init__(self, cache: TieredCache, name: str):
+        self.cache = cache
+        self.name = name
+
+    def configure(self, **settings: Any) -> 'CacheNamespace':
+        self.cache.configure(self.name, **settings)
+        return self
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.cache.get(self.name, key, default)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None, stale_ttl: Optional[float] = None):
+        self.cache.set(self.name, key, value, ttl, stale_ttl)
+
+    def delete(self, key: str):
+        self.cache.delete(self.name, key)
+
+    def invalidate(self, pattern: Optional[str] = None) -> int:
+        return self.cache.invalidate(self.name, pattern)
+
+    def get_or_load(self, key: str, loader: Callable[[], Any],
+                    ttl: Optional[float] = None, stale_ttl: Optional[float] = None) -> Any:
+        return self.cache.get_or_load(self.name, key, loader, ttl, stale_ttl)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return self.cache.get_stats(self.name)
+
+    def __len__(self) -> int:
+        return len(self.cache._tier(self.name).entries)
+
+
+_default_cache: Optional[TieredCache] = None
+_default_lock = threading.Lock()
+
+
+def get_tiered_cache() -> TieredCache:
+    """Process-wide cache (Redis tier from $REDIS_URL when reachable)"""
+    global _default_cache
+    if _default_cache is None:
+        with _default_lock:
+            if _default_cache is None:
+                _default_cache = TieredCache()
+    return _default_cache
+
+
+def get_cache(namespace: str, **settings: Any) -> CacheNamespace:
+    """Namespace view of the process-wide cache (settings applied if given)"""
+    view = get_tiered_cache().namespace(namespace)
+    if settings:
+        view.configure(**settings)
+    return view
@@ -0,0 +1,503 @@
+"""
+Write-Behind Persistence - batched PostgreSQL inserts off the hot path
+DEMIR AI v8.0
+
+Signal / trade / layer-performance rows used to be written with one
+INSERT + COMMIT per call, on the analysis thread. WriteBehindWriter
+buffers them per table and a single flusher thread writes them:
+
+- Flush by size (a table reaches `batch_size` rows) or time
+  (`flush_interval` seconds), one transaction per flush, multi-row
+  `execute_values` per table
+- Bounded memory: at most `max_buffered` rows are held; beyond that,
+  rows go straight to the spill journal
+- Spill journal (JSONL on disk): a failed flush and everything queued
+  while the DB is down is appended there, and replayed - oldest first -
+  once the DB answers again (exponential retry backoff)
+- Metrics: queue depth per table, flush latency (avg / p95 / max),
+  rows written / spilled / replayed / dropped / rejected, journal size
+- after_insert hooks: per-table callback run on the same cursor and in
+  the same transaction as the insert (e.g. incremental rollup upserts),
+  so derived tables never drift from the rows actually written
+
+write() never blocks on the database.
+
+Usage:
+    writer = WriteBehindWriter('signals', DsnConnector(DATABASE_URL))
+    writer.register_table('trades', ('symbol', 'signal_type', 'confidence'))
+    writer.write('trades', ('BTCUSDT', 'LONG', 0.82))
+"""
+
+import os
+import re
+import json
+import time
+import atexit
+import logging
+import threading
+import weakref
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, ContextManager, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import psycopg2
+    from psycopg2.extras import execute_values
+    PSYCOPG2_AVAILABLE = True
+except ImportError:
+    psycopg2 = None
+    execute_values = None
+    PSYCOPG2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_JOURNAL_DIR = os.getenv('WRITE_BEHIND_DIR', os.path.join('backups', 'write_behind'))
+MAX_RETRY_SECONDS = 60.0
+REPLAY_CHUNK_ROWS = 5000
+
+_IDENTIFIER = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+
+# ============================================================================
+# CONNECTIONS
+# ============================================================================
+
+class DsnConnector:
+    """
+    Dedicated writer connection for modules that hold a single psycopg2
+    connection (sharing it with the flusher thread would interleave
+    transactions). Dropped after an error, so the next flush reconnects.
+    """
+
+    def __init__(self, dsn: str):
+        self.dsn = dsn
+        self.conn = None
+
+    @contextmanager
+    def __call__(self):
+        if self.conn is None or self.conn.closed:
+            self.conn = psycopg2.connect(self.dsn)
+        try:
+            yield self.conn
+        except Exception:
+            try:
+                self.conn.close()
+            except Exception:
+                pass
+            self.conn = None
+            raise
+
+    def close(self):
+        if self.conn is not None and not self.conn.closed:
+            self.conn.close()
+        self.conn = None
+
+
+# ============================================================================
+# WRITER
+# ============================================================================
+
+@dataclass
+class TableSpec:
+    """Target table + column order of the queued row tuples"""
+    table: str
+    columns: Tuple[str, ...]
+    template: Optional[str] = None
+    after_insert: Optional[Callable[[Any, List[tuple]], None]] = None  # (cursor, rows), same transaction
+
+    @property
+    def sql(self) -> str:
+        return f"INSERT INTO {self.table} ({', '.join(self.columns)}) VALUES %s"
+
+
+class WriteBehindWriter:
+    """
+    Per-table row buffers + one flusher thread + disk spill journal.
+
+    `connect` is a zero-argument callable returning a context manager that
+    yields a psycopg2 connection (DatabaseManager.get_connection, or a
+    DsnConnector).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        connect: Callable[[], ContextManager[Any]],
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        max_buffered: int = 50_000,
+        journal_dir: Optional[str] = DEFAULT_JOURNAL_DIR,
+        max_journal_mb: float = 256.0,
+        autostart: bool = True
+    ):
+        self.name = name
+        self.connect = connect
+        self.batch_size = max(1, int(batch_size))
+        self.flush_interval = flush_interval
+        self.max_buffered = max(self.batch_size, int(max_buffered))
+        self.max_journal_bytes = int(max_journal_mb * 1024 * 1024)
+
+        self.journal_path = os.path.join(journal_dir, f"{name}.jsonl") if journal_dir else None
+        self.replay_path = f"{self.journal_path}.replay" if self.journal_path else None
+        if journal_dir:
+            os.makedirs(journal_dir, exist_ok=True)
+
+        self.tables: Dict[str, TableSpec] = {}
+        self._buffers: Dict[str, deque] = {}
+        self._buffered = 0
+        self._lock = threading.Lock()
+        self._journal_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self._retry_at = 0.0
+        self._retry_delay = 1.0
+        self._flush_ms = deque(maxlen=512)
+        self.stats = {
+            'rows_queued': 0,
+            'rows_written': 0,
+            'rows_spilled': 0,
+            'rows_replayed': 0,
+            'rows_dropped': 0,
+            'rows_rejected': 0,
+            'flushes': 0,
+            'failed_flushes': 0,
+            'peak_queue_depth': 0,
+            'last_flush_rows': 0,
+            'last_error': None,
+        }
+
+        _writers.add(self)
+        if autostart:
+            self.start()
+
+    # ------------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------------
+
+    def register_table(
+        self,
+        table: str,
+        columns: Sequence[str],
+        template: Optional[str] = None,
+        after_insert: Optional[Callable[[Any, List[tuple]], None]] = None
+    ) -> 'WriteBehindWriter':
+        """Declare a target table (identifiers are validated, rows are bound as parameters)"""
+        for ident in (table, *columns):
+            if not _IDENTIFIER.match(ident):
+                raise ValueError(f"Invalid SQL identifier: {ident!r}")
+        self.tables[table] = TableSpec(table, tuple(columns), template, after_insert)
+        with self._lock:
+            self._buffers.setdefault(table, deque())
+        return self
+
+    def write(self, table: str, row: Sequence[Any]) -> bool:
+        """Queue one row (non-blocking). Returns False if it had to be dropped."""
+        spec = self.tables.get(table)
+        if spec is None:
+            raise KeyError(f"Table not registered with writer '{self.name}': {table}")
+        if len(row) != len(spec.columns):
+            raise ValueError(f"{table}: expected {len(spec.columns)} values, got {len(row)}")
+
+        with self._lock:
+            self.stats['rows_queued'] += 1
+            if self._buffered >= self.max_buffered:
+                overflow = True
+            else:
+                overflow = False
+                buffer = self._buffers[table]
+                buffer.append(tuple(row))
+                self._buffered += 1
+                if self._buffered > self.stats['peak_queue_depth']:
+                    self.stats['peak_queue_depth'] = self._buffered
+                if len(buffer) >= self.batch_size:
+                    self._wake.set()
+
+        if overflow:
+            return self._spill([(table, tuple(row))]) > 0
+        return True
+
+    def flush(self) -> bool:
+        """Write everything queued now (journal first). True if the DB took it."""
+        return self._flush_once()
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name=f"write-behind-{self.name}", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def close(self, timeout: float = 10.0):
+        """Stop the flusher; whatever the final flush cannot write is journaled"""
+        self._stop.set()
+        self._wake.set()
+        if self._thread and self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+        self._thread = None
+        if not self._flush_once():
+            self._spill_buffers()
+
+    def queue_depth(self) -> int:
+        return self._buffered
+
+    def get_metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            depth = {table: len(buffer) for table, buffer in self._buffers.items()}
+            stats = dict(self.stats)
+        latencies = sorted(self._flush_ms)
+        return {
+            **stats,
+            'queue_depth': sum(depth.values()),
+            'queue_depth_by_table': depth,
+            'max_buffered': self.max_buffered,
+            'flush_ms_avg': round(sum(latencies) / len(latencies), 2) if latencies else 0.0,
+            'flush_ms_p95': round(latencies[int(0.95 * (len(latencies) - 1))], 2) if latencies else 0.0,
+            'flush_ms_max': round(latencies[-1], 2) if latencies else 0.0,
+            'journal_bytes': self._journal_bytes(),
+            'db_available': time.monotonic() >= self._retry_at,
+        }
+
+    # ------------------------------------------------------------------------
+    # Flushing
+    # ------------------------------------------------------------------------
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            try:
+                self._flush_once()
+            except Exception as e:
+                logger.error(f"❌ Write-behind [{self.name}] flusher error: {e}")
+
+    def _drain(self) -> Dict[str, List[tuple]]:
+        with self._lock:
+            batch = {table: list(buffer) for table, buffer in self._buffers.items() if buffer}
+            for table in batch:
+                self._buffers[table].clear()
+            self._buffered = 0
+        return batch
+
+    def _flush_once(self) -> bool:
+        with self._flush_lock:
+            if time.monotonic() < self._retry_at:
+                # DB is down: keep memory flat, rows wait in the journal
+                self._spill_buffers()
+                return False
+
+            if not self._replay_journal():
+                self._spill_buffers()
+                return False
+
+            batch = self._drain()
+            if not batch:
+                return True
+
+            try:
+                rows = self._write_batch(batch)
+            except Exception as e:
+                self._spill([(table, row) for table, table_rows in batch.items() for row in table_rows])
+                self._mark_down(e)
+                return False
+
+            self._mark_up()
+            self.stats['rows_written'] += rows
+            self.stats['last_flush_rows'] = rows
+            return True
+
+    def _write_batch(self, batch: Dict[str, List[tuple]]) -> int:
+        """
+        Multi-row insert; if the DB rejects the data itself (not the
+        connection), rows are retried one by one so a single bad row
+        cannot block the queue / journal forever. Returns rows written.
+        """
+        rows = sum(len(r) for r in batch.values())
+        try:
+            self._insert(batch)
+            return rows
+        except Exception as e:
+            if _is_transient(e):
+                raise
+            logger.warning(f"⚠️ Write-behind [{self.name}] batch rejected ({e}), retrying row by row")
+            return rows - self._insert_rowwise(batch)
+
+    def _insert_rowwise(self, batch: Dict[str, List[tuple]]) -> int:
+        rejected = 0
+        with self.connect() as conn:
+            cursor = conn.cursor()
+            for table, rows in batch.items():
+                spec = self.tables[table]
+                for row in rows:
+                    cursor.execute("SAVEPOINT write_behind_row")
+                    try:
+                        execute_values(cursor, spec.sql, [row], template=spec.template)
+                        if spec.after_insert:
+                            spec.after_insert(cursor, [row])
+                        cursor.execute("RELEASE SAVEPOINT write_behind_row")
+                    except psycopg2.Error as e:
+                        cursor.execute("ROLLBACK TO SAVEPOINT write_behind_row")
+                        rejected += 1
+                        self.stats['last_error'] = str(e)[:200]
+            conn.commit()
+            cursor.close()
+        if rejected:
+            self.stats['rows_rejected'] += rejected
+            logger.error(f"❌ Write-behind [{self.name}] {rejected} rows rejected by the database")
+        return rejected
+
+    def _insert(self, batch: Dict[str, List[tuple]]):
+        """One transaction, one multi-row INSERT per table (pages of batch_size)"""
+        start = time.perf_counter()
+        with self.connect() as conn:
+            try:
+                cursor = conn.cursor()
+                for table, rows in batch.items():
+                    spec = self.tables[table]
+                    execute_values(cursor, spec.sql, rows, template=spec.template, page_size=self.batch_size)
+                    if spec.after_insert:
+                        spec.after_insert(cursor, rows)
+                conn.commit()
+                cursor.close()
+            except Exception:
+                try:
+                    conn.rollback()
+                except Exception:
+                    pass
+                raise
+        self._flush_ms.append((time.perf_counter() - start) * 1000)
+        self.stats['flushes'] += 1
+
+    def _mark_down(self, error: Exception):
+        self.stats['failed_flushes'] += 1
+        self.stats['last_error'] = str(error)[:200]
+        self._retry_at = time.monotonic() + self._retry_delay
+        logger.warning(f"⚠️ Write-behind [{self.name}] flush failed, retry in {self._retry_delay:.0f}s: {error}")
+        self._retry_delay = min(self._retry_delay * 2, MAX_RETRY_SECONDS)
+
+    def _mark_up(self):
+        if self._retry_delay > 1.0:
+            logger.info(f"✅ Write-behind [{self.name}] database reachable again")
+        self._retry_at = 0.0
+        self._retry_delay = 1.0
+
+    # ------------------------------------------------------------------------
+    # Spill journal
+    # ------------------------------------------------------------------------
+
+    def _journal_bytes(self) -> int:
+        total = 0
+        for path in (self.journal_path, self.replay_path):
+            if path and os.path.exists(path):
+                total += os.path.getsize(path)
+        return total
+
+    def _spill_buffers(self):
+        batch = self._drain()
+        if batch:
+            self._spill([(table, row) for table, rows in batch.items() for row in rows])
+
+    def _spill(self, rows: List[Tuple[str, tuple]]) -> int:
+        """Append rows to the journal; rows that do not fit are dropped (counted)"""
+        if not rows:
+            return 0
+        if not self.journal_path:
+            self.stats['rows_dropped'] += len(rows)
+            return 0
+
+        lines = ''.join(json.dumps([table, list(row)], default=str) + '\n' for table, row in rows)
+        with self._journal_lock:
+            try:
+                if self._journal_bytes() + len(lines) > self.max_journal_bytes:
+                    self.stats['rows_dropped'] += len(rows)
+                    logger.error(f"❌ Write-behind [{self.name}] journal full, {len(rows)} rows dropped")
+                    return 0
+                with open(self.journal_path, 'a', encoding='utf-8') as f:
+                    f.write(lines)
+            except OSError as e:
+                self.stats['rows_dropped'] += len(rows)
+                logger.error(f"❌ Write-behind [{self.name}] journal write failed: {e}")
+                return 0
+        self.stats['rows_spilled'] += len(rows)
+        return len(rows)
+
+    def _replay_journal(self) -> bool:
+        """Insert journaled rows (oldest first). False if the DB rejected them."""
+        if not self.journal_path:
+            return True
+        while True:
+            with self._journal_lock:
+                if not os.path.exists(self.replay_path):
+                    if not os.path.exists(self.journal_path) or not os.path.getsize(self.journal_path):
+                        return True
+                    os.replace(self.journal_path, self.replay_path)
+
+            failed_at, error = self._replay_file()
+            if error is not None:
+                self._trim_replay(failed_at)
+                self._mark_down(error)
+                return False
+            os.remove(self.replay_path)
+            logger.info(f"✅ Write-behind [{self.name}] journal replayed")
+
+    def _replay_file(self) -> Tuple[int, Optional[Exception]]:
+        """Replay in chunks; on failure returns the offset of the first unwritten chunk"""
+        with open(self.replay_path, 'r', encoding='utf-8') as f:
+            while True:
+                offset = f.tell()
+                chunk = [line for line in (f.readline() for _ in range(REPLAY_CHUNK_ROWS)) if line]
+                if not chunk:
+                    return offset, None
+                batch: Dict[str, List[tuple]] = {}
+                for line in chunk:
+                    try:
+                        table, row = json.loads(line)
+                    except ValueError:
+                        self.stats['rows_dropped'] += 1
+                        continue
+                    spec = self.tables.get(table)
+                    if spec is None or len(row) > len(spec.columns):
+                        self.stats['rows_dropped'] += 1
+                        continue
+                    # Journaled before trailing columns were added: pad with NULLs
+                    row = tuple(row) + (None,) * (len(spec.columns) - len(row))
+                    batch.setdefault(table, []).append(row)
+                try:
+                    self.stats['rows_replayed'] += self._write_batch(batch) if batch else 0
+                except Exception as e:
+                    return offset, e
+
+    def _trim_replay(self, offset: int):
+        """Keep only the not-yet-inserted tail of the replay file"""
+        with open(self.replay_path, 'r', encoding='utf-8') as f:
+            f.seek(offset)
+            remainder = f.read()
+        tmp_path = f"{self.replay_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(remainder)
+        os.replace(tmp_path, self.replay_path)
+
+
+def _is_transient(error: Exception) -> bool:
+    """Connection-level failure (retry later) vs. rows the DB refuses"""
+    if not PSYCOPG2_AVAILABLE or not isinstance(error, psycopg2.Error):
+        return True
+    return isinstance(error, (psycopg2.OperationalError, psycopg2.InterfaceError))
+
+
+# ============================================================================
+# METRICS
+# ============================================================================
+
+_writers: 'weakref.WeakSet[WriteBehindWriter]' = weakref.WeakSet()
+
+
+def get_write_behind_metrics() -> Dict[str, Dict[str, Any]]:
+    """Metrics of every live writer, keyed by writer name"""
+    return {writer.name: writer.get_metrics() for writer in list(_writers)}